@@ -0,0 +1,25 @@
+"""
+API 공용 의존성
+"""
+
+from functools import lru_cache
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가 (임시 해결책)
+project_root = os.path.dirname(os.path.dirname(__file__))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import PROJECT_ID, DATASET_ID
+from src.utils.bigquery_client import BigQueryClient
+
+
+@lru_cache(maxsize=None)
+def get_bigquery_client() -> BigQueryClient:
+    """프로세스 전체에서 공유하는 BigQuery 클라이언트
+
+    요청마다 새로 만들면 조회 캐시도 요청과 함께 버려지므로, 하나를 만들어
+    모든 요청이 같은 클라이언트(와 조회 캐시)를 사용합니다.
+    """
+    return BigQueryClient(PROJECT_ID, DATASET_ID)
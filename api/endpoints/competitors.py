@@ -20,6 +20,7 @@ try:
         CompetitorStats
     )
     from src.utils.bigquery_client import BigQueryClient
+    from api.dependencies import get_bigquery_client
 except ImportError:
     from ..models.competitor import (
         CompetitorModel, 
@@ -29,17 +30,18 @@ except ImportError:
     )
     try:
         from ...src.utils.bigquery_client import BigQueryClient
+        from ..dependencies import get_bigquery_client
     except ImportError:
         # BigQuery 클라이언트가 없는 경우 더미 클래스 사용
         class BigQueryClient:
             def __init__(self):
                 pass
 
-router = APIRouter()
+        # BigQuery 클라이언트 의존성
+        def get_bigquery_client() -> BigQueryClient:
+            return BigQueryClient()
 
-# BigQuery 클라이언트 의존성
-def get_bigquery_client() -> BigQueryClient:
-    return BigQueryClient()
+router = APIRouter()
 
 
 @router.get("/", response_model=List[CompetitorModel])
@@ -3,6 +3,7 @@ from fastapi.middleware.cors import CORSMiddleware
 
 # 라우터 임포트
 from api.routes.collections import router as collections_router
+from api.routes.metrics import router as metrics_router
 
 app = FastAPI(
     title="MarketingAI API",
@@ -21,6 +22,7 @@ app.add_middleware(
 
 # 라우터 등록
 app.include_router(collections_router, prefix="/api/v1", tags=["collections"])
+app.include_router(metrics_router, prefix="/api/v1", tags=["metrics"])
 
 @app.get("/")
 async def root():
@@ -60,6 +60,17 @@ competitors_db: Dict[str, Dict[str, Any]] = {}
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# 요청마다 새 세션을 만들지 않도록 수집기를 프로세스에서 재사용
+_instagram_collector = None
+
+
+def get_instagram_collector():
+    """재사용할 Instagram 수집기 반환 (최초 호출 시 생성)"""
+    global _instagram_collector
+    if _instagram_collector is None:
+        _instagram_collector = InstagramCollector()
+    return _instagram_collector
+
 @router.get("/collections/")
 async def get_collections():
     """수집 작업 목록 조회"""
@@ -84,7 +95,7 @@ async def collect_instagram_posts(username: str, max_posts: int = 10):
         username = username.strip()
         logger.info(f"Starting Instagram collection for @{username}, max_posts={max_posts}")
         
-        collector = InstagramCollector()
+        collector = get_instagram_collector()
         posts = collector.collect_user_posts(username, max_posts)
         
         # 데이터 변환 (안전하게)
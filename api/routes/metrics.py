@@ -0,0 +1,66 @@
+"""
+수집 지표 API 엔드포인트
+"""
+
+from fastapi import APIRouter, HTTPException
+import logging
+import os
+import sys
+
+# 프로젝트 루트를 Python 경로에 추가 (임시 해결책)
+project_root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from config.config import SCRAPE_METRICS_PATH
+from src.utils.http_transport import transport_stats
+from src.utils.metrics import (
+    bandwidth_usage, hosts_by_total_time, load_merged_metrics_summary, scrape_metrics
+)
+
+router = APIRouter()
+logger = logging.getLogger(__name__)
+
+
+@router.get("/metrics/scraping")
+async def get_scraping_metrics():
+    """스크래핑 단계별 지연 시간 및 전송량 요약 조회
+
+    이 프로세스에서 수집한 지표가 있으면 그 값을, 없으면 마지막 배치 실행
+    (src/main.py)이 저장한 요약을 반환합니다. 샤드 실행이면 샤드별 지표 파일을
+    모두 합친 값을 반환합니다.
+    """
+    hosts = scrape_metrics.summary()
+    bandwidth = bandwidth_usage.summary()
+    source = "live"
+    files = None
+
+    if not hosts:
+        saved = load_merged_metrics_summary(SCRAPE_METRICS_PATH)
+        if saved is None:
+            raise HTTPException(status_code=404, detail="수집된 스크래핑 지표가 없습니다")
+        hosts = saved.get('hosts', {})
+        bandwidth = saved.get('bandwidth')
+        source = "last_run"
+        files = saved['files']
+
+    return {
+        "status": "success",
+        "source": source,
+        "files": files,
+        "hosts": hosts,
+        "slowest_hosts": [
+            {"host": host, "total_ms": round(total_ms, 3)}
+            for host, total_ms in hosts_by_total_time(hosts)
+        ],
+        "bandwidth": bandwidth
+    }
+
+
+@router.get("/metrics/transport")
+async def get_transport_metrics():
+    """공유 HTTP 연결 풀 및 DNS 캐시 통계 조회"""
+    return {
+        "status": "success",
+        **transport_stats()
+    }
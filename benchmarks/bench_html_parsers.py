@@ -0,0 +1,107 @@
+"""
+HTML 파서 백엔드 벤치마크
+
+백엔드별 페이지당 파싱 시간과 최대 메모리 사용량을 측정합니다.
+
+사용법:
+    python benchmarks/bench_html_parsers.py [--repeat 20] [--html-dir DIR | --archive-dir DIR]
+
+--archive-dir를 주면 원본 응답 아카이브의 실제 페이지를 고정 입력으로 사용합니다.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Tuple
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data_collection.archive import iter_archive
+from src.data_collection.html_extractor import (
+    LXML_AVAILABLE, PARSER_BACKENDS, extract_page
+)
+
+
+def build_synthetic_page(paragraphs: int) -> bytes:
+    """스크립트/스타일과 반복 문단을 가진 합성 페이지 생성"""
+    body = "\n".join(
+        f"<div class=\"section\"><h2>Section {i}</h2>"
+        f"<p>Plan {i} includes analytics, reporting and  priority support.</p>"
+        f"<script>window.dataLayer.push({{'section': {i}}});</script></div>"
+        for i in range(paragraphs)
+    )
+    html = (
+        "<html><head><title>Pricing - Benchmark</title>"
+        "<meta name=\"description\" content=\"Benchmark page\">"
+        "<style>.section { margin: 0 }</style></head>"
+        f"<body>{body}</body></html>"
+    )
+    return html.encode('utf-8')
+
+
+def load_pages(html_dir: str = None, archive_dir: str = None) -> List[Tuple[str, bytes]]:
+    """벤치마크 대상 페이지 목록 (디렉터리가 주어지면 *.html 파일 또는 아카이브 레코드 사용)"""
+    if archive_dir:
+        return [
+            (record['url'][-24:], record['body'])
+            for record in iter_archive(archive_dir) if record['status_code'] == 200
+        ]
+
+    if html_dir:
+        pages = []
+        for name in sorted(os.listdir(html_dir)):
+            if name.endswith('.html'):
+                with open(os.path.join(html_dir, name), 'rb') as f:
+                    pages.append((name, f.read()))
+        return pages
+
+    return [
+        ('small (20 sections)', build_synthetic_page(20)),
+        ('medium (500 sections)', build_synthetic_page(500)),
+        ('large (10k sections)', build_synthetic_page(10000)),
+    ]
+
+
+def measure(html: bytes, backend: str, repeat: int) -> Dict[str, float]:
+    """한 페이지에 대한 백엔드의 평균 파싱 시간(ms)과 최대 메모리(KiB) 측정"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        extract_page(html, backend=backend)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    tracemalloc.start()
+    extract_page(html, backend=backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'mean_ms': statistics.mean(timings),
+        'p50_ms': statistics.median(timings),
+        'peak_kib': peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 파서 백엔드 벤치마크")
+    parser.add_argument('--repeat', type=int, default=20, help="페이지당 반복 횟수")
+    parser.add_argument('--html-dir', help="측정할 *.html 파일 디렉터리 (기본: 합성 페이지)")
+    parser.add_argument('--archive-dir', help="측정할 원본 응답 아카이브 디렉터리")
+    args = parser.parse_args()
+
+    backends = [b for b in PARSER_BACKENDS if b != 'lxml' or LXML_AVAILABLE]
+
+    print(f"{'page':<24} {'backend':<12} {'mean ms':>10} {'p50 ms':>10} {'peak KiB':>10}")
+    for name, html in load_pages(args.html_dir, args.archive_dir):
+        for backend in backends:
+            result = measure(html, backend, args.repeat)
+            print(f"{name:<24} {backend:<12} {result['mean_ms']:>10.2f} "
+                  f"{result['p50_ms']:>10.2f} {result['peak_kib']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""
+BigQuery 행 직렬화 벤치마크
+
+삽입 전 행 준비 비용을 비교합니다.
+    - legacy: 행마다 필드를 손으로 복사하고 json.dumps로 결과/요청 크기를 계산하던 기존 방식
+    - compiled: 스키마로 만든 RowSerializer로 배치 전체를 변환하고 크기를 한 번에 계산
+
+사용법:
+    python benchmarks/bench_row_serializer.py [--rows 100000] [--repeat 3]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.load_files import estimate_json_bytes
+from src.utils.row_serializer import ORJSON_AVAILABLE, TABLE_SCHEMAS, RowSerializer
+
+
+def make_competitor_rows(count: int) -> List[Dict]:
+    """스크래퍼 결과 형태의 합성 페이지 행 (저장하지 않는 필드 포함)"""
+    return [
+        {
+            'id': f"id-{i}",
+            'competitor_name': f"competitor-{i % 20}",
+            'url': f"https://example{i % 20}.com/page/{i}",
+            'page_title': f"요금제 {i}",
+            'content': "요금제 안내와 기능 비교 " * 20,
+            'meta_description': "benchmark",
+            'collected_at': "2024-01-01T10:00:00",
+            'content_hash': f"{i:032x}",
+            'content_simhash': f"{i:016x}",
+            'status_code': 200,
+            'content_length': 400,
+        }
+        for i in range(count)
+    ]
+
+
+def make_analysis_rows(count: int) -> List[Dict]:
+    """분석기 결과 형태의 합성 분석 행"""
+    return [
+        {
+            'id': f"analysis-{i}",
+            'competitor_name': f"competitor-{i % 20}",
+            'analysis_type': 'keyword',
+            'analysis_date': "2024-01-01",
+            'results': {'top_keywords': [[f"키워드{k}", k] for k in range(10)], 'total_words': 1000 + i},
+            'summary': "요약",
+            'created_at': "2024-01-01T10:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_competitor(data: List[Dict]) -> int:
+    """기존 insert_competitor_data 행 준비 + _write_rows 크기 추정"""
+    rows_to_insert = []
+    for row in data:
+        rows_to_insert.append({
+            'id': row['id'],
+            'competitor_name': row['competitor_name'],
+            'url': row['url'],
+            'page_title': row['page_title'],
+            'content': row['content'],
+            'meta_description': row['meta_description'],
+            'collected_at': row['collected_at'],
+            'content_hash': row['content_hash'],
+            'content_simhash': row.get('content_simhash')
+        })
+    return estimate_json_bytes(rows_to_insert)
+
+
+def legacy_analysis(data: List[Dict]) -> int:
+    """기존 insert_analysis_results 행 준비 + _write_rows 크기 추정"""
+    rows_to_insert = []
+    for row in data:
+        rows_to_insert.append({
+            'id': row['id'],
+            'competitor_name': row['competitor_name'],
+            'analysis_type': row['analysis_type'],
+            'analysis_date': row['analysis_date'],
+            'results': json.dumps(row['results']) if row['results'] else None,
+            'summary': row['summary'],
+            'created_at': row['created_at']
+        })
+    return estimate_json_bytes(rows_to_insert)
+
+
+def rows_per_second(prepare: Callable[[List[Dict]], object], rows: List[Dict], repeat: int) -> float:
+    """repeat회 중 중앙값 기준 초당 처리 행 수"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        prepare(rows)
+        timings.append(time.perf_counter() - start)
+    return len(rows) / statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BigQuery 행 직렬화 벤치마크")
+    parser.add_argument('--rows', type=int, default=100000, help="테이블별 행 수")
+    parser.add_argument('--repeat', type=int, default=3, help="반복 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    print(f"JSON 인코더: {'orjson' if ORJSON_AVAILABLE else 'json (orjson 미설치)'}")
+    print(f"{'table':<18} {'path':<10} {'rows/s':>12} {'speedup':>8}")
+    cases = [
+        ('competitor_data', make_competitor_rows(args.rows), legacy_competitor),
+        ('analysis_results', make_analysis_rows(args.rows), legacy_analysis),
+    ]
+    for table_name, rows, legacy in cases:
+        serializer = RowSerializer(TABLE_SCHEMAS[table_name])
+        baseline = rows_per_second(legacy, rows, args.repeat)
+        compiled = rows_per_second(serializer.serialize, rows, args.repeat)
+        print(f"{table_name:<18} {'legacy':<10} {baseline:>12,.0f} {1.0:>7.2f}x")
+        print(f"{table_name:<18} {'compiled':<10} {compiled:>12,.0f} {compiled / baseline:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+커밋 스트림 쓰기 벤치마크
+
+로컬 가짜 Storage Write 서버(LocalWriteServer)에 행을 추가하며, 동시 요청 수
+(max_in_flight)에 따른 처리량과 실패 주입 시 재시도/중복 방지 결과를 측정합니다.
+
+사용법:
+    python benchmarks/bench_stream_writer.py [--rows 20000] [--rows-per-request 500]
+        [--latency-ms 20] [--in-flight 1,2,4,8,16] [--failure-rate 0.05]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Dict
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils.stream_writer import CommittedStreamWriter, LocalWriteServer
+
+TABLE_PATH = "projects/bench/datasets/bench/tables/competitor_data"
+
+
+def make_row(i: int) -> Dict:
+    """competitor_data 형태의 합성 행 (약 1KB)"""
+    return {
+        'id': f"row-{i}",
+        'competitor_name': f"competitor-{i % 20}",
+        'url': f"https://example{i % 20}.com/page/{i}",
+        'page_title': f"Page {i}",
+        'content': "pricing plan details " * 40,
+        'collected_at': "2024-01-01T10:00:00",
+        'content_hash': f"{i:032x}",
+    }
+
+
+def run(rows: int, rows_per_request: int, latency_seconds: float, max_in_flight: int,
+        failure_rate: float, seed: int = 0) -> Dict[str, float]:
+    """한 설정으로 행을 모두 쓰고 처리량/재시도/커밋 행 수를 반환"""
+    requests = -(-rows // rows_per_request)
+    rng = random.Random(seed)
+    # 재전송 요청도 순번을 받으므로 원래 요청 수의 범위 안에서만 실패 주입
+    failures = {
+        number: rng.choice(('before_commit', 'after_commit'))
+        for number in range(requests) if rng.random() < failure_rate
+    }
+    server = LocalWriteServer(latency_seconds=latency_seconds, failures=failures)
+    writer = CommittedStreamWriter(server, TABLE_PATH, max_in_flight=max_in_flight,
+                                   max_rows_per_request=rows_per_request, sleep=lambda _: None)
+
+    start = time.perf_counter()
+    for chunk_start in range(0, rows, rows_per_request):
+        writer.append_rows([make_row(i) for i in range(chunk_start, min(rows, chunk_start + rows_per_request))])
+    writer.close()
+    elapsed = time.perf_counter() - start
+
+    committed = server.streams[writer.stream_name]
+    server.close()
+    return {
+        'seconds': elapsed,
+        'rows_per_second': rows / elapsed,
+        'requests': server.requests,
+        'retries': writer.retries,
+        'duplicates_skipped': writer.duplicates_skipped,
+        'committed': len(committed),
+        'unique': len(set(committed)),
+        'max_concurrent': server.max_concurrent,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="커밋 스트림 쓰기 벤치마크")
+    parser.add_argument('--rows', type=int, default=20000, help="쓸 행 수")
+    parser.add_argument('--rows-per-request', type=int, default=500, help="요청당 행 수")
+    parser.add_argument('--latency-ms', type=float, default=20.0, help="요청 왕복 지연 (ms)")
+    parser.add_argument('--in-flight', default="1,2,4,8,16", help="비교할 max_in_flight 값 (쉼표 구분)")
+    parser.add_argument('--failure-rate', type=float, default=0.05,
+                        help="요청 실패 주입 비율 (커밋 전 실패/응답 유실 절반씩)")
+    args = parser.parse_args()
+
+    print(f"{'in-flight':>9} {'seconds':>9} {'rows/s':>10} {'requests':>9} {'retries':>8} "
+          f"{'dup skip':>9} {'committed':>10} {'unique':>8} {'max conc':>9}")
+    for max_in_flight in [int(value) for value in args.in_flight.split(',')]:
+        result = run(args.rows, args.rows_per_request, args.latency_ms / 1000,
+                     max_in_flight, args.failure_rate)
+        print(f"{max_in_flight:>9} {result['seconds']:>9.2f} {result['rows_per_second']:>10.0f} "
+              f"{result['requests']:>9} {result['retries']:>8} {result['duplicates_skipped']:>9} "
+              f"{result['committed']:>10} {result['unique']:>8} {result['max_concurrent']:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,28 +12,94 @@ DATASET_ID = "marketing_data"
 # BigQuery 테이블 설정
 COMPETITOR_DATA_TABLE = "competitor_data"
 ANALYSIS_RESULTS_TABLE = "analysis_results"
+CONTENT_BLOCKS_TABLE = "content_blocks"  # 블록 단위 저장: 본문 블록 (block_hash별 1행)
+PAGE_VERSIONS_TABLE = "page_versions"  # 블록 단위 저장: 버전 매니페스트 (block_hashes 순서)
+INCREMENTAL_CONTENT_STORAGE = os.getenv("INCREMENTAL_CONTENT_STORAGE", "false").lower() == "true"
+BIGQUERY_LOAD_JOB_THRESHOLD_BYTES = 4 * 1024 * 1024  # 이 크기(행 JSON 기준) 이상 배치는 스트리밍 삽입 대신 로드 작업
+BIGQUERY_LOAD_FILE_FORMAT = "parquet"  # 로드 파일 형식 ("parquet", pyarrow 미설치 시 gzip "ndjson")
+BIGQUERY_STORAGE_WRITE_API = os.getenv("BIGQUERY_STORAGE_WRITE_API", "false").lower() == "true"  # 삽입을 Storage Write API 커밋 스트림으로 (재시도 중복 없음)
+BIGQUERY_LOCAL_DIR = os.getenv("BIGQUERY_LOCAL_DIR")  # 설정 시 BigQuery 대신 로컬 대체 클라이언트에 저장 (오프라인 실행용)
+BIGQUERY_QUERY_CACHE_SIZE = 256  # 조회 결과 캐시 최대 항목 수 (0이면 캐시 사용 안 함)
+BIGQUERY_QUERY_CACHE_TTL_SECONDS = 300  # 조회 결과 캐시 유효 시간 (이 클라이언트의 삽입 시 해당 테이블 항목은 즉시 무효화)
+STREAM_BATCH_ROWS = 100  # 이 페이지 수가 모이면 중복 확인 후 BigQuery에 저장
+STREAM_FLUSH_SECONDS = 5  # 배치가 덜 찼더라도 첫 페이지 수집 후 이 시간이 지나면 저장
+STREAM_QUEUE_SIZE = 200  # 수집→저장 단계 사이 대기 페이지 수 상한 (초과 시 수집 대기)
 
 # Cloud Storage 설정
 BUCKET_NAME = f"{PROJECT_ID}-marketing-data"
 
 # 경쟁사 목록 (예시)
+# 선택 항목: "crawl": True이면 target_pages와 sitemap.xml에서 시작해 같은 사이트 링크를 탐색,
+#            "max_pages"로 해당 경쟁사의 MAX_PAGES_PER_SITE를 대체
 COMPETITORS = [
     {
         "name": "competitor_1",
         "url": "https://example1.com",
-        "target_pages": ["/products", "/pricing", "/about"]
+        "target_pages": ["/products", "/pricing", "/about"],
+        "rate_limit": {"requests_per_second": 1.0, "burst": 2}
     },
     {
         "name": "competitor_2", 
         "url": "https://example2.com",
-        "target_pages": ["/solutions", "/pricing", "/company"]
+        "target_pages": ["/solutions", "/pricing", "/company"],
+        "rate_limit": {"requests_per_second": 0.5, "burst": 1}
     }
 ]
 
 # 데이터 수집 설정
-COLLECTION_SCHEDULE = "0 9 * * *"  # 매일 오전 9시
-MAX_PAGES_PER_SITE = 10
-REQUEST_DELAY = 1  # 초 단위
+COLLECTION_SCHEDULE = "0 9 * * *"  # 매일 오전 9시 (실행마다 재수집 일정상 수집 시각이 된 페이지만 요청)
+RECRAWL_SCHEDULE_ENABLED = os.getenv("RECRAWL_SCHEDULE_ENABLED", "true").lower() == "true"
+RECRAWL_MIN_INTERVAL_HOURS = 20  # 최소 재수집 간격 (COLLECTION_SCHEDULE 주기보다 약간 짧게)
+RECRAWL_MAX_INTERVAL_HOURS = {0: 48, 1: 96, 2: 168, 3: 336}  # 페이지 우선순위별 최대 간격 (0 가격, 1 제품, 2 기타, 3 블로그)
+RECRAWL_HISTORY_DAYS = 90  # seed-schedule 명령이 변경 빈도 추정에 사용할 저장 이력 기간
+MAX_PAGES_PER_SITE = 10  # 크롤 모드("crawl": True) 사이트당 최대 수집 페이지 수
+REQUEST_DELAY = 1  # 초 단위 (rate_limit 설정이 없는 호스트의 요청 간격)
+REQUEST_TIMEOUT_SECONDS = 10  # 지연 시간 표본이 부족한 호스트의 요청 타임아웃 (이후 관측 p95 기반)
+REQUEST_MAX_RETRIES = 2  # 연결 오류/타임아웃/429·5xx 재시도 횟수 (지터 지수 백오프)
+CIRCUIT_BREAKER_FAILURES = 3  # 호스트 연속 실패가 이 횟수에 도달하면 남은 페이지를 건너뜀
+CIRCUIT_BREAKER_COOLDOWN_SECONDS = 300  # 서킷 브레이커 유지 시간
+SCRAPER_MODE = os.getenv("SCRAPER_MODE", "async")  # "async", "pipeline" 또는 "serial"
+MAX_CONCURRENT_REQUESTS = 10  # 비동기 모드 전체 동시 요청 수
+PIPELINE_FETCH_WORKERS = 8  # 파이프라인 모드 다운로드 스레드 수
+PIPELINE_PARSE_WORKERS = None  # 파이프라인 모드 추출 프로세스 수 (None이면 CPU 코어 수)
+PIPELINE_QUEUE_SIZE = 32  # 다운로드→추출 단계 사이 대기 작업 수 상한
+HTML_PARSER_BACKEND = os.getenv("HTML_PARSER_BACKEND", "stream")  # "html.parser", "lxml", "stream"
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 응답 본문 최대 크기 (초과 시 다운로드 중단)
+ALLOWED_CONTENT_TYPES = ["text/html", "application/xhtml+xml"]
+HTTP_POOL_CONNECTIONS = 32  # 공유 연결 풀을 유지할 호스트 수
+HTTP_POOL_MAXSIZE = 16  # 호스트당 keep-alive 연결 수 (MAX_CONCURRENT_REQUESTS 이상 권장)
+DNS_CACHE_TTL_SECONDS = 300  # 공유 DNS 캐시 유지 시간
+BANDWIDTH_BUDGET_BYTES = int(os.getenv("BANDWIDTH_BUDGET_BYTES", "0")) or None  # 실행당 전송량 예산 (wire 바이트, None이면 무제한)
+BANDWIDTH_DEFER_PRIORITY = 2  # 예산 소진 후 수집을 연기할 페이지 우선순위 (0 가격, 1 제품, 2 기타, 3 블로그)
+SIMHASH_SIMILARITY_THRESHOLD = 0.95  # 이 값 이상이면 같은 버전으로 간주 (64비트 중 3비트 이하 차이)
+# 근사 중복(SimHash) 페이지 저장 생략 여부 (기본 꺼짐)
+# 긴 페이지에서는 가격/요금제 이름/날짜처럼 토큰 하나만 바뀌어도 유사도가 1.0에 가까워
+# 실제 변경이 버려지므로, 배너/타임스탬프 변경이 잦은 사이트에서만 켭니다.
+NEAR_DUPLICATE_DEDUP_ENABLED = os.getenv("NEAR_DUPLICATE_DEDUP_ENABLED", "false").lower() == "true"
+
+# 로컬 상태 저장 설정
+LOCAL_STATE_DIR = os.getenv("MARKETING_AI_STATE_DIR", ".marketing_ai")
+HTTP_VALIDATOR_CACHE_PATH = os.path.join(LOCAL_STATE_DIR, "http_validators.json")
+SCRAPE_METRICS_PATH = os.path.join(LOCAL_STATE_DIR, "scrape_metrics.json")  # 마지막 실행의 단계별 지연 시간 요약
+RUN_JOURNAL_ENABLED = os.getenv("RUN_JOURNAL_ENABLED", "true").lower() == "true"
+RUN_JOURNAL_PATH = os.path.join(LOCAL_STATE_DIR, "run_journal.jsonl")  # 중단된 실행 재개용 완료 페이지 기록
+RUN_JOURNAL_MAX_AGE_HOURS = 24  # 이보다 오래된 저널은 재개하지 않고 폐기
+CONTENT_HASH_INDEX_ENABLED = os.getenv("CONTENT_HASH_INDEX_ENABLED", "true").lower() == "true"
+CONTENT_HASH_INDEX_PATH = os.path.join(LOCAL_STATE_DIR, "content_hashes.sqlite3")  # URL별 최신 지문 (BigQuery 조회 전 확인)
+RECRAWL_SCHEDULE_PATH = os.path.join(LOCAL_STATE_DIR, "recrawl_schedule.sqlite3")  # URL별 변경 빈도와 다음 수집 시각
+
+# 샤드 실행 설정 (여러 노드에 경쟁사를 나눠 수집, 기본값은 Cloud Run 작업 태스크 번호/수)
+SHARD_INDEX = int(os.getenv("SHARD_INDEX", os.getenv("CLOUD_RUN_TASK_INDEX", "0")))
+SHARD_COUNT = int(os.getenv("SHARD_COUNT", os.getenv("CLOUD_RUN_TASK_COUNT", "1")))
+RUN_ID = os.getenv("RUN_ID", os.getenv("CLOUD_RUN_EXECUTION", ""))  # 비어 있으면 실행 날짜(YYYYMMDD)
+RUN_SUMMARY_DIR = os.path.join(LOCAL_STATE_DIR, "run_summaries")  # 샤드별 실행 요약
+RUN_SUMMARY_UPLOAD = os.getenv("RUN_SUMMARY_UPLOAD", "false").lower() == "true"  # BUCKET_NAME에 업로드 (노드 간 공유)
+
+# 원본 응답 아카이브 설정 (재추출 및 벤치마크 고정 입력용)
+RESPONSE_ARCHIVE_ENABLED = os.getenv("RESPONSE_ARCHIVE_ENABLED", "false").lower() == "true"
+RESPONSE_ARCHIVE_DIR = os.getenv("RESPONSE_ARCHIVE_DIR", os.path.join(LOCAL_STATE_DIR, "archive"))
+RESPONSE_ARCHIVE_SEGMENT_BYTES = 64 * 1024 * 1024  # 세그먼트 교체 기준 (압축 후 크기)
+RESPONSE_ARCHIVE_UPLOAD = os.getenv("RESPONSE_ARCHIVE_UPLOAD", "false").lower() == "true"  # BUCKET_NAME에 업로드
 
 # 환경별 설정
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
@@ -10,6 +10,8 @@ from datetime import datetime, timedelta
 from dataclasses import dataclass
 import logging
 
+from src.utils.http_transport import mount_shared_adapter
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -52,6 +54,8 @@ class InstagramCollector:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
+        # 프로세스 전역 연결 풀/DNS 캐시 공유
+        mount_shared_adapter(self.session)
     
     def collect_user_posts(self, username: str, max_posts: int = 5) -> List[InstagramPost]:
         """사용자의 포스트를 수집합니다 (현재는 더미 데이터)"""
@@ -0,0 +1,304 @@
+"""
+원본 응답 아카이브 모듈
+내려받은 원본 응답을 WARC 형식과 유사한 gzip 세그먼트에 추가 전용으로 저장하고,
+네트워크 없이 아카이브에서 추출 로직을 다시 실행합니다.
+
+세그먼트 파일은 레코드마다 독립된 gzip 멤버를 이어 붙인 형태이므로
+`gzip.open`으로 순서대로 읽을 수 있고, 기록 도중 중단되어도 앞선 레코드는 유지됩니다.
+"""
+
+import gzip
+import logging
+import os
+import threading
+import uuid
+import zlib
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = '.warc.gz'
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024  # 세그먼트 교체 기준 (압축 후 크기)
+GCS_PREFIX = 'raw_responses'
+
+# 원본 응답에서 보존하는 HTTP 헤더
+ARCHIVED_HTTP_HEADERS = ('Content-Type', 'ETag', 'Last-Modified')
+
+
+class ResponseArchive:
+    """추가 전용 원본 응답 아카이브
+
+    실행마다 새 세그먼트 파일을 만들고, 세그먼트가 segment_max_bytes를 넘으면
+    다음 세그먼트로 교체합니다. bucket_name이 주어지면 close() 시 이번 실행에서
+    기록한 세그먼트를 Cloud Storage에 업로드합니다.
+    """
+
+    def __init__(self, directory: str, segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+                 bucket_name: Optional[str] = None, project_id: Optional[str] = None):
+        """
+        Args:
+            directory: 세그먼트 파일을 저장할 디렉터리
+            segment_max_bytes: 세그먼트 교체 기준 크기 (바이트)
+            bucket_name: 업로드 대상 Cloud Storage 버킷 (선택사항)
+            project_id: Cloud Storage 클라이언트 프로젝트 ID (선택사항)
+        """
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.bucket_name = bucket_name
+        self.project_id = project_id
+        self.written_segments: List[str] = []
+        self._run_id = f"{datetime.utcnow().strftime('%Y%m%dT%H%M%S')}-{os.getpid()}"
+        self._file = None
+        self._segment_bytes = 0
+        self._lock = threading.Lock()
+
+    def append(self, url: str, competitor_name: str, body: bytes,
+               headers: Optional[Dict[str, str]] = None, status_code: int = 200,
+               fetched_at: Optional[str] = None) -> None:
+        """
+        원본 응답 하나를 현재 세그먼트에 추가합니다.
+
+        Args:
+            url: 요청 URL
+            competitor_name: 경쟁사 이름
+            body: 응답 본문 바이트 (전송 인코딩 해제 후)
+            headers: 응답 헤더 (Content-Type, ETag, Last-Modified만 보존)
+            status_code: HTTP 상태 코드
+            fetched_at: 수집 시각 (ISO 8601, 기본: 현재 UTC)
+        """
+        record = gzip.compress(
+            build_record(url, competitor_name, body, headers or {}, status_code,
+                         fetched_at or datetime.utcnow().isoformat())
+        )
+
+        with self._lock:
+            if self._file is None or self._segment_bytes >= self.segment_max_bytes:
+                self._open_segment()
+            self._file.write(record)
+            self._file.flush()
+            self._segment_bytes += len(record)
+
+    def _open_segment(self) -> None:
+        """현재 세그먼트를 닫고 새 세그먼트 파일 생성"""
+        if self._file is not None:
+            self._file.close()
+
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(
+            self.directory,
+            f"responses-{self._run_id}-{len(self.written_segments):05d}{SEGMENT_SUFFIX}"
+        )
+        self._file = open(path, 'ab')
+        self._segment_bytes = 0
+        self.written_segments.append(path)
+
+    def close(self) -> bool:
+        """
+        세그먼트를 닫고, 버킷이 설정되어 있으면 업로드합니다.
+
+        Returns:
+            업로드 성공 여부 (버킷 미설정 시 True)
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        if not self.bucket_name or not self.written_segments:
+            return True
+        return self._upload_segments()
+
+    def _upload_segments(self) -> bool:
+        """이번 실행에서 기록한 세그먼트를 Cloud Storage에 업로드"""
+        try:
+            from google.cloud import storage
+
+            bucket = storage.Client(project=self.project_id).bucket(self.bucket_name)
+            for path in self.written_segments:
+                blob = bucket.blob(f"{GCS_PREFIX}/{os.path.basename(path)}")
+                blob.upload_from_filename(path)
+
+            logger.info(f"아카이브 업로드 완료: {len(self.written_segments)}개 세그먼트 → gs://{self.bucket_name}/{GCS_PREFIX}/")
+            return True
+
+        except Exception as e:
+            logger.error(f"아카이브 업로드 실패: {str(e)}")
+            return False
+
+
+def build_record(url: str, competitor_name: str, body: bytes, headers: Dict[str, str],
+                 status_code: int, fetched_at: str) -> bytes:
+    """WARC response 레코드 형식의 바이트열 생성 (HTTP 헤더 블록 + 본문)"""
+    http_lines = [f"HTTP/1.1 {status_code}"]
+    for name in ARCHIVED_HTTP_HEADERS:
+        if headers.get(name):
+            http_lines.append(f"{name}: {headers[name]}")
+    http_block = ("\r\n".join(http_lines) + "\r\n\r\n").encode('utf-8') + body
+
+    warc_headers = [
+        "WARC/1.0",
+        "WARC-Type: response",
+        f"WARC-Record-ID: <urn:uuid:{uuid.uuid4()}>",
+        f"WARC-Date: {fetched_at}",
+        f"WARC-Target-URI: {url}",
+        f"WARC-X-Competitor-Name: {competitor_name}",
+        "Content-Type: application/http; msgtype=response",
+        f"Content-Length: {len(http_block)}",
+    ]
+    return ("\r\n".join(warc_headers) + "\r\n\r\n").encode('utf-8') + http_block + b"\r\n\r\n"
+
+
+def list_segments(directory: str) -> List[str]:
+    """디렉터리의 세그먼트 파일 경로 목록 (이름순 = 기록 순)"""
+    if not os.path.isdir(directory):
+        return []
+    return sorted(
+        os.path.join(directory, name) for name in os.listdir(directory)
+        if name.endswith(SEGMENT_SUFFIX)
+    )
+
+
+def iter_records(path: str) -> Iterator[Dict]:
+    """
+    세그먼트 파일의 레코드를 순서대로 읽습니다.
+
+    마지막 레코드가 기록 도중 잘린 경우 해당 레코드는 건너뜁니다.
+
+    Yields:
+        url, competitor_name, fetched_at, status_code, headers, body 딕셔너리
+    """
+    with gzip.open(path, 'rb') as f:
+        while True:
+            try:
+                record = _read_record(f)
+            except (EOFError, zlib.error, ValueError) as e:
+                logger.warning(f"잘린 아카이브 레코드 무시 {path}: {str(e)}")
+                return
+            if record is None:
+                return
+            yield record
+
+
+def _read_record(f) -> Optional[Dict]:
+    """gzip 스트림에서 레코드 하나를 읽음 (스트림 끝이면 None)"""
+    warc_headers = _read_header_block(f)
+    if warc_headers is None:
+        return None
+
+    length = int(warc_headers['Content-Length'])
+    block = f.read(length)
+    if len(block) < length:
+        raise EOFError("레코드 본문이 잘렸습니다")
+    f.read(4)  # 레코드 끝 \r\n\r\n
+
+    http_head, _, body = block.partition(b"\r\n\r\n")
+    http_lines = http_head.decode('utf-8').split("\r\n")
+    headers = dict(line.split(': ', 1) for line in http_lines[1:] if ': ' in line)
+
+    return {
+        'url': warc_headers['WARC-Target-URI'],
+        'competitor_name': warc_headers.get('WARC-X-Competitor-Name', ''),
+        'fetched_at': warc_headers['WARC-Date'],
+        'status_code': int(http_lines[0].split()[1]),
+        'headers': headers,
+        'body': body,
+    }
+
+
+def _read_header_block(f) -> Optional[Dict[str, str]]:
+    """빈 줄까지 WARC 헤더를 읽어 딕셔너리로 반환"""
+    first_line = f.readline()
+    if not first_line:
+        return None
+    if not first_line.startswith(b"WARC/"):
+        raise ValueError("WARC 레코드 헤더가 아닙니다")
+
+    headers = {}
+    for line in iter(f.readline, b"\r\n"):
+        if not line:
+            raise EOFError("레코드 헤더가 잘렸습니다")
+        name, _, value = line.decode('utf-8').rstrip("\r\n").partition(': ')
+        headers[name] = value
+    return headers
+
+
+def iter_archive(directory: str) -> Iterator[Dict]:
+    """아카이브 디렉터리의 모든 레코드를 기록 순서대로 읽음"""
+    for path in list_segments(directory):
+        yield from iter_records(path)
+
+
+def reextract_archive(directory: str, backend: str, workers: Optional[int] = None,
+                      max_in_flight: int = 64,
+                      executor: Optional[ProcessPoolExecutor] = None) -> Iterator[Dict]:
+    """
+    아카이브의 원본 응답에 현재 추출 로직을 다시 실행합니다. (네트워크 사용 없음)
+
+    Args:
+        directory: 아카이브 디렉터리
+        backend: HTML 파서 백엔드
+        workers: 추출 프로세스 수 (기본: CPU 코어 수)
+        max_in_flight: 동시에 추출 중인 레코드 수 상한 (메모리 제한, 순서를 기다리는
+            결과까지 포함한 보관 수는 두 배까지)
+        executor: 외부에서 관리하는 추출 실행기 (테스트/재사용용, 선택사항)
+
+    Yields:
+        WebScraper 수집 결과와 같은 형식의 페이지 데이터 (collected_at은 원래 수집 시각)
+    """
+    # web_scraper가 이 모듈을 참조하므로 순환 import를 피해 함수 안에서 가져옴
+    from src.data_collection.web_scraper import WebScraper, parse_page_body
+
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+    max_in_flight = max(1, max_in_flight)
+    in_flight = threading.BoundedSemaphore(max_in_flight)
+    # 앞쪽 작업이 느리면 끝난 뒤쪽 결과가 쌓이므로, 순서 대기 중인 결과까지 포함해 제한
+    max_pending = max_in_flight * 2
+    pending: List[Tuple[Dict, Future]] = []
+
+    def drain(limit: int) -> Iterator[Dict]:
+        """완료된 앞쪽 결과를 내보내고, limit개 이상 남아 있으면 앞쪽 작업 완료를 기다림"""
+        while pending and (len(pending) >= limit or pending[0][1].done()):
+            record, future = pending.pop(0)
+            try:
+                fields = future.result()
+            except Exception as e:
+                logger.error(f"재추출 실패 {record['url']}: {str(e)}")
+                continue
+            yield _build_reextracted_page(record, fields)
+
+    try:
+        for record in iter_archive(directory):
+            if record['status_code'] != 200:
+                continue
+
+            in_flight.acquire()
+            encoding = WebScraper._charset_of(record['headers'].get('Content-Type', ''))
+            future = pool.submit(parse_page_body, record['body'], backend, encoding)
+            future.add_done_callback(lambda _: in_flight.release())
+            record['body'] = None  # 본문은 작업에 넘겼으므로 메타데이터만 보관
+            pending.append((record, future))
+
+            # 완료된 앞쪽 결과는 바로 내보내 기록 순서를 유지하면서 메모리를 제한
+            yield from drain(max_pending)
+
+        yield from drain(0)
+    finally:
+        if executor is None:
+            pool.shutdown(wait=True)
+
+
+def _build_reextracted_page(record: Dict, fields: Dict[str, str]) -> Dict:
+    """아카이브 레코드와 추출 결과로 페이지 데이터 생성"""
+    return {
+        'id': str(uuid.uuid4()),
+        'competitor_name': record['competitor_name'],
+        'url': record['url'],
+        'page_title': fields['page_title'],
+        'content': fields['content'],
+        'meta_description': fields['meta_description'],
+        'collected_at': record['fetched_at'],
+        'content_hash': fields['content_hash'],
+        'content_simhash': fields['content_simhash']
+    }
@@ -0,0 +1,129 @@
+"""
+비동기 웹 스크래핑 모듈
+여러 경쟁사 호스트의 페이지를 asyncio로 동시에 수집합니다.
+"""
+
+import asyncio
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional
+
+from src.data_collection.web_scraper import WebScraper
+from src.utils.http_transport import get_shared_adapter
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWebScraper(WebScraper):
+    """asyncio 기반 동시 스크래핑 클래스
+
+    요청/추출 로직은 WebScraper를 그대로 사용하고, 블로킹 요청은
+    워커 스레드에서 실행합니다. 전체 동시 요청 수는 max_concurrency로 제한되며,
+    요청 간격은 호스트별 속도 제한기로만 조절되므로 서로 다른 호스트의 요청은
+    서로를 기다리지 않습니다. 크롤 모드 사이트도 요청(페이지/sitemap) 하나마다
+    같은 상한의 슬롯을 점유합니다.
+
+    슬롯은 워커 스레드 안에서 획득하는 스레드 세마포어입니다. 이벤트 루프의
+    세마포어를 쥔 채 to_thread를 기다리면, 슬롯을 기다리는 크롤 스레드가 실행기
+    스레드를 모두 차지했을 때 슬롯을 가진 요청이 실행되지 못해 멈추기 때문입니다.
+    """
+
+    def __init__(self, delay: int = 1, max_concurrency: int = 10, **kwargs):
+        """
+        Args:
+            delay: 같은 호스트 요청 간 기본 지연 시간 (초)
+            max_concurrency: 전체 동시 요청 수 상한
+            **kwargs: WebScraper 생성자 옵션 (rate_limiter, validator_store 등)
+        """
+        super().__init__(delay=delay, **kwargs)
+        self.max_concurrency = max(1, max_concurrency)
+        # 전체 동시 요청 슬롯 (일반 페이지와 크롤 요청 모두 워커 스레드에서 획득)
+        self._fetch_slots = threading.BoundedSemaphore(self.max_concurrency)
+
+        # 공유 연결 풀이 호스트당 동시 요청 수보다 작으면 초과 연결은 재사용되지 않음
+        pool_maxsize = get_shared_adapter()._pool_maxsize
+        if pool_maxsize < self.max_concurrency:
+            logger.warning(
+                f"공유 연결 풀 크기({pool_maxsize})가 동시 요청 수({self.max_concurrency})보다 작습니다. "
+                "configure_shared_transport()로 pool_maxsize를 늘리세요."
+            )
+
+    async def scrape_many(self, competitors: List[Dict],
+                          on_page: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        여러 경쟁사의 페이지를 동시에 스크래핑합니다.
+
+        Args:
+            competitors: 경쟁사 설정 딕셔너리 리스트 (config.COMPETITORS 형식)
+            on_page: 페이지가 완료될 때마다 호출할 함수 (선택사항, 워커 스레드에서 호출되며
+                지정하면 결과를 모아 두지 않음)
+
+        Returns:
+            스크래핑된 데이터 리스트 (경쟁사 순서, target_pages 순서 유지,
+            on_page를 지정하면 빈 리스트)
+        """
+        tasks = []
+        for competitor in competitors:
+            self._configure_rate_limit(competitor)
+            if competitor.get('crawl'):
+                # 크롤 모드는 발견한 링크에 따라 다음 요청이 정해지므로 사이트 단위로 실행
+                tasks.append(self._crawl_async(competitor, on_page))
+                continue
+            for full_url in self._build_target_urls(competitor):
+                tasks.append(self._scrape_page_async(full_url, competitor['name'], on_page))
+
+        results = await asyncio.gather(*tasks)
+
+        pages = []
+        for result in results:
+            if isinstance(result, list):
+                pages.extend(result)
+            elif result:
+                pages.append(result)
+        return pages
+
+    @contextmanager
+    def _fetch_slot(self) -> Iterator[None]:
+        """워커 스레드의 요청 하나가 전체 동시 요청 슬롯을 점유합니다. (이벤트 루프에서 호출 금지)"""
+        with self._fetch_slots:
+            yield
+
+    def _fetch_page_in_slot(self, url: str, competitor_name: str) -> Optional[Dict]:
+        """동시 요청 슬롯 안에서 단일 페이지 요청 (워커 스레드에서 실행)"""
+        with self._fetch_slot():
+            return self._fetch_page_data(url, competitor_name)
+
+    async def _crawl_async(self, competitor: Dict,
+                           on_page: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """크롤 모드 경쟁사를 워커 스레드에서 수집 (다른 사이트와 동시에 진행, 요청마다 _fetch_slot 점유)"""
+        try:
+            pages = await asyncio.to_thread(self.scrape_competitor, competitor)
+        except Exception as e:
+            logger.error(f"경쟁사 '{competitor['name']}' 크롤링 실패: {str(e)}")
+            return []
+
+        if on_page is None:
+            return pages
+        for page in pages:
+            await asyncio.to_thread(on_page, page)
+        return []
+
+    async def _scrape_page_async(self, url: str, competitor_name: str,
+                                 on_page: Optional[Callable[[Dict], None]] = None) -> Optional[Dict]:
+        """호스트 속도 제한을 통과한 뒤 동시성 상한 안에서 단일 페이지 수집"""
+        page = self.journaled_page(url, competitor_name)
+        if page is None:
+            if self._skip_not_due(url) or self._skip_unavailable_host(url):
+                return None
+
+            # 대기 중에는 동시성 슬롯을 점유하지 않도록 속도 제한을 먼저 통과
+            await self.rate_limiter.acquire_async(url)
+
+            page = await asyncio.to_thread(self._fetch_page_in_slot, url, competitor_name)
+
+        if page is None or on_page is None:
+            return page
+        # 소비자가 밀리면(버퍼 적재 중) 이벤트 루프를 막지 않고 워커 스레드에서 대기
+        await asyncio.to_thread(on_page, page)
+        return None
@@ -0,0 +1,172 @@
+"""
+블록 단위 콘텐츠 저장 모듈
+페이지 본문을 블록으로 나눠 블록별 해시를 계산하고, 새 블록과 버전 매니페스트만
+저장하도록 행을 구성합니다. 저장된 매니페스트와 블록으로 본문을 복원할 수 있습니다.
+
+저장되는 content는 공백이 정리된 한 줄 텍스트이므로 HTML 구조(문단 경계)가
+남아 있지 않습니다. 대신 문장 끝을 후보 경계로 삼고, 문장 해시로 블록 경계를
+정하는 내용 기반 분할을 사용합니다. 경계가 위치가 아닌 내용으로 정해지므로
+문장 하나가 바뀌거나 추가되어도 해당 블록만 달라지고 나머지 블록은 그대로 재사용됩니다.
+"""
+
+import hashlib
+import re
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 문장 끝 (구두점 뒤 공백까지 앞 문장에 포함)
+_SENTENCE_END = re.compile(r'[.!?。！？]+\s+')
+
+BLOCK_BOUNDARY_MODULUS = 4  # 문장 해시가 이 값으로 나누어떨어지면 블록 종료 (평균 4문장)
+MAX_BLOCK_CHARS = 1000  # 블록 최대 길이 (문장이 길면 이 길이로 자름)
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    텍스트를 문장 조각으로 나눕니다.
+
+    ''.join(결과)는 원래 텍스트와 같습니다.
+    """
+    sentences = []
+    start = 0
+    for match in _SENTENCE_END.finditer(text):
+        sentences.append(text[start:match.end()])
+        start = match.end()
+    if start < len(text):
+        sentences.append(text[start:])
+    return sentences
+
+
+def split_blocks(text: str, boundary_modulus: int = BLOCK_BOUNDARY_MODULUS,
+                 max_block_chars: int = MAX_BLOCK_CHARS) -> List[str]:
+    """
+    텍스트를 내용 기반 경계로 블록 리스트로 나눕니다.
+
+    ''.join(결과)는 원래 텍스트와 같습니다.
+
+    Args:
+        text: 페이지 본문
+        boundary_modulus: 문장 해시가 이 값으로 나누어떨어지는 문장 뒤에서 블록을 끝냄
+        max_block_chars: 블록 최대 길이
+
+    Returns:
+        블록 문자열 리스트
+    """
+    blocks = []
+    current = ""
+    for sentence in split_sentences(text):
+        while len(sentence) > max_block_chars:
+            if current:
+                blocks.append(current)
+                current = ""
+            blocks.append(sentence[:max_block_chars])
+            sentence = sentence[max_block_chars:]
+
+        if current and len(current) + len(sentence) > max_block_chars:
+            blocks.append(current)
+            current = ""
+        current += sentence
+
+        if _is_boundary(sentence, boundary_modulus):
+            blocks.append(current)
+            current = ""
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def _is_boundary(sentence: str, boundary_modulus: int) -> bool:
+    """문장 뒤가 블록 경계인지 여부 (앞뒤 공백은 무시)"""
+    digest = hashlib.md5(sentence.strip().encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') % max(1, boundary_modulus) == 0
+
+
+def generate_block_hash(block: str) -> str:
+    """블록 해시 생성 (MD5, content_hash와 같은 형식)"""
+    return hashlib.md5(block.encode('utf-8')).hexdigest()
+
+
+def build_page_version(page: Dict) -> Tuple[Dict, Dict[str, str]]:
+    """
+    수집된 페이지를 버전 매니페스트 행과 블록으로 변환합니다.
+
+    Args:
+        page: WebScraper가 만든 페이지 데이터 딕셔너리
+
+    Returns:
+        (page_versions 행, {block_hash: 블록 텍스트})
+    """
+    blocks = {}
+    block_hashes = []
+    for block in split_blocks(page['content'] or ""):
+        block_hash = generate_block_hash(block)
+        blocks[block_hash] = block
+        block_hashes.append(block_hash)
+
+    version = {
+        'id': page['id'],
+        'competitor_name': page['competitor_name'],
+        'url': page['url'],
+        'page_title': page['page_title'],
+        'meta_description': page['meta_description'],
+        'collected_at': page['collected_at'],
+        'content_hash': page['content_hash'],
+        'content_simhash': page.get('content_simhash'),
+        'content_length': len(page['content'] or ""),
+        'block_hashes': block_hashes
+    }
+    return version, blocks
+
+
+def collect_block_hashes(pages: Iterable[Dict]) -> List[str]:
+    """페이지들의 블록 해시 목록 (중복 제거, 순서 유지)"""
+    hashes = {}
+    for page in pages:
+        for block in split_blocks(page['content'] or ""):
+            hashes.setdefault(generate_block_hash(block), None)
+    return list(hashes)
+
+
+def plan_incremental_rows(pages: List[Dict], existing_hashes: Set[str],
+                          created_at: str) -> Tuple[List[Dict], List[Dict]]:
+    """
+    저장할 새 블록 행과 버전 매니페스트 행을 구성합니다.
+
+    Args:
+        pages: 수집된 페이지 데이터 리스트
+        existing_hashes: 이미 저장된 블록 해시 집합
+        created_at: 새 블록의 생성 시각 (ISO 형식)
+
+    Returns:
+        (content_blocks 행 리스트, page_versions 행 리스트)
+    """
+    block_rows = []
+    version_rows = []
+    seen = set(existing_hashes)
+
+    for page in pages:
+        version, blocks = build_page_version(page)
+        version_rows.append(version)
+        for block_hash, block in blocks.items():
+            if block_hash in seen:
+                continue
+            seen.add(block_hash)
+            block_rows.append({
+                'block_hash': block_hash,
+                'content': block,
+                'content_length': len(block),
+                'created_at': created_at
+            })
+
+    return block_rows, version_rows
+
+
+def reconstruct_content(block_hashes: List[str], blocks: Dict[str, str]) -> Optional[str]:
+    """
+    매니페스트의 블록 해시 순서대로 본문을 복원합니다.
+
+    Returns:
+        복원된 본문 (블록이 하나라도 없으면 None)
+    """
+    if any(block_hash not in blocks for block_hash in block_hashes):
+        return None
+    return ''.join(blocks[block_hash] for block_hash in block_hashes)
@@ -0,0 +1,322 @@
+"""
+링크 탐색 크롤러 모듈
+target_pages와 sitemap.xml에서 시작해 같은 사이트의 링크를 따라가며
+MAX_PAGES_PER_SITE 범위 안에서 우선순위가 높은 페이지부터 수집합니다.
+"""
+
+import hashlib
+import heapq
+import logging
+import math
+import re
+from contextlib import closing
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlsplit, urlunsplit
+from xml.etree.ElementTree import Element
+
+from defusedxml.ElementTree import fromstring as parse_xml
+
+logger = logging.getLogger(__name__)
+
+# 경로 키워드별 우선순위 (값이 작을수록 먼저 수집)
+PRIORITY_PATTERNS: List[Tuple[int, re.Pattern]] = [
+    (0, re.compile(r'pric|plan|subscri|billing|요금|가격')),
+    (1, re.compile(r'product|solution|feature|service|platform|제품|서비스')),
+    (3, re.compile(r'blog|news|press|career|job|legal|privacy|terms|cookie')),
+]
+DEFAULT_PRIORITY = 2
+SEED_PRIORITY = -1  # target_pages 시작 페이지
+
+# 수집하지 않는 파일 확장자
+SKIPPED_EXTENSIONS = frozenset([
+    'pdf', 'jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'ico', 'css', 'js', 'json',
+    'xml', 'zip', 'gz', 'mp4', 'mp3', 'woff', 'woff2', 'ttf', 'doc', 'docx', 'xls', 'xlsx'
+])
+
+# 정규화 시 제거하는 추적용 쿼리 파라미터
+TRACKING_PARAMS = frozenset(['gclid', 'fbclid', 'msclkid', 'mc_cid', 'mc_eid', 'ref'])
+
+MAX_SITEMAPS = 5  # sitemap index에서 따라갈 하위 sitemap 수
+
+
+def page_priority(url: str) -> int:
+    """URL 경로 키워드로 수집 우선순위 계산 (작을수록 우선)"""
+    path = urlsplit(url).path.lower()
+    for priority, pattern in PRIORITY_PATTERNS:
+        if pattern.search(path):
+            return priority
+    return DEFAULT_PRIORITY
+
+
+def normalize_url(url: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    URL을 정규화합니다.
+
+    상대 경로 해석, 스킴/호스트 소문자화, 기본 포트/프래그먼트/추적 파라미터 제거,
+    쿼리 파라미터 정렬을 수행합니다.
+
+    Args:
+        url: 원본 URL 또는 상대 경로
+        base_url: 상대 경로 해석 기준 URL
+
+    Returns:
+        정규화된 URL (http/https가 아니면 None)
+    """
+    url = url.strip()
+    if base_url:
+        url = urljoin(base_url, url)
+
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in ('http', 'https') or not parts.hostname:
+        return None
+
+    host = parts.hostname.lower()
+    if parts.port and not (scheme == 'http' and parts.port == 80) \
+            and not (scheme == 'https' and parts.port == 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r'/{2,}', '/', parts.path) or '/'
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+
+    return urlunsplit((scheme, host, path, query, ''))
+
+
+def site_key(url: str) -> str:
+    """같은 사이트 판별용 호스트 키 (www. 접두어 무시)"""
+    host = (urlsplit(url).hostname or '').lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+class BloomFilter:
+    """방문 URL 추적용 블룸 필터
+
+    거짓 양성(방문하지 않은 URL을 방문했다고 판단)은 error_rate 확률로 발생하지만
+    거짓 음성은 없으므로, 같은 URL을 두 번 수집하지 않습니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 예상 최대 원소 수
+            error_rate: 목표 거짓 양성 확률
+        """
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'big')
+        second = int.from_bytes(digest[8:], 'big') | 1
+        return ((first + i * second) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str) -> bool:
+        """
+        원소를 추가합니다.
+
+        Returns:
+            새로 추가되었으면 True, 이미 있었으면(또는 거짓 양성이면) False
+        """
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(item)
+        )
+
+
+class CrawlFrontier:
+    """우선순위 크롤 대기열
+
+    (우선순위, 깊이, 발견 순서)로 정렬하며, 한 번 넣은 URL은 블룸 필터로 걸러
+    다시 넣지 않습니다. 대기열 크기는 max_size로 제한됩니다.
+    """
+
+    def __init__(self, max_size: int, expected_urls: int):
+        """
+        Args:
+            max_size: 대기열 최대 크기
+            expected_urls: 블룸 필터 용량 (발견될 것으로 예상되는 URL 수)
+        """
+        self.max_size = max(1, max_size)
+        self.seen = BloomFilter(expected_urls)
+        self._heap: List[Tuple[int, int, int, str]] = []
+        self._sequence = 0
+
+    def push(self, url: str, depth: int, priority: Optional[int] = None) -> bool:
+        """URL을 대기열에 추가 (이미 본 URL이거나 대기열이 가득 차면 False)
+
+        priority를 지정하지 않으면 page_priority(url)를 사용합니다.
+        """
+        if url in self.seen or len(self._heap) >= self.max_size:
+            return False
+
+        if priority is None:
+            priority = page_priority(url)
+        self.seen.add(url)
+        heapq.heappush(self._heap, (priority, depth, self._sequence, url))
+        self._sequence += 1
+        return True
+
+    def pop(self) -> Optional[Tuple[str, int]]:
+        """가장 우선순위가 높은 (URL, 깊이) 반환 (비어 있으면 None)"""
+        if not self._heap:
+            return None
+        _, depth, _, url = heapq.heappop(self._heap)
+        return url, depth
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class SiteCrawler:
+    """경쟁사 사이트 링크 탐색 크롤러"""
+
+    def __init__(self, scraper, max_pages: int = 10, max_depth: int = 3):
+        """
+        Args:
+            scraper: 요청/추출에 사용할 WebScraper
+            max_pages: 사이트당 최대 수집 페이지 수
+            max_depth: 시작 페이지로부터 따라갈 최대 링크 깊이
+        """
+        self.scraper = scraper
+        self.max_pages = max(1, max_pages)
+        self.max_depth = max_depth
+
+    def crawl(self, competitor_config: Dict) -> List[Dict]:
+        """
+        target_pages와 sitemap.xml에서 시작해 같은 사이트 페이지를 수집합니다.
+
+        Args:
+            competitor_config: 경쟁사 설정 딕셔너리
+
+        Returns:
+            스크래핑된 데이터 리스트 (최대 max_pages개)
+        """
+        competitor_name = competitor_config['name']
+        base_url = competitor_config['url']
+        site = site_key(base_url)
+
+        frontier = CrawlFrontier(
+            max_size=self.max_pages * 50,
+            expected_urls=self.max_pages * 100
+        )
+        # 직접 지정한 target_pages는 발견한 페이지보다 항상 먼저 수집
+        for seed in self.scraper._build_target_urls(competitor_config):
+            normalized = normalize_url(seed)
+            if normalized:
+                frontier.push(normalized, 0, priority=SEED_PRIORITY)
+        for loc in self._sitemap_urls(base_url):
+            normalized = normalize_url(loc)
+            if normalized and self._is_crawlable(normalized, site):
+                frontier.push(normalized, 1)
+
+        results = []
+        attempts = 0
+        while len(frontier) and attempts < self.max_pages:
+            url, depth = frontier.pop()
+            attempts += 1
+
+            # 이전 실행에서 완료된 페이지는 기록된 링크로 대기열만 다시 구성
+            page_data = self.scraper.journaled_page(url, competitor_name, collect_links=True)
+            if page_data is None:
+                # 시작 페이지는 링크 발견을 위해 항상 수집하고, 발견한 페이지는 재수집 일정을 따름
+                # (수집 시각 전인 페이지는 상한에 포함하지 않음)
+                if depth > 0 and self.scraper._skip_not_due(url):
+                    attempts -= 1
+                    continue
+                # 서킷 브레이커가 열린 호스트는 속도 제한 대기 없이 건너뜀
+                if self.scraper._skip_unavailable_host(url):
+                    continue
+                self.scraper.rate_limiter.acquire(url)
+                with self.scraper._fetch_slot():
+                    page_data = self.scraper._fetch_page_data(url, competitor_name, collect_links=True)
+            if not page_data:
+                continue
+
+            # 304 응답은 본문이 없으므로 새 링크를 발견하지 않음
+            links = page_data.pop('links', [])
+            results.append(page_data)
+
+            if depth >= self.max_depth:
+                continue
+            for href in links:
+                normalized = normalize_url(href, base_url=url)
+                if normalized and self._is_crawlable(normalized, site):
+                    frontier.push(normalized, depth + 1)
+
+        logger.info(f"크롤링 완료 '{competitor_name}': {len(results)}개 페이지, 대기열 {len(frontier)}개 남음")
+        return results
+
+    @staticmethod
+    def _is_crawlable(url: str, site: str) -> bool:
+        """같은 사이트의 HTML 페이지로 보이는 URL인지 여부"""
+        if site_key(url) != site:
+            return False
+        last_segment = urlsplit(url).path.rsplit('/', 1)[-1]
+        extension = last_segment.rsplit('.', 1)[-1].lower() if '.' in last_segment else ''
+        return extension not in SKIPPED_EXTENSIONS
+
+    def _sitemap_urls(self, base_url: str) -> List[str]:
+        """sitemap.xml(및 sitemap index 하위 sitemap)의 페이지 URL 목록"""
+        sitemap_queue = [base_url.rstrip('/') + '/sitemap.xml']
+        page_urls: List[str] = []
+        fetched = 0
+
+        while sitemap_queue and fetched < MAX_SITEMAPS:
+            sitemap_url = sitemap_queue.pop(0)
+            fetched += 1
+            root = self._fetch_sitemap(sitemap_url)
+            if root is None:
+                continue
+
+            locs = [el.text.strip() for el in root.iter() if el.tag.endswith('loc') and el.text]
+            if root.tag.endswith('sitemapindex'):
+                sitemap_queue.extend(locs)
+            else:
+                page_urls.extend(locs)
+
+        return page_urls
+
+    def _fetch_sitemap(self, sitemap_url: str) -> Optional[Element]:
+        """
+        sitemap XML을 내려받아 파싱합니다. (실패 시 None)
+
+        페이지와 같은 요청 경로(속도 제한, 호스트별 적응형 타임아웃/서킷 브레이커,
+        재시도, 전송량 기록)를 사용하고, 외부 엔티티/엔티티 확장은 defusedxml로 거부합니다.
+        """
+        if self.scraper._skip_unavailable_host(sitemap_url):
+            return None
+
+        try:
+            self.scraper.rate_limiter.acquire(sitemap_url)
+            with self.scraper._fetch_slot():
+                response = self.scraper._request(sitemap_url)
+                try:
+                    if response.status_code != 200:
+                        return None
+                    host = urlsplit(sitemap_url).hostname or ''
+                    with closing(self.scraper._iter_body(response, host)) as chunks:
+                        body = b''.join(chunks)
+                finally:
+                    response.close()
+            return parse_xml(body)
+
+        except Exception as e:
+            logger.warning(f"sitemap 조회 실패 {sitemap_url}: {str(e)}")
+            return None
@@ -0,0 +1,71 @@
+"""
+콘텐츠 유사도 지문 모듈
+SimHash로 페이지 텍스트의 근사 중복 여부를 판단합니다.
+
+content_hash(MD5)는 한 글자만 달라도 바뀌지만, SimHash는 배너/타임스탬프/
+토큰처럼 작은 변경에는 몇 비트만 달라지므로 해밍 거리로 "실질적 변경"을 판별할 수 있습니다.
+"""
+
+import hashlib
+import re
+from typing import List, Optional
+
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3  # 단어 n-gram 크기
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def _shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """텍스트를 소문자 단어 n-gram 목록으로 변환"""
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return [' '.join(tokens)] if tokens else []
+    return [' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1)]
+
+
+def compute_simhash(text: str) -> str:
+    """
+    텍스트의 64비트 SimHash를 계산합니다.
+
+    Args:
+        text: 지문을 만들 텍스트 (제목 + 본문)
+
+    Returns:
+        16자리 16진수 문자열 (BigQuery STRING 컬럼에 저장)
+    """
+    weights = [0] * SIMHASH_BITS
+
+    for shingle in _shingles(text):
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big'
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+
+    return f"{fingerprint:016x}"
+
+
+def simhash_similarity(first: Optional[str], second: Optional[str]) -> float:
+    """
+    두 SimHash의 유사도를 반환합니다. (1 - 해밍 거리 / 64)
+
+    Returns:
+        0.0 ~ 1.0 사이 유사도 (어느 한쪽이 없으면 0.0)
+    """
+    if not first or not second:
+        return 0.0
+
+    distance = bin(int(first, 16) ^ int(second, 16)).count('1')
+    return 1.0 - distance / SIMHASH_BITS
+
+
+def is_near_duplicate(first: Optional[str], second: Optional[str],
+                      threshold: float) -> bool:
+    """두 SimHash의 유사도가 임계값 이상인지 여부"""
+    return simhash_similarity(first, second) >= threshold
@@ -0,0 +1,169 @@
+"""
+로컬 콘텐츠 해시 인덱스 모듈
+(경쟁사 이름, URL)별 최신 content_hash / content_simhash / collected_at을 로컬 SQLite에
+보관하여, 변경 여부 판단에 BigQuery 조회가 필요 없도록 합니다.
+
+인덱스는 BigQuery 저장 결과의 캐시이며, reconcile 명령으로 언제든 웨어하우스에서
+다시 만들 수 있습니다.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# SQLite 변수 개수 제한(기본 999) 안에서 한 번에 조회할 쌍 수
+LOOKUP_BATCH_SIZE = 400
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS page_hashes (
+    competitor_name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    content_simhash TEXT,
+    collected_at TEXT,
+    PRIMARY KEY (competitor_name, url)
+) WITHOUT ROWID
+"""
+
+# 더 오래된 수집 결과가 최신 값을 덮어쓰지 않도록 collected_at을 비교
+_UPSERT = """
+INSERT INTO page_hashes (competitor_name, url, content_hash, content_simhash, collected_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (competitor_name, url) DO UPDATE SET
+    content_hash = excluded.content_hash,
+    content_simhash = excluded.content_simhash,
+    collected_at = excluded.collected_at
+WHERE excluded.collected_at IS NULL
+   OR page_hashes.collected_at IS NULL
+   OR excluded.collected_at >= page_hashes.collected_at
+"""
+
+
+class ContentHashIndex:
+    """(경쟁사 이름, URL) → 최신 지문 로컬 인덱스 (SQLite, 스레드 안전)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite 파일 경로
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    def get(self, competitor_name: str, url: str) -> Optional[Dict[str, str]]:
+        """URL의 최신 지문 (없으면 None)"""
+        return self.get_many([(competitor_name, url)]).get((competitor_name, url))
+
+    def get_many(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, str]]:
+        """
+        여러 (경쟁사 이름, URL) 쌍의 최신 지문을 조회합니다.
+
+        Returns:
+            {(competitor_name, url): {'content_hash', 'content_simhash', 'collected_at'}}
+            (인덱스에 없는 쌍은 포함되지 않음)
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        found: Dict[Tuple[str, str], Dict[str, str]] = {}
+
+        with self._lock:
+            for start in range(0, len(unique_pairs), LOOKUP_BATCH_SIZE):
+                batch = unique_pairs[start:start + LOOKUP_BATCH_SIZE]
+                conditions = " OR ".join(["(competitor_name = ? AND url = ?)"] * len(batch))
+                params = [value for pair in batch for value in pair]
+                rows = self._conn.execute(
+                    "SELECT competitor_name, url, content_hash, content_simhash, collected_at "
+                    f"FROM page_hashes WHERE {conditions}",
+                    params
+                )
+                for row in rows:
+                    found[(row['competitor_name'], row['url'])] = {
+                        'content_hash': row['content_hash'],
+                        'content_simhash': row['content_simhash'] or "",
+                        'collected_at': row['collected_at'] or "",
+                    }
+        return found
+
+    def update(self, rows: Iterable[Dict]) -> int:
+        """
+        저장된 페이지의 지문을 반영합니다. (기존 값보다 오래된 행은 무시)
+
+        Args:
+            rows: competitor_name, url, content_hash, content_simhash, collected_at 키를 가진 행
+
+        Returns:
+            반영을 시도한 행 수
+        """
+        values = [self._row_values(row) for row in rows]
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT, values)
+        return len(values)
+
+    def replace_all(self, rows: Iterable[Dict]) -> int:
+        """
+        인덱스 전체를 주어진 행으로 교체합니다. (reconcile용, 단일 트랜잭션)
+
+        Returns:
+            저장된 행 수
+        """
+        values = [self._row_values(row) for row in rows]
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM page_hashes")
+            self._conn.executemany(_UPSERT, values)
+        return len(values)
+
+    def count(self) -> int:
+        """인덱스 항목 수"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM page_hashes").fetchone()[0]
+
+    def close(self) -> None:
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+    @staticmethod
+    def _row_values(row: Dict) -> Tuple:
+        collected_at = row.get('collected_at')
+        if collected_at is not None and not isinstance(collected_at, str):
+            # BigQuery TIMESTAMP는 datetime으로 반환됨
+            collected_at = collected_at.isoformat()
+        return (
+            row['competitor_name'],
+            row['url'],
+            row['content_hash'] or "",
+            row.get('content_simhash') or None,
+            collected_at,
+        )
+
+
+def split_by_index(index: Optional[ContentHashIndex], pairs: List[Tuple[str, str]]
+                   ) -> Tuple[Dict[Tuple[str, str], Dict[str, str]], List[Tuple[str, str]]]:
+    """
+    인덱스에서 찾은 지문과 인덱스에 없는 쌍을 나눕니다.
+
+    Returns:
+        (인덱스에서 찾은 지문, BigQuery에서 조회해야 할 쌍 리스트)
+    """
+    if index is None:
+        return {}, list(dict.fromkeys(pairs))
+
+    try:
+        found = index.get_many(pairs)
+    except sqlite3.Error as e:
+        logger.error(f"해시 인덱스 조회 실패: {str(e)}")
+        return {}, list(dict.fromkeys(pairs))
+
+    return found, [pair for pair in dict.fromkeys(pairs) if pair not in found]
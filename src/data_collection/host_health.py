@@ -0,0 +1,189 @@
+"""
+호스트 상태 추적 모듈
+호스트별 응답 지연 시간으로 요청 타임아웃을 정하고, 연속 실패한 호스트는
+서킷 브레이커로 일정 시간 동안 요청하지 않습니다.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 10.0  # 지연 시간 표본이 부족한 호스트의 타임아웃
+MIN_TIMEOUT_SECONDS = 2.0
+MAX_TIMEOUT_SECONDS = 30.0
+TIMEOUT_PERCENTILE = 0.95
+TIMEOUT_MULTIPLIER = 4.0  # 관측된 p95 지연 시간의 몇 배까지 기다릴지
+MIN_LATENCY_SAMPLES = 5
+LATENCY_WINDOW = 50  # 호스트별로 유지할 최근 지연 시간 표본 수
+
+DEFAULT_FAILURE_THRESHOLD = 3  # 연속 실패가 이 횟수에 도달하면 서킷 브레이커 열림
+DEFAULT_COOLDOWN_SECONDS = 300.0
+
+# 재시도 대상 HTTP 상태 코드 (서버 과부하/일시 장애)
+RETRYABLE_STATUS_CODES = frozenset([429, 500, 502, 503, 504])
+DEFAULT_BACKOFF_BASE_SECONDS = 0.5
+DEFAULT_BACKOFF_MAX_SECONDS = 8.0
+
+
+def backoff_delay(attempt: int, base_seconds: float = DEFAULT_BACKOFF_BASE_SECONDS,
+                  max_seconds: float = DEFAULT_BACKOFF_MAX_SECONDS) -> float:
+    """
+    지터를 적용한 지수 백오프 대기 시간 (0 ~ min(max, base * 2^attempt) 균등 분포)
+
+    여러 작업이 같은 호스트에서 동시에 실패해도 재시도 시점이 흩어지도록
+    전체 구간에서 무작위로 고릅니다.
+
+    Args:
+        attempt: 0부터 시작하는 재시도 순번
+    """
+    return random.uniform(0, min(max_seconds, base_seconds * (2 ** attempt)))
+
+
+class _HostState:
+    """호스트 하나의 지연 시간 표본과 서킷 브레이커 상태"""
+
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.consecutive_failures = 0
+        self.open_until = 0.0
+        self.failures = 0
+        self.skipped = 0
+        self.trips = 0
+
+
+class HostHealth:
+    """호스트별 적응형 타임아웃과 서킷 브레이커 (스레드 안전)
+
+    연속 실패가 failure_threshold에 도달하면 cooldown_seconds 동안 해당 호스트를
+    사용할 수 없는 상태로 둡니다. 대기 시간이 지나면 다시 요청을 허용하고,
+    그 요청이 실패하면 곧바로 다시 열리며 성공하면 실패 횟수가 초기화됩니다.
+    """
+
+    def __init__(self, default_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                 min_timeout: float = MIN_TIMEOUT_SECONDS,
+                 max_timeout: float = MAX_TIMEOUT_SECONDS,
+                 failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+                 cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            default_timeout: 표본이 부족한 호스트의 타임아웃 (초)
+            min_timeout: 적응형 타임아웃 하한 (초)
+            max_timeout: 적응형 타임아웃 상한 (초)
+            failure_threshold: 서킷 브레이커를 여는 연속 실패 횟수
+            cooldown_seconds: 서킷 브레이커가 열려 있는 시간 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max(min_timeout, max_timeout)
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host_of(url: str) -> str:
+        return (urlsplit(url).hostname or '').lower()
+
+    def _state(self, url: str) -> _HostState:
+        host = self._host_of(url)
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState()
+        return state
+
+    def timeout_for(self, url: str) -> float:
+        """
+        호스트의 요청 타임아웃 (초)
+
+        최근 응답 지연 시간의 p95 × TIMEOUT_MULTIPLIER를 [min_timeout, max_timeout]
+        범위로 제한한 값이며, 표본이 MIN_LATENCY_SAMPLES보다 적으면 default_timeout입니다.
+        """
+        with self._lock:
+            return self._timeout_of(self._state(url))
+
+    def _timeout_of(self, state: _HostState) -> float:
+        samples = sorted(state.latencies)
+        if len(samples) < MIN_LATENCY_SAMPLES:
+            return self.default_timeout
+
+        p95 = samples[min(len(samples) - 1, int(TIMEOUT_PERCENTILE * len(samples)))]
+        return min(self.max_timeout, max(self.min_timeout, p95 * TIMEOUT_MULTIPLIER))
+
+    def is_available(self, url: str) -> bool:
+        """서킷 브레이커가 닫혀 있거나 대기 시간이 지났는지 여부"""
+        with self._lock:
+            return self._clock() >= self._state(url).open_until
+
+    def record_success(self, url: str, seconds: float) -> None:
+        """응답 수신 성공과 지연 시간 기록 (연속 실패 초기화)"""
+        with self._lock:
+            state = self._state(url)
+            state.latencies.append(max(0.0, seconds))
+            state.consecutive_failures = 0
+            state.open_until = 0.0
+
+    def record_failure(self, url: str) -> bool:
+        """
+        일시적 실패(연결 오류, 타임아웃, 재시도 대상 상태 코드)를 기록합니다.
+
+        Returns:
+            이번 실패로 서킷 브레이커가 열렸는지 여부
+        """
+        with self._lock:
+            state = self._state(url)
+            state.failures += 1
+            state.consecutive_failures += 1
+            if state.consecutive_failures < self.failure_threshold:
+                return False
+            state.open_until = self._clock() + self.cooldown_seconds
+            state.trips += 1
+
+        logger.warning(f"서킷 브레이커 열림 ({self.cooldown_seconds:.0f}초): {self._host_of(url)}")
+        return True
+
+    def record_skipped(self, url: str) -> None:
+        """서킷 브레이커로 건너뛴 요청 기록"""
+        with self._lock:
+            self._state(url).skipped += 1
+
+    def summary(self) -> Dict[str, Dict]:
+        """
+        호스트별 상태 요약을 반환합니다.
+
+        Returns:
+            {host: {timeout_seconds, samples, failures, trips, skipped, open}}
+        """
+        with self._lock:
+            now = self._clock()
+            return {
+                host: {
+                    'timeout_seconds': round(self._timeout_of(state), 3),
+                    'samples': len(state.latencies),
+                    'failures': state.failures,
+                    'trips': state.trips,
+                    'skipped': state.skipped,
+                    'open': now < state.open_until,
+                }
+                for host, state in sorted(self._hosts.items())
+            }
+
+    def format_summary(self) -> Optional[str]:
+        """실패/건너뛴 요청이 있는 호스트의 로그용 요약 (없으면 None)"""
+        lines = [
+            f"  {host}: 실패 {stats['failures']}회, 차단 {stats['trips']}회, "
+            f"건너뛴 페이지 {stats['skipped']}개, 타임아웃 {stats['timeout_seconds']:.1f}초"
+            for host, stats in self.summary().items()
+            if stats['failures'] or stats['skipped']
+        ]
+        if not lines:
+            return None
+        return "호스트 장애 요약\n" + "\n".join(lines)
@@ -0,0 +1,388 @@
+"""
+HTML 추출 모듈
+페이지 제목, 메타 설명, 본문 텍스트를 추출하는 파서 백엔드를 제공합니다.
+
+지원 백엔드:
+    - "html.parser": BeautifulSoup + 표준 라이브러리 파서 (기존 방식)
+    - "lxml": BeautifulSoup + lxml 파서 (lxml 설치 시)
+    - "stream": 표준 라이브러리 HTMLParser 기반 단일 패스 추출기.
+      트리를 만들지 않고, 텍스트 상한에 도달하면 파싱을 멈춥니다.
+"""
+
+import codecs
+import logging
+import time
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Union
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLTreeBuilder
+from bs4.dammit import EncodingDetector, UnicodeDammit
+
+try:
+    import lxml  # noqa: F401
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+MAX_CONTENT_CHARS = 10000  # 본문 텍스트 최대 길이
+PARSER_BACKENDS = ('html.parser', 'lxml', 'stream')
+DEFAULT_PARSER_BACKEND = 'html.parser'
+
+# 줄바꿈 없이 이 길이를 넘으면 이중 공백 위치에서 텍스트를 미리 정리
+PENDING_FLUSH_CHARS = 4096
+
+# stream 백엔드가 한 번에 파서에 넣는 문자 수
+FEED_CHUNK_CHARS = 16384
+
+# 본문 텍스트에서 제외하는 태그
+# (BeautifulSoup get_text()가 제외하는 문자열 컨테이너와 같음: 템플릿, 루비 주석 포함)
+SKIPPED_TEXT_TAGS = frozenset(['script', 'style', 'template', 'rt', 'rp'])
+
+# 종료 태그 없이 끝나는 태그 (BeautifulSoup과 같은 목록, 열린 태그 스택에 넣지 않음)
+VOID_TAGS = frozenset(HTMLTreeBuilder.DEFAULT_EMPTY_ELEMENT_TAGS)
+
+
+def normalize_text_lines(text: str) -> List[str]:
+    """
+    텍스트를 줄/이중 공백 단위로 나누고 공백을 정리한 조각 리스트를 반환합니다.
+
+    ' '.join(결과)는 기존 _extract_content의 공백 정리 결과와 같습니다.
+    """
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return [chunk for chunk in chunks if chunk]
+
+
+def extract_title(soup: BeautifulSoup) -> str:
+    """파싱된 트리에서 페이지 제목 추출"""
+    title_tag = soup.find('title')
+    return title_tag.get_text().strip() if title_tag else ""
+
+
+def extract_content(soup: BeautifulSoup, max_chars: int = MAX_CONTENT_CHARS) -> str:
+    """파싱된 트리에서 페이지 텍스트 콘텐츠 추출 (script/style/template 등 제거)"""
+    for script in soup(list(SKIPPED_TEXT_TAGS)):
+        script.decompose()
+
+    return ' '.join(normalize_text_lines(soup.get_text()))[:max_chars]
+
+
+def extract_meta_description(soup: BeautifulSoup) -> str:
+    """파싱된 트리에서 메타 설명 추출"""
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    if meta_desc:
+        return meta_desc.get('content', '').strip()
+    return ""
+
+
+class StreamingTextExtractor(HTMLParser):
+    """단일 패스 HTML 추출기
+
+    feed()로 HTML 조각을 여러 번 넣을 수 있으며(증분 파싱), 본문 텍스트가
+    max_chars에 도달하고 제목까지 확보되면 done이 True가 되고 이후 입력은 무시합니다.
+    결과는 BeautifulSoup 기반 추출과 같은 규칙(제목 포함 전체 텍스트,
+    SKIPPED_TEXT_TAGS 내부 제외, 줄/이중 공백 단위 정리)을 따릅니다.
+    종료 태그는 BeautifulSoup(html.parser)처럼 가장 가까운 같은 이름의 열린 태그까지
+    닫으므로, 닫히지 않은 <rt> 등도 부모 태그가 닫힐 때 함께 닫힙니다.
+    """
+
+    def __init__(self, max_chars: int = MAX_CONTENT_CHARS, collect_links: bool = False):
+        """
+        Args:
+            max_chars: 본문 텍스트 최대 길이
+            collect_links: <a href> 링크 수집 여부 (수집 시 문서 끝까지 파싱)
+        """
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.collect_links = collect_links
+        self.links: List[str] = []
+        self.done = False
+        self._text_full = False
+
+        self._title_parts: Optional[List[str]] = None
+        self._title: Optional[str] = None
+        self._meta_description: Optional[str] = None
+        self._open_tags: List[str] = []
+        self._skip_depth = 0  # 열린 태그 중 SKIPPED_TEXT_TAGS 수
+
+        self._pending = ""  # 아직 줄바꿈을 만나지 않은 텍스트
+        self._chunks: List[str] = []
+        self._length = 0  # ' '.join(self._chunks)의 길이
+
+    def feed(self, data: str) -> None:
+        """HTML 조각 입력 (텍스트 상한 도달 후에는 무시)"""
+        if not self.done:
+            super().feed(data)
+
+    def handle_starttag(self, tag, attrs):
+        if tag not in VOID_TAGS:
+            self._open_tags.append(tag)
+            if tag in SKIPPED_TEXT_TAGS:
+                self._skip_depth += 1
+                return
+
+        if tag == 'a' and self.collect_links:
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+        elif tag == 'title' and self._title is None:
+            self._title_parts = []
+        elif tag == 'meta' and self._meta_description is None:
+            attr_map = dict(attrs)
+            if attr_map.get('name') == 'description':
+                self._meta_description = (attr_map.get('content') or '').strip()
+
+    def handle_startendtag(self, tag, attrs):
+        # <meta ... /> 형태는 바로 닫힌 태그로 처리 (열린 태그 스택은 변경하지 않음)
+        if tag in VOID_TAGS:
+            self.handle_starttag(tag, attrs)
+        elif tag not in SKIPPED_TEXT_TAGS:
+            self.handle_starttag(tag, attrs)
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        # 열린 적 없는 종료 태그는 무시하고, 있으면 그 사이에 열린 태그까지 함께 닫음
+        if tag in self._open_tags:
+            while True:
+                closed = self._open_tags.pop()
+                if closed in SKIPPED_TEXT_TAGS:
+                    self._skip_depth -= 1
+                if closed == tag:
+                    break
+
+        if tag == 'title' and self._title_parts is not None:
+            self._title = ''.join(self._title_parts).strip()
+            self._title_parts = None
+            self.done = self._text_full and not self.collect_links
+
+    def handle_data(self, data):
+        if self._skip_depth or self.done:
+            return
+
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+
+        if self._text_full:
+            return
+
+        self._pending += data
+        if '\n' in data or '\r' in data or len(self._pending) > PENDING_FLUSH_CHARS:
+            cut = self._safe_cut()
+            if cut:
+                complete, self._pending = self._pending[:cut], self._pending[cut:]
+                self._append_text(complete)
+
+    def _safe_cut(self) -> int:
+        """
+        정리 결과가 바뀌지 않고 잘라낼 수 있는 위치 반환 (없으면 0)
+
+        마지막 줄바꿈 뒤, 또는 줄바꿈 없는 긴 줄이면 마지막 이중 공백 뒤에서
+        자르면 앞뒤를 따로 정리해도 전체를 한 번에 정리한 것과 같습니다.
+        """
+        cut = max(self._pending.rfind('\n'), self._pending.rfind('\r')) + 1
+        if cut == 0 and len(self._pending) > PENDING_FLUSH_CHARS:
+            double_space = self._pending.rfind('  ')
+            if double_space >= 0:
+                cut = double_space + 2
+        return cut
+
+    def _append_text(self, text: str) -> None:
+        """정리된 텍스트 조각을 누적하고 상한 도달 여부 확인"""
+        for chunk in normalize_text_lines(text):
+            self._length += len(chunk) + (1 if self._chunks else 0)
+            self._chunks.append(chunk)
+            if self._length >= self.max_chars:
+                self._text_full = True
+                self.done = self._title is not None and not self.collect_links
+                return
+
+    def close(self) -> None:
+        """입력 종료 처리 (남은 텍스트 반영)"""
+        if not self.done:
+            super().close()
+        if self._pending and not self._text_full:
+            self._append_text(self._pending)
+        self._pending = ""
+        if self._title is None and self._title_parts is not None:
+            self._title = ''.join(self._title_parts).strip()
+
+    def result(self) -> Dict[str, str]:
+        """추출 결과 반환 (close() 호출 후 사용, 링크 수집 시 links 포함)"""
+        result = {
+            'page_title': self._title or "",
+            'meta_description': self._meta_description or "",
+            'content': ' '.join(self._chunks)[:self.max_chars]
+        }
+        if self.collect_links:
+            result['links'] = list(self.links)
+        return result
+
+
+def decode_html(html: Union[bytes, str]) -> str:
+    """바이트 HTML을 문자열로 디코딩 (BeautifulSoup과 같은 인코딩 추정 사용)"""
+    if isinstance(html, str):
+        return html
+    return UnicodeDammit(html, is_html=True).unicode_markup or ""
+
+
+def resolve_backend(backend: str) -> str:
+    """
+    사용할 파서 백엔드 이름을 확정합니다.
+
+    Raises:
+        ValueError: 지원하지 않는 백엔드 이름
+    """
+    if backend not in PARSER_BACKENDS:
+        raise ValueError(f"지원하지 않는 파서 백엔드입니다: {backend}")
+
+    if backend == 'lxml' and not LXML_AVAILABLE:
+        logger.warning("lxml이 설치되지 않아 html.parser 백엔드를 사용합니다.")
+        return 'html.parser'
+    return backend
+
+
+def extract_page(html: Union[bytes, str], backend: str = DEFAULT_PARSER_BACKEND,
+                 max_chars: int = MAX_CONTENT_CHARS, collect_links: bool = False) -> Dict[str, str]:
+    """
+    HTML에서 제목, 메타 설명, 본문 텍스트를 추출합니다.
+
+    Args:
+        html: 원본 HTML (bytes 또는 str)
+        backend: 파서 백엔드 ("html.parser", "lxml", "stream")
+        max_chars: 본문 텍스트 최대 길이
+        collect_links: <a href> 링크 수집 여부
+
+    Returns:
+        page_title, meta_description, content 키를 가진 딕셔너리
+        (collect_links이면 links 리스트 포함)
+    """
+    backend = resolve_backend(backend)
+
+    if backend == 'stream':
+        extractor = StreamingTextExtractor(max_chars=max_chars, collect_links=collect_links)
+        text = decode_html(html)
+        # 조각 단위로 넣어 텍스트 상한 도달 시 나머지 문서는 파싱하지 않음
+        for start in range(0, len(text), FEED_CHUNK_CHARS):
+            if extractor.done:
+                break
+            extractor.feed(text[start:start + FEED_CHUNK_CHARS])
+        extractor.close()
+        return extractor.result()
+
+    return extract_from_soup(BeautifulSoup(html, backend), max_chars, collect_links)
+
+
+def extract_from_soup(soup: BeautifulSoup, max_chars: int = MAX_CONTENT_CHARS,
+                      collect_links: bool = False) -> Dict[str, str]:
+    """파싱된 문서 트리에서 제목, 메타 설명, 본문 텍스트(및 링크) 추출"""
+    result = {
+        'page_title': extract_title(soup),
+        'meta_description': extract_meta_description(soup),
+        'content': extract_content(soup, max_chars)
+    }
+    if collect_links:
+        result['links'] = [a['href'] for a in soup.find_all('a', href=True)]
+    return result
+
+
+class IncrementalPageExtractor:
+    """바이트 조각 단위 추출기
+
+    응답 본문을 내려받는 동안 조각을 feed()로 넣습니다. stream 백엔드는 도착한
+    조각을 즉시 파싱하고 텍스트 상한에 도달하면 done이 True가 되어 다운로드를
+    중단할 수 있습니다. 트리 기반 백엔드는 조각을 모았다가 close()에서 파싱합니다.
+
+    timings에는 파싱('parse')과 추출('extract')에 쓴 누적 시간(초)이 기록됩니다.
+    stream 백엔드는 토큰화와 텍스트 수집이 feed()에서 함께 일어나므로 feed() 시간을
+    파싱으로, close()의 마무리 시간을 추출로 봅니다.
+    """
+
+    def __init__(self, backend: str = DEFAULT_PARSER_BACKEND,
+                 max_chars: int = MAX_CONTENT_CHARS, encoding: Optional[str] = None,
+                 collect_links: bool = False):
+        """
+        Args:
+            backend: 파서 백엔드 ("html.parser", "lxml", "stream")
+            max_chars: 본문 텍스트 최대 길이
+            encoding: Content-Type 헤더에 명시된 문자 인코딩 (없으면 문서에서 추정)
+            collect_links: <a href> 링크 수집 여부
+        """
+        self.backend = resolve_backend(backend)
+        self.max_chars = max_chars
+        self.encoding = encoding
+        self.collect_links = collect_links
+        self.bytes_fed = 0
+        self.timings = {'parse': 0.0, 'extract': 0.0}
+
+        self._buffer: List[bytes] = []
+        self._decoder = None
+        self._extractor = (
+            StreamingTextExtractor(max_chars, collect_links=collect_links)
+            if self.backend == 'stream' else None
+        )
+        self._result: Optional[Dict[str, str]] = None
+
+    @property
+    def done(self) -> bool:
+        """더 이상 입력이 필요 없는지 여부"""
+        return self._extractor is not None and self._extractor.done
+
+    def feed(self, chunk: bytes) -> None:
+        """본문 바이트 조각 입력"""
+        if not chunk or self.done:
+            return
+        self.bytes_fed += len(chunk)
+
+        if self._extractor is None:
+            self._buffer.append(chunk)
+            return
+
+        started = time.perf_counter()
+        if self._decoder is None:
+            self._decoder = self._make_decoder(chunk)
+        self._extractor.feed(self._decoder.decode(chunk))
+        self.timings['parse'] += time.perf_counter() - started
+
+    def _make_decoder(self, first_chunk: bytes):
+        """첫 조각의 BOM/선언으로 인코딩을 정하고 증분 디코더 생성"""
+        encoding = self.encoding
+        if first_chunk.startswith(codecs.BOM_UTF8):
+            encoding = 'utf-8-sig'
+        if not encoding:
+            encoding = EncodingDetector.find_declared_encoding(first_chunk, is_html=True)
+
+        try:
+            return codecs.getincrementaldecoder(encoding or 'utf-8')(errors='replace')
+        except LookupError:
+            return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    def close(self) -> Dict[str, str]:
+        """
+        입력을 마치고 추출 결과를 반환합니다.
+
+        Returns:
+            page_title, meta_description, content 키를 가진 딕셔너리
+        """
+        if self._result is not None:
+            return self._result
+
+        if self._extractor is None:
+            started = time.perf_counter()
+            soup = BeautifulSoup(b''.join(self._buffer), self.backend)
+            self._buffer = []
+            parsed = time.perf_counter()
+            self._result = extract_from_soup(soup, self.max_chars, self.collect_links)
+            self.timings['parse'] += parsed - started
+            self.timings['extract'] += time.perf_counter() - parsed
+            return self._result
+
+        started = time.perf_counter()
+        if self._decoder is not None and not self.done:
+            self._extractor.feed(self._decoder.decode(b'', final=True))
+        self._extractor.close()
+        self._result = self._extractor.result()
+        self.timings['extract'] += time.perf_counter() - started
+        return self._result
@@ -0,0 +1,115 @@
+"""
+호스트별 요청 속도 제한 모듈
+토큰 버킷 방식으로 경쟁사 호스트마다 독립적인 요청 속도를 유지합니다.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+
+class TokenBucket:
+    """토큰 버킷 속도 제한기 (스레드 안전)"""
+
+    def __init__(self, requests_per_second: Optional[float], burst: int = 1):
+        """
+        Args:
+            requests_per_second: 초당 허용 요청 수 (None 또는 0 이하이면 제한 없음)
+            burst: 연속으로 즉시 허용되는 최대 요청 수
+        """
+        self.rate = requests_per_second if requests_per_second and requests_per_second > 0 else None
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        토큰 하나를 예약하고 요청 전까지 기다려야 할 시간을 반환합니다.
+
+        토큰이 부족하면 음수 잔고로 미리 예약하므로, 동시에 호출한 요청들은
+        도착 순서대로 1/rate 간격의 슬롯을 배정받습니다.
+
+        Returns:
+            대기 시간 (초)
+        """
+        if self.rate is None:
+            return 0.0
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """토큰을 얻을 때까지 대기 (블로킹)"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """토큰을 얻을 때까지 대기 (이벤트 루프 비차단)"""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 관리 클래스
+
+    서로 다른 호스트의 요청은 각자의 버킷만 사용하므로 서로를 기다리지 않습니다.
+    """
+
+    def __init__(self, requests_per_second: Optional[float] = 1.0, burst: int = 1):
+        """
+        Args:
+            requests_per_second: 설정이 없는 호스트의 기본 초당 요청 수
+            burst: 설정이 없는 호스트의 기본 버스트 크기
+        """
+        self.default_rate = requests_per_second
+        self.default_burst = burst
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """URL에서 속도 제한 키로 쓸 호스트 추출"""
+        return urlparse(url).netloc.lower()
+
+    def configure(self, url: str, requests_per_second: Optional[float],
+                  burst: int = 1) -> None:
+        """
+        특정 호스트의 속도 제한을 설정합니다.
+
+        Args:
+            url: 호스트를 포함한 URL
+            requests_per_second: 초당 허용 요청 수
+            burst: 버스트 크기
+        """
+        with self._lock:
+            self._buckets[self.host_of(url)] = TokenBucket(requests_per_second, burst)
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        """URL의 호스트에 해당하는 버킷 반환 (없으면 기본값으로 생성)"""
+        host = self.host_of(url)
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = TokenBucket(self.default_rate, self.default_burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> None:
+        """URL 호스트의 토큰을 얻을 때까지 대기 (블로킹)"""
+        self.bucket_for(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        """URL 호스트의 토큰을 얻을 때까지 대기 (비동기)"""
+        await self.bucket_for(url).acquire_async()
@@ -0,0 +1,249 @@
+"""
+적응형 재수집 일정 모듈
+URL별로 관측한 변경 빈도와 페이지 유형 우선순위로 다음 수집 시각을 정하고,
+실행마다 수집 시각이 된 URL만 요청하도록 합니다.
+
+변경은 포아송 과정으로 보고, 수집 n회 중 변경을 발견한 횟수 X와 평균 수집 간격 I로
+변경 빈도를 -ln((n - X + 0.5) / (n + 1)) / I로 추정합니다. (간격 사이 여러 번 바뀌어도
+한 번으로 보이는 점을 보정) 오래된 관측은 HISTORY_DECAY로 점점 덜 반영합니다.
+다음 수집 간격은 평균 변경 간격의 TARGET_INTERVAL_FACTOR배를 [최소 간격, 우선순위별
+최대 간격] 범위로 제한한 값이며, 가격 페이지처럼 우선순위가 높은 페이지는 최대 간격이
+짧아 변경이 드물어도 자주 확인합니다. 처음 본 URL은 최소 간격 뒤에 다시 확인합니다.
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.data_collection.crawler import DEFAULT_PRIORITY, page_priority
+
+logger = logging.getLogger(__name__)
+
+HOUR = 3600.0
+DEFAULT_MIN_INTERVAL_HOURS = 20.0  # 매일 실행 일정이 조금 앞당겨져도 다음 실행에서 수집되도록 하루보다 짧게
+# 페이지 우선순위(crawler.page_priority)별 최대 수집 간격: 0 가격, 1 제품, 2 기타, 3 블로그
+DEFAULT_MAX_INTERVAL_HOURS = {0: 48.0, 1: 96.0, 2: 168.0, 3: 336.0}
+TARGET_INTERVAL_FACTOR = 0.5  # 평균 변경 간격의 절반마다 확인
+HISTORY_DECAY = 0.95  # 수집할 때마다 이전 관측에 곱하는 가중치 (최근 약 20회 위주로 추정)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recrawl_schedule (
+    url TEXT PRIMARY KEY,
+    checks INTEGER NOT NULL,
+    intervals REAL NOT NULL,
+    changes REAL NOT NULL,
+    observed_seconds REAL NOT NULL,
+    last_checked_at REAL NOT NULL,
+    last_changed_at REAL,
+    next_due_at REAL NOT NULL
+) WITHOUT ROWID
+"""
+
+_UPSERT = """
+INSERT OR REPLACE INTO recrawl_schedule
+    (url, checks, intervals, changes, observed_seconds, last_checked_at, last_changed_at, next_due_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class RecrawlSchedule:
+    """URL별 다음 수집 시각 저장소 (SQLite, 스레드 안전)
+
+    일정에 없는 URL은 항상 수집 대상이며, 수집 결과를 record_checks()로 반영하면
+    변경 빈도 추정과 다음 수집 시각이 갱신됩니다. 수집에 실패한 URL은 반영하지
+    않으므로 다음 실행에서 다시 수집됩니다.
+    """
+
+    def __init__(self, path: str, min_interval_hours: float = DEFAULT_MIN_INTERVAL_HOURS,
+                 max_interval_hours: Optional[Dict[int, float]] = None,
+                 clock: Callable[[], float] = time.time):
+        """
+        Args:
+            path: SQLite 파일 경로
+            min_interval_hours: 최소 수집 간격 (시간)
+            max_interval_hours: 페이지 우선순위별 최대 수집 간격 (시간)
+            clock: 시간 함수 (테스트용, epoch 초)
+        """
+        self.path = path
+        self.min_interval = min_interval_hours * HOUR
+        self.max_intervals = {
+            priority: hours * HOUR
+            for priority, hours in (max_interval_hours or DEFAULT_MAX_INTERVAL_HOURS).items()
+        }
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.skipped = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+        # 실행 중 대상 여부가 바뀌지 않도록 시작 시각 기준으로 판단
+        self.as_of = clock()
+        self._next_due: Dict[str, float] = {
+            row['url']: row['next_due_at']
+            for row in self._conn.execute("SELECT url, next_due_at FROM recrawl_schedule")
+        }
+
+    def is_due(self, url: str) -> bool:
+        """수집 시각이 되었거나 일정에 없는 URL인지 여부"""
+        with self._lock:
+            next_due_at = self._next_due.get(url)
+        return next_due_at is None or next_due_at <= self.as_of
+
+    def skip_if_not_due(self, url: str) -> bool:
+        """수집 시각 전인 URL이면 건너뛴 것으로 기록 (건너뛸 때 True)"""
+        if self.is_due(url):
+            return False
+        with self._lock:
+            self.skipped += 1
+        logger.info(f"재수집 일정 전이므로 건너뜀: {url}")
+        return True
+
+    def due_count(self, urls: Iterable[str]) -> int:
+        """주어진 URL 중 수집 대상 수"""
+        return sum(1 for url in urls if self.is_due(url))
+
+    def interval_for(self, url: str, intervals: float, changes: float,
+                     observed_seconds: float) -> float:
+        """
+        관측 이력으로 정한 다음 수집 간격 (초)
+
+        Args:
+            url: 페이지 URL (우선순위별 최대 간격 적용)
+            intervals: 관측한 수집 간격 수 (가중치 적용)
+            changes: 그중 변경을 발견한 수 (가중치 적용)
+            observed_seconds: 관측한 수집 간격 합계 (초, 가중치 적용)
+        """
+        max_interval = max(self.min_interval, self.max_intervals.get(
+            page_priority(url), self.max_intervals.get(DEFAULT_PRIORITY, self.min_interval)
+        ))
+        if intervals <= 0 or observed_seconds <= 0:
+            return self.min_interval
+
+        unchanged = max(0.0, intervals - changes)
+        rate = -math.log((unchanged + 0.5) / (intervals + 1)) / (observed_seconds / intervals)
+        if rate <= 0:
+            return max_interval
+        return min(max(self.min_interval, TARGET_INTERVAL_FACTOR / rate), max_interval)
+
+    def record_checks(self, observations: Iterable[Tuple[str, bool]]) -> int:
+        """
+        수집 결과를 반영해 URL별 변경 빈도와 다음 수집 시각을 갱신합니다.
+
+        Args:
+            observations: (URL, 이전 수집 이후 변경 여부) 쌍
+
+        Returns:
+            반영한 URL 수
+        """
+        now = self._clock()
+        observations = dict(observations)
+        if not observations:
+            return 0
+
+        with self._lock, self._conn:
+            existing = self._load(list(observations))
+            values = []
+            for url, changed in observations.items():
+                row = existing.get(url)
+                if row is None:
+                    # 처음 본 URL은 비교 대상이 없으므로 관측 없이 시작
+                    checks, intervals, changes, observed, last_changed = 0, 0.0, 0.0, 0.0, None
+                else:
+                    checks = row['checks']
+                    intervals = row['intervals'] * HISTORY_DECAY + 1
+                    changes = row['changes'] * HISTORY_DECAY + (1 if changed else 0)
+                    observed = (row['observed_seconds'] * HISTORY_DECAY
+                                + max(0.0, now - row['last_checked_at']))
+                    last_changed = now if changed else row['last_changed_at']
+
+                next_due_at = now + self.interval_for(url, intervals, changes, observed)
+                values.append((url, checks + 1, intervals, changes, observed, now,
+                               last_changed, next_due_at))
+                self._next_due[url] = next_due_at
+            self._conn.executemany(_UPSERT, values)
+        return len(values)
+
+    def seed_from_analysis(self, page_analysis: Dict[str, Dict], overwrite: bool = False) -> int:
+        """
+        BasicAnalyzer.analyze_content_changes()의 URL별 분석 결과로 일정을 초기화합니다.
+
+        저장된 버전 수 - 1을 변경 수로, 첫 수집부터 마지막 수집까지를 관측 기간으로 봅니다.
+        BigQuery에는 변경된 버전만 저장되므로 관측 간격 수는 기간을 최소 간격으로 나눈
+        값(실행 주기 기준 확인 횟수)으로 추정합니다.
+
+        Args:
+            page_analysis: {url: {total_collections, unique_versions, change_frequency,
+                first_collected, last_collected}}
+            overwrite: 이미 일정에 있는 URL도 덮어쓸지 여부
+
+        Returns:
+            반영한 URL 수
+        """
+        values = []
+        with self._lock:
+            for url, analysis in page_analysis.items():
+                if url in self._next_due and not overwrite:
+                    continue
+                first = self._timestamp(analysis.get('first_collected'))
+                last = self._timestamp(analysis.get('last_collected'))
+                if first is None or last is None:
+                    continue
+
+                changes = max(0, analysis.get('unique_versions', 1) - 1)
+                observed = max(0.0, last - first)
+                intervals = max(float(changes), math.floor(observed / self.min_interval))
+                next_due_at = last + self.interval_for(url, intervals, changes, observed)
+                values.append((url, analysis.get('total_collections', 1), intervals, changes,
+                               observed, last, last if changes else None, next_due_at))
+                self._next_due[url] = next_due_at
+
+            with self._conn:
+                self._conn.executemany(_UPSERT, values)
+        return len(values)
+
+    def count(self) -> int:
+        """일정에 있는 URL 수"""
+        with self._lock:
+            return len(self._next_due)
+
+    def close(self) -> None:
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, urls: List[str]) -> Dict[str, sqlite3.Row]:
+        rows = {}
+        for start in range(0, len(urls), 900):
+            batch = urls[start:start + 900]
+            placeholders = ",".join("?" * len(batch))
+            for row in self._conn.execute(
+                f"SELECT * FROM recrawl_schedule WHERE url IN ({placeholders})", batch
+            ):
+                rows[row['url']] = row
+        return rows
+
+    @staticmethod
+    def _timestamp(value) -> Optional[float]:
+        """ISO 문자열/datetime 수집 시각을 epoch 초로 변환 (시간대 없으면 UTC)"""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                value = datetime.fromisoformat(value)
+            except ValueError:
+                return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
@@ -0,0 +1,182 @@
+"""
+수집 실행 저널 모듈
+완료된 페이지와 저장 대기 중인 행을 로컬 JSON Lines 파일에 기록하여,
+중단된 실행을 다시 시작하면 이미 수집한 페이지를 다시 요청하지 않고 이어서 진행합니다.
+
+대상 페이지 모드의 남은 작업은 설정의 target_pages에서 완료된 URL을 뺀 것이고,
+크롤 모드의 탐색 대기열은 저널에 함께 기록된 페이지 링크로 요청 없이 다시 구성됩니다.
+
+메모리에는 완료된 (경쟁사, URL) 키와 파일 내 위치만 두고, 재개 시 필요한 페이지는
+저널 파일에서 다시 읽으므로 실행 규모가 커져도 페이지 본문이 메모리에 쌓이지 않습니다.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGE_HOURS = 24.0  # 이보다 오래된 저널은 이어서 진행하지 않고 폐기
+
+
+class RunJournal:
+    """수집 실행 체크포인트 저널 (추가 전용 JSON Lines, 스레드 안전)
+
+    첫 줄은 실행 정보({"type": "run", "started_at": ...}), 이후 줄은 완료된
+    페이지({"type": "page", "page": {...}})입니다. 페이지마다 fsync하므로
+    프로세스가 중간에 종료되어도 마지막으로 기록된 페이지까지 보존됩니다.
+    메모리에는 페이지별 줄의 시작 위치(바이트)만 보관합니다.
+    """
+
+    def __init__(self, path: str, max_age_hours: float = DEFAULT_MAX_AGE_HOURS):
+        """
+        Args:
+            path: 저널 파일 경로
+            max_age_hours: 이어서 진행할 수 있는 저널의 최대 경과 시간
+        """
+        self.path = path
+        self.max_age_hours = max_age_hours
+        self.started_at = time.time()
+        self._offsets: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._file = None
+        self._load()
+
+    def _load(self) -> None:
+        """기존 저널 로드 (없거나 만료/손상되면 새 실행으로 시작)"""
+        if not os.path.exists(self.path):
+            return
+
+        offsets: Dict[Tuple[str, str], int] = {}
+        started_at = None
+        line = b""
+        try:
+            with open(self.path, 'rb') as f:
+                offset = 0
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # 기록 도중 종료된 마지막 줄
+                        logger.warning(f"실행 저널의 손상된 줄을 건너뜁니다: {self.path}")
+                        entry = {}
+                    if entry.get('type') == 'run':
+                        started_at = entry.get('started_at')
+                    elif entry.get('type') == 'page':
+                        page = entry['page']
+                        offsets[(page['competitor_name'], page['url'])] = offset
+                    offset += len(line)
+        except OSError as e:
+            logger.warning(f"실행 저널 로드 실패, 새로 시작합니다 {self.path}: {str(e)}")
+            return
+
+        if started_at is None or time.time() - started_at > self.max_age_hours * 3600:
+            logger.info(f"만료된 실행 저널을 폐기합니다: {self.path}")
+            self._remove_file()
+            return
+
+        self.started_at = started_at
+        self._offsets = offsets
+        if line and not line.endswith(b"\n"):
+            # 잘린 마지막 줄 뒤에 이어 쓰면 다음 페이지 줄까지 손상되므로 줄바꿈으로 마감
+            try:
+                with open(self.path, 'ab') as f:
+                    f.write(b"\n")
+            except OSError as e:
+                logger.error(f"실행 저널 마감 실패 {self.path}: {str(e)}")
+
+    @property
+    def resumed(self) -> bool:
+        """이전 실행의 완료 페이지를 이어받았는지 여부"""
+        with self._lock:
+            return bool(self._offsets)
+
+    @property
+    def page_count(self) -> int:
+        """기록된 완료 페이지 수"""
+        with self._lock:
+            return len(self._offsets)
+
+    def completed_page(self, url: str, competitor_name: str) -> Optional[Dict]:
+        """완료된 페이지 데이터 (저널 파일에서 읽음, 없으면 None)"""
+        with self._lock:
+            offset = self._offsets.get((competitor_name, url))
+            if offset is None:
+                return None
+            pages = self._read_pages([offset])
+            return pages[0] if pages else None
+
+    def pages(self) -> List[Dict]:
+        """저장 대기 중인 페이지 데이터 리스트 (기록 순서, 저널 파일에서 읽음)"""
+        with self._lock:
+            return self._read_pages(sorted(self._offsets.values()))
+
+    def _read_pages(self, offsets: List[int]) -> List[Dict]:
+        """저널 파일의 지정 위치에서 페이지 줄 읽기"""
+        pages = []
+        try:
+            with open(self.path, 'rb') as f:
+                for offset in offsets:
+                    f.seek(offset)
+                    pages.append(json.loads(f.readline())['page'])
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"실행 저널 페이지 읽기 실패 {self.path}: {str(e)}")
+        return pages
+
+    def record_page(self, page_data: Dict) -> None:
+        """
+        완료된 페이지를 기록합니다. (크롤 모드 재개를 위해 'links'도 함께 보존)
+
+        Args:
+            page_data: WebScraper가 만든 페이지 데이터 딕셔너리
+        """
+        line = (json.dumps({'type': 'page', 'page': page_data}, ensure_ascii=False) + "\n").encode('utf-8')
+        with self._lock:
+            try:
+                handle = self._open()
+                offset = handle.tell()
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+                self._offsets[(page_data['competitor_name'], page_data['url'])] = offset
+            except OSError as e:
+                logger.error(f"실행 저널 기록 실패 {page_data['url']}: {str(e)}")
+
+    def _open(self):
+        """추가 모드로 저널 파일 열기 (새 파일이면 실행 정보 줄 기록)"""
+        if self._file is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            is_new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+            self._file = open(self.path, 'ab')
+            if is_new:
+                self._file.write((json.dumps({'type': 'run', 'started_at': self.started_at}) + "\n").encode('utf-8'))
+        return self._file
+
+    def close(self) -> None:
+        """파일 핸들 닫기 (저널은 유지되어 다음 실행에서 이어서 진행)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def complete(self) -> None:
+        """저장까지 끝난 실행의 저널 삭제"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._offsets = {}
+            self._remove_file()
+
+    def _remove_file(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"실행 저널 삭제 실패 {self.path}: {str(e)}")
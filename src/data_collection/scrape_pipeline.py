@@ -0,0 +1,227 @@
+"""
+2단계 스크래핑 파이프라인 모듈
+I/O 스레드가 원본 응답을 내려받고, 프로세스 풀이 HTML 추출과 지문 계산을 수행합니다.
+
+네트워크 대기와 CPU 바운드 파싱(GIL 점유)을 분리하여, 파싱 처리량이
+스크래핑 노드의 CPU 코어 수에 비례하도록 합니다.
+"""
+
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.data_collection.web_scraper import WebScraper, parse_page_body
+from src.utils.metrics import scrape_metrics
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()  # 다운로드 단계 종료 표시
+_POLL_SECONDS = 0.5  # 다운로드 결과를 기다리는 동안 완료된 추출 결과를 확인하는 간격
+
+
+class ScrapePipeline:
+    """다운로드(스레드) → 추출(프로세스) 2단계 파이프라인
+
+    단계 사이 큐는 크기가 제한되어 있어, 추출 단계가 밀리면 다운로드 워커가
+    대기하여 메모리에 쌓이는 원본 응답 수가 queue_size를 넘지 않습니다.
+    """
+
+    def __init__(self, scraper: WebScraper, fetch_workers: int = 8,
+                 parse_workers: Optional[int] = None, queue_size: int = 32,
+                 executor: Optional[ProcessPoolExecutor] = None):
+        """
+        Args:
+            scraper: 요청/속도 제한/검증자 설정을 가진 WebScraper
+            fetch_workers: 다운로드 스레드 수
+            parse_workers: 추출 프로세스 수 (기본: CPU 코어 수)
+            queue_size: 다운로드→추출 대기 큐 및 추출 중 작업 수 상한
+            executor: 외부에서 관리하는 추출 실행기 (테스트/재사용용, 선택사항)
+        """
+        self.scraper = scraper
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = max(1, parse_workers or os.cpu_count() or 1)
+        self.queue_size = max(1, queue_size)
+        self._executor = executor
+
+    def run(self, competitors: List[Dict],
+            on_page: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        여러 경쟁사의 페이지를 파이프라인으로 수집합니다.
+
+        Args:
+            competitors: 경쟁사 설정 딕셔너리 리스트 (config.COMPETITORS 형식)
+            on_page: 페이지가 완료될 때마다 호출할 함수 (선택사항, 완료 순서로 호출되며
+                지정하면 결과를 모아 두지 않음)
+
+        Returns:
+            스크래핑된 데이터 리스트 (경쟁사 순서, target_pages 순서 유지,
+            on_page를 지정하면 빈 리스트)
+        """
+        targets: List[Tuple[str, str]] = []
+        crawled: List[Dict] = []
+        for competitor in competitors:
+            if competitor.get('crawl'):
+                # 크롤 모드는 발견한 링크에 따라 다음 요청이 정해지므로 사이트 단위로 수집
+                pages = self.scraper.scrape_competitor(competitor)
+                if on_page is None:
+                    crawled.extend(pages)
+                else:
+                    for page in pages:
+                        on_page(page)
+                continue
+            self.scraper._configure_rate_limit(competitor)
+            for full_url in self.scraper._build_target_urls(competitor):
+                targets.append((full_url, competitor['name']))
+
+        if not targets:
+            return crawled
+
+        # 호스트별 속도 제한 대기가 한 호스트에 몰리지 않도록 경쟁사 간 번갈아 배치
+        url_queue: "queue.Queue" = queue.Queue()
+        for index in self._interleave_by_competitor(targets):
+            url_queue.put((index, targets[index]))
+
+        results: List[Optional[Dict]] = []
+        if on_page is None:
+            results = [None] * len(targets)
+
+            def emit(index: int, page: Dict) -> None:
+                results[index] = page
+        else:
+            def emit(index: int, page: Dict) -> None:
+                on_page(page)
+
+        raw_queue: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+        fetchers = [
+            threading.Thread(target=self._fetch_worker, args=(url_queue, raw_queue), daemon=True)
+            for _ in range(min(self.fetch_workers, len(targets)))
+        ]
+        for fetcher in fetchers:
+            fetcher.start()
+
+        executor = self._executor or ProcessPoolExecutor(max_workers=self.parse_workers)
+        try:
+            self._parse_stage(raw_queue, executor, targets, len(fetchers), emit)
+        finally:
+            if self._executor is None:
+                executor.shutdown(wait=True)
+
+        for fetcher in fetchers:
+            fetcher.join()
+
+        pages = [page for page in results if page]
+        pages.extend(crawled)
+        return pages
+
+    @staticmethod
+    def _interleave_by_competitor(targets: List[Tuple[str, str]]) -> List[int]:
+        """경쟁사별 대상 인덱스를 라운드 로빈 순서로 나열"""
+        groups: Dict[str, List[int]] = {}
+        for index, (_, competitor_name) in enumerate(targets):
+            groups.setdefault(competitor_name, []).append(index)
+
+        order = []
+        for position in range(max(len(indexes) for indexes in groups.values())):
+            for indexes in groups.values():
+                if position < len(indexes):
+                    order.append(indexes[position])
+        return order
+
+    def _fetch_worker(self, url_queue: "queue.Queue", raw_queue: "queue.Queue") -> None:
+        """다운로드 단계: URL을 가져와 원본 응답을 추출 대기 큐에 넣음"""
+        while True:
+            try:
+                index, (url, competitor_name) = url_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            # 이전 실행에서 완료된 페이지는 다운로드/추출 없이 기록된 결과를 전달
+            journaled = self.scraper.journaled_page(url, competitor_name)
+            if journaled is not None:
+                raw_queue.put((index, {'journaled': journaled}))
+                continue
+
+            if self.scraper._skip_not_due(url) or self.scraper._skip_unavailable_host(url):
+                raw_queue.put((index, None))
+                continue
+
+            self.scraper.rate_limiter.acquire(url)
+            raw_queue.put((index, self.scraper.fetch_raw(url, competitor_name)))
+
+        raw_queue.put(_STOP)
+
+    def _parse_stage(self, raw_queue: "queue.Queue", executor: ProcessPoolExecutor,
+                     targets: List[Tuple[str, str]], fetcher_count: int,
+                     emit: Callable[[int, Dict], None]) -> None:
+        """추출 단계: 원본 응답을 프로세스 풀에 제출하고, 완료된 페이지 데이터를 바로 emit에 전달"""
+        in_flight = threading.BoundedSemaphore(self.queue_size)
+        pending: List[Tuple[int, Optional[str], Optional[str], Future]] = []
+        stopped = 0
+
+        while stopped < fetcher_count:
+            try:
+                item = raw_queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                pending = self._drain(pending, targets, emit)
+                continue
+            if item is _STOP:
+                stopped += 1
+                continue
+
+            index, raw = item
+            url, competitor_name = targets[index]
+            if raw is not None and raw.get('journaled'):
+                emit(index, raw['journaled'])
+            elif raw is not None and raw.get('not_modified'):
+                page = self.scraper._build_not_modified_data(url, competitor_name)
+                self.scraper.record_completed(page)
+                emit(index, page)
+            elif raw is not None:
+                # 추출 중 작업 수 제한 (초과 시 완료될 때까지 대기 → 다운로드 단계로 역압 전달)
+                in_flight.acquire()
+                future = executor.submit(
+                    parse_page_body, raw['body'], self.scraper.parser_backend, raw['encoding']
+                )
+                future.add_done_callback(lambda _: in_flight.release())
+                # 본문은 작업에 넘겼으므로 검증자만 보관
+                pending.append((index, raw['etag'], raw['last_modified'], future))
+
+            # 완료된 추출 결과는 다운로드가 끝나기를 기다리지 않고 바로 전달
+            pending = self._drain(pending, targets, emit)
+
+        self._drain(pending, targets, emit, wait=True)
+
+    def _drain(self, pending: List[Tuple[int, Optional[str], Optional[str], Future]],
+               targets: List[Tuple[str, str]], emit: Callable[[int, Dict], None],
+               wait: bool = False) -> List[Tuple[int, Optional[str], Optional[str], Future]]:
+        """완료된 추출 작업을 페이지 데이터로 변환해 전달하고, 남은 작업을 반환"""
+        remaining = []
+        for entry in pending:
+            index, etag, last_modified, future = entry
+            if not wait and not future.done():
+                remaining.append(entry)
+                continue
+
+            url, competitor_name = targets[index]
+            try:
+                fields = future.result()
+            except Exception as e:
+                logger.error(f"추출 실패 {url}: {str(e)}")
+                continue
+
+            host = urlsplit(url).hostname or ''
+            for phase, seconds in fields.get('timings', {}).items():
+                scrape_metrics.record(host, phase, seconds)
+
+            page = self.scraper.build_page_data(
+                url, competitor_name, fields,
+                etag=etag, last_modified=last_modified
+            )
+            self.scraper.record_completed(page)
+            logger.info(f"스크래핑 완료: {url}")
+            emit(index, page)
+        return remaining
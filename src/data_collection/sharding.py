@@ -0,0 +1,66 @@
+"""
+수집 샤딩 모듈
+경쟁사 목록을 여러 실행 노드(Cloud Run 작업 태스크, VM)에 나누어 배정합니다.
+
+배정은 경쟁사 호스트 기준 랑데부 해싱(HRW)으로 결정하므로, 같은 설정이면 어느
+노드에서 계산해도 같은 결과가 나오고 한 호스트는 항상 한 샤드에서만 요청합니다
+(호스트별 속도 제한이 노드 수만큼 늘어나지 않음). 샤드 수가 바뀌어도 새 샤드로
+옮겨 가는 경쟁사만 배정이 바뀝니다.
+"""
+
+import hashlib
+import os
+from typing import Dict, List
+from urllib.parse import urlsplit
+
+
+def shard_key(competitor: Dict) -> str:
+    """경쟁사의 샤드 배정 키 (사이트 호스트, 없으면 경쟁사 이름)"""
+    host = (urlsplit(competitor.get('url', '')).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    return host or competitor['name']
+
+
+def shard_of(key: str, num_shards: int) -> int:
+    """
+    키가 배정되는 샤드 번호 (0 ~ num_shards - 1)
+
+    각 샤드에 대해 (샤드, 키) 해시를 계산하여 가장 큰 값을 가진 샤드를 고릅니다.
+    """
+    if num_shards <= 1:
+        return 0
+    return max(
+        range(num_shards),
+        key=lambda shard: hashlib.md5(f"{shard}:{key}".encode('utf-8')).digest()
+    )
+
+
+def select_shard(competitors: List[Dict], shard: int, num_shards: int) -> List[Dict]:
+    """
+    샤드에 배정된 경쟁사만 골라 반환합니다. (설정 순서 유지)
+
+    Raises:
+        ValueError: 샤드 번호가 범위를 벗어난 경우
+    """
+    if num_shards < 1 or not 0 <= shard < num_shards:
+        raise ValueError(f"잘못된 샤드 설정: shard={shard}, num_shards={num_shards}")
+    return [c for c in competitors if shard_of(shard_key(c), num_shards) == shard]
+
+
+def shard_label(shard: int, num_shards: int) -> str:
+    """샤드 표시 이름 (예: shard-0002-of-0008)"""
+    return f"shard-{shard:04d}-of-{num_shards:04d}"
+
+
+def shard_state_path(path: str, shard: int, num_shards: int) -> str:
+    """
+    샤드별 로컬 상태 파일 경로
+
+    같은 호스트에서 여러 샤드를 실행해도 저널/검증자 파일이 겹치지 않도록
+    확장자 앞에 샤드 표시를 붙입니다. (샤드가 하나면 원래 경로)
+    """
+    if num_shards <= 1:
+        return path
+    root, ext = os.path.splitext(path)
+    return f"{root}.{shard_label(shard, num_shards)}{ext}"
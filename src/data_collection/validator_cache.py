@@ -0,0 +1,109 @@
+"""
+HTTP 조건부 요청 검증자 저장소 모듈
+URL별 ETag / Last-Modified 값을 보관하여 변경되지 않은 페이지의 재다운로드를 막습니다.
+"""
+
+import json
+import logging
+import os
+import threading
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ValidatorStore:
+    """URL별 HTTP 캐시 검증자 저장소 (JSON 파일 기반, 스레드 안전)"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 검증자를 저장할 JSON 파일 경로
+        """
+        self.path = path
+        self._entries: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        """저장된 검증자 로드 (파일이 없거나 손상되면 빈 저장소로 시작)"""
+        if not os.path.exists(self.path):
+            return
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self._entries = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"검증자 저장소 로드 실패, 새로 시작합니다 {self.path}: {str(e)}")
+            self._entries = {}
+
+    def get(self, url: str) -> Optional[Dict[str, str]]:
+        """URL의 검증자 항목 반환"""
+        with self._lock:
+            entry = self._entries.get(url)
+            return dict(entry) if entry else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        URL에 대한 조건부 요청 헤더를 생성합니다.
+
+        Returns:
+            If-None-Match / If-Modified-Since 헤더 딕셔너리 (검증자가 없으면 빈 딕셔너리)
+        """
+        entry = self.get(url)
+        if not entry or not entry.get('content_hash'):
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def update(self, url: str, etag: Optional[str], last_modified: Optional[str],
+               content_hash: str) -> None:
+        """
+        URL의 검증자를 갱신합니다. 검증자가 없는 응답이면 항목을 제거합니다.
+
+        Args:
+            url: 페이지 URL
+            etag: 응답 ETag 헤더
+            last_modified: 응답 Last-Modified 헤더
+            content_hash: 응답 본문으로 계산한 콘텐츠 해시
+        """
+        with self._lock:
+            if not etag and not last_modified:
+                self._entries.pop(url, None)
+                return
+
+            self._entries[url] = {
+                'etag': etag or '',
+                'last_modified': last_modified or '',
+                'content_hash': content_hash
+            }
+
+    def save(self) -> bool:
+        """
+        검증자를 파일에 저장합니다. (임시 파일 작성 후 교체)
+
+        Returns:
+            성공 여부
+        """
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            with self._lock:
+                snapshot = dict(self._entries)
+
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+            return True
+
+        except OSError as e:
+            logger.error(f"검증자 저장소 저장 실패 {self.path}: {str(e)}")
+            return False
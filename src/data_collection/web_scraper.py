@@ -4,32 +4,108 @@
 """
 
 import requests
-import time
 import hashlib
+import time
 import uuid
+from contextlib import closing, nullcontext
 from datetime import datetime
 from bs4 import BeautifulSoup
 from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+from urllib3.util.request import ACCEPT_ENCODING
 import logging
 
+from src.data_collection.archive import ResponseArchive
+from src.data_collection.crawler import SiteCrawler, page_priority
+from src.data_collection.fingerprint import compute_simhash
+from src.data_collection.host_health import HostHealth, RETRYABLE_STATUS_CODES, backoff_delay
+from src.data_collection.html_extractor import (
+    DEFAULT_PARSER_BACKEND, IncrementalPageExtractor, extract_title, extract_content,
+    extract_meta_description, resolve_backend
+)
+from src.data_collection.rate_limiter import HostRateLimiter
+from src.data_collection.recrawl_schedule import RecrawlSchedule
+from src.data_collection.run_journal import RunJournal
+from src.data_collection.validator_cache import ValidatorStore
+from src.utils.http_transport import mount_shared_adapter
+from src.utils.metrics import BandwidthTracker, bandwidth_usage, scrape_metrics
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 응답 다운로드 기본 설정
+DEFAULT_MAX_RESPONSE_BYTES = 5 * 1024 * 1024  # 5 MiB
+DEFAULT_ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+DOWNLOAD_CHUNK_BYTES = 16 * 1024
+DEFAULT_MAX_RETRIES = 2  # 연결 오류/타임아웃/재시도 대상 상태 코드의 최대 재시도 횟수
+# 예산 소진 시 이 우선순위 이상(숫자가 클수록 낮은 우선순위)의 페이지는 수집을 연기
+DEFAULT_DEFER_PRIORITY = 2
+
 
 class WebScraper:
     """웹 스크래핑 클래스"""
     
-    def __init__(self, delay: int = 1):
+    def __init__(self, delay: int = 1, rate_limiter: Optional[HostRateLimiter] = None,
+                 validator_store: Optional[ValidatorStore] = None,
+                 parser_backend: str = DEFAULT_PARSER_BACKEND,
+                 max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+                 allowed_content_types: Optional[List[str]] = None,
+                 max_pages_per_site: int = 10,
+                 archive: Optional[ResponseArchive] = None,
+                 bandwidth: Optional[BandwidthTracker] = None,
+                 defer_priority: int = DEFAULT_DEFER_PRIORITY,
+                 journal: Optional[RunJournal] = None,
+                 host_health: Optional[HostHealth] = None,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 recrawl_schedule: Optional[RecrawlSchedule] = None):
         """
         Args:
-            delay: 요청 간 지연 시간 (초)
+            delay: 같은 호스트 요청 간 기본 지연 시간 (초)
+            rate_limiter: 호스트별 속도 제한기 (없으면 delay 기반 기본값 사용)
+            validator_store: 조건부 요청용 ETag/Last-Modified 저장소 (선택사항)
+            parser_backend: HTML 파서 백엔드 ("html.parser", "lxml", "stream")
+            max_response_bytes: 응답 본문 최대 크기 (바이트, 초과 시 다운로드 중단)
+            allowed_content_types: 허용할 Content-Type 목록 (없으면 HTML 계열만 허용)
+            max_pages_per_site: 크롤 모드에서 사이트당 최대 수집 페이지 수
+            archive: 원본 응답을 보관할 아카이브 (선택사항, 설정 시 본문 전체를 내려받음)
+            bandwidth: 전송량 집계기 (없으면 프로세스 전역 bandwidth_usage 사용)
+            defer_priority: 전송량 예산 소진 후 수집을 연기할 최소 페이지 우선순위
+                (crawler.page_priority 기준, 숫자가 클수록 낮은 우선순위)
+            journal: 완료 페이지 체크포인트 저널 (선택사항, 설정 시 저널에 있는 페이지는
+                다시 요청하지 않고 기록된 결과를 반환)
+            host_health: 호스트별 적응형 타임아웃/서킷 브레이커 (없으면 기본 설정으로 생성)
+            max_retries: 일시적 오류의 최대 재시도 횟수 (지터 지수 백오프)
+            recrawl_schedule: URL별 재수집 일정 (선택사항, 설정 시 수집 시각 전인
+                페이지는 요청하지 않음)
         """
         self.delay = delay
+        self.parser_backend = resolve_backend(parser_backend)
+        self.max_response_bytes = max_response_bytes
+        self.allowed_content_types = tuple(
+            allowed_content_types or DEFAULT_ALLOWED_CONTENT_TYPES
+        )
+        self.validator_store = validator_store
+        self.max_pages_per_site = max_pages_per_site
+        self.archive = archive
+        self.bandwidth = bandwidth or bandwidth_usage
+        self.defer_priority = defer_priority
+        self.journal = journal
+        self.host_health = host_health or HostHealth()
+        self.max_retries = max(0, max_retries)
+        self.recrawl_schedule = recrawl_schedule
+        self.rate_limiter = rate_limiter or HostRateLimiter(
+            requests_per_second=1.0 / delay if delay > 0 else None,
+            burst=1
+        )
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            # urllib3가 해제할 수 있는 인코딩만 요청 (Brotli/zstandard 설치 시 br, zstd 포함)
+            'Accept-Encoding': ACCEPT_ENCODING
         })
+        # 프로세스 전역 연결 풀/DNS 캐시 공유 (DNS/연결/TLS/TTFB 단계 시간도 기록)
+        mount_shared_adapter(self.session)
     
     def scrape_page(self, url: str, competitor_name: str) -> Optional[Dict]:
         """
@@ -55,35 +131,119 @@ class WebScraper:
         Returns:
             스크래핑된 데이터 딕셔너리 또는 None
         """
+        # 이전 실행에서 완료된 페이지는 속도 제한 대기 없이 바로 반환
+        journaled = self.journaled_page(url, competitor_name)
+        if journaled is not None:
+            return journaled
+        
+        # 재수집 일정 전이거나 서킷 브레이커가 열린 호스트는 속도 제한 대기 없이 건너뜀
+        if self._skip_not_due(url) or self._skip_unavailable_host(url):
+            return None
+        
+        # Rate limiting (호스트별 토큰 버킷)
+        self.rate_limiter.acquire(url)
+        
+        return self._fetch_page_data(url, competitor_name)
+    
+    def journaled_page(self, url: str, competitor_name: str,
+                       collect_links: bool = False) -> Optional[Dict]:
+        """
+        저널에 기록된 완료 페이지를 반환합니다.
+        
+        Args:
+            url: 페이지 URL
+            competitor_name: 경쟁사 이름
+            collect_links: 기록된 'links'를 함께 반환할지 여부
+            
+        Returns:
+            기록된 페이지 데이터 또는 None (저널이 없거나 기록되지 않은 페이지)
+        """
+        if not self.journal:
+            return None
+        
+        page_data = self.journal.completed_page(url, competitor_name)
+        if page_data is None:
+            return None
+        
+        if not collect_links:
+            page_data.pop('links', None)
+        logger.info(f"이전 실행에서 완료된 페이지: {url}")
+        return page_data
+    
+    def record_completed(self, page_data: Dict) -> None:
+        """완료된 페이지를 저널에 기록 (저널이 없으면 무시)"""
+        if self.journal:
+            self.journal.record_page(page_data)
+    
+    def _fetch_slot(self):
+        """
+        크롤러의 요청 하나가 점유하는 동시성 슬롯 (with 문으로 사용)
+
+        동기 스크래퍼는 한 번에 한 요청만 보내므로 제한하지 않습니다.
+        AsyncWebScraper는 전체 동시 요청 수 상한에 포함되도록 재정의합니다.
+        """
+        return nullcontext()
+    
+    def _fetch_page_data(self, url: str, competitor_name: str,
+                         collect_links: bool = False) -> Optional[Dict]:
+        """
+        페이지를 요청하고 데이터를 추출합니다. (지연 없이 1회 요청)
+        
+        Args:
+            url: 스크래핑할 URL
+            competitor_name: 경쟁사 이름
+            collect_links: 페이지의 <a href> 링크를 'links' 키로 함께 반환할지 여부
+            
+        Returns:
+            스크래핑된 데이터 딕셔너리 또는 None
+            (304 응답이면 not_modified=True가 표시된 딕셔너리,
+             전송량 예산 소진으로 연기되거나 서킷 브레이커로 건너뛰면 None)
+        """
+        journaled = self.journaled_page(url, competitor_name, collect_links=collect_links)
+        if journaled is not None:
+            return journaled
+        
+        if self._defer_for_budget(url) or self._skip_unavailable_host(url):
+            return None
+        
         try:
             logger.info(f"스크래핑 시작: {url}")
             
-            response = self.session.get(url, timeout=10)
+            response = self._request(url)
+            
+            # 304: 본문 다운로드/파싱 없이 변경 없음으로 처리
+            if response.status_code == 304:
+                logger.info(f"변경 없음 (304): {url}")
+                page_data = self._build_not_modified_data(url, competitor_name)
+                self.record_completed(page_data)
+                return page_data
+            
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 페이지 데이터 추출
-            page_data = {
-                'id': str(uuid.uuid4()),
-                'competitor_name': competitor_name,
-                'url': url,
-                'page_title': self._extract_title(soup),
-                'content': self._extract_content(soup),
-                'meta_description': self._extract_meta_description(soup),
-                'collected_at': datetime.utcnow().isoformat(),
-                'content_hash': None
-            }
+            host = urlsplit(url).hostname or ''
+            raw_chunks = [] if self.archive else None
+            try:
+                extracted = self._read_body(response, collect_links=collect_links,
+                                            raw_chunks=raw_chunks, host=host)
+            finally:
+                response.close()
             
-            # 콘텐츠 해시 생성
-            content_for_hash = f"{page_data['page_title']}{page_data['content']}"
-            page_data['content_hash'] = self._generate_content_hash(content_for_hash)
+            if self.archive:
+                self.archive.append(url, competitor_name, b''.join(raw_chunks), response.headers)
             
-            logger.info(f"스크래핑 완료: {url}")
+            with scrape_metrics.timer(host, 'hash'):
+                fields = add_fingerprints(extracted)
             
-            # Rate limiting
-            if self.delay > 0:
-                time.sleep(self.delay)
+            page_data = self.build_page_data(
+                url, competitor_name, fields,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified')
+            )
+            if collect_links:
+                page_data['links'] = extracted.get('links', [])
+            self.record_completed(page_data)
+            
+            logger.info(f"스크래핑 완료: {url}")
             
             return page_data
             
@@ -91,10 +251,291 @@ class WebScraper:
             logger.error(f"스크래핑 실패 {url}: {str(e)}")
             return None
     
+    def fetch_raw(self, url: str, competitor_name: str = '') -> Optional[Dict]:
+        """
+        본문을 파싱하지 않고 원본 응답만 내려받습니다. (속도 제한은 호출자가 처리)
+        
+        Args:
+            url: 요청할 URL
+            competitor_name: 경쟁사 이름 (아카이브 기록용)
+            
+        Returns:
+            {'not_modified': True} (304 응답), 
+            {'body', 'encoding', 'etag', 'last_modified'} 딕셔너리, 
+            또는 실패/전송량 예산 소진으로 연기/서킷 브레이커로 건너뛴 경우 None
+        """
+        if self._defer_for_budget(url) or self._skip_unavailable_host(url):
+            return None
+        
+        try:
+            logger.info(f"다운로드 시작: {url}")
+            
+            response = self._request(url)
+            
+            if response.status_code == 304:
+                logger.info(f"변경 없음 (304): {url}")
+                return {'not_modified': True}
+            
+            response.raise_for_status()
+            
+            try:
+                encoding = self._check_response_headers(response)
+                host = urlsplit(url).hostname or ''
+                with scrape_metrics.timer(host, 'download'):
+                    with closing(self._iter_body(response, host)) as chunks:
+                        body = b''.join(chunks)
+            finally:
+                response.close()
+            
+            if self.archive:
+                self.archive.append(url, competitor_name, body, response.headers)
+            
+            return {
+                'body': body,
+                'encoding': encoding,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+            
+        except Exception as e:
+            logger.error(f"다운로드 실패 {url}: {str(e)}")
+            return None
+    
+    def build_page_data(self, url: str, competitor_name: str, fields: Dict[str, str],
+                        etag: Optional[str] = None,
+                        last_modified: Optional[str] = None) -> Dict:
+        """
+        추출/지문 결과로 페이지 데이터 딕셔너리를 만들고 검증자를 갱신합니다.
+        
+        Args:
+            url: 페이지 URL
+            competitor_name: 경쟁사 이름
+            fields: page_title, content, meta_description, content_hash, content_simhash
+            etag: 응답 ETag 헤더
+            last_modified: 응답 Last-Modified 헤더
+            
+        Returns:
+            페이지 데이터 딕셔너리
+        """
+        page_data = {
+            'id': str(uuid.uuid4()),
+            'competitor_name': competitor_name,
+            'url': url,
+            'page_title': fields['page_title'],
+            'content': fields['content'],
+            'meta_description': fields['meta_description'],
+            'collected_at': datetime.utcnow().isoformat(),
+            'content_hash': fields['content_hash'],
+            'content_simhash': fields['content_simhash']
+        }
+        
+        if self.validator_store:
+            self.validator_store.update(
+                url,
+                etag=etag,
+                last_modified=last_modified,
+                content_hash=page_data['content_hash']
+            )
+        
+        return page_data
+    
+    def _request(self, url: str) -> requests.Response:
+        """
+        조건부 헤더를 붙여 스트리밍 모드로 요청합니다.
+        
+        타임아웃은 호스트의 관측 지연 시간으로 정하고, 연결 오류/타임아웃/재시도 대상
+        상태 코드는 지터 지수 백오프로 최대 max_retries번 재시도합니다. 재시도 중
+        서킷 브레이커가 열리면 더 기다리지 않습니다.
+        
+        Raises:
+            requests.ConnectionError, requests.Timeout: 재시도 후에도 실패
+        """
+        conditional_headers = (
+            self.validator_store.conditional_headers(url) if self.validator_store else {}
+        )
+        request_options = {'headers': conditional_headers} if conditional_headers else {}
+        
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url, timeout=self.host_health.timeout_for(url), stream=True, **request_options
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.host_health.record_failure(url)
+                if not self._should_retry(url, attempt):
+                    raise
+                self._wait_before_retry(url, attempt, str(e))
+                attempt += 1
+                continue
+            
+            if response.status_code not in RETRYABLE_STATUS_CODES:
+                self.host_health.record_success(url, time.perf_counter() - started)
+                return response
+            
+            self.host_health.record_failure(url)
+            if not self._should_retry(url, attempt):
+                return response
+            response.close()
+            self._wait_before_retry(url, attempt, f"HTTP {response.status_code}")
+            attempt += 1
+    
+    def _should_retry(self, url: str, attempt: int) -> bool:
+        """재시도 횟수가 남았고 호스트가 차단되지 않았는지 여부"""
+        return attempt < self.max_retries and self.host_health.is_available(url)
+    
+    def _wait_before_retry(self, url: str, attempt: int, reason: str) -> None:
+        """지터 지수 백오프 대기"""
+        delay = backoff_delay(attempt)
+        logger.warning(f"요청 재시도 {attempt + 1}/{self.max_retries} ({delay:.1f}초 후) {url}: {reason}")
+        time.sleep(delay)
+    
+    def _skip_unavailable_host(self, url: str) -> bool:
+        """서킷 브레이커가 열린 호스트의 페이지면 건너뜀 (건너뛰면 True)"""
+        if self.host_health.is_available(url):
+            return False
+        
+        self.host_health.record_skipped(url)
+        logger.warning(f"호스트 차단 중(서킷 브레이커)으로 건너뜀: {url}")
+        return True
+    
+    def _skip_not_due(self, url: str) -> bool:
+        """재수집 일정상 아직 수집 시각이 아닌 페이지면 건너뜀 (건너뛸 때 True)"""
+        return self.recrawl_schedule is not None and self.recrawl_schedule.skip_if_not_due(url)
+    
+    def _check_response_headers(self, response: requests.Response) -> Optional[str]:
+        """
+        본문을 받기 전에 Content-Type과 Content-Length를 검사합니다.
+        
+        Returns:
+            Content-Type에 명시된 charset (없으면 None)
+            
+        Raises:
+            ValueError: 허용되지 않은 Content-Type 또는 크기 상한 초과
+        """
+        content_type = response.headers.get('Content-Type', '')
+        mime_type = content_type.split(';')[0].strip().lower()
+        if mime_type and mime_type not in self.allowed_content_types:
+            raise ValueError(f"허용되지 않은 Content-Type: {mime_type}")
+        
+        content_length = response.headers.get('Content-Length', '')
+        if content_length.isdigit() and int(content_length) > self.max_response_bytes:
+            raise ValueError(f"응답 크기 상한 초과: {content_length} bytes")
+        
+        return self._charset_of(content_type)
+    
+    def _iter_body(self, response: requests.Response, host: str = ''):
+        """
+        본문을 조각 단위로 내려받습니다. (Content-Encoding은 스트리밍으로 해제)
+        
+        다운로드가 끝나거나 중단되면 네트워크로 받은 바이트(wire)와 해제 후 바이트를
+        host 기준으로 bandwidth에 기록합니다. 중간에 멈출 수 있으므로 호출자는
+        contextlib.closing으로 감싸 기록 시점을 보장해야 합니다.
+        
+        Raises:
+            ValueError: 누적 크기가 max_response_bytes 초과
+        """
+        received = 0
+        try:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_BYTES):
+                received += len(chunk)
+                if received > self.max_response_bytes:
+                    raise ValueError(f"응답 크기 상한 초과: {self.max_response_bytes} bytes")
+                yield chunk
+        finally:
+            self.bandwidth.record(host, self._wire_bytes(response, received), received)
+    
+    @staticmethod
+    def _wire_bytes(response: requests.Response, decoded_bytes: int) -> int:
+        """압축 해제 전 수신 바이트 (원본 스트림 위치를 알 수 없으면 해제 후 바이트)"""
+        raw = getattr(response, 'raw', None)
+        tell = getattr(raw, 'tell', None)
+        if callable(tell):
+            try:
+                position = tell()
+                if isinstance(position, int):
+                    return position
+            except (OSError, ValueError):
+                pass
+        return decoded_bytes
+    
+    def _defer_for_budget(self, url: str) -> bool:
+        """전송량 예산이 소진되었고 우선순위가 낮은 페이지면 연기 (연기 시 True)"""
+        if not self.bandwidth.exhausted or page_priority(url) < self.defer_priority:
+            return False
+        
+        self.bandwidth.record_deferred(url)
+        logger.warning(f"대역폭 예산 소진으로 수집 연기: {url}")
+        return True
+    
+    def _read_body(self, response: requests.Response, collect_links: bool = False,
+                   raw_chunks: Optional[List[bytes]] = None, host: str = '') -> Dict[str, str]:
+        """
+        응답 본문을 조각 단위로 내려받으며 추출합니다.
+        
+        Content-Type이 허용 목록에 없거나 본문이 max_response_bytes를 넘으면
+        다운로드를 중단하고, 텍스트 상한에 도달하면 나머지 본문은 받지 않습니다.
+        raw_chunks가 주어지면 원본 조각을 모두 담기 위해 본문 끝까지 내려받습니다.
+        다운로드/파싱/추출 시간은 host 기준으로 scrape_metrics에, 전송량은 bandwidth에
+        기록됩니다.
+        
+        Raises:
+            ValueError: 허용되지 않은 Content-Type 또는 크기 상한 초과
+        """
+        extractor = IncrementalPageExtractor(
+            backend=self.parser_backend,
+            encoding=self._check_response_headers(response),
+            collect_links=collect_links
+        )
+        started = time.perf_counter()
+        with closing(self._iter_body(response, host)) as chunks:
+            for chunk in chunks:
+                if raw_chunks is not None:
+                    raw_chunks.append(chunk)
+                    if not extractor.done:
+                        extractor.feed(chunk)
+                    continue
+                extractor.feed(chunk)
+                if extractor.done:
+                    break
+        # 스트리밍 파싱이 다운로드 중에 일어나므로 파싱 시간을 빼서 순수 다운로드 시간 계산
+        download_seconds = time.perf_counter() - started - extractor.timings['parse']
+        
+        extracted = extractor.close()
+        scrape_metrics.record(host, 'download', download_seconds)
+        scrape_metrics.record(host, 'parse', extractor.timings['parse'])
+        scrape_metrics.record(host, 'extract', extractor.timings['extract'])
+        return extracted
+    
+    @staticmethod
+    def _charset_of(content_type: str) -> Optional[str]:
+        """Content-Type 헤더의 charset 값 추출"""
+        for param in content_type.split(';')[1:]:
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'charset':
+                return value.strip('"\' ') or None
+        return None
+    
+    def _build_not_modified_data(self, url: str, competitor_name: str) -> Dict:
+        """304 응답에 대한 변경 없음 표시 데이터 생성"""
+        entry = self.validator_store.get(url) or {}
+        return {
+            'competitor_name': competitor_name,
+            'url': url,
+            'collected_at': datetime.utcnow().isoformat(),
+            'content_hash': entry.get('content_hash'),
+            'not_modified': True
+        }
+    
     def scrape_competitor(self, competitor_config: Dict) -> List[Dict]:
         """
         경쟁사의 여러 페이지를 스크래핑합니다.
         
+        competitor_config에 "crawl": True가 있으면 target_pages와 sitemap.xml에서
+        시작해 같은 사이트 링크를 따라가며 최대 max_pages(기본: max_pages_per_site)개를
+        수집합니다.
+        
         Args:
             competitor_config: 경쟁사 설정 딕셔너리
             
@@ -102,12 +543,17 @@ class WebScraper:
             스크래핑된 데이터 리스트
         """
         results = []
-        base_url = competitor_config['url']
         competitor_name = competitor_config['name']
-        target_pages = competitor_config.get('target_pages', ['/'])
+        self._configure_rate_limit(competitor_config)
         
-        for page_path in target_pages:
-            full_url = base_url.rstrip('/') + page_path
+        if competitor_config.get('crawl'):
+            crawler = SiteCrawler(
+                self,
+                max_pages=competitor_config.get('max_pages', self.max_pages_per_site)
+            )
+            return crawler.crawl(competitor_config)
+        
+        for full_url in self._build_target_urls(competitor_config):
             page_data = self._scrape_page(full_url, competitor_name)
             
             if page_data:
@@ -115,34 +561,85 @@ class WebScraper:
         
         return results
     
+    def _build_target_urls(self, competitor_config: Dict) -> List[str]:
+        """경쟁사 설정의 target_pages로 전체 URL 목록 생성"""
+        base_url = competitor_config['url']
+        target_pages = competitor_config.get('target_pages', ['/'])
+        return [base_url.rstrip('/') + page_path for page_path in target_pages]
+    
+    def _configure_rate_limit(self, competitor_config: Dict) -> None:
+        """경쟁사 설정의 rate_limit 항목을 해당 호스트 속도 제한에 반영"""
+        rate_limit = competitor_config.get('rate_limit')
+        if not rate_limit:
+            return
+        
+        self.rate_limiter.configure(
+            competitor_config['url'],
+            requests_per_second=rate_limit.get('requests_per_second'),
+            burst=rate_limit.get('burst', 1)
+        )
+    
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """페이지 제목 추출"""
-        title_tag = soup.find('title')
-        return title_tag.get_text().strip() if title_tag else ""
+        return extract_title(soup)
     
     def _extract_content(self, soup: BeautifulSoup) -> str:
         """페이지 텍스트 콘텐츠 추출"""
-        # 스크립트와 스타일 태그 제거
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # 텍스트 추출
-        text = soup.get_text()
-        
-        # 공백 정리
-        lines = (line.strip() for line in text.splitlines())
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-        
-        return text[:10000]  # 최대 10,000자로 제한
+        return extract_content(soup)  # 최대 10,000자로 제한
     
     def _extract_meta_description(self, soup: BeautifulSoup) -> str:
         """메타 설명 추출"""
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc:
-            return meta_desc.get('content', '').strip()
-        return ""
+        return extract_meta_description(soup)
     
     def _generate_content_hash(self, content: str) -> str:
         """콘텐츠 해시 생성"""
-        return hashlib.md5(content.encode('utf-8')).hexdigest() 
+        return generate_content_hash(content)
+
+
+def generate_content_hash(content: str) -> str:
+    """콘텐츠 해시 생성 (MD5)"""
+    return hashlib.md5(content.encode('utf-8')).hexdigest()
+
+
+def add_fingerprints(extracted: Dict[str, str]) -> Dict[str, str]:
+    """
+    추출 결과에 content_hash와 content_simhash를 추가합니다.
+    
+    Args:
+        extracted: page_title, content, meta_description 딕셔너리
+        
+    Returns:
+        지문이 추가된 새 딕셔너리
+    """
+    fields = dict(extracted)
+    fields['content_hash'] = generate_content_hash(f"{fields['page_title']}{fields['content']}")
+    fields['content_simhash'] = compute_simhash(f"{fields['page_title']} {fields['content']}")
+    return fields
+
+
+def parse_page_body(body: bytes, backend: str = DEFAULT_PARSER_BACKEND,
+                    encoding: Optional[str] = None) -> Dict[str, str]:
+    """
+    내려받은 본문을 추출하고 지문을 계산합니다. (프로세스 풀 작업 단위)
+    
+    Args:
+        body: 응답 본문 바이트
+        backend: HTML 파서 백엔드
+        encoding: Content-Type에 명시된 charset
+        
+    Returns:
+        page_title, content, meta_description, content_hash, content_simhash 딕셔너리
+        (단계별 소요 시간(초)은 'timings' 키에 parse/extract/hash로 포함)
+    """
+    extractor = IncrementalPageExtractor(backend=backend, encoding=encoding)
+    for start in range(0, len(body), DOWNLOAD_CHUNK_BYTES):
+        if extractor.done:
+            break
+        extractor.feed(body[start:start + DOWNLOAD_CHUNK_BYTES])
+    extracted = extractor.close()
+    
+    started = time.perf_counter()
+    fields = add_fingerprints(extracted)
+    fields['timings'] = dict(extractor.timings, hash=time.perf_counter() - started)
+    return fields
+
@@ -5,18 +5,58 @@ MarketingAI 메인 실행 스크립트
 
 import sys
 import os
+import argparse
+import asyncio
+import json
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from functools import partial
 import hashlib
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from config.config import (
-    PROJECT_ID, DATASET_ID, COMPETITORS, REQUEST_DELAY, LOG_LEVEL
+    PROJECT_ID, DATASET_ID, COMPETITORS, REQUEST_DELAY, LOG_LEVEL, MAX_PAGES_PER_SITE,
+    SCRAPER_MODE, MAX_CONCURRENT_REQUESTS, HTTP_VALIDATOR_CACHE_PATH,
+    HTML_PARSER_BACKEND, MAX_RESPONSE_BYTES, ALLOWED_CONTENT_TYPES,
+    SIMHASH_SIMILARITY_THRESHOLD, NEAR_DUPLICATE_DEDUP_ENABLED, PIPELINE_FETCH_WORKERS, PIPELINE_PARSE_WORKERS,
+    PIPELINE_QUEUE_SIZE, BUCKET_NAME, RESPONSE_ARCHIVE_ENABLED, RESPONSE_ARCHIVE_DIR,
+    RESPONSE_ARCHIVE_SEGMENT_BYTES, RESPONSE_ARCHIVE_UPLOAD, SCRAPE_METRICS_PATH,
+    HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, DNS_CACHE_TTL_SECONDS,
+    BANDWIDTH_BUDGET_BYTES, BANDWIDTH_DEFER_PRIORITY, INCREMENTAL_CONTENT_STORAGE,
+    RUN_JOURNAL_ENABLED, RUN_JOURNAL_PATH, RUN_JOURNAL_MAX_AGE_HOURS,
+    REQUEST_TIMEOUT_SECONDS, REQUEST_MAX_RETRIES, CIRCUIT_BREAKER_FAILURES,
+    CIRCUIT_BREAKER_COOLDOWN_SECONDS, CONTENT_HASH_INDEX_ENABLED, CONTENT_HASH_INDEX_PATH,
+    STREAM_BATCH_ROWS, STREAM_FLUSH_SECONDS, STREAM_QUEUE_SIZE,
+    SHARD_INDEX, SHARD_COUNT, RUN_ID, RUN_SUMMARY_DIR, RUN_SUMMARY_UPLOAD,
+    RECRAWL_SCHEDULE_ENABLED, RECRAWL_SCHEDULE_PATH, RECRAWL_MIN_INTERVAL_HOURS,
+    RECRAWL_MAX_INTERVAL_HOURS, RECRAWL_HISTORY_DAYS, BIGQUERY_LOAD_JOB_THRESHOLD_BYTES,
+    BIGQUERY_LOAD_FILE_FORMAT, BIGQUERY_LOCAL_DIR, BIGQUERY_STORAGE_WRITE_API, BIGQUERY_QUERY_CACHE_SIZE,
+    BIGQUERY_QUERY_CACHE_TTL_SECONDS
 )
 from src.data_collection.web_scraper import WebScraper
+from src.data_collection.async_scraper import AsyncWebScraper
+from src.data_collection.scrape_pipeline import ScrapePipeline
+from src.data_collection.validator_cache import ValidatorStore
+from src.data_collection.archive import ResponseArchive, reextract_archive
+from src.data_collection.run_journal import RunJournal
+from src.data_collection.host_health import HostHealth
+from src.data_collection.hash_index import ContentHashIndex, split_by_index
+from src.data_collection.recrawl_schedule import RecrawlSchedule
+from src.data_collection.fingerprint import is_near_duplicate
+from src.data_collection.sharding import select_shard, shard_label, shard_state_path
 from src.utils.bigquery_client import BigQueryClient
+from src.utils.local_bigquery import LocalBigQueryClient
+from src.utils.metrics import bandwidth_usage, scrape_metrics
+from src.utils.micro_batch import MicroBatchBuffer
+from src.utils.run_summary import (
+    save_run_summary, load_run_summaries, merge_run_summaries, format_merged_summary
+)
+from src.utils.http_transport import configure_shared_transport, transport_stats
 from src.analysis.basic_analyzer import BasicAnalyzer
 
 # 로깅 설정
@@ -26,58 +66,508 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_END_OF_PAGES = object()  # 수집 단계 종료 표시
+_QUEUE_POLL_SECONDS = 0.5  # 수집 결과를 기다리는 동안 배치 저장 시간을 확인하는 간격
+
 
-def main():
-    """메인 실행 함수"""
-    logger.info("MarketingAI 데이터 수집 시작")
+def create_bigquery_client():
+    """
+    설정에 맞는 BigQueryClient를 생성합니다.
     
-    # 클라이언트 초기화
-    scraper = WebScraper(delay=REQUEST_DELAY)
-    bq_client = BigQueryClient(PROJECT_ID, DATASET_ID)
+    BIGQUERY_LOCAL_DIR가 설정되어 있으면 GCP 대신 로컬 대체 클라이언트에 저장합니다.
+    (이전 실행이 남긴 테이블 파일을 읽어 중복 확인도 로컬에서 수행)
+    """
+    client = None
+    if BIGQUERY_LOCAL_DIR:
+        logger.info(f"로컬 BigQuery 대체 클라이언트 사용: {BIGQUERY_LOCAL_DIR}")
+        client = LocalBigQueryClient(PROJECT_ID, directory=BIGQUERY_LOCAL_DIR)
+    
+    return BigQueryClient(
+        PROJECT_ID, DATASET_ID,
+        incremental_storage=INCREMENTAL_CONTENT_STORAGE,
+        load_job_threshold_bytes=BIGQUERY_LOAD_JOB_THRESHOLD_BYTES,
+        load_file_format=BIGQUERY_LOAD_FILE_FORMAT,
+        client=client,
+        query_cache_size=BIGQUERY_QUERY_CACHE_SIZE,
+        query_cache_ttl_seconds=BIGQUERY_QUERY_CACHE_TTL_SECONDS,
+        # 로컬 대체 클라이언트에는 Storage Write API가 없으므로 일반 삽입 경로 사용
+        storage_write_api=BIGQUERY_STORAGE_WRITE_API and client is None
+    )
+
+
+def scrape_competitors(competitors, on_page, validator_store=None, archive=None, journal=None,
+                       host_health=None, recrawl_schedule=None):
+    """
+    경쟁사 페이지를 수집하여 완료되는 대로 on_page에 전달합니다.
     
-    all_data = []
+    SCRAPER_MODE가 "async"이면 모든 경쟁사를 동시에 수집하고, "pipeline"이면
+    다운로드 스레드와 추출 프로세스 풀로 나눠 수집하며,
+    그 외에는 경쟁사를 하나씩 순서대로 수집합니다.
+    journal이 주어지면 이전 실행에서 완료된 페이지는 다시 요청하지 않고,
+    recrawl_schedule이 주어지면 수집 시각이 된 페이지만 요청합니다.
+    """
+    scraper_options = {
+        'delay': REQUEST_DELAY,
+        'validator_store': validator_store,
+        'parser_backend': HTML_PARSER_BACKEND,
+        'max_response_bytes': MAX_RESPONSE_BYTES,
+        'allowed_content_types': ALLOWED_CONTENT_TYPES,
+        'max_pages_per_site': MAX_PAGES_PER_SITE,
+        'archive': archive,
+        'defer_priority': BANDWIDTH_DEFER_PRIORITY,
+        'journal': journal,
+        'host_health': host_health,
+        'max_retries': REQUEST_MAX_RETRIES,
+        'recrawl_schedule': recrawl_schedule
+    }
     
-    # 각 경쟁사 데이터 수집
-    for competitor in COMPETITORS:
+    if SCRAPER_MODE == "async":
+        scraper = AsyncWebScraper(max_concurrency=MAX_CONCURRENT_REQUESTS, **scraper_options)
+        asyncio.run(scraper.scrape_many(competitors, on_page=on_page))
+        return
+    
+    if SCRAPER_MODE == "pipeline":
+        pipeline = ScrapePipeline(
+            WebScraper(**scraper_options),
+            fetch_workers=PIPELINE_FETCH_WORKERS,
+            parse_workers=PIPELINE_PARSE_WORKERS,
+            queue_size=PIPELINE_QUEUE_SIZE
+        )
+        pipeline.run(competitors, on_page=on_page)
+        return
+    
+    scraper = WebScraper(**scraper_options)
+    for competitor in competitors:
         logger.info(f"경쟁사 '{competitor['name']}' 데이터 수집 시작")
-        
         try:
-            competitor_data = scraper.scrape_competitor(competitor)
-            
-            # 중복 체크 및 필터링
-            filtered_data = []
-            for data in competitor_data:
-                latest_hash = bq_client.get_latest_content_hash(
-                    data['competitor_name'], 
-                    data['url']
-                )
-                
-                if latest_hash != data['content_hash']:
-                    filtered_data.append(data)
-                    logger.info(f"새로운 콘텐츠 발견: {data['url']}")
-                else:
-                    logger.info(f"콘텐츠 변경 없음: {data['url']}")
-            
-            all_data.extend(filtered_data)
-            logger.info(f"경쟁사 '{competitor['name']}' 수집 완료: {len(filtered_data)}개 새 페이지")
-            
+            for page in scraper.scrape_competitor(competitor):
+                on_page(page)
         except Exception as e:
             logger.error(f"경쟁사 '{competitor['name']}' 수집 실패: {str(e)}")
+
+
+def lookup_latest_fingerprints(bq_client, hash_index, pairs):
+    """
+    (경쟁사 이름, URL) 쌍의 최신 지문을 로컬 해시 인덱스에서 먼저 찾고,
+    인덱스에 없는 쌍만 BigQuery에서 한 번에 조회합니다.
+    
+    BigQuery에서 찾은 지문은 다음 실행을 위해 인덱스에 반영합니다.
+    """
+    pairs = list(pairs)
+    fingerprints, missing = split_by_index(hash_index, pairs)
+    logger.info(f"해시 인덱스 적중 {len(fingerprints)}개, BigQuery 조회 {len(missing)}개")
     
-    # BigQuery에 데이터 저장
-    if all_data:
-        logger.info(f"총 {len(all_data)}개 페이지를 BigQuery에 저장 중...")
-        success = bq_client.insert_competitor_data(all_data)
+    if missing:
+        fetched = bq_client.get_latest_content_fingerprints(missing)
+        fingerprints.update(fetched)
+        if hash_index is not None and fetched:
+            hash_index.update(
+                dict(fingerprint, competitor_name=name, url=url)
+                for (name, url), fingerprint in fetched.items()
+            )
+    
+    return fingerprints
+
+
+def store_new_pages(bq_client, hash_index, pages, new_page_counts=None, recrawl_schedule=None,
+                    near_duplicate_dedup=NEAR_DUPLICATE_DEDUP_ENABLED):
+    """
+    수집된 페이지 배치에서 변경된 페이지만 골라 BigQuery에 저장합니다.
+    
+    배치의 최신 지문은 로컬 인덱스 → BigQuery(쿼리 한 번) 순으로 조회하고,
+    304 응답과 해시가 같은 페이지는 저장하지 않습니다. near_duplicate_dedup이 켜져
+    있으면 SimHash 근사 중복 페이지도 저장하지 않습니다.
+    
+    Args:
+        new_page_counts: 경쟁사별 저장한 새 페이지 수를 누적할 딕셔너리 (선택사항)
+        recrawl_schedule: 저장 후 페이지별 변경 여부를 반영할 재수집 일정 (선택사항)
+        near_duplicate_dedup: 근사 중복 페이지 저장 생략 여부 (가격 등 작은 변경도 생략될 수 있음)
+    
+    Returns:
+        저장 성공 여부 (저장할 페이지가 없으면 True)
+    """
+    latest_fingerprints = lookup_latest_fingerprints(bq_client, hash_index, (
+        (data['competitor_name'], data['url'])
+        for data in pages
+        if not data.get('not_modified')
+    ))
+    no_fingerprint = {'content_hash': "", 'content_simhash': ""}
+    
+    new_pages = []
+    changed = {}  # URL → 이전 수집 이후 변경 여부 (재수집 일정 반영용)
+    for data in pages:
+        changed[data['url']] = False
         
-        if success:
-            logger.info("데이터 저장 완료")
+        # 304 응답은 해시 조회 없이 변경 없음으로 처리
+        if data.get('not_modified'):
+            logger.info(f"콘텐츠 변경 없음 (304): {data['url']}")
+            continue
+        
+        key = (data['competitor_name'], data['url'])
+        latest = latest_fingerprints.get(key, no_fingerprint)
+        
+        if latest['content_hash'] == data['content_hash']:
+            logger.info(f"콘텐츠 변경 없음: {data['url']}")
+        elif near_duplicate_dedup and is_near_duplicate(
+                latest['content_simhash'], data.get('content_simhash'), SIMHASH_SIMILARITY_THRESHOLD):
+            logger.info(f"콘텐츠 변경 없음 (근사 중복): {data['url']}")
         else:
-            logger.error("데이터 저장 실패")
+            new_pages.append(data)
+            # 처음 수집한 페이지는 비교 대상이 없으므로 변경으로 보지 않음
+            changed[data['url']] = key in latest_fingerprints
+            logger.info(f"새로운 콘텐츠 발견: {data['url']}")
+    
+    if new_pages:
+        logger.info(f"{len(new_pages)}개 페이지를 BigQuery에 저장 중...")
+        if not bq_client.store_competitor_pages(new_pages):
+            logger.error(f"배치 저장 실패: {len(new_pages)}개 페이지")
+            return False
+    
+    # 저장에 실패한 배치는 반영하지 않으므로 다음 실행에서 다시 수집
+    if recrawl_schedule is not None:
+        recrawl_schedule.record_checks(changed.items())
+    
+    if hash_index is not None:
+        hash_index.update(new_pages)
+    if new_page_counts is not None:
+        for data in new_pages:
+            name = data['competitor_name']
+            new_page_counts[name] = new_page_counts.get(name, 0) + 1
+    return True
+
+
+def main(shard=SHARD_INDEX, num_shards=SHARD_COUNT, run_id=RUN_ID):
+    """
+    메인 실행 함수
+    
+    Args:
+        shard: 이 노드가 수집할 샤드 번호 (0부터 시작)
+        num_shards: 전체 샤드 수 (경쟁사는 호스트 기준 일관 해싱으로 배정)
+        run_id: 샤드 요약을 묶는 실행 ID (기본: 실행 날짜)
+    
+    Returns:
+        모든 배치 저장 성공 여부
+    """
+    run_id = run_id or datetime.now().strftime('%Y%m%d')
+    started_at = time.time()
+    competitors = select_shard(COMPETITORS, shard, num_shards)
+    logger.info(f"MarketingAI 데이터 수집 시작: {shard_label(shard, num_shards)}, "
+                f"경쟁사 {len(competitors)}/{len(COMPETITORS)}개")
+    
+    # 같은 호스트에서 여러 샤드를 실행해도 로컬 상태 파일이 겹치지 않도록 샤드별 경로 사용
+    validator_cache_path = shard_state_path(HTTP_VALIDATOR_CACHE_PATH, shard, num_shards)
+    journal_path = shard_state_path(RUN_JOURNAL_PATH, shard, num_shards)
+    metrics_path = shard_state_path(SCRAPE_METRICS_PATH, shard, num_shards)
+    
+    # 클라이언트 초기화
+    configure_shared_transport(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        dns_ttl_seconds=DNS_CACHE_TTL_SECONDS
+    )
+    # 전송량 예산은 실행 전체 기준이므로 샤드 수로 나눠 적용
+    budget_bytes = BANDWIDTH_BUDGET_BYTES // num_shards if BANDWIDTH_BUDGET_BYTES else None
+    bandwidth_usage.reset(budget_bytes=budget_bytes)
+    bq_client = create_bigquery_client()
+    validator_store = ValidatorStore(validator_cache_path)
+    archive = None
+    if RESPONSE_ARCHIVE_ENABLED:
+        archive = ResponseArchive(
+            RESPONSE_ARCHIVE_DIR,
+            segment_max_bytes=RESPONSE_ARCHIVE_SEGMENT_BYTES,
+            bucket_name=BUCKET_NAME if RESPONSE_ARCHIVE_UPLOAD else None,
+            project_id=PROJECT_ID
+        )
+    
+    journal = None
+    if RUN_JOURNAL_ENABLED:
+        journal = RunJournal(journal_path, max_age_hours=RUN_JOURNAL_MAX_AGE_HOURS)
+        if journal.resumed:
+            logger.info(f"중단된 실행을 이어서 진행합니다: 완료된 페이지 {journal.page_count}개")
+    
+    host_health = HostHealth(
+        default_timeout=REQUEST_TIMEOUT_SECONDS,
+        failure_threshold=CIRCUIT_BREAKER_FAILURES,
+        cooldown_seconds=CIRCUIT_BREAKER_COOLDOWN_SECONDS
+    )
+    
+    hash_index = ContentHashIndex(CONTENT_HASH_INDEX_PATH) if CONTENT_HASH_INDEX_ENABLED else None
+    recrawl_schedule = None
+    if RECRAWL_SCHEDULE_ENABLED:
+        recrawl_schedule = RecrawlSchedule(
+            RECRAWL_SCHEDULE_PATH,
+            min_interval_hours=RECRAWL_MIN_INTERVAL_HOURS,
+            max_interval_hours=RECRAWL_MAX_INTERVAL_HOURS
+        )
+    
+    # 수집 스레드가 크기 제한 큐에 페이지를 넣고, 이 스레드가 배치 단위로 중복 확인 후 저장
+    # (저장이 밀리면 큐가 차서 수집이 대기하고, 실행 저널도 페이지 키와 파일 위치만 메모리에
+    #  두므로 메모리에 남는 페이지 본문은 큐와 배치 크기로 제한됨)
+    page_queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+    
+    def produce():
+        try:
+            scrape_competitors(competitors, page_queue.put, validator_store, archive, journal,
+                               host_health, recrawl_schedule)
+        except Exception as e:
+            logger.error(f"데이터 수집 실패: {str(e)}")
+        finally:
+            page_queue.put(_END_OF_PAGES)
+    
+    producer = threading.Thread(target=produce, name="scrape-producer", daemon=True)
+    producer.start()
+    
+    new_page_counts = {}
+    buffer = MicroBatchBuffer(
+        partial(store_new_pages, bq_client, hash_index, new_page_counts=new_page_counts,
+                recrawl_schedule=recrawl_schedule),
+        max_rows=STREAM_BATCH_ROWS,
+        max_wait_seconds=STREAM_FLUSH_SECONDS
+    )
+    
+    while True:
+        try:
+            page = page_queue.get(timeout=_QUEUE_POLL_SECONDS)
+        except queue.Empty:
+            buffer.flush_if_due()
+            continue
+        if page is _END_OF_PAGES:
+            break
+        buffer.add(page)
+        buffer.flush_if_due()
+    
+    producer.join()
+    success = buffer.close()
+    
+    for competitor in competitors:
+        logger.info(f"경쟁사 '{competitor['name']}' 수집 완료: "
+                    f"{new_page_counts.get(competitor['name'], 0)}개 새 페이지")
+    
+    if buffer.failed_batches:
+        logger.error(f"데이터 저장 실패: 배치 {buffer.failed_batches}개 ({buffer.failed_rows}개 페이지)")
+    elif new_page_counts:
+        logger.info(f"데이터 저장 완료: 총 {sum(new_page_counts.values())}개 페이지 "
+                    f"(배치 {buffer.flushed_batches}개)")
     else:
         logger.info("저장할 새로운 데이터가 없습니다.")
     
+    # 모든 배치 저장에 성공한 경우에만 검증자를 보존 (실패 시 다음 실행에서 전체 재수집)
+    if success:
+        validator_store.save()
+    
+    # 저장까지 끝나면 저널 삭제, 실패 시 다음 실행이 재요청 없이 저장을 재시도
+    if journal:
+        if success:
+            journal.complete()
+        else:
+            journal.close()
+            logger.info(f"실행 저널을 보존합니다 (다음 실행에서 재개): {journal_path}")
+    
+    if archive:
+        archive.close()
+    if hash_index is not None:
+        hash_index.close()
+    if recrawl_schedule is not None:
+        logger.info(f"재수집 일정: 수집 시각 전이라 건너뛴 페이지 {recrawl_schedule.skipped}개")
+        recrawl_schedule.close()
+    
+    # 단계별 지연 시간 요약 (네트워크/파싱 병목 및 느린 호스트 확인용)
+    logger.info("수집 단계별 지연 시간 요약\n" + scrape_metrics.format_summary())
+    logger.info(bandwidth_usage.format_summary())
+    host_summary = host_health.format_summary()
+    if host_summary:
+        logger.warning(host_summary)
+    scrape_metrics.save(metrics_path, extra={'bandwidth': bandwidth_usage.summary()})
+    
+    # 코디네이터(merge-summaries)가 샤드 결과를 합칠 수 있도록 실행 요약 저장
+    save_run_summary(RUN_SUMMARY_DIR, {
+        'run_id': run_id,
+        'shard': shard,
+        'num_shards': num_shards,
+        'competitors': [competitor['name'] for competitor in competitors],
+        'started_at': started_at,
+        'finished_at': time.time(),
+        'success': success,
+        'new_pages': new_page_counts,
+        'stored_batches': buffer.flushed_batches,
+        'failed_batches': buffer.failed_batches,
+        'failed_pages': buffer.failed_rows,
+        'bandwidth': bandwidth_usage.summary(),
+        'hosts': host_health.summary(),
+    }, bucket_name=BUCKET_NAME if RUN_SUMMARY_UPLOAD else None, project_id=PROJECT_ID)
+    
+    stats = transport_stats()
+    reused = sum(pool['reused_requests'] for pool in stats['pools'])
+    created = sum(pool['connections_created'] for pool in stats['pools'])
+    logger.info(f"연결 풀 통계: 새 연결 {created}개, 연결 재사용 요청 {reused}개, "
+                f"DNS 캐시 적중률 {stats['dns_cache']['hit_rate']:.0%}")
+    
     logger.info("MarketingAI 데이터 수집 완료")
+    return success
+
+
+def reextract(output_path, archive_dir=RESPONSE_ARCHIVE_DIR, backend=HTML_PARSER_BACKEND,
+              workers=PIPELINE_PARSE_WORKERS):
+    """
+    원본 응답 아카이브에 현재 추출 로직을 다시 실행해 JSONL로 저장합니다. (네트워크 사용 없음)
+    
+    Returns:
+        재추출된 페이지 수
+    """
+    logger.info(f"아카이브 재추출 시작: {archive_dir}")
+    
+    count = 0
+    with open(output_path, 'w', encoding='utf-8') as f:
+        for page in reextract_archive(archive_dir, backend, workers=workers):
+            f.write(json.dumps(page, ensure_ascii=False) + "\n")
+            count += 1
+    
+    logger.info(f"아카이브 재추출 완료: {count}개 페이지 → {output_path}")
+    return count
+
+
+def reconcile_hash_index(index_path=CONTENT_HASH_INDEX_PATH):
+    """
+    BigQuery의 URL별 최신 지문으로 로컬 해시 인덱스를 다시 만듭니다.
+    
+    Returns:
+        인덱스에 저장된 항목 수 (BigQuery 조회 실패 시 None, 기존 인덱스 유지)
+    """
+    logger.info(f"해시 인덱스 재구성 시작: {index_path}")
+    
+    bq_client = create_bigquery_client()
+    rows = bq_client.get_all_latest_content_fingerprints()
+    if rows is None:
+        logger.error("해시 인덱스 재구성 실패: 기존 인덱스를 유지합니다.")
+        return None
+    
+    hash_index = ContentHashIndex(index_path)
+    try:
+        count = hash_index.replace_all(rows)
+    finally:
+        hash_index.close()
+    
+    logger.info(f"해시 인덱스 재구성 완료: {count}개 항목")
+    return count
+
+
+def seed_recrawl_schedule(schedule_path=RECRAWL_SCHEDULE_PATH, days=RECRAWL_HISTORY_DAYS,
+                          overwrite=False):
+    """
+    BigQuery에 저장된 버전 이력의 URL별 변경 빈도로 재수집 일정을 초기화합니다.
+    
+    Returns:
+        일정에 반영한 URL 수 (BigQuery 조회 실패 시 None)
+    """
+    logger.info(f"재수집 일정 초기화 시작: 최근 {days}일 이력")
+    
+    bq_client = create_bigquery_client()
+    history = bq_client.get_page_history(days)
+    if history is None:
+        logger.error("재수집 일정 초기화 실패: 이력을 조회하지 못했습니다.")
+        return None
+    
+    analysis = BasicAnalyzer().analyze_content_changes(history)
+    schedule = RecrawlSchedule(
+        schedule_path,
+        min_interval_hours=RECRAWL_MIN_INTERVAL_HOURS,
+        max_interval_hours=RECRAWL_MAX_INTERVAL_HOURS
+    )
+    try:
+        count = schedule.seed_from_analysis(analysis.get('page_analysis', {}), overwrite=overwrite)
+    finally:
+        schedule.close()
+    
+    logger.info(f"재수집 일정 초기화 완료: {count}개 URL "
+                f"(평균 변경 빈도 {analysis.get('average_change_frequency', 0)})")
+    return count
+
+
+def merge_summaries(run_id, num_shards=None, summary_dir=RUN_SUMMARY_DIR, output_path=None):
+    """
+    샤드별 실행 요약을 하나로 합쳐 로그로 남깁니다. (코디네이터)
+    
+    RUN_SUMMARY_UPLOAD가 켜져 있으면 BUCKET_NAME에서 요약을 읽습니다.
+    
+    Returns:
+        통합 실행 요약 (누락/실패 샤드가 없으면 success가 True)
+    """
+    summaries = load_run_summaries(
+        summary_dir, run_id,
+        bucket_name=BUCKET_NAME if RUN_SUMMARY_UPLOAD else None,
+        project_id=PROJECT_ID
+    )
+    merged = merge_run_summaries(summaries, num_shards)
+    merged['run_id'] = run_id
+    
+    if merged['success']:
+        logger.info(format_merged_summary(merged))
+    else:
+        logger.error(format_merged_summary(merged))
+    
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(merged, f, ensure_ascii=False, indent=2)
+    return merged
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱 (기본 명령: collect)"""
+    parser = argparse.ArgumentParser(description="MarketingAI 경쟁사 데이터 수집")
+    subparsers = parser.add_subparsers(dest='command')
+    
+    collect_parser = subparsers.add_parser('collect', help="경쟁사 데이터 수집 및 BigQuery 저장")
+    collect_parser.add_argument('--shard', type=int, default=SHARD_INDEX, help="수집할 샤드 번호 (0부터 시작)")
+    collect_parser.add_argument('--num-shards', type=int, default=SHARD_COUNT, help="전체 샤드 수")
+    collect_parser.add_argument('--run-id', default=RUN_ID, help="샤드 요약을 묶는 실행 ID (기본: 실행 날짜)")
+    
+    reextract_parser = subparsers.add_parser('reextract', help="원본 응답 아카이브 재추출")
+    reextract_parser.add_argument('--output', required=True, help="결과 JSONL 파일 경로")
+    reextract_parser.add_argument('--archive-dir', default=RESPONSE_ARCHIVE_DIR, help="아카이브 디렉터리")
+    reextract_parser.add_argument('--backend', default=HTML_PARSER_BACKEND, help="HTML 파서 백엔드")
+    reextract_parser.add_argument('--workers', type=int, default=PIPELINE_PARSE_WORKERS,
+                                  help="추출 프로세스 수 (기본: CPU 코어 수)")
+    
+    reconcile_parser = subparsers.add_parser('reconcile-index', help="BigQuery 기준으로 로컬 해시 인덱스 재구성")
+    reconcile_parser.add_argument('--index-path', default=CONTENT_HASH_INDEX_PATH, help="해시 인덱스 파일 경로")
+    
+    seed_parser = subparsers.add_parser('seed-schedule', help="저장 이력의 변경 빈도로 재수집 일정 초기화")
+    seed_parser.add_argument('--schedule-path', default=RECRAWL_SCHEDULE_PATH, help="재수집 일정 파일 경로")
+    seed_parser.add_argument('--days', type=int, default=RECRAWL_HISTORY_DAYS, help="사용할 이력 기간 (일)")
+    seed_parser.add_argument('--overwrite', action='store_true', help="이미 일정에 있는 URL도 덮어쓰기")
+    
+    merge_parser = subparsers.add_parser('merge-summaries', help="샤드별 실행 요약 통합")
+    merge_parser.add_argument('--run-id', default=RUN_ID or datetime.now().strftime('%Y%m%d'),
+                              help="실행 ID (기본: 오늘 날짜)")
+    merge_parser.add_argument('--num-shards', type=int, default=None,
+                              help="기대하는 샤드 수 (기본: 요약에 기록된 값)")
+    merge_parser.add_argument('--summary-dir', default=RUN_SUMMARY_DIR, help="실행 요약 디렉터리")
+    merge_parser.add_argument('--output', default=None, help="통합 요약 JSON 저장 경로")
+    
+    return parser.parse_args(argv)
+
+
+def run_command(args):
+    """
+    파싱된 명령을 실행합니다.
+    
+    Returns:
+        프로세스 종료 코드 (성공 0, 실패 1 — 스케줄러/코디네이터가 실패한 실행을 감지하도록)
+    """
+    if args.command == 'reextract':
+        reextract(args.output, args.archive_dir, args.backend, args.workers)
+        return 0
+    if args.command == 'reconcile-index':
+        return 0 if reconcile_hash_index(args.index_path) is not None else 1
+    if args.command == 'seed-schedule':
+        return 0 if seed_recrawl_schedule(args.schedule_path, args.days, args.overwrite) is not None else 1
+    if args.command == 'merge-summaries':
+        merged = merge_summaries(args.run_id, args.num_shards, args.summary_dir, args.output)
+        return 0 if merged['success'] else 1
+    if args.command == 'collect':
+        return 0 if main(args.shard, args.num_shards, args.run_id) else 1
+    return 0 if main() else 1
 
 
 if __name__ == "__main__":
-    main() 
+    sys.exit(run_command(parse_args()))
@@ -4,26 +4,82 @@ BigQuery 클라이언트 모듈
 """
 
 from google.cloud import bigquery
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Set, Tuple
 import logging
-import json
+import re
+import tempfile
+
+from src.data_collection.content_blocks import (
+    collect_block_hashes, plan_incremental_rows, reconstruct_content
+)
+from src.utils.load_files import resolve_load_format, write_load_file
+from src.utils.query_cache import DEFAULT_MAX_ENTRIES, DEFAULT_TTL_SECONDS, QueryCache, cache_key
+from src.utils.row_serializer import RowSerializer, schema_for
+from src.utils.stream_writer import (
+    DEFAULT_MAX_IN_FLIGHT, DEFAULT_MAX_ROWS_PER_REQUEST, CommittedStreamWriter, StorageWriteTransport
+)
 
 logger = logging.getLogger(__name__)
 
+# 최신 해시 일괄 조회 시 쿼리 한 번에 넣을 (경쟁사, URL) 쌍 수
+LATEST_HASH_BATCH_SIZE = 1000
+
+# 삽입할 행의 JSON 크기가 이 값 이상이면 스트리밍 삽입 대신 로드 작업 사용
+# (스트리밍 삽입은 바이트당 과금되고 요청당 10MB로 제한됨)
+DEFAULT_LOAD_JOB_THRESHOLD_BYTES = 4 * 1024 * 1024
+
+# 스트리밍 조회 시 한 번에 가져올 행 수 (메모리에 동시에 올라가는 행 수 상한)
+DEFAULT_READ_PAGE_SIZE = 5000
+
+_COLUMN_NAME = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
 
 class BigQueryClient:
     """BigQuery 클라이언트 클래스"""
     
-    def __init__(self, project_id: str, dataset_id: str):
+    def __init__(self, project_id: str, dataset_id: str, incremental_storage: bool = False,
+                 load_job_threshold_bytes: Optional[int] = DEFAULT_LOAD_JOB_THRESHOLD_BYTES,
+                 load_file_format: str = 'parquet', client=None,
+                 query_cache_size: int = DEFAULT_MAX_ENTRIES,
+                 query_cache_ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 query_cache: Optional[QueryCache] = None,
+                 storage_write_api: bool = False, write_transport=None):
         """
         Args:
             project_id: GCP 프로젝트 ID
             dataset_id: BigQuery 데이터셋 ID
+            incremental_storage: True이면 페이지를 블록 단위(content_blocks +
+                page_versions)로 저장하고 최신 해시도 page_versions에서 조회
+            load_job_threshold_bytes: 행 JSON 크기가 이 값 이상인 삽입은 로드 작업으로 처리
+                (None이면 항상 스트리밍 삽입)
+            load_file_format: 로드 파일 형식 ("parquet", pyarrow가 없으면 "ndjson")
+            client: 사용할 BigQuery 클라이언트 (선택사항, 예: LocalBigQueryClient)
+            query_cache_size: 조회 결과 캐시 최대 항목 수 (0이면 캐시 사용 안 함)
+            query_cache_ttl_seconds: 조회 결과 캐시 유효 시간 (초)
+            query_cache: 여러 클라이언트가 공유할 캐시 (선택사항, 주어지면 위 두 값은 무시)
+            storage_write_api: True이면 삽입을 Storage Write API 커밋 스트림으로 처리
+                (오프셋으로 재시도 중복을 막고, 스트리밍 삽입/로드 작업 대신 사용)
+            write_transport: 커밋 스트림 전송 계층 (기본: 테이블별 StorageWriteTransport,
+                예: LocalWriteServer)
         """
-        self.client = bigquery.Client(project=project_id)
+        self.client = client or bigquery.Client(project=project_id)
         self.project_id = project_id
         self.dataset_id = dataset_id
         self.dataset_ref = self.client.dataset(dataset_id)
+        self.incremental_storage = incremental_storage
+        self.page_table = 'page_versions' if incremental_storage else 'competitor_data'
+        self.load_job_threshold_bytes = load_job_threshold_bytes
+        self.load_file_format = resolve_load_format(load_file_format)
+        # 테이블 이름별 (Table, RowSerializer) (스키마는 실행 중 바뀌지 않는다고 가정)
+        self._tables: Dict[str, Tuple[bigquery.Table, RowSerializer]] = {}
+        self.rejected_rows: List[Dict[str, Any]] = []
+        if query_cache is None and query_cache_size > 0:
+            query_cache = QueryCache(query_cache_size, query_cache_ttl_seconds)
+        self.query_cache = query_cache
+        self.storage_write_api = storage_write_api
+        self.write_transport = write_transport
+        self._write_transports: Dict[str, StorageWriteTransport] = {}
     
     def insert_competitor_data(self, data: List[Dict[str, Any]]) -> bool:
         """
@@ -36,72 +92,325 @@ class BigQueryClient:
             성공 여부
         """
         try:
-            table_ref = self.dataset_ref.table('competitor_data')
-            table = self.client.get_table(table_ref)
-            
-            # 데이터 형식 변환
-            rows_to_insert = []
-            for row in data:
-                formatted_row = {
-                    'id': row['id'],
-                    'competitor_name': row['competitor_name'],
-                    'url': row['url'],
-                    'page_title': row['page_title'],
-                    'content': row['content'],
-                    'meta_description': row['meta_description'],
-                    'collected_at': row['collected_at'],
-                    'content_hash': row['content_hash']
-                }
-                rows_to_insert.append(formatted_row)
-            
-            errors = self.client.insert_rows_json(table, rows_to_insert)
-            
-            if errors:
-                logger.error(f"BigQuery 삽입 오류: {errors}")
+            written = self._write_rows('competitor_data', data)
+            if written is None:
                 return False
             
-            logger.info(f"{len(rows_to_insert)}개 행이 성공적으로 삽입되었습니다.")
+            logger.info(f"{written}개 행이 성공적으로 삽입되었습니다.")
             return True
             
         except Exception as e:
             logger.error(f"BigQuery 삽입 실패: {str(e)}")
             return False
     
-    def insert_analysis_results(self, data: List[Dict[str, Any]]) -> bool:
+    def store_competitor_pages(self, data: List[Dict[str, Any]]) -> bool:
         """
-        분석 결과를 BigQuery에 삽입합니다.
+        수집된 페이지를 저장 방식(전체 행 또는 블록 단위)에 맞게 저장합니다.
         
         Args:
-            data: 삽입할 분석 결과 리스트
+            data: 삽입할 데이터 리스트
             
         Returns:
             성공 여부
         """
+        if self.incremental_storage:
+            return self.insert_page_versions(data)
+        return self.insert_competitor_data(data)
+    
+    def insert_page_versions(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        페이지를 블록 단위로 저장합니다.
+        
+        본문을 블록으로 나눠 아직 저장되지 않은 블록만 content_blocks에 넣고,
+        블록 해시 순서를 담은 버전 매니페스트를 page_versions에 넣습니다.
+        매니페스트가 없는 블록을 가리키지 않도록 블록을 먼저 저장합니다.
+        
+        Args:
+            data: 삽입할 데이터 리스트
+            
+        Returns:
+            성공 여부
+        """
+        try:
+            existing = self.get_existing_block_hashes(collect_block_hashes(data))
+            block_rows, version_rows = plan_incremental_rows(
+                data, existing, datetime.now().isoformat()
+            )
+            
+            if block_rows and self._write_rows('content_blocks', block_rows) is None:
+                return False
+            
+            if self._write_rows('page_versions', version_rows) is None:
+                return False
+            
+            new_chars = sum(row['content_length'] for row in block_rows)
+            total_chars = sum(row['content_length'] for row in version_rows)
+            logger.info(f"{len(version_rows)}개 페이지 버전 저장 완료: "
+                        f"새 블록 {len(block_rows)}개 ({new_chars}/{total_chars}자)")
+            return True
+            
+        except Exception as e:
+            logger.error(f"BigQuery 버전 삽입 실패: {str(e)}")
+            return False
+    
+    def get_existing_block_hashes(self, block_hashes: List[str]) -> Set[str]:
+        """
+        이미 저장된 블록 해시를 조회합니다.
+        
+        Args:
+            block_hashes: 확인할 블록 해시 리스트
+            
+        Returns:
+            content_blocks에 있는 블록 해시 집합
+            
+        Raises:
+            Exception: 조회 실패 (저장 여부를 모르면 블록이 누락될 수 있으므로 전달)
+        """
+        if not block_hashes:
+            return set()
+        
+        query = f"""
+        SELECT DISTINCT block_hash
+        FROM `{self.project_id}.{self.dataset_id}.content_blocks`
+        WHERE block_hash IN UNNEST(@block_hashes)
+        """
+        job_config = bigquery.QueryJobConfig(query_parameters=[
+            bigquery.ArrayQueryParameter('block_hashes', 'STRING', list(block_hashes))
+        ])
+        
+        query_job = self.client.query(query, job_config=job_config)
+        return {row['block_hash'] for row in query_job.result()}
+    
+    def get_page_version(self, competitor_name: str, url: str,
+                         version_id: Optional[str] = None) -> Optional[Dict]:
+        """
+        블록 단위로 저장된 페이지 버전을 복원합니다.
+        
+        Args:
+            competitor_name: 경쟁사 이름
+            url: URL
+            version_id: 버전 ID (없으면 최신 버전)
+            
+        Returns:
+            competitor_data 행과 같은 형식의 딕셔너리 (content 복원 포함) 또는 None
+        """
         try:
-            table_ref = self.dataset_ref.table('analysis_results')
-            table = self.client.get_table(table_ref)
-            
-            # 데이터 형식 변환
-            rows_to_insert = []
-            for row in data:
-                formatted_row = {
-                    'id': row['id'],
-                    'competitor_name': row['competitor_name'],
-                    'analysis_type': row['analysis_type'],
-                    'analysis_date': row['analysis_date'],
-                    'results': json.dumps(row['results']) if row['results'] else None,
-                    'summary': row['summary'],
-                    'created_at': row['created_at']
+            query = f"""
+            SELECT *
+            FROM `{self.project_id}.{self.dataset_id}.page_versions`
+            WHERE competitor_name = @competitor_name AND url = @url
+            """
+            params = [
+                bigquery.ScalarQueryParameter('competitor_name', 'STRING', competitor_name),
+                bigquery.ScalarQueryParameter('url', 'STRING', url)
+            ]
+            if version_id:
+                query += " AND id = @version_id"
+                params.append(bigquery.ScalarQueryParameter('version_id', 'STRING', version_id))
+            query += " ORDER BY collected_at DESC LIMIT 1"
+            
+            versions = self._cached_query(query, params, ['page_versions'])
+            if not versions:
+                return None
+            version = versions[0]
+            block_hashes = list(version.pop('block_hashes') or [])
+            
+            blocks = {}
+            if block_hashes:
+                blocks_query = f"""
+                SELECT block_hash, ANY_VALUE(content) AS content
+                FROM `{self.project_id}.{self.dataset_id}.content_blocks`
+                WHERE block_hash IN UNNEST(@block_hashes)
+                GROUP BY block_hash
+                """
+                blocks = {
+                    row['block_hash']: row['content']
+                    for row in self._cached_query(blocks_query, [
+                        bigquery.ArrayQueryParameter('block_hashes', 'STRING', sorted(set(block_hashes)))
+                    ], ['content_blocks'])
                 }
-                rows_to_insert.append(formatted_row)
             
-            errors = self.client.insert_rows_json(table, rows_to_insert)
+            content = reconstruct_content(block_hashes, blocks)
+            if content is None:
+                logger.error(f"버전 복원 실패 (누락된 블록): {url}")
+                return None
             
+            version['content'] = content
+            return version
+            
+        except Exception as e:
+            logger.error(f"버전 조회 실패: {str(e)}")
+            return None
+    
+    def _write_rows(self, table_name: str, rows: List[Dict[str, Any]]) -> Optional[int]:
+        """
+        행을 테이블 스키마에 맞게 변환해 추가합니다.
+        작은 배치는 스트리밍 삽입, 큰 배치는 로드 작업을 사용하며 (storage_write_api가
+        켜져 있으면 커밋 스트림),
+        스키마에 맞지 않는 행은 건너뛰고 rejected_rows에 기록합니다.
+        
+        Returns:
+            저장한 행 수 (실패 시 None, 예외는 호출자가 처리)
+        """
+        table, serializer = self._table_serializer(table_name)
+        batch = serializer.serialize(rows)
+        
+        if batch.errors:
+            self.rejected_rows.extend(
+                {'table': table_name, 'row': rows[index], 'error': error}
+                for index, error in batch.errors
+            )
+            logger.error(f"스키마에 맞지 않는 행 {len(batch.errors)}개 제외 ({table_name}): "
+                         f"{batch.errors[:5]}")
+            if not batch.rows:
+                return None
+        
+        try:
+            if self.storage_write_api:
+                writer = self.committed_stream_writer(table_name)
+                writer.append_rows(batch.rows)
+                return writer.close()
+            
+            if (self.load_job_threshold_bytes is not None
+                    and batch.json_bytes >= self.load_job_threshold_bytes):
+                return len(batch.rows) if self._load_rows(table, batch.rows) else None
+            
+            errors = self.client.insert_rows_json(table, batch.rows)
             if errors:
-                logger.error(f"BigQuery 삽입 오류: {errors}")
+                logger.error(f"BigQuery 삽입 오류 ({table_name}): {errors}")
+                return None
+            return len(batch.rows)
+        finally:
+            # 쓰기가 끝난 뒤 무효화 (실패해도 일부가 기록되었을 수 있으므로 항상,
+            # 쓰기 도중 시작된 조회의 결과는 세대 번호로 캐시에 남지 않음)
+            self.invalidate_query_cache([table_name])
+    
+    def _cached_query(self, query: str, params: List, tables: List[str]) -> List[Dict]:
+        """
+        파라미터 쿼리를 실행하고 결과를 캐시합니다.
+        
+        Args:
+            query: 쿼리 문자열 (@이름 파라미터 사용)
+            params: 쿼리 파라미터 리스트
+            tables: 쿼리가 읽는 테이블 이름 (삽입 시 무효화 기준)
+            
+        Returns:
+            행 딕셔너리 리스트 (호출자가 수정해도 캐시에 영향 없도록 복사본, 예외는 호출자가 처리)
+        """
+        key = cache_key(query, params)
+        generation = None
+        if self.query_cache is not None:
+            hit, rows = self.query_cache.get(key)
+            if hit:
+                return [dict(row) for row in rows]
+            # 조회 도중 쓰기로 무효화되면 (쓰기 이전일 수 있는) 결과를 캐시하지 않도록
+            generation = self.query_cache.generation(tables)
+        
+        job_config = bigquery.QueryJobConfig(query_parameters=params)
+        rows = [dict(row) for row in self.client.query(query, job_config=job_config).result()]
+        if self.query_cache is not None:
+            self.query_cache.put(key, rows, tables, generation=generation)
+        return [dict(row) for row in rows]
+    
+    @staticmethod
+    def _page_params(competitor_name: str, url: str) -> List[bigquery.ScalarQueryParameter]:
+        return [
+            bigquery.ScalarQueryParameter('competitor_name', 'STRING', competitor_name),
+            bigquery.ScalarQueryParameter('url', 'STRING', url)
+        ]
+    
+    def invalidate_query_cache(self, tables: Optional[Iterable[str]] = None) -> int:
+        """
+        조회 결과 캐시에서 주어진 테이블을 읽은 항목을 무효화합니다. (None이면 전체)
+        이 클라이언트의 삽입은 자동으로 무효화하므로, 다른 경로로 테이블을 바꾼 뒤 호출합니다.
+        
+        Returns:
+            제거한 항목 수
+        """
+        if self.query_cache is None:
+            return 0
+        return self.query_cache.invalidate_tables(tables)
+    
+    def _table_serializer(self, table_name: str) -> Tuple[bigquery.Table, RowSerializer]:
+        """테이블 메타데이터와 스키마로 만든 직렬화기 (테이블별 한 번만 조회)"""
+        cached = self._tables.get(table_name)
+        if cached is None:
+            table = self.client.get_table(self.dataset_ref.table(table_name))
+            cached = (table, RowSerializer(schema_for(table_name, table.schema)))
+            self._tables[table_name] = cached
+        return cached
+    
+    def _load_rows(self, table, rows: List[Dict[str, Any]]) -> bool:
+        """행을 압축 로드 파일로 써서 로드 작업으로 추가 (작업 완료까지 대기)"""
+        with tempfile.TemporaryFile() as f:
+            source_format = write_load_file(rows, f, self.load_file_format, schema=table.schema)
+            file_bytes = f.tell()
+            f.seek(0)
+            
+            job_config = bigquery.LoadJobConfig(
+                source_format=source_format,
+                write_disposition=bigquery.WriteDisposition.WRITE_APPEND
+            )
+            job = self.client.load_table_from_file(f, table, job_config=job_config)
+            job.result()
+        
+        if job.errors:
+            logger.error(f"BigQuery 로드 작업 오류 ({table.table_id}): {job.errors}")
+            return False
+        
+        logger.info(f"로드 작업 완료 ({table.table_id}): {len(rows)}개 행, "
+                    f"{source_format} {file_bytes / 1024:.1f} KiB")
+        return True
+
+    def committed_stream_writer(self, table_name: str, transport=None, row_message_cls=None,
+                                max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                                max_rows_per_request: int = DEFAULT_MAX_ROWS_PER_REQUEST
+                                ) -> CommittedStreamWriter:
+        """
+        테이블에 오프셋 기반으로 행을 추가하는 커밋 스트림 쓰기 객체를 만듭니다.
+        재시도해도 행이 중복되지 않으므로 연속 수집에는 insert_rows_json 대신 사용합니다.
+
+        Args:
+            table_name: 대상 테이블 이름
+            transport: 전송 계층 (기본: write_transport 또는 Storage Write API, 예: LocalWriteServer)
+            row_message_cls: 행 protobuf 메시지 클래스 (기본: 테이블 스키마로 생성)
+            max_in_flight: 응답을 기다리는 요청 수 상한
+            max_rows_per_request: 요청 하나에 담을 최대 행 수
+        """
+        if transport is None:
+            transport = self.write_transport
+        if transport is None and row_message_cls is not None:
+            transport = StorageWriteTransport(row_message_cls)
+        if transport is None:
+            # 테이블마다 한 번만 스키마로 메시지 클래스와 API 클라이언트를 만듦
+            transport = self._write_transports.get(table_name)
+            if transport is None:
+                table, _ = self._table_serializer(table_name)
+                transport = StorageWriteTransport(
+                    schema=schema_for(table_name, table.schema), table_name=table_name
+                )
+                self._write_transports[table_name] = transport
+
+        table_path = f"projects/{self.project_id}/datasets/{self.dataset_id}/tables/{table_name}"
+        return CommittedStreamWriter(transport, table_path, max_in_flight=max_in_flight,
+                                     max_rows_per_request=max_rows_per_request)
+
+    def insert_analysis_results(self, data: List[Dict[str, Any]]) -> bool:
+        """
+        분석 결과를 BigQuery에 삽입합니다.
+        
+        Args:
+            data: 삽입할 분석 결과 리스트
+            
+        Returns:
+            성공 여부
+        """
+        try:
+            written = self._write_rows('analysis_results', data)
+            if written is None:
                 return False
             
-            logger.info(f"{len(rows_to_insert)}개 분석 결과가 성공적으로 삽입되었습니다.")
+            logger.info(f"{written}개 분석 결과가 성공적으로 삽입되었습니다.")
             return True
             
         except Exception as e:
@@ -121,24 +430,127 @@ class BigQueryClient:
             조회된 데이터 리스트
         """
         try:
-            query = f"""
-            SELECT *
-            FROM `{self.project_id}.{self.dataset_id}.competitor_data`
-            """
+            query, params = self._competitor_data_query(competitor_name, limit)
+            return self._cached_query(query, params, ['competitor_data'])
             
-            if competitor_name:
-                query += f" WHERE competitor_name = '{competitor_name}'"
+        except Exception as e:
+            logger.error(f"데이터 조회 실패: {str(e)}")
+            return []
+    
+    def iter_competitor_data(self, competitor_name: Optional[str] = None, limit: Optional[int] = None,
+                             columns: Optional[List[str]] = None,
+                             page_size: int = DEFAULT_READ_PAGE_SIZE) -> Iterator[List[Dict]]:
+        """
+        경쟁사 데이터를 페이지 단위로 조회합니다. (다음 페이지는 소비할 때 가져옴)
+        
+        Args:
+            competitor_name: 특정 경쟁사 이름 (선택사항)
+            limit: 조회할 최대 행 수 (None이면 전체)
+            columns: 조회할 컬럼 (None이면 전체)
+            page_size: 페이지당 행 수
             
-            query += f" ORDER BY collected_at DESC LIMIT {limit}"
+        Yields:
+            행 딕셔너리 리스트 (최대 page_size개)
             
-            query_job = self.client.query(query)
-            results = query_job.result()
+        Raises:
+            Exception: 조회 실패 (일부 페이지를 처리한 뒤 실패할 수 있으므로 전달)
+        """
+        query, params = self._competitor_data_query(competitor_name, limit, columns)
+        job_config = bigquery.QueryJobConfig(query_parameters=params)
+        rows = self.client.query(query, job_config=job_config).result(page_size=page_size)
+        for page in rows.pages:
+            yield [dict(row) for row in page]
+    
+    def iter_competitor_data_batches(self, competitor_name: Optional[str] = None,
+                                     limit: Optional[int] = None,
+                                     columns: Optional[List[str]] = None,
+                                     page_size: int = DEFAULT_READ_PAGE_SIZE) -> Iterator:
+        """
+        경쟁사 데이터를 Arrow RecordBatch 단위로 조회합니다. (행별 Python 객체를 만들지 않음)
+        
+        google-cloud-bigquery-storage가 있으면 Storage Read API로 열 단위로 읽고,
+        없으면 REST 페이지를 RecordBatch로 변환합니다. pyarrow가 필요합니다.
+        
+        Yields:
+            pyarrow.RecordBatch
             
-            return [dict(row) for row in results]
+        Raises:
+            Exception: 조회 실패
+        """
+        query, params = self._competitor_data_query(competitor_name, limit, columns)
+        job_config = bigquery.QueryJobConfig(query_parameters=params)
+        rows = self.client.query(query, job_config=job_config).result(page_size=page_size)
+        yield from rows.to_arrow_iterable(bqstorage_client=self._bqstorage_client())
+    
+    def competitor_data_to_arrow(self, competitor_name: Optional[str] = None,
+                                 limit: Optional[int] = None,
+                                 columns: Optional[List[str]] = None):
+        """
+        경쟁사 데이터를 Arrow 테이블로 조회합니다. (가능하면 Storage Read API 사용)
+        
+        Returns:
+            pyarrow.Table (실패 시 None - 빈 결과와 구분)
+        """
+        try:
+            query, params = self._competitor_data_query(competitor_name, limit, columns)
+            job_config = bigquery.QueryJobConfig(query_parameters=params)
+            return self.client.query(query, job_config=job_config).to_arrow(create_bqstorage_client=True)
             
         except Exception as e:
-            logger.error(f"데이터 조회 실패: {str(e)}")
-            return []
+            logger.error(f"Arrow 조회 실패: {str(e)}")
+            return None
+    
+    def competitor_data_to_dataframe(self, competitor_name: Optional[str] = None,
+                                     limit: Optional[int] = None,
+                                     columns: Optional[List[str]] = None):
+        """
+        경쟁사 데이터를 pandas DataFrame으로 조회합니다. (Arrow 경유, 가능하면 Storage Read API 사용)
+        
+        Returns:
+            pandas.DataFrame (실패 시 None - 빈 결과와 구분)
+        """
+        try:
+            query, params = self._competitor_data_query(competitor_name, limit, columns)
+            job_config = bigquery.QueryJobConfig(query_parameters=params)
+            return self.client.query(query, job_config=job_config).to_dataframe(
+                create_bqstorage_client=True
+            )
+            
+        except Exception as e:
+            logger.error(f"DataFrame 조회 실패: {str(e)}")
+            return None
+    
+    def _competitor_data_query(self, competitor_name: Optional[str], limit: Optional[int],
+                               columns: Optional[List[str]] = None) -> Tuple[str, List]:
+        """competitor_data 조회 쿼리와 파라미터 (컬럼 이름이 올바르지 않으면 ValueError)"""
+        for column in columns or []:
+            if not _COLUMN_NAME.match(column):
+                raise ValueError(f"올바르지 않은 컬럼 이름: {column}")
+        
+        query = f"""
+        SELECT {", ".join(columns) if columns else "*"}
+        FROM `{self.project_id}.{self.dataset_id}.competitor_data`
+        """
+        params = []
+        
+        if competitor_name:
+            query += " WHERE competitor_name = @competitor_name"
+            params.append(bigquery.ScalarQueryParameter('competitor_name', 'STRING', competitor_name))
+        
+        query += " ORDER BY collected_at DESC"
+        if limit is not None:
+            query += " LIMIT @limit"
+            params.append(bigquery.ScalarQueryParameter('limit', 'INT64', limit))
+        return query, params
+    
+    @staticmethod
+    def _bqstorage_client():
+        """Storage Read API 클라이언트 (google-cloud-bigquery-storage가 없으면 None)"""
+        try:
+            from google.cloud import bigquery_storage
+        except ImportError:
+            return None
+        return bigquery_storage.BigQueryReadClient()
     
     def get_latest_content_hash(self, competitor_name: str, url: str) -> str:
         """
@@ -154,14 +566,14 @@ class BigQueryClient:
         try:
             query = f"""
             SELECT content_hash
-            FROM `{self.project_id}.{self.dataset_id}.competitor_data`
-            WHERE competitor_name = '{competitor_name}' AND url = '{url}'
+            FROM `{self.project_id}.{self.dataset_id}.{self.page_table}`
+            WHERE competitor_name = @competitor_name AND url = @url
             ORDER BY collected_at DESC
             LIMIT 1
             """
             
-            query_job = self.client.query(query)
-            results = list(query_job.result())
+            results = self._cached_query(query, self._page_params(competitor_name, url),
+                                         [self.page_table])
             
             if results:
                 return results[0]['content_hash'] or ""
@@ -169,4 +581,153 @@ class BigQueryClient:
             
         except Exception as e:
             logger.error(f"해시 조회 실패: {str(e)}")
-            return "" 
+            return ""
+    
+    def get_latest_content_hashes(self, pairs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+        """
+        여러 (경쟁사 이름, URL) 쌍의 최신 콘텐츠 해시를 한 번에 조회합니다.
+        
+        Args:
+            pairs: (competitor_name, url) 쌍 목록
+            
+        Returns:
+            {(competitor_name, url): content_hash} (기록이 없는 쌍은 포함되지 않음)
+        """
+        return {
+            pair: fingerprint['content_hash']
+            for pair, fingerprint in self.get_latest_content_fingerprints(pairs).items()
+        }
+    
+    def get_latest_content_fingerprints(self, pairs: Iterable[Tuple[str, str]]
+                                        ) -> Dict[Tuple[str, str], Dict[str, str]]:
+        """
+        여러 (경쟁사 이름, URL) 쌍의 최신 콘텐츠 해시와 SimHash 지문을 한 번에 조회합니다.
+        
+        페이지마다 쿼리 작업을 만들지 않도록 LATEST_HASH_BATCH_SIZE 쌍씩 묶어
+        URL별 최신 행만 남기는 쿼리 하나로 조회합니다.
+        
+        Args:
+            pairs: (competitor_name, url) 쌍 목록
+            
+        Returns:
+            {(competitor_name, url): {'content_hash', 'content_simhash', 'collected_at'}}
+            (기록이 없는 쌍은 포함되지 않음, 조회 실패 시 빈 딕셔너리)
+        """
+        unique_pairs = list(dict.fromkeys(pairs))
+        fingerprints: Dict[Tuple[str, str], Dict[str, str]] = {}
+        
+        try:
+            for start in range(0, len(unique_pairs), LATEST_HASH_BATCH_SIZE):
+                batch = unique_pairs[start:start + LATEST_HASH_BATCH_SIZE]
+                query = f"""
+                SELECT competitor_name, url, content_hash, content_simhash, collected_at
+                FROM `{self.project_id}.{self.dataset_id}.{self.page_table}`
+                WHERE CONCAT(competitor_name, '\\t', url) IN UNNEST(@page_keys)
+                QUALIFY ROW_NUMBER() OVER (
+                    PARTITION BY competitor_name, url ORDER BY collected_at DESC
+                ) = 1
+                """
+                job_config = bigquery.QueryJobConfig(query_parameters=[
+                    bigquery.ArrayQueryParameter(
+                        'page_keys', 'STRING', [f"{name}\t{url}" for name, url in batch]
+                    )
+                ])
+                
+                query_job = self.client.query(query, job_config=job_config)
+                for row in query_job.result():
+                    fingerprints[(row['competitor_name'], row['url'])] = {
+                        'content_hash': row['content_hash'] or "",
+                        'content_simhash': row['content_simhash'] or "",
+                        'collected_at': row.get('collected_at')
+                    }
+            
+            return fingerprints
+            
+        except Exception as e:
+            logger.error(f"지문 일괄 조회 실패: {str(e)}")
+            return {}
+    
+    def get_all_latest_content_fingerprints(self) -> Optional[List[Dict]]:
+        """
+        모든 (경쟁사 이름, URL)의 최신 지문을 조회합니다. (로컬 해시 인덱스 재구성용)
+        
+        Returns:
+            competitor_name, url, content_hash, content_simhash, collected_at 행 리스트
+            (조회 실패 시 None - 빈 결과와 구분하여 인덱스를 비우지 않도록 함)
+        """
+        try:
+            query = f"""
+            SELECT competitor_name, url, content_hash, content_simhash, collected_at
+            FROM `{self.project_id}.{self.dataset_id}.{self.page_table}`
+            QUALIFY ROW_NUMBER() OVER (
+                PARTITION BY competitor_name, url ORDER BY collected_at DESC
+            ) = 1
+            """
+            
+            query_job = self.client.query(query)
+            return [dict(row) for row in query_job.result()]
+            
+        except Exception as e:
+            logger.error(f"전체 지문 조회 실패: {str(e)}")
+            return None
+    
+    def get_page_history(self, days: int = 90) -> Optional[List[Dict]]:
+        """
+        최근 기간에 저장된 페이지 버전 이력을 조회합니다. (재수집 일정 초기화용)
+        
+        Args:
+            days: 조회할 기간 (일)
+            
+        Returns:
+            competitor_name, url, content_hash, collected_at 행 리스트 (조회 실패 시 None)
+        """
+        try:
+            query = f"""
+            SELECT competitor_name, url, content_hash, collected_at
+            FROM `{self.project_id}.{self.dataset_id}.{self.page_table}`
+            WHERE collected_at >= TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL @days DAY)
+            """
+            
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[bigquery.ScalarQueryParameter("days", "INT64", days)]
+            )
+            query_job = self.client.query(query, job_config=job_config)
+            return [dict(row) for row in query_job.result()]
+            
+        except Exception as e:
+            logger.error(f"페이지 이력 조회 실패: {str(e)}")
+            return None
+    
+    def get_latest_content_fingerprint(self, competitor_name: str, url: str) -> Dict[str, str]:
+        """
+        특정 URL의 최신 콘텐츠 해시와 SimHash 지문을 조회합니다.
+        
+        Args:
+            competitor_name: 경쟁사 이름
+            url: URL
+            
+        Returns:
+            content_hash, content_simhash 키를 가진 딕셔너리 (없으면 빈 문자열)
+        """
+        try:
+            query = f"""
+            SELECT content_hash, content_simhash
+            FROM `{self.project_id}.{self.dataset_id}.{self.page_table}`
+            WHERE competitor_name = @competitor_name AND url = @url
+            ORDER BY collected_at DESC
+            LIMIT 1
+            """
+            
+            results = self._cached_query(query, self._page_params(competitor_name, url),
+                                         [self.page_table])
+            
+            if results:
+                return {
+                    'content_hash': results[0]['content_hash'] or "",
+                    'content_simhash': results[0]['content_simhash'] or ""
+                }
+            return {'content_hash': "", 'content_simhash': ""}
+            
+        except Exception as e:
+            logger.error(f"지문 조회 실패: {str(e)}")
+            return {'content_hash': "", 'content_simhash': ""}
@@ -0,0 +1,352 @@
+"""
+HTTP 전송 계층 모듈
+연결 수립 단계(DNS, TCP 연결, TLS)와 첫 바이트 수신 시간(TTFB)을 측정하는
+urllib3 연결 클래스와 requests 어댑터를 제공합니다.
+
+수집기들은 프로세스 전역 공유 어댑터(get_shared_adapter)를 세션에 연결해
+호스트별 keep-alive 연결 풀과 DNS 캐시를 함께 사용합니다. 세션 자체(헤더, 쿠키)는
+수집기마다 따로 둡니다.
+"""
+
+import ipaddress
+import logging
+import socket
+import sys
+import threading
+import time
+from socket import timeout as SocketTimeout
+from typing import Dict, List, Optional, Tuple
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NameResolutionError, NewConnectionError
+from urllib3.util import connection
+
+from src.utils.metrics import scrape_metrics
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_DNS_TTL_SECONDS = 300.0
+DEFAULT_DNS_CACHE_SIZE = 1024
+DEFAULT_POOL_CONNECTIONS = 32  # 연결 풀을 유지할 호스트 수
+DEFAULT_POOL_MAXSIZE = 16  # 호스트당 유지할 keep-alive 연결 수
+
+
+def resolve_host(host: str, port: int) -> List[str]:
+    """
+    호스트 이름을 연결할 주소 목록으로 변환합니다.
+
+    Raises:
+        socket.gaierror: 이름 해석 실패
+    """
+    if host.startswith('['):
+        host = host.strip('[]')
+
+    addresses = []
+    for _, _, _, _, sockaddr in socket.getaddrinfo(
+        host, port, connection.allowed_gai_family(), socket.SOCK_STREAM
+    ):
+        if sockaddr[0] not in addresses:
+            addresses.append(sockaddr[0])
+    return addresses
+
+
+class DNSCache:
+    """TTL 기반 이름 해석 캐시 (스레드 안전)
+
+    getaddrinfo는 레코드 TTL을 알려주지 않으므로 고정 TTL을 사용합니다.
+    IP 주소 리터럴은 캐시하지 않고 그대로 반환합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_DNS_TTL_SECONDS,
+                 max_entries: int = DEFAULT_DNS_CACHE_SIZE):
+        """
+        Args:
+            ttl_seconds: 해석 결과 유지 시간 (초, 0이면 캐시하지 않음)
+            max_entries: 최대 항목 수 (초과 시 가장 오래된 항목 제거)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> List[str]:
+        """
+        캐시된 주소 목록을 반환하고, 없거나 만료되었으면 새로 해석합니다.
+
+        Raises:
+            socket.gaierror: 이름 해석 실패
+        """
+        if _is_ip_literal(host) or self.ttl_seconds <= 0:
+            return resolve_host(host, port)
+
+        key = (host.lower(), port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                self.hits += 1
+                return list(entry[1])
+            self.misses += 1
+
+        addresses = resolve_host(host, port)
+
+        with self._lock:
+            if len(self._entries) >= self.max_entries and key not in self._entries:
+                oldest = min(self._entries, key=lambda k: self._entries[k][0])
+                del self._entries[oldest]
+            self._entries[key] = (now + self.ttl_seconds, addresses)
+        return list(addresses)
+
+    def invalidate(self, host: str, port: int) -> None:
+        """특정 호스트의 캐시 항목 제거 (캐시된 주소로 연결이 모두 실패한 경우)"""
+        with self._lock:
+            self._entries.pop((host.lower(), port), None)
+
+    def clear(self) -> None:
+        """캐시와 통계 초기화"""
+        with self._lock:
+            self._entries = {}
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'ttl_seconds': self.ttl_seconds,
+            }
+
+
+def _is_ip_literal(host: str) -> bool:
+    """IP 주소 리터럴 여부"""
+    try:
+        ipaddress.ip_address(host.strip('[]'))
+        return True
+    except ValueError:
+        return False
+
+
+# 프로세스 전역 DNS 캐시 (측정 연결이 모두 공유)
+dns_cache = DNSCache()
+
+
+class TimedConnectionMixin:
+    """urllib3 연결의 DNS/연결/TLS/TTFB 시간을 scrape_metrics에 기록
+
+    이름 해석을 연결과 분리해 DNS 캐시로 수행하며, 해석된 주소를 순서대로 시도하는
+    동작과 예외 종류는 urllib3 기본 구현과 같습니다.
+    """
+
+    _connect_seconds = 0.0
+
+    def _new_conn(self) -> socket.socket:
+        started = time.perf_counter()
+        try:
+            addresses = dns_cache.resolve(self._dns_host, self.port)
+        except socket.gaierror as e:
+            raise NameResolutionError(self.host, self, e) from e
+        resolved = time.perf_counter()
+
+        sock = None
+        last_error = None
+        for address in addresses:
+            try:
+                sock = connection.create_connection(
+                    (address, self.port),
+                    self.timeout,
+                    source_address=self.source_address,
+                    socket_options=self.socket_options,
+                )
+                break
+            except OSError as e:
+                last_error = e
+
+        if sock is None:
+            # 캐시된 주소가 바뀌었을 수 있으므로 다음 연결은 다시 해석
+            dns_cache.invalidate(self._dns_host, self.port)
+            if isinstance(last_error, SocketTimeout):
+                raise ConnectTimeoutError(
+                    self,
+                    f"Connection to {self.host} timed out. (connect timeout={self.timeout})",
+                ) from last_error
+            raise NewConnectionError(
+                self, f"Failed to establish a new connection: {last_error}"
+            ) from last_error
+
+        connected = time.perf_counter()
+        scrape_metrics.record(self.host, 'dns', resolved - started)
+        scrape_metrics.record(self.host, 'connect', connected - resolved)
+        self._connect_seconds = connected - started
+
+        sys.audit("http.client.connect", self, self.host, self.port)
+        return sock
+
+    def getresponse(self, *args, **kwargs):
+        started = time.perf_counter()
+        response = super().getresponse(*args, **kwargs)
+        scrape_metrics.record(self.host, 'ttfb', time.perf_counter() - started)
+        return response
+
+
+class TimedHTTPConnection(TimedConnectionMixin, HTTPConnection):
+    """단계 시간을 기록하는 HTTP 연결"""
+
+
+class TimedHTTPSConnection(TimedConnectionMixin, HTTPSConnection):
+    """단계 시간을 기록하는 HTTPS 연결 (TLS 핸드셰이크 포함)"""
+
+    def connect(self) -> None:
+        started = time.perf_counter()
+        self._connect_seconds = 0.0
+        super().connect()
+        # connect() 전체에서 _new_conn()(DNS + TCP) 시간을 뺀 나머지가 TLS 핸드셰이크
+        tls_seconds = time.perf_counter() - started - self._connect_seconds
+        scrape_metrics.record(self.host, 'tls', tls_seconds)
+
+
+class TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class InstrumentedHTTPAdapter(HTTPAdapter):
+    """단계 시간 측정 연결을 사용하는 requests 어댑터"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': TimedHTTPConnectionPool,
+            'https': TimedHTTPSConnectionPool,
+        }
+
+
+class SharedHTTPAdapter(InstrumentedHTTPAdapter):
+    """여러 세션이 공유하는 어댑터
+
+    한 세션의 close()가 다른 수집기의 연결 풀까지 닫지 않도록 close()는 무시하며,
+    실제 종료는 close_shared_transport()로 합니다.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def close_pools(self) -> None:
+        super().close()
+
+
+_shared_adapter: Optional[SharedHTTPAdapter] = None
+_shared_lock = threading.Lock()
+
+
+def mount_instrumented_adapter(session, pool_maxsize: int = 10) -> InstrumentedHTTPAdapter:
+    """세션의 http/https 요청에 (세션 전용) 단계 시간 측정 어댑터를 연결"""
+    adapter = InstrumentedHTTPAdapter(pool_maxsize=pool_maxsize)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+def configure_shared_transport(pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+                               pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                               dns_ttl_seconds: float = DEFAULT_DNS_TTL_SECONDS) -> SharedHTTPAdapter:
+    """
+    공유 전송 계층의 풀 크기와 DNS TTL을 설정합니다.
+
+    이미 만들어진 공유 어댑터가 있으면 닫고 새 설정으로 다시 만들므로,
+    수집기를 만들기 전에 호출해야 합니다.
+
+    Args:
+        pool_connections: 연결 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 유지할 keep-alive 연결 수
+        dns_ttl_seconds: DNS 캐시 TTL (초)
+
+    Returns:
+        새 공유 어댑터
+    """
+    global _shared_adapter
+
+    with _shared_lock:
+        if _shared_adapter is not None:
+            _shared_adapter.close_pools()
+        _shared_adapter = SharedHTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        dns_cache.ttl_seconds = dns_ttl_seconds
+        return _shared_adapter
+
+
+def get_shared_adapter() -> SharedHTTPAdapter:
+    """프로세스 전역 공유 어댑터 (없으면 기본 설정으로 생성)"""
+    global _shared_adapter
+
+    with _shared_lock:
+        if _shared_adapter is None:
+            _shared_adapter = SharedHTTPAdapter(
+                pool_connections=DEFAULT_POOL_CONNECTIONS, pool_maxsize=DEFAULT_POOL_MAXSIZE
+            )
+        return _shared_adapter
+
+
+def mount_shared_adapter(session) -> SharedHTTPAdapter:
+    """세션의 http/https 요청에 공유 어댑터를 연결 (연결 풀과 DNS 캐시 공유)"""
+    adapter = get_shared_adapter()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+def close_shared_transport() -> None:
+    """공유 어댑터의 연결 풀을 모두 닫음 (프로세스 종료 시)"""
+    global _shared_adapter
+
+    with _shared_lock:
+        if _shared_adapter is not None:
+            _shared_adapter.close_pools()
+            _shared_adapter = None
+
+
+def transport_stats() -> Dict:
+    """
+    공유 전송 계층 통계를 반환합니다.
+
+    Returns:
+        dns_cache 통계와 호스트별 연결 풀 통계
+        (connections_created: 새로 만든 연결 수, requests: 처리한 요청 수,
+         idle_connections: 재사용 대기 중인 연결 수)
+    """
+    with _shared_lock:
+        adapter = _shared_adapter
+
+    pools = []
+    if adapter is not None:
+        container = adapter.poolmanager.pools
+        for key in container.keys():
+            pool = container.get(key)
+            if pool is None:
+                continue
+            idle = sum(1 for conn in list(pool.pool.queue) if conn) if pool.pool else 0
+            pools.append({
+                'scheme': pool.scheme,
+                'host': pool.host,
+                'port': pool.port,
+                'connections_created': pool.num_connections,
+                'requests': pool.num_requests,
+                'reused_requests': max(0, pool.num_requests - pool.num_connections),
+                'idle_connections': idle,
+                'max_size': pool.pool.maxsize if pool.pool else 0,
+            })
+
+    return {'dns_cache': dns_cache.stats(), 'pools': pools}
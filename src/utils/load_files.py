@@ -0,0 +1,119 @@
+"""
+BigQuery 로드 파일 모듈
+행을 로드 작업용 압축 파일(Parquet 또는 gzip NDJSON)로 쓰고 다시 읽습니다.
+
+Parquet(zstd 압축, 열 단위)은 pyarrow가 설치된 경우에만 사용하며,
+없으면 BigQuery가 그대로 읽을 수 있는 gzip 압축 줄 단위 JSON으로 대체합니다.
+"""
+
+import gzip
+import io
+import json
+import logging
+from datetime import date, datetime, timezone
+from typing import BinaryIO, Dict, List, Optional, Sequence
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+LOAD_FILE_FORMATS = ('parquet', 'ndjson')
+# BigQuery LoadJobConfig.source_format 값
+SOURCE_FORMATS = {'parquet': 'PARQUET', 'ndjson': 'NEWLINE_DELIMITED_JSON'}
+PARQUET_COMPRESSION = 'zstd'
+
+
+def resolve_load_format(file_format: str) -> str:
+    """설치된 라이브러리에 맞는 로드 파일 형식 (Parquet 불가 시 ndjson)"""
+    if file_format not in LOAD_FILE_FORMATS:
+        raise ValueError(f"지원하지 않는 로드 파일 형식: {file_format}")
+    if file_format == 'parquet' and not PYARROW_AVAILABLE:
+        logger.warning("pyarrow가 설치되지 않아 gzip NDJSON 로드 파일을 사용합니다.")
+        return 'ndjson'
+    return file_format
+
+
+def estimate_json_bytes(rows: Sequence[Dict]) -> int:
+    """스트리밍 삽입 요청 본문 크기 추정 (행 JSON 직렬화 길이 합계)"""
+    return sum(len(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8')) for row in rows)
+
+
+def write_load_file(rows: Sequence[Dict], fileobj: BinaryIO, file_format: str,
+                    schema: Optional[Sequence] = None) -> str:
+    """
+    행을 로드 파일로 씁니다.
+
+    Args:
+        rows: 행 딕셔너리 리스트
+        fileobj: 쓰기용 바이너리 파일 객체
+        file_format: "parquet" 또는 "ndjson" (resolve_load_format 결과)
+        schema: 대상 테이블의 SchemaField 리스트 (Parquet 열 타입 결정용, 선택사항)
+
+    Returns:
+        BigQuery source_format 값
+    """
+    if file_format == 'parquet':
+        table = pa.Table.from_pylist(
+            [_arrow_row(row, schema) for row in rows] if schema else list(rows),
+            schema=_arrow_schema(schema) if schema else None
+        )
+        pq.write_table(table, fileobj, compression=PARQUET_COMPRESSION)
+        return SOURCE_FORMATS['parquet']
+
+    with gzip.GzipFile(fileobj=fileobj, mode='wb') as gz:
+        for row in rows:
+            gz.write(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8'))
+            gz.write(b"\n")
+    return SOURCE_FORMATS['ndjson']
+
+
+def read_load_file(fileobj: BinaryIO, source_format: str) -> List[Dict]:
+    """로드 파일을 행 딕셔너리 리스트로 읽습니다. (로컬 대체 클라이언트/검증용)"""
+    if source_format == SOURCE_FORMATS['parquet']:
+        return pq.read_table(io.BytesIO(fileobj.read())).to_pylist()
+
+    with gzip.GzipFile(fileobj=fileobj, mode='rb') as gz:
+        return [json.loads(line) for line in gz if line.strip()]
+
+
+def _arrow_type(field):
+    """BigQuery SchemaField 타입에 대응하는 Arrow 타입"""
+    field_type = field.field_type.upper()
+    if field_type in ('INTEGER', 'INT64'):
+        arrow_type = pa.int64()
+    elif field_type in ('FLOAT', 'FLOAT64'):
+        arrow_type = pa.float64()
+    elif field_type in ('BOOLEAN', 'BOOL'):
+        arrow_type = pa.bool_()
+    elif field_type == 'TIMESTAMP':
+        arrow_type = pa.timestamp('us', tz='UTC')
+    elif field_type == 'DATE':
+        arrow_type = pa.date32()
+    else:
+        arrow_type = pa.string()
+    return pa.list_(arrow_type) if field.mode == 'REPEATED' else arrow_type
+
+
+def _arrow_schema(schema: Sequence):
+    return pa.schema([pa.field(field.name, _arrow_type(field)) for field in schema])
+
+
+def _arrow_row(row: Dict, schema: Sequence) -> Dict:
+    """ISO 문자열 TIMESTAMP/DATE 값을 Arrow가 받는 datetime/date로 변환"""
+    converted = {}
+    for field in schema:
+        value = row.get(field.name)
+        field_type = field.field_type.upper()
+        if isinstance(value, str) and field_type == 'TIMESTAMP':
+            value = datetime.fromisoformat(value)
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+        elif isinstance(value, str) and field_type == 'DATE':
+            value = date.fromisoformat(value[:10])
+        converted[field.name] = value
+    return converted
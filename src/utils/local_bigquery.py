@@ -0,0 +1,308 @@
+"""
+로컬 BigQuery 대체 클라이언트 모듈
+BigQueryClient가 사용하는 google.cloud.bigquery.Client의 쓰기 API(get_table,
+insert_rows_json, load_table_from_file)를 메모리/로컬 파일로 흉내 내어,
+GCP 인증 없이 저장 경로(스트리밍 삽입, 로드 작업)를 실행하고 검증할 수 있게 합니다.
+
+query()는 BigQueryClient가 보내는 형태의 조회(등호/IN UNNEST/기간 조건, URL별 최신 행
+QUALIFY, GROUP BY + ANY_VALUE, ORDER BY ... DESC, LIMIT)만 메모리 테이블에 실행하므로,
+오프라인 실행에서도 이전 실행과의 중복 확인과 블록 재사용이 동작합니다.
+그 외 형태의 SQL은 ValueError로 거부합니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from google.cloud import bigquery
+
+from src.utils.load_files import estimate_json_bytes, read_load_file
+
+logger = logging.getLogger(__name__)
+
+# 스트리밍 삽입 요청 본문 크기 제한 (BigQuery insertAll 한도)
+MAX_STREAMING_REQUEST_BYTES = 10 * 1024 * 1024
+
+_TABLE = re.compile(r"FROM\s+`(?:[\w-]+\.)*(\w+)`", re.I)
+_SELECT = re.compile(r"SELECT\s+(DISTINCT\s+)?(.*?)\s+FROM\s", re.I | re.S)
+_WHERE = re.compile(r"\sWHERE\s+(.*?)(?=\s+(?:QUALIFY|GROUP\s+BY|ORDER\s+BY|LIMIT)\s|$)", re.I | re.S)
+_LATEST_PER = re.compile(
+    r"QUALIFY\s+ROW_NUMBER\(\)\s+OVER\s*\(\s*PARTITION\s+BY\s+([\w\s,]+?)\s+"
+    r"ORDER\s+BY\s+(\w+)\s+DESC\s*\)\s*=\s*1", re.I
+)
+_GROUP_BY = re.compile(r"GROUP\s+BY\s+(\w+)", re.I)
+_ORDER_BY = re.compile(r"ORDER\s+BY\s+(\w+)\s+DESC", re.I)
+_LIMIT = re.compile(r"LIMIT\s+(\d+|@\w+)", re.I)
+_ANY_VALUE = re.compile(r"ANY_VALUE\((\w+)\)(?:\s+AS\s+(\w+))?$", re.I)
+
+# WHERE 조건 (AND로 연결된 것만 지원)
+_EQUALS = re.compile(r"(\w+)\s*=\s*@(\w+)$")
+_IN_UNNEST = re.compile(r"(\w+)\s+IN\s+UNNEST\(@(\w+)\)$", re.I)
+_CONCAT_IN_UNNEST = re.compile(
+    r"CONCAT\((\w+),\s*'\\t',\s*(\w+)\)\s+IN\s+UNNEST\(@(\w+)\)$", re.I
+)
+_WITHIN_DAYS = re.compile(
+    r"(\w+)\s*>=\s*TIMESTAMP_SUB\(CURRENT_TIMESTAMP\(\),\s*INTERVAL\s+@(\w+)\s+DAY\)$", re.I
+)
+
+
+class LocalLoadJob:
+    """완료된 로드 작업 (google.cloud.bigquery.LoadJob 대체)"""
+
+    def __init__(self, destination, source_format: str, output_rows: int,
+                 input_file_bytes: int):
+        self.destination = destination
+        self.source_format = source_format
+        self.output_rows = output_rows
+        self.input_file_bytes = input_file_bytes
+        self.errors = None
+        self.state = 'DONE'
+
+    def result(self, timeout: Optional[float] = None) -> "LocalLoadJob":
+        return self
+
+
+class LocalRowIterator:
+    """조회 결과 행 (google.cloud.bigquery.table.RowIterator 대체, 행은 딕셔너리)"""
+
+    def __init__(self, rows: List[Dict], page_size: Optional[int] = None):
+        self.rows = rows
+        self.page_size = page_size
+        self.total_rows = len(rows)
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.rows)
+
+    @property
+    def pages(self) -> Iterator[List[Dict]]:
+        size = self.page_size or max(1, len(self.rows))
+        for start in range(0, len(self.rows), size):
+            yield self.rows[start:start + size]
+
+
+class LocalQueryJob:
+    """완료된 조회 작업 (google.cloud.bigquery.QueryJob 대체)"""
+
+    def __init__(self, query: str, rows: List[Dict]):
+        self.query = query
+        self.rows = rows
+        self.state = 'DONE'
+
+    def result(self, timeout: Optional[float] = None, page_size: Optional[int] = None,
+               **kwargs) -> LocalRowIterator:
+        return LocalRowIterator(self.rows, page_size)
+
+
+class LocalBigQueryClient:
+    """테이블별 행을 메모리(및 선택적으로 JSONL 파일)에 저장하는 대체 클라이언트"""
+
+    def __init__(self, project: str = 'local', directory: Optional[str] = None,
+                 schemas: Optional[Dict[str, List[bigquery.SchemaField]]] = None):
+        """
+        Args:
+            project: 프로젝트 ID
+            directory: 테이블별 {table}.jsonl을 추가 저장할 디렉터리 (선택사항)
+            schemas: 테이블 이름별 스키마 (get_table이 반환하는 Table에 설정, 선택사항)
+        """
+        self.project = project
+        self.directory = directory
+        self.schemas = schemas or {}
+        self.tables: Dict[str, List[Dict]] = {}
+        self.streaming_requests = 0
+        self.load_jobs: List[LocalLoadJob] = []
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self._load_tables()
+
+    def dataset(self, dataset_id: str) -> bigquery.DatasetReference:
+        return bigquery.DatasetReference(self.project, dataset_id)
+
+    def get_table(self, table_ref) -> bigquery.Table:
+        return bigquery.Table(table_ref, schema=self.schemas.get(table_ref.table_id, []))
+
+    def insert_rows_json(self, table, json_rows: List[Dict], **kwargs) -> List[Dict]:
+        """스트리밍 삽입 (요청 크기 한도 초과 시 BigQuery처럼 오류 반환)"""
+        rows = list(json_rows)
+        request_bytes = estimate_json_bytes(rows)
+        if request_bytes > MAX_STREAMING_REQUEST_BYTES:
+            return [{'index': 0, 'errors': [{
+                'reason': 'requestTooLarge',
+                'message': f"요청 크기 {request_bytes}바이트가 한도를 넘었습니다."
+            }]}]
+
+        with self._lock:
+            self.streaming_requests += 1
+        self._append(table.table_id, rows)
+        return []
+
+    def load_table_from_file(self, file_obj: BinaryIO, destination,
+                             job_config: Optional[bigquery.LoadJobConfig] = None,
+                             **kwargs) -> LocalLoadJob:
+        """로드 작업 (로드 파일을 읽어 테이블에 추가)"""
+        start = file_obj.tell()
+        source_format = job_config.source_format if job_config else 'NEWLINE_DELIMITED_JSON'
+        rows = read_load_file(file_obj, source_format)
+        job = LocalLoadJob(destination, source_format, len(rows), file_obj.tell() - start)
+
+        with self._lock:
+            self.load_jobs.append(job)
+        self._append(destination.table_id, rows)
+        return job
+
+    def query(self, query: str, job_config=None, **kwargs) -> LocalQueryJob:
+        """
+        BigQueryClient가 보내는 형태의 조회를 메모리 테이블에 실행합니다.
+
+        Raises:
+            ValueError: 지원하지 않는 형태의 쿼리
+        """
+        params = {
+            param.name: getattr(param, 'values', getattr(param, 'value', None))
+            for param in (job_config.query_parameters if job_config else [])
+        }
+        table_match = _TABLE.search(query)
+        select_match = _SELECT.search(query)
+        if not table_match or not select_match:
+            raise ValueError(f"지원하지 않는 쿼리입니다: {' '.join(query.split())}")
+
+        with self._lock:
+            rows = list(self.tables.get(table_match.group(1), []))
+
+        where_match = _WHERE.search(query)
+        if where_match:
+            for condition in re.split(r"\s+AND\s+", where_match.group(1).strip(), flags=re.I):
+                rows = _filter_rows(rows, condition.strip(), params)
+
+        latest_match = _LATEST_PER.search(query)
+        if latest_match:
+            partition = [column.strip() for column in latest_match.group(1).split(',')]
+            rows = _latest_per_partition(rows, partition, latest_match.group(2))
+            query = query[:latest_match.start()] + query[latest_match.end():]
+
+        group_match = _GROUP_BY.search(query)
+        order_match = _ORDER_BY.search(query)
+        if order_match:
+            rows = sorted(rows, key=lambda row: _sort_key(row.get(order_match.group(1))), reverse=True)
+
+        rows = _project(rows, select_match.group(2), group_match.group(1) if group_match else None,
+                        distinct=bool(select_match.group(1)))
+
+        limit_match = _LIMIT.search(query)
+        if limit_match:
+            limit = limit_match.group(1)
+            rows = rows[:int(params[limit[1:]] if limit.startswith('@') else limit)]
+        return LocalQueryJob(query, rows)
+
+    def _load_tables(self) -> None:
+        """디렉터리에 남아 있는 이전 실행의 테이블 파일 로드"""
+        for file_name in sorted(os.listdir(self.directory)):
+            if not file_name.endswith('.jsonl'):
+                continue
+            rows = []
+            with open(os.path.join(self.directory, file_name), 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        rows.append(json.loads(line))
+                    except ValueError:
+                        logger.warning(f"로컬 테이블의 손상된 줄을 건너뜁니다: {file_name}")
+            self.tables[file_name[:-len('.jsonl')]] = rows
+
+    def _append(self, table_id: str, rows: List[Dict]) -> None:
+        with self._lock:
+            self.tables.setdefault(table_id, []).extend(rows)
+            if self.directory:
+                path = os.path.join(self.directory, f"{table_id}.jsonl")
+                with open(path, 'a', encoding='utf-8') as f:
+                    for row in rows:
+                        f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+
+def _filter_rows(rows: List[Dict], condition: str, params: Dict[str, Any]) -> List[Dict]:
+    """WHERE 조건 하나로 행 거르기"""
+    match = _EQUALS.match(condition)
+    if match:
+        column, value = match.group(1), params[match.group(2)]
+        return [row for row in rows if row.get(column) == value]
+
+    match = _CONCAT_IN_UNNEST.match(condition)
+    if match:
+        first, second = match.group(1), match.group(2)
+        keys = set(params[match.group(3)])
+        return [row for row in rows if f"{row.get(first)}\t{row.get(second)}" in keys]
+
+    match = _IN_UNNEST.match(condition)
+    if match:
+        values = set(params[match.group(2)])
+        return [row for row in rows if row.get(match.group(1)) in values]
+
+    match = _WITHIN_DAYS.match(condition)
+    if match:
+        since = datetime.now(timezone.utc) - timedelta(days=params[match.group(2)])
+        return [row for row in rows
+                if (_timestamp(row.get(match.group(1))) or since) > since]
+
+    raise ValueError(f"지원하지 않는 조건입니다: {condition}")
+
+
+def _latest_per_partition(rows: List[Dict], partition: List[str], order_column: str) -> List[Dict]:
+    """파티션별 order_column이 가장 큰 행 하나만 남기기 (처음 나타난 순서 유지)"""
+    latest: Dict[tuple, Dict] = {}
+    for row in rows:
+        key = tuple(row.get(column) for column in partition)
+        if key not in latest or _sort_key(row.get(order_column)) > _sort_key(latest[key].get(order_column)):
+            latest[key] = row
+    return list(latest.values())
+
+
+def _project(rows: List[Dict], select: str, group_by: Optional[str], distinct: bool) -> List[Dict]:
+    """SELECT 목록으로 컬럼 선택 (GROUP BY는 ANY_VALUE만 지원)"""
+    expressions = [expression.strip() for expression in select.split(',')]
+    if group_by:
+        groups: Dict[Any, Dict] = {}
+        for row in rows:
+            groups.setdefault(row.get(group_by), row)
+        rows = list(groups.values())
+
+    if expressions == ['*']:
+        projected = [dict(row) for row in rows]
+    else:
+        columns = []
+        for expression in expressions:
+            match = _ANY_VALUE.match(expression)
+            if match:
+                columns.append((match.group(2) or match.group(1), match.group(1)))
+            elif re.match(r"\w+$", expression):
+                columns.append((expression, expression))
+            else:
+                raise ValueError(f"지원하지 않는 SELECT 항목입니다: {expression}")
+        projected = [{alias: row.get(column) for alias, column in columns} for row in rows]
+
+    if distinct:
+        unique = {json.dumps(row, sort_keys=True, default=str): row for row in projected}
+        projected = list(unique.values())
+    return projected
+
+
+def _timestamp(value) -> Optional[datetime]:
+    """TIMESTAMP 값 (ISO 문자열 또는 datetime, 시간대가 없으면 로컬 시각으로 간주)"""
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    return value if value.tzinfo else value.astimezone()
+
+
+def _sort_key(value) -> tuple:
+    """정렬 키 (NULL은 가장 작게, TIMESTAMP 문자열은 시각으로 비교)"""
+    timestamp = _timestamp(value)
+    if timestamp is not None:
+        return (1, timestamp.timestamp())
+    return (0, 0) if value is None else (1, value)
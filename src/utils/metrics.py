@@ -0,0 +1,438 @@
+"""
+수집 지표 모듈
+요청 단계별 지연 시간(히스토그램)과 전송량을 호스트별로 집계합니다.
+"""
+
+import glob
+import json
+import logging
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 요청 한 건의 단계 (네트워크 단계 → CPU 단계 순)
+NETWORK_PHASES = ('dns', 'connect', 'tls', 'ttfb', 'download')
+CPU_PHASES = ('parse', 'extract', 'hash')
+REQUEST_PHASES = NETWORK_PHASES + CPU_PHASES
+
+# 히스토그램 버킷 상한 (밀리초, 마지막 버킷 이후는 초과 버킷)
+HISTOGRAM_BOUNDS_MS: Tuple[float, ...] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000
+)
+
+
+class LatencyHistogram:
+    """고정 버킷 지연 시간 히스토그램"""
+
+    def __init__(self, bounds_ms: Tuple[float, ...] = HISTOGRAM_BOUNDS_MS):
+        """
+        Args:
+            bounds_ms: 오름차순 버킷 상한 (밀리초)
+        """
+        self.bounds_ms = bounds_ms
+        self.bucket_counts = [0] * (len(bounds_ms) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, value_ms: float) -> None:
+        """측정값 하나를 기록"""
+        index = len(self.bounds_ms)
+        for i, bound in enumerate(self.bounds_ms):
+            if value_ms <= bound:
+                index = i
+                break
+        self.bucket_counts[index] += 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.max_ms = max(self.max_ms, value_ms)
+
+    def percentile(self, q: float) -> float:
+        """
+        백분위 추정값 (해당 버킷 상한, 최대값을 넘지 않음)
+
+        Args:
+            q: 0~1 사이 백분위
+        """
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.bucket_counts):
+            seen += bucket_count
+            if seen >= rank and bucket_count:
+                bound = self.bounds_ms[i] if i < len(self.bounds_ms) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def bucket_labels(self) -> List[str]:
+        """to_dict() 버킷 키 (le_{상한}, 마지막은 gt_max)"""
+        return [f"le_{bound:g}" for bound in self.bounds_ms] + ["gt_max"]
+
+    def merge(self, stats: Dict) -> None:
+        """
+        to_dict()로 저장한 다른 히스토그램을 합칩니다. (샤드별 지표 병합용)
+
+        Args:
+            stats: 같은 버킷 상한으로 만든 to_dict() 결과
+        """
+        buckets = stats.get('buckets', {})
+        for i, label in enumerate(self.bucket_labels()):
+            self.bucket_counts[i] += buckets.get(label, 0)
+        self.count += stats.get('count', 0)
+        self.total_ms += stats.get('total_ms', 0.0)
+        self.max_ms = max(self.max_ms, stats.get('max_ms', 0.0))
+
+    def to_dict(self) -> Dict:
+        """요약 통계와 버킷 분포 딕셔너리"""
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total_ms / self.count, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.5), 3),
+            'p95_ms': round(self.percentile(0.95), 3),
+            'max_ms': round(self.max_ms, 3),
+            'total_ms': round(self.total_ms, 3),
+            'buckets': dict(zip(self.bucket_labels(), self.bucket_counts)),
+        }
+
+
+class ScrapeMetrics:
+    """호스트 × 단계별 지연 시간 집계기 (스레드 안전)"""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def record(self, host: str, phase: str, seconds: float) -> None:
+        """
+        단계 하나의 소요 시간을 기록합니다.
+
+        Args:
+            host: 요청 호스트
+            phase: REQUEST_PHASES 중 하나
+            seconds: 소요 시간 (초)
+        """
+        key = (host or 'unknown', phase)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(max(0.0, seconds) * 1000)
+
+    @contextmanager
+    def timer(self, host: str, phase: str) -> Iterator[None]:
+        """with 블록 실행 시간을 기록하는 컨텍스트 매니저"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(host, phase, time.perf_counter() - started)
+
+    def summary(self) -> Dict[str, Dict[str, Dict]]:
+        """
+        호스트별 단계 요약을 반환합니다.
+
+        Returns:
+            {host: {phase: {count, mean_ms, p50_ms, p95_ms, max_ms, total_ms, buckets}}}
+        """
+        with self._lock:
+            items = sorted(self._histograms.items())
+            result: Dict[str, Dict[str, Dict]] = {}
+            for (host, phase), histogram in items:
+                result.setdefault(host, {})[phase] = histogram.to_dict()
+        return result
+
+    def reset(self) -> None:
+        """집계 초기화"""
+        with self._lock:
+            self._histograms = {}
+            self.started_at = time.time()
+
+    def format_summary(self) -> str:
+        """로그 출력용 표 형식 요약 (호스트별 네트워크/CPU 합계 포함)"""
+        summary = self.summary()
+        if not summary:
+            return "수집된 지표가 없습니다."
+
+        lines = [f"{'host':<32} {'phase':<9} {'count':>6} {'mean ms':>9} "
+                 f"{'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for host, phases in summary.items():
+            for phase in REQUEST_PHASES:
+                stats = phases.get(phase)
+                if not stats:
+                    continue
+                lines.append(
+                    f"{host[:32]:<32} {phase:<9} {stats['count']:>6} {stats['mean_ms']:>9.1f} "
+                    f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['max_ms']:>9.1f}"
+                )
+            network_ms, cpu_ms = self._split_totals(phases)
+            lines.append(f"{host[:32]:<32} 합계: 네트워크 {network_ms:.0f} ms / CPU {cpu_ms:.0f} ms")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _split_totals(phases: Dict[str, Dict]) -> Tuple[float, float]:
+        """단계 요약에서 네트워크/CPU 누적 시간(ms) 계산"""
+        network_ms = sum(phases[p]['total_ms'] for p in NETWORK_PHASES if p in phases)
+        cpu_ms = sum(phases[p]['total_ms'] for p in CPU_PHASES if p in phases)
+        return network_ms, cpu_ms
+
+    def save(self, path: str, extra: Optional[Dict] = None) -> bool:
+        """
+        요약을 JSON 파일로 저장합니다.
+
+        Args:
+            path: 저장 경로
+            extra: 함께 저장할 추가 항목 (예: 전송량 요약)
+
+        Returns:
+            저장 성공 여부
+        """
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+            payload = {
+                'started_at': self.started_at,
+                'saved_at': time.time(),
+                'hosts': self.summary(),
+                **(extra or {}),
+            }
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, path)
+            return True
+
+        except Exception as e:
+            logger.error(f"수집 지표 저장 실패: {str(e)}")
+            return False
+
+
+class BandwidthTracker:
+    """호스트별 전송량 집계기 (스레드 안전)
+
+    wire_bytes는 네트워크로 받은 (압축된) 바이트, decoded_bytes는 압축 해제 후
+    바이트입니다. budget_bytes가 설정되면 실행 전체 wire_bytes가 예산에 도달한 뒤
+    우선순위가 낮은 페이지 수집을 연기하는 데 사용됩니다.
+    """
+
+    def __init__(self, budget_bytes: Optional[int] = None):
+        """
+        Args:
+            budget_bytes: 실행당 전송량 예산 (wire 바이트, None이면 무제한)
+        """
+        self.budget_bytes = budget_bytes
+        self._hosts: Dict[str, Dict[str, int]] = {}
+        self._deferred: List[str] = []
+        self._lock = threading.Lock()
+
+    def record(self, host: str, wire_bytes: int, decoded_bytes: int) -> None:
+        """응답 하나의 전송량 기록"""
+        with self._lock:
+            stats = self._hosts.setdefault(
+                host or 'unknown', {'responses': 0, 'wire_bytes': 0, 'decoded_bytes': 0}
+            )
+            stats['responses'] += 1
+            stats['wire_bytes'] += wire_bytes
+            stats['decoded_bytes'] += decoded_bytes
+
+    def record_deferred(self, url: str) -> None:
+        """예산 소진으로 연기한 URL 기록"""
+        with self._lock:
+            self._deferred.append(url)
+
+    @property
+    def wire_bytes(self) -> int:
+        """실행 전체 wire 바이트"""
+        with self._lock:
+            return sum(stats['wire_bytes'] for stats in self._hosts.values())
+
+    @property
+    def exhausted(self) -> bool:
+        """예산 소진 여부 (예산이 없으면 항상 False)"""
+        return self.budget_bytes is not None and self.wire_bytes >= self.budget_bytes
+
+    def reset(self, budget_bytes: Optional[int] = None) -> None:
+        """집계 초기화 및 예산 재설정"""
+        with self._lock:
+            self.budget_bytes = budget_bytes
+            self._hosts = {}
+            self._deferred = []
+
+    def summary(self) -> Dict:
+        """
+        전송량 요약을 반환합니다.
+
+        Returns:
+            실행 합계(wire_bytes, decoded_bytes, compression_ratio, budget_bytes,
+            deferred_urls)와 호스트별 집계(hosts)
+        """
+        with self._lock:
+            hosts = {host: dict(stats) for host, stats in sorted(self._hosts.items())}
+            deferred = list(self._deferred)
+
+        wire = sum(stats['wire_bytes'] for stats in hosts.values())
+        decoded = sum(stats['decoded_bytes'] for stats in hosts.values())
+        return {
+            'wire_bytes': wire,
+            'decoded_bytes': decoded,
+            'compression_ratio': round(decoded / wire, 3) if wire else 0.0,
+            'budget_bytes': self.budget_bytes,
+            'deferred_urls': deferred,
+            'hosts': hosts,
+        }
+
+    def format_summary(self) -> str:
+        """로그 출력용 요약"""
+        summary = self.summary()
+        lines = [
+            f"전송량: wire {summary['wire_bytes'] / 1024:.1f} KiB / 압축 해제 "
+            f"{summary['decoded_bytes'] / 1024:.1f} KiB (압축률 {summary['compression_ratio']:.2f}x)"
+        ]
+        for host, stats in summary['hosts'].items():
+            lines.append(f"  {host}: 응답 {stats['responses']}개, wire {stats['wire_bytes'] / 1024:.1f} KiB, "
+                         f"압축 해제 {stats['decoded_bytes'] / 1024:.1f} KiB")
+        if summary['deferred_urls']:
+            lines.append(f"  예산 소진으로 연기된 페이지: {len(summary['deferred_urls'])}개")
+        return "\n".join(lines)
+
+
+def load_metrics_summary(path: str) -> Optional[Dict]:
+    """save()로 저장한 요약 파일 읽기 (없거나 손상되면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _shard_metrics_paths(path: str) -> List[str]:
+    """
+    가장 최근 실행의 지표 파일 경로들
+
+    샤드 실행은 shard_state_path()로 '{이름}.shard-0002-of-0008{확장자}' 파일에
+    저장합니다. 이전 실행의 샤드 수가 달랐을 수 있으므로, 샤드 수별로 묶은 뒤
+    가장 최근에 저장된 파일이 속한 묶음만 반환합니다. (단일 실행은 원래 경로)
+    """
+    root, ext = os.path.splitext(path)
+    pattern = re.compile(re.escape(root) + r"\.shard-\d+-of-(\d+)" + re.escape(ext) + "$")
+
+    groups: Dict[int, List[str]] = {}
+    if os.path.exists(path):
+        groups[1] = [path]
+    for shard_path in glob.glob(f"{glob.escape(root)}.shard-*-of-*{glob.escape(ext)}"):
+        match = pattern.match(shard_path)
+        if match:
+            groups.setdefault(int(match.group(1)), []).append(shard_path)
+
+    if not groups:
+        return []
+    latest = max(groups.values(), key=lambda paths: max(os.path.getmtime(p) for p in paths))
+    return sorted(latest)
+
+
+def merge_metrics_summaries(summaries: List[Dict]) -> Dict:
+    """
+    샤드별로 저장한 지표 요약을 하나로 합칩니다.
+
+    호스트 × 단계 히스토그램은 버킷 단위로 합쳐 백분위를 다시 계산하고,
+    전송량은 호스트별/전체 합계와 연기된 URL 목록을 합칩니다.
+
+    Returns:
+        save() 형식의 요약 (started_at은 가장 이른 값, saved_at은 가장 늦은 값)
+    """
+    histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+    bandwidth_hosts: Dict[str, Dict[str, int]] = {}
+    deferred: List[str] = []
+    budgets = []
+    has_bandwidth = False
+
+    for summary in summaries:
+        for host, phases in summary.get('hosts', {}).items():
+            for phase, stats in phases.items():
+                histograms.setdefault((host, phase), LatencyHistogram()).merge(stats)
+
+        bandwidth = summary.get('bandwidth')
+        if not bandwidth:
+            continue
+        has_bandwidth = True
+        for host, stats in bandwidth.get('hosts', {}).items():
+            merged = bandwidth_hosts.setdefault(
+                host, {'responses': 0, 'wire_bytes': 0, 'decoded_bytes': 0}
+            )
+            for field in merged:
+                merged[field] += stats.get(field, 0)
+        deferred.extend(bandwidth.get('deferred_urls', []))
+        if bandwidth.get('budget_bytes') is not None:
+            budgets.append(bandwidth['budget_bytes'])
+
+    hosts: Dict[str, Dict[str, Dict]] = {}
+    for (host, phase), histogram in sorted(histograms.items()):
+        hosts.setdefault(host, {})[phase] = histogram.to_dict()
+
+    merged_summary = {
+        'started_at': min((s['started_at'] for s in summaries if 'started_at' in s), default=None),
+        'saved_at': max((s['saved_at'] for s in summaries if 'saved_at' in s), default=None),
+        'hosts': hosts,
+        'bandwidth': None,
+    }
+    if has_bandwidth:
+        wire = sum(stats['wire_bytes'] for stats in bandwidth_hosts.values())
+        decoded = sum(stats['decoded_bytes'] for stats in bandwidth_hosts.values())
+        merged_summary['bandwidth'] = {
+            'wire_bytes': wire,
+            'decoded_bytes': decoded,
+            'compression_ratio': round(decoded / wire, 3) if wire else 0.0,
+            'budget_bytes': sum(budgets) if budgets else None,
+            'deferred_urls': deferred,
+            'hosts': dict(sorted(bandwidth_hosts.items())),
+        }
+    return merged_summary
+
+
+def load_merged_metrics_summary(path: str) -> Optional[Dict]:
+    """
+    마지막 실행의 지표 요약을 읽습니다. (샤드 실행이면 샤드 파일을 모두 합침)
+
+    Args:
+        path: 설정의 지표 경로 (SCRAPE_METRICS_PATH, 샤드 표시가 붙기 전)
+
+    Returns:
+        merge_metrics_summaries() 결과에 합친 파일 수(files)를 더한 요약
+        (읽을 파일이 없으면 None)
+    """
+    summaries = []
+    for metrics_path in _shard_metrics_paths(path):
+        summary = load_metrics_summary(metrics_path)
+        if summary is None:
+            logger.warning(f"지표 파일을 읽지 못해 건너뜁니다: {metrics_path}")
+            continue
+        summaries.append(summary)
+
+    if not summaries:
+        return None
+    merged = merge_metrics_summaries(summaries)
+    merged['files'] = len(summaries)
+    return merged
+
+
+def hosts_by_total_time(summary: Dict[str, Dict[str, Dict]]) -> List[Tuple[str, float]]:
+    """호스트를 전체 누적 시간(ms) 내림차순으로 정렬 (느린 호스트 파악용)"""
+    totals = [
+        (host, sum(stats['total_ms'] for stats in phases.values()))
+        for host, phases in summary.items()
+    ]
+    return sorted(totals, key=lambda item: item[1], reverse=True)
+
+
+# 프로세스 전역 수집 지표 (스크래퍼, HTTP 전송 계층, API가 공유)
+scrape_metrics = ScrapeMetrics()
+bandwidth_usage = BandwidthTracker()
@@ -0,0 +1,107 @@
+"""
+마이크로 배치 버퍼 모듈
+수집된 행을 모아 두었다가 행 수 또는 경과 시간 기준으로 묶어서 저장 함수에 넘깁니다.
+
+실행 전체를 메모리에 모으지 않고 일정 크기 단위로 내보내므로, 메모리 사용량은
+실행 규모와 무관하게 배치 크기로 제한되고 첫 데이터가 곧바로 저장됩니다.
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ROWS = 100
+DEFAULT_MAX_WAIT_SECONDS = 5.0
+
+
+class MicroBatchBuffer:
+    """행 수/시간 기준으로 비우는 크기 제한 버퍼 (스레드 안전)
+
+    flush_fn은 배치(행 리스트)를 받아 성공 여부를 반환해야 합니다. 실패한 배치는
+    다시 시도하지 않고 건수만 기록하며, close()의 반환값으로 전체 성공 여부를 알립니다.
+    """
+
+    def __init__(self, flush_fn: Callable[[List[Dict]], bool],
+                 max_rows: int = DEFAULT_MAX_ROWS,
+                 max_wait_seconds: float = DEFAULT_MAX_WAIT_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            flush_fn: 배치를 저장하는 함수 (성공 여부 반환)
+            max_rows: 이 행 수가 모이면 즉시 비움
+            max_wait_seconds: 첫 행이 들어온 뒤 이 시간이 지나면 비움 (flush_if_due 호출 시)
+            clock: 시간 함수 (테스트용)
+        """
+        self.flush_fn = flush_fn
+        self.max_rows = max(1, max_rows)
+        self.max_wait_seconds = max_wait_seconds
+        self._clock = clock
+        self._rows: List[Dict] = []
+        self._first_added_at = None
+        self._lock = threading.Lock()
+
+        self.flushed_rows = 0
+        self.flushed_batches = 0
+        self.failed_rows = 0
+        self.failed_batches = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def add(self, row: Dict) -> None:
+        """행 추가 (max_rows에 도달하면 바로 비움)"""
+        with self._lock:
+            if not self._rows:
+                self._first_added_at = self._clock()
+            self._rows.append(row)
+            if len(self._rows) >= self.max_rows:
+                self._flush_locked()
+
+    def flush_if_due(self) -> bool:
+        """
+        첫 행이 들어온 뒤 max_wait_seconds가 지났으면 비웁니다.
+
+        Returns:
+            비웠는지 여부
+        """
+        with self._lock:
+            if not self._rows or self._clock() - self._first_added_at < self.max_wait_seconds:
+                return False
+            self._flush_locked()
+            return True
+
+    def flush(self) -> None:
+        """남은 행을 모두 비움"""
+        with self._lock:
+            if self._rows:
+                self._flush_locked()
+
+    def close(self) -> bool:
+        """
+        남은 행을 비우고 전체 결과를 반환합니다.
+
+        Returns:
+            실패한 배치가 없으면 True
+        """
+        self.flush()
+        return self.failed_batches == 0
+
+    def _flush_locked(self) -> None:
+        batch, self._rows = self._rows, []
+        self._first_added_at = None
+
+        try:
+            success = self.flush_fn(batch)
+        except Exception as e:
+            logger.error(f"배치 저장 실패: {str(e)}")
+            success = False
+
+        if success:
+            self.flushed_rows += len(batch)
+            self.flushed_batches += 1
+        else:
+            self.failed_rows += len(batch)
+            self.failed_batches += 1
@@ -0,0 +1,151 @@
+"""
+조회 결과 캐시 모듈
+(정규화한 SQL, 쿼리 파라미터)를 키로 조회 결과를 프로세스 메모리에 보관합니다.
+
+항목은 TTL이 지나면 만료되고, 항목 수가 상한을 넘으면 가장 오래 사용하지 않은
+항목부터 제거합니다. 항목마다 조회한 테이블을 기록해 두어, 삽입 후
+invalidate_tables()로 해당 테이블을 읽은 결과만 무효화할 수 있습니다.
+
+무효화할 때마다 테이블별 세대 번호를 올리므로, 조회 시작 전에 generation()으로
+받은 값을 put()에 넘기면 조회 도중 무효화된 (쓰기 이전일 수 있는) 결과는 저장하지 않습니다.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 300.0
+
+CacheKey = Tuple[str, str]
+
+
+def normalize_sql(sql: str) -> str:
+    """공백/줄바꿈 차이를 없앤 SQL (들여쓰기만 다른 같은 쿼리를 같은 키로)"""
+    return " ".join(sql.split())
+
+
+def cache_key(sql: str, query_parameters: Sequence = ()) -> CacheKey:
+    """
+    캐시 키 생성
+
+    Args:
+        sql: 쿼리 문자열
+        query_parameters: bigquery.ScalarQueryParameter/ArrayQueryParameter 리스트
+    """
+    params = [param.to_api_repr() for param in query_parameters]
+    return normalize_sql(sql), json.dumps(params, sort_keys=True, default=str)
+
+
+class QueryCache:
+    """TTL 만료와 LRU 제거를 적용한 조회 결과 캐시 (스레드 안전)"""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            max_entries: 보관할 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (초)
+            clock: 시간 함수 (테스트용)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[CacheKey, Tuple[float, Any, Set[str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        self._global_generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """
+        캐시 조회
+
+        Returns:
+            (적중 여부, 값)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return True, entry[1]
+
+    def generation(self, tables: Iterable[str]) -> Tuple:
+        """테이블들의 현재 세대 (조회 시작 전에 받아 put()에 전달)"""
+        with self._lock:
+            return self._generation(tables)
+
+    def put(self, key: CacheKey, value: Any, tables: Iterable[str],
+            generation: Optional[Tuple] = None) -> bool:
+        """
+        조회 결과 저장
+
+        Args:
+            key: cache_key() 결과
+            value: 조회 결과
+            tables: 쿼리가 읽은 테이블 이름 (무효화 기준)
+            generation: 조회 시작 전 generation(tables) 값 (그 사이 무효화되었으면 저장하지 않음)
+
+        Returns:
+            저장 여부
+        """
+        tables = set(tables)
+        with self._lock:
+            if generation is not None and generation != self._generation(tables):
+                return False
+            self._entries[key] = (self._clock() + self.ttl_seconds, value, tables)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate_tables(self, tables: Optional[Iterable[str]] = None) -> int:
+        """
+        테이블을 읽은 항목을 무효화합니다. (tables가 None이면 전체)
+
+        Returns:
+            제거한 항목 수
+        """
+        with self._lock:
+            if tables is None:
+                self._global_generation += 1
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+
+            tables = set(tables)
+            for table in tables:
+                self._generations[table] = self._generations.get(table, 0) + 1
+            stale = [key for key, (_, _, read) in self._entries.items() if read & tables]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def _generation(self, tables: Iterable[str]) -> Tuple:
+        return (self._global_generation,) + tuple(
+            (table, self._generations.get(table, 0)) for table in sorted(tables)
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,228 @@
+"""
+스키마 기반 행 직렬화 모듈
+테이블 스키마(SchemaField 리스트)로부터 필드별 변환 함수를 한 번 만들어 두고,
+삽입할 배치 전체를 한 번에 검증/변환합니다.
+
+- 스키마에 있는 필드만 남기고 없는 NULLABLE 필드는 NULL로 채웁니다.
+- 타입이 맞지 않거나 REQUIRED 필드가 빠진 행은 배치를 실패시키지 않고 따로 보고합니다.
+- STRING 컬럼에 들어온 dict/list(예: 분석 결과)는 JSON 문자열로 저장합니다.
+- orjson이 설치되어 있으면 JSON 인코딩에 사용하고, 없으면 표준 json으로 대체합니다.
+
+테이블에 스키마가 없으면(로컬 대체 클라이언트 등) TABLE_SCHEMAS의 기본 스키마를 사용합니다.
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from google.cloud import bigquery
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+def _field(name: str, field_type: str, mode: str = 'NULLABLE') -> bigquery.SchemaField:
+    return bigquery.SchemaField(name, field_type, mode=mode)
+
+
+# 이 저장소가 쓰는 테이블의 기본 스키마 (테이블 메타데이터에 스키마가 없을 때 사용)
+TABLE_SCHEMAS: Dict[str, List[bigquery.SchemaField]] = {
+    'competitor_data': [
+        _field('id', 'STRING', 'REQUIRED'),
+        _field('competitor_name', 'STRING', 'REQUIRED'),
+        _field('url', 'STRING', 'REQUIRED'),
+        _field('page_title', 'STRING'),
+        _field('content', 'STRING'),
+        _field('meta_description', 'STRING'),
+        _field('collected_at', 'TIMESTAMP', 'REQUIRED'),
+        _field('content_hash', 'STRING', 'REQUIRED'),
+        _field('content_simhash', 'STRING'),
+    ],
+    'analysis_results': [
+        _field('id', 'STRING', 'REQUIRED'),
+        _field('competitor_name', 'STRING', 'REQUIRED'),
+        _field('analysis_type', 'STRING', 'REQUIRED'),
+        _field('analysis_date', 'DATE'),
+        _field('results', 'STRING'),
+        _field('summary', 'STRING'),
+        _field('created_at', 'TIMESTAMP'),
+    ],
+}
+
+
+def dumps_json(value: Any) -> str:
+    """값을 JSON 문자열로 인코딩 (orjson 우선)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=str).decode('utf-8')
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
+def json_size(rows: Sequence[Dict]) -> int:
+    """행 리스트 전체를 한 번에 인코딩한 JSON 바이트 수 (스트리밍 삽입 요청 크기 추정)"""
+    if ORJSON_AVAILABLE:
+        return len(orjson.dumps(rows, default=str))
+    return len(json.dumps(rows, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8'))
+
+
+class RowError(ValueError):
+    """스키마에 맞지 않는 행"""
+
+
+class SerializedBatch(NamedTuple):
+    """직렬화 결과"""
+    rows: List[Dict]  # 변환된 정상 행
+    errors: List[Tuple[int, str]]  # (원래 배치 내 인덱스, 오류 메시지)
+    json_bytes: int  # 정상 행의 JSON 바이트 수
+
+
+def _to_string(value):
+    if isinstance(value, str):
+        return value
+    if isinstance(value, (dict, list, tuple)):
+        # 빈 결과는 NULL로 저장
+        return dumps_json(value) if value else None
+    raise TypeError(f"문자열이 아닌 값: {type(value).__name__}")
+
+
+def _to_integer(value):
+    if isinstance(value, bool):
+        raise TypeError("불리언은 정수로 저장할 수 없습니다")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return int(value)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    raise TypeError(f"정수가 아닌 값: {value!r}")
+
+
+def _to_float(value):
+    if isinstance(value, bool):
+        raise TypeError("불리언은 실수로 저장할 수 없습니다")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        return float(value)
+    raise TypeError(f"실수가 아닌 값: {value!r}")
+
+
+def _to_boolean(value):
+    if isinstance(value, bool):
+        return value
+    raise TypeError(f"불리언이 아닌 값: {value!r}")
+
+
+def _to_timestamp(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, str):
+        datetime.fromisoformat(value)  # 형식 검증
+        return value
+    raise TypeError(f"시각이 아닌 값: {value!r}")
+
+
+def _to_date(value):
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        date.fromisoformat(value[:10])  # 형식 검증
+        return value
+    raise TypeError(f"날짜가 아닌 값: {value!r}")
+
+
+def _to_json(value):
+    return value if isinstance(value, str) else dumps_json(value)
+
+
+def _to_record(value):
+    if isinstance(value, dict):
+        return value
+    raise TypeError(f"레코드가 아닌 값: {type(value).__name__}")
+
+
+_CONVERTERS: Dict[str, Callable[[Any], Any]] = {
+    'STRING': _to_string,
+    'INTEGER': _to_integer, 'INT64': _to_integer,
+    'FLOAT': _to_float, 'FLOAT64': _to_float, 'NUMERIC': _to_float, 'BIGNUMERIC': _to_float,
+    'BOOLEAN': _to_boolean, 'BOOL': _to_boolean,
+    'TIMESTAMP': _to_timestamp, 'DATETIME': _to_timestamp,
+    'DATE': _to_date,
+    'JSON': _to_json,
+    'RECORD': _to_record, 'STRUCT': _to_record,
+}
+
+
+def _repeated(convert: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def convert_list(value):
+        if not isinstance(value, (list, tuple)):
+            raise TypeError(f"리스트가 아닌 값: {type(value).__name__}")
+        return [convert(item) for item in value]
+    return convert_list
+
+
+class RowSerializer:
+    """테이블 스키마로 만든 배치 직렬화기"""
+
+    def __init__(self, schema: Sequence[bigquery.SchemaField]):
+        """
+        Args:
+            schema: 대상 테이블의 SchemaField 리스트 (비어 있으면 행을 그대로 통과)
+        """
+        self.fields: List[Tuple[str, Callable[[Any], Any], bool]] = []
+        for field in schema:
+            convert = _CONVERTERS.get(field.field_type.upper(), lambda value: value)
+            if field.mode == 'REPEATED':
+                convert = _repeated(convert)
+            self.fields.append((field.name, convert, field.mode == 'REQUIRED'))
+
+    def serialize_row(self, row: Dict) -> Dict:
+        """행 하나를 변환 (스키마에 맞지 않으면 RowError)"""
+        if not self.fields:
+            return dict(row)
+
+        converted = {}
+        for name, convert, required in self.fields:
+            value = row.get(name)
+            if value is None:
+                if required:
+                    raise RowError(f"필수 필드 누락: {name}")
+                converted[name] = None
+                continue
+            try:
+                converted[name] = convert(value)
+            except (TypeError, ValueError) as e:
+                raise RowError(f"{name}: {str(e)}")
+        return converted
+
+    def serialize(self, rows: Sequence[Dict]) -> SerializedBatch:
+        """
+        배치 전체를 변환합니다. 잘못된 행은 제외하고 errors로 보고합니다.
+
+        Returns:
+            SerializedBatch(정상 행, (인덱스, 오류) 리스트, 정상 행 JSON 바이트 수)
+        """
+        converted = []
+        errors = []
+        serialize_row = self.serialize_row
+        for index, row in enumerate(rows):
+            try:
+                converted.append(serialize_row(row))
+            except RowError as e:
+                errors.append((index, str(e)))
+        return SerializedBatch(converted, errors, json_size(converted))
+
+
+def schema_for(table_name: str, table_schema: Optional[Sequence[bigquery.SchemaField]]
+               ) -> Sequence[bigquery.SchemaField]:
+    """테이블 메타데이터의 스키마 (없으면 TABLE_SCHEMAS 기본값, 둘 다 없으면 빈 리스트)"""
+    if isinstance(table_schema, (list, tuple)) and table_schema:
+        return table_schema
+    return TABLE_SCHEMAS.get(table_name, [])
@@ -0,0 +1,156 @@
+"""
+실행 요약 모듈
+샤드별 수집 실행 결과를 JSON으로 남기고, 모든 샤드의 요약을 하나로 합칩니다.
+
+각 샤드는 {directory}/{run_id}/{shard_label}.json에 요약을 저장하며,
+bucket_name이 주어지면 gs://{bucket}/run_summaries/{run_id}/에도 업로드합니다.
+코디네이터(merge-summaries 명령)는 같은 위치에서 요약을 읽어 누락/실패 샤드를 확인합니다.
+"""
+
+import glob
+import json
+import logging
+import os
+from typing import Dict, List, Optional
+
+from src.data_collection.sharding import shard_label
+
+logger = logging.getLogger(__name__)
+
+GCS_PREFIX = 'run_summaries'
+
+
+def save_run_summary(directory: str, summary: Dict, bucket_name: Optional[str] = None,
+                     project_id: Optional[str] = None) -> Optional[str]:
+    """
+    샤드 실행 요약을 저장합니다.
+
+    Args:
+        directory: 요약 저장 디렉터리
+        summary: run_id, shard, num_shards 키를 포함한 요약
+        bucket_name: 업로드 대상 Cloud Storage 버킷 (선택사항)
+        project_id: GCP 프로젝트 ID
+
+    Returns:
+        저장된 로컬 파일 경로 (실패 시 None)
+    """
+    try:
+        file_name = f"{shard_label(summary['shard'], summary['num_shards'])}.json"
+        run_dir = os.path.join(directory, summary['run_id'])
+        os.makedirs(run_dir, exist_ok=True)
+
+        path = os.path.join(run_dir, file_name)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+        if bucket_name:
+            from google.cloud import storage
+
+            blob_name = f"{GCS_PREFIX}/{summary['run_id']}/{file_name}"
+            bucket = storage.Client(project=project_id).bucket(bucket_name)
+            bucket.blob(blob_name).upload_from_filename(path, content_type='application/json')
+            logger.info(f"실행 요약 업로드 완료: gs://{bucket_name}/{blob_name}")
+
+        return path
+
+    except Exception as e:
+        logger.error(f"실행 요약 저장 실패: {str(e)}")
+        return None
+
+
+def load_run_summaries(directory: str, run_id: str, bucket_name: Optional[str] = None,
+                       project_id: Optional[str] = None) -> List[Dict]:
+    """
+    실행의 샤드 요약을 모두 읽습니다. (bucket_name이 주어지면 Cloud Storage에서)
+
+    Returns:
+        샤드 요약 리스트 (읽지 못한 파일은 제외)
+    """
+    summaries = []
+    try:
+        if bucket_name:
+            from google.cloud import storage
+
+            client = storage.Client(project=project_id)
+            for blob in client.list_blobs(bucket_name, prefix=f"{GCS_PREFIX}/{run_id}/"):
+                if blob.name.endswith('.json'):
+                    summaries.append(json.loads(blob.download_as_text()))
+        else:
+            for path in sorted(glob.glob(os.path.join(directory, run_id, 'shard-*.json'))):
+                with open(path, 'r', encoding='utf-8') as f:
+                    summaries.append(json.load(f))
+
+    except Exception as e:
+        logger.error(f"실행 요약 읽기 실패: {str(e)}")
+
+    return summaries
+
+
+def merge_run_summaries(summaries: List[Dict], num_shards: Optional[int] = None) -> Dict:
+    """
+    샤드 요약을 하나의 실행 요약으로 합칩니다.
+
+    같은 샤드의 요약이 여러 개면(태스크 재시도) 가장 늦게 끝난 요약을 사용합니다.
+
+    Args:
+        summaries: 샤드 요약 리스트
+        num_shards: 기대하는 샤드 수 (기본: 요약에 기록된 값)
+
+    Returns:
+        {run_id, num_shards, missing_shards, failed_shards, success, competitors,
+         new_pages, stored_batches, failed_batches, failed_pages, wire_bytes,
+         decoded_bytes, deferred_urls, started_at, finished_at}
+    """
+    latest: Dict[int, Dict] = {}
+    for summary in summaries:
+        current = latest.get(summary['shard'])
+        if current is None or summary.get('finished_at', 0) >= current.get('finished_at', 0):
+            latest[summary['shard']] = summary
+
+    if num_shards is None:
+        num_shards = max((s['num_shards'] for s in latest.values()), default=0)
+
+    shards = [latest[shard] for shard in sorted(latest)]
+    new_pages: Dict[str, int] = {}
+    for summary in shards:
+        for name, count in summary.get('new_pages', {}).items():
+            new_pages[name] = new_pages.get(name, 0) + count
+
+    missing = [shard for shard in range(num_shards) if shard not in latest]
+    failed = [summary['shard'] for summary in shards if not summary.get('success')]
+    return {
+        'run_id': shards[0]['run_id'] if shards else None,
+        'num_shards': num_shards,
+        'missing_shards': missing,
+        'failed_shards': failed,
+        'success': bool(shards) and not missing and not failed,
+        'competitors': sorted(name for s in shards for name in s.get('competitors', [])),
+        'new_pages': dict(sorted(new_pages.items())),
+        'stored_batches': sum(s.get('stored_batches', 0) for s in shards),
+        'failed_batches': sum(s.get('failed_batches', 0) for s in shards),
+        'failed_pages': sum(s.get('failed_pages', 0) for s in shards),
+        'wire_bytes': sum(s.get('bandwidth', {}).get('wire_bytes', 0) for s in shards),
+        'decoded_bytes': sum(s.get('bandwidth', {}).get('decoded_bytes', 0) for s in shards),
+        'deferred_urls': [url for s in shards for url in s.get('bandwidth', {}).get('deferred_urls', [])],
+        'started_at': min((s['started_at'] for s in shards), default=None),
+        'finished_at': max((s['finished_at'] for s in shards), default=None),
+    }
+
+
+def format_merged_summary(merged: Dict) -> str:
+    """로그 출력용 통합 실행 요약"""
+    lines = [
+        f"실행 '{merged['run_id']}' 통합 요약: 샤드 {merged['num_shards'] - len(merged['missing_shards'])}"
+        f"/{merged['num_shards']}개 보고, 경쟁사 {len(merged['competitors'])}개, "
+        f"새 페이지 {sum(merged['new_pages'].values())}개",
+        f"  저장 배치 {merged['stored_batches']}개, 실패 배치 {merged['failed_batches']}개 "
+        f"({merged['failed_pages']}개 페이지), wire {merged['wire_bytes'] / 1024:.1f} KiB, "
+        f"연기된 URL {len(merged['deferred_urls'])}개",
+    ]
+    if merged['missing_shards']:
+        lines.append(f"  보고하지 않은 샤드: {merged['missing_shards']}")
+    if merged['failed_shards']:
+        lines.append(f"  저장에 실패한 샤드: {merged['failed_shards']}")
+    return "\n".join(lines)
@@ -0,0 +1,512 @@
+"""
+커밋 스트림 쓰기 모듈
+BigQuery Storage Write API의 COMMITTED 스트림 방식으로, 직렬화한 행 배치를 명시적
+오프셋과 함께 추가합니다.
+
+각 요청은 스트림 안의 시작 오프셋을 지정하므로, 응답을 받지 못해 다시 보낸 요청이
+이미 기록되어 있으면 서버가 ALREADY_EXISTS로 거절하여 행이 중복되지 않습니다.
+(insert_rows_json 재시도는 중복 행을 만들 수 있음)
+여러 요청을 응답을 기다리지 않고 이어서 보내되, 응답 대기 중인 요청 수가
+max_in_flight에 도달하면 가장 오래된 응답을 기다립니다.
+
+전송 계층은 교체할 수 있습니다:
+    - StorageWriteTransport: google-cloud-bigquery-storage 사용 (실제 BigQuery)
+    - LocalWriteServer: 같은 오프셋 규칙을 따르는 프로세스 내 가짜 서버 (테스트/벤치마크용)
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from src.data_collection.host_health import backoff_delay
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 4
+DEFAULT_MAX_ROWS_PER_REQUEST = 500
+DEFAULT_MAX_RETRIES = 3
+
+
+class StreamWriteError(Exception):
+    """스트림 쓰기 실패 (재시도 횟수 초과 또는 재시도할 수 없는 오류)"""
+
+
+class TransientAppendError(StreamWriteError):
+    """일시적 전송 실패 (같은 오프셋으로 다시 보내면 됨)"""
+
+
+class OffsetAlreadyExists(StreamWriteError):
+    """요청 오프셋의 행이 이미 기록됨 (이전 시도가 커밋된 경우)"""
+
+
+class OffsetOutOfRange(StreamWriteError):
+    """요청 오프셋이 스트림 끝보다 뒤임 (앞선 요청이 실패한 경우)"""
+
+
+RETRYABLE_ERRORS = (TransientAppendError, OffsetOutOfRange)
+
+
+class _Batch:
+    """오프셋이 정해진 추가 요청 하나"""
+
+    __slots__ = ('offset', 'rows', 'attempts')
+
+    def __init__(self, offset: int, rows: List[bytes]):
+        self.offset = offset
+        self.rows = rows
+        self.attempts = 0
+
+
+class CommittedStreamWriter:
+    """오프셋 기반 정확히 한 번 추가 쓰기 (요청 파이프라이닝, 스레드 하나에서 사용)"""
+
+    def __init__(self, transport, table_path: str,
+                 max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+                 max_rows_per_request: int = DEFAULT_MAX_ROWS_PER_REQUEST,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 serializer: Optional[Callable[[Dict], bytes]] = None,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            transport: create_stream/append/finalize를 제공하는 전송 계층
+            table_path: projects/{p}/datasets/{d}/tables/{t} 형식 테이블 경로
+            max_in_flight: 응답을 기다리는 요청 수 상한 (초과 시 가장 오래된 응답 대기)
+            max_rows_per_request: 요청 하나에 담을 최대 행 수
+            max_retries: 요청별 최대 재시도 횟수
+            serializer: 행 직렬화 함수 (기본: transport.serialize_row)
+            sleep: 재시도 대기 함수 (테스트용)
+        """
+        self.transport = transport
+        self.table_path = table_path
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_rows_per_request = max(1, max_rows_per_request)
+        self.max_retries = max(0, max_retries)
+        self.serializer = serializer or transport.serialize_row
+        self._sleep = sleep
+        self.stream_name: Optional[str] = None
+        self._next_offset = 0
+        self._in_flight: Deque[Tuple[_Batch, Future]] = deque()
+
+        self.rows_committed = 0
+        self.requests_sent = 0
+        self.retries = 0
+        self.duplicates_skipped = 0
+
+    def append_rows(self, rows: List[Dict]) -> int:
+        """
+        행을 직렬화하여 스트림에 추가 요청합니다. (응답은 기다리지 않음)
+
+        Returns:
+            첫 행의 스트림 오프셋
+        """
+        if self.stream_name is None:
+            self.stream_name = self.transport.create_stream(self.table_path)
+
+        first_offset = self._next_offset
+        serialized = [self.serializer(row) for row in rows]
+        for start in range(0, len(serialized), self.max_rows_per_request):
+            batch = _Batch(self._next_offset, serialized[start:start + self.max_rows_per_request])
+            self._next_offset += len(batch.rows)
+
+            # 역압: 응답 대기 요청이 상한이면 가장 오래된 응답부터 처리
+            while len(self._in_flight) >= self.max_in_flight:
+                self._complete_oldest()
+            self._send(batch)
+        return first_offset
+
+    def flush(self) -> None:
+        """보낸 요청의 응답을 모두 기다림 (실패 시 StreamWriteError)"""
+        while self._in_flight:
+            self._complete_oldest()
+
+    def close(self) -> int:
+        """
+        남은 요청을 마치고 스트림을 종료합니다.
+
+        Returns:
+            커밋된 행 수
+        """
+        self.flush()
+        if self.stream_name is not None:
+            self.transport.finalize(self.stream_name)
+        return self.rows_committed
+
+    def stats(self) -> Dict[str, int]:
+        """쓰기 통계"""
+        return {
+            'rows_committed': self.rows_committed,
+            'requests_sent': self.requests_sent,
+            'retries': self.retries,
+            'duplicates_skipped': self.duplicates_skipped,
+        }
+
+    def _send(self, batch: _Batch) -> None:
+        future = self.transport.append(self.stream_name, batch.rows, batch.offset)
+        self._in_flight.append((batch, future))
+        self.requests_sent += 1
+
+    def _complete_oldest(self) -> None:
+        batch, future = self._in_flight.popleft()
+        try:
+            future.result()
+        except OffsetAlreadyExists:
+            # 이전 시도가 커밋되었으나 응답을 받지 못한 경우
+            self.duplicates_skipped += len(batch.rows)
+        except RETRYABLE_ERRORS as e:
+            self._resend_from(batch, e)
+            return
+        except Exception as e:
+            raise StreamWriteError(f"오프셋 {batch.offset} 추가 실패: {str(e)}") from e
+        self.rows_committed += len(batch.rows)
+
+    def _resend_from(self, failed: _Batch, error: Exception) -> None:
+        """실패한 요청과 그 뒤에 보낸 요청을 같은 오프셋으로 다시 보냄"""
+        failed.attempts += 1
+        if failed.attempts > self.max_retries:
+            raise StreamWriteError(
+                f"오프셋 {failed.offset} 추가 재시도 횟수 초과: {str(error)}"
+            ) from error
+
+        # 뒤 요청의 결과를 기다려 실패한 요청만 다시 보냄
+        # (실패한 요청이 실제로는 커밋되었다면 뒤 요청이 성공할 수 있음)
+        pending = [failed]
+        while self._in_flight:
+            batch, future = self._in_flight.popleft()
+            try:
+                future.result()
+            except OffsetAlreadyExists:
+                self.duplicates_skipped += len(batch.rows)
+            except Exception:
+                pending.append(batch)
+                continue
+            self.rows_committed += len(batch.rows)
+
+        self.retries += 1
+        logger.warning(f"스트림 추가 재시도 ({failed.attempts}/{self.max_retries}, "
+                       f"오프셋 {failed.offset}): {str(error)}")
+        self._sleep(backoff_delay(failed.attempts - 1))
+        for batch in pending:
+            self._send(batch)
+
+
+class LocalWriteServer:
+    """오프셋 규칙을 따르는 프로세스 내 가짜 Storage Write 서버 (전송 계층)
+
+    요청은 스트림별로 보낸 순서대로 처리되며, 요청마다 latency_seconds의 왕복 지연이
+    있습니다. failures로 특정 요청(전체 요청 순번, 0부터)을 커밋 전('before_commit')
+    또는 커밋 후 응답 유실('after_commit')로 실패시킬 수 있습니다.
+    """
+
+    def __init__(self, latency_seconds: float = 0.0,
+                 failures: Optional[Dict[int, str]] = None, workers: int = 64):
+        self.latency_seconds = latency_seconds
+        self.failures = dict(failures or {})
+        self.streams: Dict[str, List[bytes]] = {}
+        self.finalized: Dict[str, int] = {}
+        self.requests = 0
+        self.max_concurrent = 0
+        self._concurrent = 0
+        self._sequence: Dict[str, int] = {}
+        self._processed: Dict[str, int] = {}
+        self._cond = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=workers)
+
+    @staticmethod
+    def serialize_row(row: Dict) -> bytes:
+        return json.dumps(row, ensure_ascii=False, sort_keys=True, default=str).encode('utf-8')
+
+    def create_stream(self, table_path: str) -> str:
+        with self._cond:
+            name = f"{table_path}/streams/{len(self.streams)}"
+            self.streams[name] = []
+            self._sequence[name] = 0
+            self._processed[name] = 0
+        return name
+
+    def append(self, stream_name: str, rows: List[bytes], offset: int) -> Future:
+        with self._cond:
+            sequence = self._sequence[stream_name]
+            self._sequence[stream_name] += 1
+            request_number = self.requests
+            self.requests += 1
+            self._concurrent += 1
+            self.max_concurrent = max(self.max_concurrent, self._concurrent)
+        return self._executor.submit(self._handle, stream_name, sequence, request_number,
+                                     rows, offset)
+
+    def finalize(self, stream_name: str) -> int:
+        with self._cond:
+            self.finalized[stream_name] = len(self.streams[stream_name])
+            return self.finalized[stream_name]
+
+    def rows(self, stream_name: str) -> List[Dict]:
+        """스트림에 커밋된 행 (직렬화 해제)"""
+        with self._cond:
+            return [json.loads(row) for row in self.streams[stream_name]]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def _handle(self, stream_name: str, sequence: int, request_number: int,
+                rows: List[bytes], offset: int) -> int:
+        try:
+            time.sleep(self.latency_seconds / 2)
+            with self._cond:
+                # 같은 연결로 보낸 요청은 보낸 순서대로 처리
+                self._cond.wait_for(lambda: self._processed[stream_name] == sequence)
+                try:
+                    error = self._commit(stream_name, request_number, rows, offset)
+                finally:
+                    self._processed[stream_name] += 1
+                    self._cond.notify_all()
+            time.sleep(self.latency_seconds / 2)
+            if error:
+                raise error
+            return offset
+        finally:
+            with self._cond:
+                self._concurrent -= 1
+
+    def _commit(self, stream_name: str, request_number: int, rows: List[bytes],
+                offset: int) -> Optional[Exception]:
+        failure = self.failures.pop(request_number, None)
+        if failure == 'before_commit':
+            return TransientAppendError(f"요청 {request_number} 전송 실패")
+        if stream_name in self.finalized:
+            return StreamWriteError(f"종료된 스트림: {stream_name}")
+
+        stored = self.streams[stream_name]
+        if offset < len(stored):
+            return OffsetAlreadyExists(f"오프셋 {offset} 이미 기록됨 (스트림 길이 {len(stored)})")
+        if offset > len(stored):
+            return OffsetOutOfRange(f"오프셋 {offset}이 스트림 끝({len(stored)}) 뒤임")
+
+        stored.extend(rows)
+        if failure == 'after_commit':
+            return TransientAppendError(f"요청 {request_number} 응답 유실")
+        return None
+
+
+# BigQuery 컬럼 타입 → Storage Write API가 받는 protobuf 필드 타입
+_PROTO_TYPES = {
+    'STRING': 'TYPE_STRING', 'JSON': 'TYPE_STRING', 'DATETIME': 'TYPE_STRING',
+    'NUMERIC': 'TYPE_STRING', 'BIGNUMERIC': 'TYPE_STRING',
+    'INTEGER': 'TYPE_INT64', 'INT64': 'TYPE_INT64',
+    'FLOAT': 'TYPE_DOUBLE', 'FLOAT64': 'TYPE_DOUBLE',
+    'BOOLEAN': 'TYPE_BOOL', 'BOOL': 'TYPE_BOOL',
+    'TIMESTAMP': 'TYPE_INT64',  # 에포크 기준 마이크로초
+    'DATE': 'TYPE_INT32',  # 에포크 기준 일수
+    'BYTES': 'TYPE_BYTES',
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _timestamp_micros(value) -> int:
+    """TIMESTAMP 값 (ISO 문자열 또는 datetime, 시간대가 없으면 UTC) → 에포크 마이크로초"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _date_days(value) -> int:
+    """DATE 값 (ISO 문자열 또는 date) → 에포크 기준 일수"""
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - _EPOCH.date()).days
+
+
+_PROTO_CONVERTERS: Dict[str, Callable] = {
+    'TIMESTAMP': _timestamp_micros,
+    'DATE': _date_days,
+    'DATETIME': str, 'NUMERIC': str, 'BIGNUMERIC': str,
+}
+
+
+def row_message_class(table_name: str, schema):
+    """
+    테이블 스키마(SchemaField 리스트)로 행 protobuf 메시지 클래스를 런타임에 생성합니다.
+    (.proto 파일 없이 proto2 DescriptorProto를 만들어 등록)
+
+    Raises:
+        ValueError: 스키마가 비어 있거나 지원하지 않는 타입(RECORD 등)이 있는 경우
+    """
+    from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
+
+    if not schema:
+        raise ValueError(f"스키마가 없는 테이블입니다: {table_name}")
+
+    file_proto = descriptor_pb2.FileDescriptorProto(
+        name=f"{table_name}_row.proto", package="marketingai.storage_write", syntax="proto2"
+    )
+    message_proto = file_proto.message_type.add(name="Row")
+    for number, field in enumerate(schema, start=1):
+        proto_type = _PROTO_TYPES.get(field.field_type.upper())
+        if proto_type is None:
+            raise ValueError(f"Storage Write API로 쓸 수 없는 컬럼 타입: {field.name} ({field.field_type})")
+        message_proto.field.add(
+            name=field.name,
+            number=number,
+            type=getattr(descriptor_pb2.FieldDescriptorProto, proto_type),
+            label=(descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED if field.mode == 'REPEATED'
+                   else descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL)
+        )
+
+    pool = descriptor_pool.DescriptorPool()
+    pool.Add(file_proto)
+    descriptor = pool.FindMessageTypeByName(f"{file_proto.package}.Row")
+    if hasattr(message_factory, 'GetMessageClass'):
+        return message_factory.GetMessageClass(descriptor)
+    return message_factory.MessageFactory(pool).GetPrototype(descriptor)
+
+
+class StorageWriteTransport:
+    """BigQuery Storage Write API 전송 계층 (google-cloud-bigquery-storage 필요)
+
+    행은 대상 테이블 스키마로 런타임에 만든 protobuf 메시지 클래스(row_message_class)나
+    직접 준 row_message_cls로 직렬화하며, 스트림마다 AppendRowsStream 연결 하나를
+    사용합니다. 연결이 끊기면 다음 요청에서 같은 스트림으로 다시 연결합니다.
+    API 클라이언트는 첫 스트림을 만들 때 생성합니다.
+    """
+
+    def __init__(self, row_message_cls=None, schema=None, table_name: str = 'table'):
+        """
+        Args:
+            row_message_cls: 행 protobuf 메시지 클래스 (없으면 schema로 생성)
+            schema: 대상 테이블의 SchemaField 리스트 (row_message_cls가 없을 때 필요)
+            table_name: 메시지 이름에 쓸 테이블 이름
+        """
+        from google.protobuf import descriptor_pb2
+
+        self._converters: List[Tuple[str, Callable]] = []
+        if row_message_cls is None:
+            if not schema:
+                raise ValueError("Storage Write API 전송에는 row_message_cls 또는 테이블 스키마가 필요합니다.")
+            row_message_cls = row_message_class(table_name, schema)
+            self._converters = [
+                (field.name, _PROTO_CONVERTERS[field.field_type.upper()])
+                for field in schema if field.field_type.upper() in _PROTO_CONVERTERS
+            ]
+        self.row_message_cls = row_message_cls
+        self._proto_descriptor = descriptor_pb2.DescriptorProto()
+        row_message_cls.DESCRIPTOR.CopyToProto(self._proto_descriptor)
+        self._client = None
+        self._templates: Dict[str, object] = {}
+        self._connections: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def client(self):
+        if self._client is None:
+            from google.cloud import bigquery_storage_v1
+            self._client = bigquery_storage_v1.BigQueryWriteClient()
+        return self._client
+
+    def serialize_row(self, row: Dict) -> bytes:
+        """행(RowSerializer 결과 형식)을 protobuf 메시지로 직렬화 (NULL 필드는 생략)"""
+        values = {name: value for name, value in row.items() if value is not None}
+        for name, convert in self._converters:
+            if name in values:
+                values[name] = convert(values[name])
+        return self.row_message_cls(**values).SerializeToString()
+
+    def create_stream(self, table_path: str) -> str:
+        from google.cloud.bigquery_storage_v1 import types
+
+        write_stream = types.WriteStream(type_=types.WriteStream.Type.COMMITTED)
+        stream = self.client.create_write_stream(parent=table_path, write_stream=write_stream)
+
+        template = types.AppendRowsRequest(write_stream=stream.name)
+        proto_data = types.AppendRowsRequest.ProtoData()
+        proto_data.writer_schema = types.ProtoSchema(proto_descriptor=self._proto_descriptor)
+        template.proto_rows = proto_data
+        with self._lock:
+            self._templates[stream.name] = template
+        return stream.name
+
+    def append(self, stream_name: str, rows: List[bytes], offset: int) -> Future:
+        from google.cloud.bigquery_storage_v1 import types
+
+        request = types.AppendRowsRequest(offset=offset)
+        proto_data = types.AppendRowsRequest.ProtoData()
+        proto_data.rows = types.ProtoRows(serialized_rows=rows)
+        request.proto_rows = proto_data
+
+        result: Future = Future()
+        try:
+            connection = self._connection(stream_name)
+            response_future = connection.send(request)
+        except Exception as e:
+            result.set_exception(self._translate(e, stream_name))
+            return result
+
+        def done(response_future):
+            try:
+                result.set_result(response_future.result())
+            except Exception as e:
+                result.set_exception(self._translate(e, stream_name))
+        response_future.add_done_callback(done)
+        return result
+
+    def finalize(self, stream_name: str) -> int:
+        with self._lock:
+            self._templates.pop(stream_name, None)
+            connection = self._connections.pop(stream_name, None)
+        if connection is not None:
+            connection.close()
+        response = self.client.finalize_write_stream(name=stream_name)
+        return response.row_count
+
+    def _connection(self, stream_name: str):
+        """스트림의 추가 연결 (없거나 끊겼으면 새로 연결)"""
+        from google.cloud.bigquery_storage_v1 import writer
+
+        with self._lock:
+            connection = self._connections.get(stream_name)
+            if connection is None:
+                connection = writer.AppendRowsStream(self.client, self._templates[stream_name])
+                self._connections[stream_name] = connection
+            return connection
+
+    def _translate(self, error: Exception, stream_name: Optional[str] = None) -> Exception:
+        """API/gRPC 오류를 오프셋 규칙 오류로 변환 (연결이 끊긴 경우 다음 요청에서 재연결)"""
+        from google.api_core import exceptions
+
+        try:
+            import grpc
+            if isinstance(error, grpc.RpcError) and not isinstance(error, exceptions.GoogleAPICallError):
+                error = exceptions.from_grpc_error(error)
+        except ImportError:
+            pass
+
+        if _is_stream_closed(error):
+            with self._lock:
+                self._connections.pop(stream_name, None)
+            return TransientAppendError(f"추가 연결 종료: {str(error)}")
+        if isinstance(error, exceptions.AlreadyExists):
+            return OffsetAlreadyExists(str(error))
+        if isinstance(error, exceptions.OutOfRange):
+            return OffsetOutOfRange(str(error))
+        if isinstance(error, (exceptions.ServiceUnavailable, exceptions.DeadlineExceeded,
+                              exceptions.InternalServerError, exceptions.Aborted,
+                              exceptions.ResourceExhausted)):
+            return TransientAppendError(str(error))
+        return error
+
+
+def _is_stream_closed(error: Exception) -> bool:
+    """AppendRowsStream 연결 종료 오류 여부"""
+    try:
+        from google.cloud.bigquery_storage_v1.exceptions import StreamClosedError
+    except ImportError:
+        return False
+    return isinstance(error, StreamClosedError)
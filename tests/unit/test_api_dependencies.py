@@ -0,0 +1,57 @@
+"""
+API BigQuery 클라이언트 의존성 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+fastapi = pytest.importorskip("fastapi")
+pytest.importorskip("httpx")
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_bigquery_client
+
+
+class TestBigQueryClientDependency:
+    """요청 간 BigQuery 클라이언트/조회 캐시 공유 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        get_bigquery_client.cache_clear()
+        self.patcher = patch('google.cloud.bigquery.Client')
+        self.mock_client = Mock()
+        self.patcher.start().return_value = self.mock_client
+        self.mock_client.query.return_value.result.return_value = [{'id': 'a', 'competitor_name': 'A'}]
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 호출되는 정리"""
+        self.patcher.stop()
+        get_bigquery_client.cache_clear()
+
+    def test_two_requests_run_one_warehouse_query(self):
+        """같은 조회를 하는 두 API 요청이 웨어하우스 쿼리를 한 번만 실행하는지 테스트"""
+        # Given: 의존성으로 받은 클라이언트로 조회하는 엔드포인트
+        app = FastAPI()
+
+        @app.get("/data/{competitor_name}")
+        def read_data(competitor_name: str, bigquery_client=Depends(get_bigquery_client)):
+            return bigquery_client.query_competitor_data(competitor_name, limit=10)
+
+        client = TestClient(app)
+
+        # When: 같은 요청 두 번
+        first = client.get("/data/A")
+        second = client.get("/data/A")
+
+        # Then: 두 번째 요청은 공유 캐시에서 응답
+        assert first.status_code == second.status_code == 200
+        assert second.json() == [{'id': 'a', 'competitor_name': 'A'}]
+        assert self.mock_client.query.call_count == 1
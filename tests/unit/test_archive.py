@@ -0,0 +1,145 @@
+"""
+원본 응답 아카이브 단위 테스트
+"""
+
+import sys
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.archive import (
+    ResponseArchive, iter_archive, list_segments, reextract_archive
+)
+from src.data_collection.web_scraper import WebScraper
+
+
+HTML = "<html><head><title>가격</title></head><body><p>월 9,900원</p></body></html>".encode('euc-kr')
+
+
+def make_response(url: str) -> requests.Response:
+    """EUC-KR 인코딩 HTML 응답 생성"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = HTML
+    response._content_consumed = True
+    response.headers['Content-Type'] = 'text/html; charset=euc-kr'
+    response.headers['ETag'] = '"v1"'
+    return response
+
+
+class SlowHeadExecutor:
+    """첫 작업만 결과를 요청받을 때 완료되고 나머지는 즉시 완료되는 실행기"""
+
+    def __init__(self):
+        self.submitted = 0
+        self.submitted_when_head_waited = None
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        future = Future()
+        if self.submitted == 1:
+            executor = self
+
+            def result(timeout=None):
+                if not future.done():
+                    executor.submitted_when_head_waited = executor.submitted
+                    future.set_result(fn(*args))
+                return Future.result(future, timeout)
+            future.result = result
+        else:
+            future.set_result(fn(*args))
+        return future
+
+
+class TestResponseArchive:
+    """ResponseArchive 클래스 테스트"""
+
+    def test_append_and_read_back(self, tmp_path):
+        """기록한 레코드를 순서대로 읽을 수 있는지 테스트"""
+        # Given: 두 개의 응답을 기록한 아카이브
+        archive = ResponseArchive(str(tmp_path))
+        archive.append("https://a.com/1", "경쟁사A", b"<html>1</html>",
+                       {'Content-Type': 'text/html', 'Set-Cookie': 'x'}, fetched_at="2024-01-01T00:00:00")
+        archive.append("https://a.com/2", "경쟁사A", b"\r\n\r\nbinary\x00", {})
+        archive.close()
+
+        # When: 아카이브 읽기
+        records = list(iter_archive(str(tmp_path)))
+
+        # Then: 본문/메타데이터가 보존되고 허용 목록 외 헤더는 제외되어야 함
+        assert [r['url'] for r in records] == ["https://a.com/1", "https://a.com/2"]
+        assert records[0]['body'] == b"<html>1</html>"
+        assert records[0]['competitor_name'] == "경쟁사A"
+        assert records[0]['fetched_at'] == "2024-01-01T00:00:00"
+        assert records[0]['headers'] == {'Content-Type': 'text/html'}
+        assert records[1]['body'] == b"\r\n\r\nbinary\x00"
+
+    def test_segment_rotation(self, tmp_path):
+        """세그먼트 크기 기준으로 파일이 교체되는지 테스트"""
+        archive = ResponseArchive(str(tmp_path), segment_max_bytes=1)
+        for i in range(3):
+            archive.append(f"https://a.com/{i}", "a", b"body")
+        archive.close()
+
+        assert len(list_segments(str(tmp_path))) == 3
+        assert len(list(iter_archive(str(tmp_path)))) == 3
+
+    def test_truncated_tail_is_skipped(self, tmp_path):
+        """기록 도중 잘린 마지막 레코드는 건너뛰는지 테스트"""
+        archive = ResponseArchive(str(tmp_path))
+        archive.append("https://a.com/1", "a", b"first")
+        archive.append("https://a.com/2", "a", b"second" * 100)
+        archive.close()
+
+        path = list_segments(str(tmp_path))[0]
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 10)
+
+        assert [r['url'] for r in iter_archive(str(tmp_path))] == ["https://a.com/1"]
+
+
+class TestReextract:
+    """스크래퍼 연동 및 재추출 테스트"""
+
+    @patch('requests.Session.get')
+    def test_reextract_matches_scrape(self, mock_get, tmp_path):
+        """아카이브 재추출 결과가 수집 당시 추출 결과와 같은지 테스트"""
+        # Given: 아카이브를 켠 스크래퍼로 수집
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        archive = ResponseArchive(str(tmp_path))
+        scraper = WebScraper(delay=0, parser_backend='stream', archive=archive)
+        scraped = scraper.scrape_page("https://a.com/pricing", "a")
+        archive.close()
+
+        # When: 네트워크 없이 재추출
+        mock_get.reset_mock()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pages = list(reextract_archive(str(tmp_path), 'stream', executor=executor))
+
+        # Then: 같은 필드가 나오고 요청은 발생하지 않아야 함
+        assert mock_get.call_count == 0
+        assert len(pages) == 1
+        for field in ('url', 'competitor_name', 'page_title', 'content', 'content_hash'):
+            assert pages[0][field] == scraped[field]
+        assert pages[0]['page_title'] == "가격"
+
+    def test_pending_results_are_bounded_behind_slow_head(self, tmp_path):
+        """앞쪽 작업이 느려도 순서 대기 결과가 상한까지만 쌓이는지 테스트"""
+        # Given: 20개 레코드와 첫 작업이 끝나지 않는 실행기
+        archive = ResponseArchive(str(tmp_path))
+        for i in range(20):
+            archive.append(f"https://a.com/{i}", "a", HTML, {'Content-Type': 'text/html; charset=euc-kr'})
+        archive.close()
+        executor = SlowHeadExecutor()
+
+        # When: 동시 추출 상한 2로 재추출
+        pages = list(reextract_archive(str(tmp_path), 'stream', max_in_flight=2, executor=executor))
+
+        # Then: 상한(2 * 2)만큼 제출한 뒤 앞쪽 작업을 기다리고, 기록 순서는 유지됨
+        assert executor.submitted_when_head_waited == 4
+        assert [page['url'] for page in pages] == [f"https://a.com/{i}" for i in range(20)]
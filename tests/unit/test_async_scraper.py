@@ -0,0 +1,200 @@
+"""
+AsyncWebScraper 단위 테스트
+"""
+
+import sys
+import os
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.async_scraper import AsyncWebScraper
+
+
+def make_response(html: str) -> requests.Response:
+    """HTML 본문을 가진 성공 응답 생성"""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = html.encode('utf-8')
+    response._content_consumed = True
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    return response
+
+
+class TestAsyncWebScraper:
+    """AsyncWebScraper 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.competitors = [
+            {"name": "a", "url": "https://a.example.com", "target_pages": ["/pricing", "/about"]},
+            {"name": "b", "url": "https://b.example.com", "target_pages": ["/products"]},
+        ]
+
+    @patch('requests.Session.get')
+    def test_scrape_many_returns_page_dicts(self, mock_get):
+        """기존 _scrape_page와 같은 페이지 딕셔너리 반환 테스트"""
+        # Given: URL별 HTML 응답
+        mock_get.side_effect = lambda url, **kwargs: make_response(
+            f"<html><head><title>{url}</title></head><body>본문</body></html>"
+        )
+        scraper = AsyncWebScraper(delay=0, max_concurrency=4)
+
+        # When: 동시 스크래핑 실행
+        results = asyncio.run(scraper.scrape_many(self.competitors))
+
+        # Then: 경쟁사/페이지 순서대로 모든 페이지가 수집되어야 함
+        assert [r['url'] for r in results] == [
+            "https://a.example.com/pricing",
+            "https://a.example.com/about",
+            "https://b.example.com/products",
+        ]
+        assert results[0]['competitor_name'] == "a"
+        assert results[0]['page_title'] == "https://a.example.com/pricing"
+        assert "본문" in results[0]['content']
+        assert len(results[0]['content_hash']) == 32
+
+    @patch('requests.Session.get')
+    def test_scrape_many_on_page(self, mock_get):
+        """on_page를 지정하면 완료된 페이지를 바로 전달하고 결과를 모아 두지 않는지 테스트"""
+        # Given: URL별 HTML 응답
+        mock_get.side_effect = lambda url, **kwargs: make_response(
+            f"<html><head><title>{url}</title></head><body>본문</body></html>"
+        )
+        scraper = AsyncWebScraper(delay=0, max_concurrency=4)
+        streamed = []
+
+        # When: on_page와 함께 동시 스크래핑 실행
+        results = asyncio.run(scraper.scrape_many(self.competitors, on_page=streamed.append))
+
+        # Then: 모든 페이지가 on_page로 전달되어야 함
+        assert results == []
+        assert sorted(page['url'] for page in streamed) == [
+            "https://a.example.com/about",
+            "https://a.example.com/pricing",
+            "https://b.example.com/products",
+        ]
+
+    @patch('requests.Session.get')
+    def test_scrape_many_skips_failed_pages(self, mock_get):
+        """실패한 페이지 제외 테스트"""
+        # Given: 한 호스트는 연결 실패
+        def side_effect(url, **kwargs):
+            if 'b.example.com' in url:
+                raise requests.RequestException("Connection failed")
+            return make_response("<html><title>ok</title></html>")
+        mock_get.side_effect = side_effect
+        scraper = AsyncWebScraper(delay=0)
+
+        # When: 동시 스크래핑 실행
+        results = asyncio.run(scraper.scrape_many(self.competitors))
+
+        # Then: 성공한 페이지만 반환되어야 함
+        assert len(results) == 2
+        assert all(r['competitor_name'] == "a" for r in results)
+
+    @patch('requests.Session.get')
+    def test_concurrency_cap(self, mock_get):
+        """전체 동시 요청 수 상한 테스트"""
+        # Given: 동시에 실행 중인 요청 수를 기록하는 느린 응답
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def side_effect(url, **kwargs):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.05)
+            with lock:
+                state['active'] -= 1
+            return make_response("<html><title>t</title></html>")
+        mock_get.side_effect = side_effect
+
+        competitors = [
+            {"name": f"c{i}", "url": f"https://c{i}.example.com", "target_pages": ["/"]}
+            for i in range(8)
+        ]
+        scraper = AsyncWebScraper(delay=0, max_concurrency=3)
+
+        # When: 동시 스크래핑 실행
+        results = asyncio.run(scraper.scrape_many(competitors))
+
+        # Then: 상한을 넘지 않으면서 병렬로 실행되어야 함
+        assert len(results) == 8
+        assert 1 < state['peak'] <= 3
+
+    @patch('requests.Session.get')
+    def test_crawl_requests_share_concurrency_cap(self, mock_get):
+        """크롤 모드 사이트의 요청도 전체 동시 요청 수 상한에 포함되는지 테스트"""
+        # Given: 링크를 가진 느린 응답 (동시에 실행 중인 요청 수 기록)
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def side_effect(url, **kwargs):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+            time.sleep(0.03)
+            with lock:
+                state['active'] -= 1
+            return make_response(
+                '<html><title>t</title><body><a href="/p1">1</a><a href="/p2">2</a></body></html>'
+            )
+        mock_get.side_effect = side_effect
+
+        competitors = [
+            {"name": f"c{i}", "url": f"https://c{i}.example.com", "target_pages": ["/"],
+             "crawl": True, "max_pages": 3}
+            for i in range(4)
+        ] + [{"name": "plain", "url": "https://plain.example.com", "target_pages": ["/a", "/b"]}]
+        scraper = AsyncWebScraper(delay=0, max_concurrency=2)
+
+        # When: 크롤 모드와 일반 경쟁사를 함께 스크래핑
+        results = asyncio.run(scraper.scrape_many(competitors))
+
+        # Then: 상한보다 많은 요청이 동시에 실행되지 않음 (sitemap 요청 포함)
+        assert len(results) == 4 * 3 + 2
+        assert mock_get.call_count == 4 * 4 + 2
+        assert 1 < state['peak'] <= 2
+
+    @patch('requests.Session.get')
+    def test_crawl_sites_exceeding_executor_threads_do_not_hang(self, mock_get):
+        """크롤 사이트가 실행기 스레드보다 많아도 멈추지 않고 끝나는지 테스트"""
+        # Given: 링크를 가진 느린 응답과 크롤 사이트 수보다 작은 기본 실행기
+        def side_effect(url, **kwargs):
+            time.sleep(0.01)
+            return make_response(
+                '<html><title>t</title><body><a href="/p1">1</a></body></html>'
+            )
+        mock_get.side_effect = side_effect
+
+        competitors = [
+            {"name": f"crawl{i}", "url": f"https://crawl{i}.example.com", "target_pages": ["/"],
+             "crawl": True, "max_pages": 2}
+            for i in range(6)
+        ] + [
+            {"name": f"page{i}", "url": f"https://page{i}.example.com", "target_pages": ["/a", "/b"]}
+            for i in range(6)
+        ]
+        scraper = AsyncWebScraper(delay=0, max_concurrency=3)
+        outcome = {}
+
+        async def run():
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=2))
+            outcome['results'] = await scraper.scrape_many(competitors)
+
+        # When: 별도 스레드에서 실행 (멈추면 테스트 프로세스를 막지 않도록 daemon)
+        runner = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+        runner.start()
+        runner.join(timeout=10)
+
+        # Then: 제한 시간 안에 모든 페이지 수집 완료
+        assert not runner.is_alive(), "scrape_many가 10초 안에 끝나지 않음"
+        assert len(outcome['results']) == 6 * 2 + 6 * 2
@@ -0,0 +1,146 @@
+"""
+전송량 집계 및 압축 전송 단위 테스트
+"""
+
+import sys
+import os
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.web_scraper import WebScraper
+from src.utils.http_transport import close_shared_transport
+from src.utils.metrics import BandwidthTracker
+
+PAGE_BODY = (
+    b"<html><head><title>Pricing</title></head><body>"
+    + b"<p>Plan details repeated for compression.</p>" * 200
+    + b"</body></html>"
+)
+
+
+class _GzipHandler(BaseHTTPRequestHandler):
+    """Accept-Encoding에 gzip이 있으면 압축해서 응답하는 핸들러"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = PAGE_BODY
+        encoded = 'gzip' in self.headers.get('Accept-Encoding', '')
+        if encoded:
+            body = gzip.compress(body)
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        if encoded:
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestBandwidthTracker:
+    """BandwidthTracker 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.tracker = BandwidthTracker(budget_bytes=1000)
+
+    def test_summary_and_budget(self):
+        """호스트별 합계, 압축률, 예산 소진 판단 테스트"""
+        # Given: 두 호스트의 전송량
+        self.tracker.record("a.com", 400, 1600)
+        assert self.tracker.exhausted is False
+        self.tracker.record("b.com", 600, 600)
+
+        # When: 요약 생성
+        summary = self.tracker.summary()
+
+        # Then: 실행 합계와 호스트별 집계가 계산되고 예산이 소진되어야 함
+        assert summary['wire_bytes'] == 1000
+        assert summary['decoded_bytes'] == 2200
+        assert summary['compression_ratio'] == 2.2
+        assert summary['hosts']['a.com'] == {'responses': 1, 'wire_bytes': 400, 'decoded_bytes': 1600}
+        assert self.tracker.exhausted is True
+
+    def test_reset(self):
+        """초기화 시 집계와 예산이 재설정되는지 테스트"""
+        self.tracker.record("a.com", 2000, 2000)
+        self.tracker.record_deferred("https://a.com/blog")
+
+        self.tracker.reset()
+
+        assert self.tracker.summary()['deferred_urls'] == []
+        assert self.tracker.wire_bytes == 0
+        assert self.tracker.exhausted is False
+
+
+class TestScraperBandwidth:
+    """WebScraper 전송량 기록 및 예산 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.tracker = BandwidthTracker()
+        self.scraper = WebScraper(delay=0, bandwidth=self.tracker)
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 공유 연결 정리"""
+        close_shared_transport()
+
+    def test_gzip_wire_and_decoded_bytes(self):
+        """압축 응답의 wire 바이트와 해제 후 바이트를 따로 기록하는지 테스트"""
+        # Given: gzip으로 응답하는 로컬 서버
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _GzipHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{server.server_address[1]}/pricing"
+
+        try:
+            # When: 원본 다운로드
+            result = self.scraper.fetch_raw(url, "a")
+        finally:
+            close_shared_transport()
+            server.shutdown()
+            server.server_close()
+
+        # Then: 본문은 해제되어 있고 wire 바이트는 압축된 크기여야 함
+        assert result['body'] == PAGE_BODY
+        stats = self.tracker.summary()['hosts']['127.0.0.1']
+        assert stats['decoded_bytes'] == len(PAGE_BODY)
+        assert stats['wire_bytes'] == len(gzip.compress(PAGE_BODY))
+        assert stats['wire_bytes'] < stats['decoded_bytes']
+
+    def test_accept_encoding_header(self):
+        """세션이 압축 인코딩을 요청하는지 테스트"""
+        assert 'gzip' in self.scraper.session.headers['Accept-Encoding']
+
+    @patch('requests.Session.get')
+    def test_budget_defers_low_priority_pages(self, mock_get):
+        """예산 소진 후 낮은 우선순위 페이지는 요청하지 않고 연기하는지 테스트"""
+        # Given: 예산이 이미 소진된 집계기
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><title>t</title><body>text</body></html>"
+        response._content_consumed = True
+        response.headers['Content-Type'] = 'text/html'
+        mock_get.return_value = response
+        self.tracker.reset(budget_bytes=10)
+        self.tracker.record("a.example.com", 10, 10)
+
+        # When: 블로그 페이지와 가격 페이지를 요청
+        deferred = self.scraper.scrape_page("https://a.example.com/blog/post", "a")
+        fetched = self.scraper.scrape_page("https://a.example.com/pricing", "a")
+
+        # Then: 블로그 페이지만 연기되어야 함
+        assert deferred is None
+        assert fetched is not None
+        assert mock_get.call_count == 1
+        assert self.tracker.summary()['deferred_urls'] == ["https://a.example.com/blog/post"]
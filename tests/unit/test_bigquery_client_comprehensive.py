@@ -213,7 +213,10 @@ class TestBigQueryClientComprehensive:
         query_call_args = mock_client_instance.query.call_args[0][0]
         assert "SELECT *" in query_call_args
         assert "competitor_data" in query_call_args
-        assert "ORDER BY collected_at DESC LIMIT 100" in query_call_args
+        assert "ORDER BY collected_at DESC LIMIT @limit" in query_call_args
+        job_config = mock_client_instance.query.call_args[1]['job_config']
+        params = {p.name: p.value for p in job_config.query_parameters}
+        assert params == {'limit': 100}
     
     @patch('google.cloud.bigquery.Client')
     def test_query_competitor_data_with_filter(self, mock_bigquery_client):
@@ -237,8 +240,11 @@ class TestBigQueryClientComprehensive:
         
         # WHERE 절이 포함된 쿼리가 실행되었는지 확인
         query_call_args = mock_client_instance.query.call_args[0][0]
-        assert "WHERE competitor_name = 'Specific Competitor'" in query_call_args
-        assert "LIMIT 50" in query_call_args
+        assert "WHERE competitor_name = @competitor_name" in query_call_args
+        assert "LIMIT @limit" in query_call_args
+        job_config = mock_client_instance.query.call_args[1]['job_config']
+        params = {p.name: p.value for p in job_config.query_parameters}
+        assert params == {'competitor_name': 'Specific Competitor', 'limit': 50}
     
     @patch('google.cloud.bigquery.Client')
     def test_query_competitor_data_exception_handling(self, mock_bigquery_client):
@@ -279,9 +285,11 @@ class TestBigQueryClientComprehensive:
         # 올바른 쿼리가 실행되었는지 확인
         query_call_args = mock_client_instance.query.call_args[0][0]
         assert "content_hash" in query_call_args
-        assert "WHERE competitor_name = 'Test Competitor'" in query_call_args
-        assert "AND url = 'https://test.com'" in query_call_args
-        assert "ORDER BY collected_at DESC LIMIT 1" in query_call_args
+        assert "WHERE competitor_name = @competitor_name AND url = @url" in query_call_args
+        assert "ORDER BY collected_at DESC" in query_call_args
+        job_config = mock_client_instance.query.call_args[1]['job_config']
+        params = {p.name: p.value for p in job_config.query_parameters}
+        assert params == {'competitor_name': 'Test Competitor', 'url': 'https://test.com'}
     
     @patch('google.cloud.bigquery.Client')
     def test_get_latest_content_hash_not_found(self, mock_bigquery_client):
@@ -0,0 +1,93 @@
+"""
+BigQuery 로드 작업 수집 경로 단위 테스트 (로컬 대체 클라이언트 사용)
+"""
+
+import sys
+import os
+import io
+
+import pytest
+from google.cloud import bigquery
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+from src.utils.load_files import read_load_file, write_load_file
+from src.utils.local_bigquery import LocalBigQueryClient
+
+
+def make_rows(count, content_chars=10_000):
+    """테스트용 경쟁사 페이지 행 (약 10KB)"""
+    return [
+        {
+            'id': f"id-{i}",
+            'competitor_name': "A",
+            'url': f"https://a.com/{i}",
+            'page_title': f"페이지 {i}",
+            'content': "가" * (content_chars // 3),
+            'meta_description': "",
+            'collected_at': "2024-01-01T10:00:00",
+            'content_hash': f"h{i}",
+            'content_simhash': None
+        }
+        for i in range(count)
+    ]
+
+
+class TestLoadJobIngestion:
+    """스트리밍 삽입/로드 작업 자동 선택 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.local = LocalBigQueryClient("test-project")
+        self.client = BigQueryClient("test-project", "test_dataset", load_job_threshold_bytes=100_000,
+                                     load_file_format='ndjson', client=self.local)
+
+    def test_small_batches_stream_and_large_batches_load(self):
+        """임계값 미만은 스트리밍 삽입, 이상은 로드 작업으로 저장되는지 테스트"""
+        # When: 작은 배치(2행)와 큰 배치(50행, 약 500KB) 저장
+        assert self.client.insert_competitor_data(make_rows(2)) is True
+        large = make_rows(50)
+        assert self.client.insert_competitor_data(large) is True
+
+        # Then: 스트리밍 요청 1회, 압축 로드 작업 1회로 모든 행이 저장되어야 함
+        assert self.local.streaming_requests == 1
+        assert len(self.local.load_jobs) == 1
+        job = self.local.load_jobs[0]
+        assert job.output_rows == 50
+        assert job.source_format == bigquery.SourceFormat.NEWLINE_DELIMITED_JSON
+        assert job.input_file_bytes < 100_000
+        stored = self.local.tables['competitor_data']
+        assert len(stored) == 52
+        assert stored[2:] == large
+
+    def test_large_batch_exceeds_streaming_limit_without_load_jobs(self):
+        """로드 작업을 끄면 큰 배치는 스트리밍 요청 한도에 걸리는지 테스트"""
+        client = BigQueryClient("test-project", "test_dataset", load_job_threshold_bytes=None,
+                                client=self.local)
+
+        assert client.insert_competitor_data(make_rows(1200)) is False
+        assert self.client.insert_competitor_data(make_rows(1200)) is True
+        assert len(self.local.tables['competitor_data']) == 1200
+
+    def test_parquet_load_file_types(self):
+        """Parquet 로드 파일이 테이블 스키마 타입으로 기록되는지 테스트 (pyarrow 설치 시)"""
+        pytest.importorskip("pyarrow")
+        schema = [
+            bigquery.SchemaField("url", "STRING"),
+            bigquery.SchemaField("collected_at", "TIMESTAMP"),
+            bigquery.SchemaField("links", "STRING", mode="REPEATED"),
+        ]
+        buffer = io.BytesIO()
+
+        source_format = write_load_file(
+            [{'url': "https://a.com/", 'collected_at': "2024-01-01T10:00:00", 'links': ["/a"]}],
+            buffer, 'parquet', schema=schema
+        )
+        buffer.seek(0)
+        rows = read_load_file(buffer, source_format)
+
+        assert source_format == bigquery.SourceFormat.PARQUET
+        assert rows[0]['collected_at'].isoformat() == "2024-01-01T10:00:00+00:00"
+        assert rows[0]['links'] == ["/a"]
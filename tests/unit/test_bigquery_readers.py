@@ -0,0 +1,86 @@
+"""
+BigQuery 스트리밍/열 단위 조회 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+
+
+class TestBigQueryReaders:
+    """iter_competitor_data / to_arrow / to_dataframe 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.patcher = patch('google.cloud.bigquery.Client')
+        self.mock_client = Mock()
+        self.patcher.start().return_value = self.mock_client
+        self.client = BigQueryClient("test-project", "test_dataset")
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 호출되는 정리"""
+        self.patcher.stop()
+
+    def test_iter_competitor_data_yields_pages_lazily(self):
+        """페이지를 소비할 때마다 하나씩 반환하는지 테스트"""
+        # Given: 두 페이지로 나뉜 결과
+        consumed = []
+
+        def pages():
+            for page in ([{'id': 'a'}, {'id': 'b'}], [{'id': 'c'}]):
+                consumed.append(len(page))
+                yield page
+
+        self.mock_client.query.return_value.result.return_value.pages = pages()
+
+        # When: 첫 페이지만 소비
+        iterator = self.client.iter_competitor_data('A', columns=['id', 'url'], page_size=2)
+        first = next(iterator)
+
+        # Then: 두 번째 페이지는 아직 가져오지 않음
+        assert first == [{'id': 'a'}, {'id': 'b'}]
+        assert consumed == [2]
+        assert list(iterator) == [[{'id': 'c'}]]
+
+        # 선택한 컬럼과 파라미터로 LIMIT 없이 조회
+        query = self.mock_client.query.call_args[0][0]
+        job_config = self.mock_client.query.call_args[1]['job_config']
+        assert "SELECT id, url" in query
+        assert "LIMIT" not in query
+        assert {p.name: p.value for p in job_config.query_parameters} == {'competitor_name': 'A'}
+        self.mock_client.query.return_value.result.assert_called_once_with(page_size=2)
+
+    def test_invalid_column_name_is_rejected(self):
+        """컬럼 이름에 SQL을 넣을 수 없는지 테스트"""
+        # When & Then
+        with pytest.raises(ValueError):
+            next(self.client.iter_competitor_data(columns=['id; DROP TABLE x']))
+        self.mock_client.query.assert_not_called()
+
+    def test_to_arrow_uses_storage_read_api(self):
+        """Arrow 조회가 Storage Read API 사용을 요청하는지 테스트"""
+        # Given
+        table = Mock()
+        self.mock_client.query.return_value.to_arrow.return_value = table
+
+        # When
+        result = self.client.competitor_data_to_arrow(limit=10)
+
+        # Then
+        assert result is table
+        self.mock_client.query.return_value.to_arrow.assert_called_once_with(create_bqstorage_client=True)
+
+    def test_to_dataframe_returns_none_on_failure(self):
+        """DataFrame 조회 실패 시 None을 반환하는지 테스트"""
+        # Given: 조회 실패
+        self.mock_client.query.side_effect = Exception("query failed")
+
+        # When & Then
+        assert self.client.competitor_data_to_dataframe('A') is None
@@ -0,0 +1,158 @@
+"""
+블록 단위 콘텐츠 저장 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.content_blocks import (
+    build_page_version, generate_block_hash, plan_incremental_rows, reconstruct_content,
+    split_blocks
+)
+from src.utils.bigquery_client import BigQueryClient
+
+
+PAGE_TEXT = " ".join(
+    f"Plan {i} includes analytics reporting dashboards and priority support for teams."
+    for i in range(120)
+)[:10000]
+
+
+def make_page(content, page_id="page-1"):
+    """테스트용 페이지 데이터"""
+    return {
+        'id': page_id,
+        'competitor_name': 'A',
+        'url': 'https://a.com/pricing',
+        'page_title': 'Pricing',
+        'content': content,
+        'meta_description': '',
+        'collected_at': '2024-01-01T00:00:00',
+        'content_hash': generate_block_hash(content),
+        'content_simhash': None
+    }
+
+
+class TestSplitBlocks:
+    """split_blocks 함수 테스트"""
+
+    def test_roundtrip(self):
+        """블록을 이어 붙이면 원래 텍스트가 되는지 테스트"""
+        blocks = split_blocks(PAGE_TEXT)
+
+        assert ''.join(blocks) == PAGE_TEXT
+        assert len(blocks) > 5
+        assert all(len(block) <= 1000 for block in blocks)
+
+    def test_long_text_without_sentences(self):
+        """문장 구분이 없는 긴 텍스트도 최대 길이로 나뉘는지 테스트"""
+        text = "가" * 2500
+
+        blocks = split_blocks(text, max_block_chars=1000)
+
+        assert [len(block) for block in blocks] == [1000, 1000, 500]
+        assert split_blocks("") == []
+
+    def test_sentence_change_touches_few_blocks(self):
+        """문장 하나가 바뀌거나 추가되어도 대부분의 블록이 유지되는지 테스트"""
+        # Given: 중간 문장 하나를 바꾸고 앞쪽에 문장 하나를 추가한 텍스트
+        changed = PAGE_TEXT.replace("Plan 60 includes", "Plan 60 now includes")
+        inserted = "Limited offer ends soon! " + changed
+
+        # When: 블록 해시 비교
+        original = {generate_block_hash(b) for b in split_blocks(PAGE_TEXT)}
+        updated = [generate_block_hash(b) for b in split_blocks(inserted)]
+        new_hashes = [h for h in updated if h not in original]
+
+        # Then: 바뀐 블록은 변경 위치 주변의 일부뿐이어야 함
+        assert 1 <= len(new_hashes) <= 4
+        assert len(new_hashes) < len(updated) / 3
+
+
+class TestIncrementalRows:
+    """버전 매니페스트/블록 행 구성 테스트"""
+
+    def test_only_new_blocks_are_stored(self):
+        """이미 저장된 블록은 다시 저장하지 않고 매니페스트로 복원되는지 테스트"""
+        # Given: 첫 버전을 저장한 상태
+        first_blocks, first_versions = plan_incremental_rows(
+            [make_page(PAGE_TEXT)], set(), '2024-01-01T00:00:00'
+        )
+        stored = {row['block_hash']: row['content'] for row in first_blocks}
+
+        # When: 문장 하나가 바뀐 두 번째 버전
+        changed = PAGE_TEXT.replace("Plan 30 includes", "Plan 30 now includes")
+        new_blocks, versions = plan_incremental_rows(
+            [make_page(changed, "page-2")], set(stored), '2024-01-02T00:00:00'
+        )
+        stored.update({row['block_hash']: row['content'] for row in new_blocks})
+
+        # Then: 새 블록은 변경분 크기이고 두 버전 모두 복원되어야 함
+        assert sum(row['content_length'] for row in new_blocks) < len(changed) / 4
+        assert reconstruct_content(first_versions[0]['block_hashes'], stored) == PAGE_TEXT
+        assert reconstruct_content(versions[0]['block_hashes'], stored) == changed
+        assert versions[0]['content_length'] == len(changed)
+
+    def test_duplicate_blocks_in_batch(self):
+        """같은 배치 안의 중복 블록은 한 번만 저장되는지 테스트"""
+        block_rows, version_rows = plan_incremental_rows(
+            [make_page(PAGE_TEXT, "p1"), make_page(PAGE_TEXT, "p2")], set(), '2024-01-01T00:00:00'
+        )
+
+        assert len(block_rows) == len(set(version_rows[0]['block_hashes']))
+        assert len(version_rows) == 2
+
+    def test_missing_block(self):
+        """블록이 없으면 복원하지 않는지 테스트"""
+        version, blocks = build_page_version(make_page(PAGE_TEXT))
+        blocks.pop(version['block_hashes'][0])
+
+        assert reconstruct_content(version['block_hashes'], blocks) is None
+
+
+class TestBigQueryIncrementalStorage:
+    """BigQueryClient 블록 단위 저장 테스트"""
+
+    @patch('google.cloud.bigquery.Client')
+    def test_insert_page_versions(self, mock_bigquery_client):
+        """저장된 블록을 제외하고 블록 → 매니페스트 순서로 삽입하는지 테스트"""
+        # Given: 첫 블록이 이미 저장된 상태
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        existing = generate_block_hash(split_blocks(PAGE_TEXT)[0])
+        mock_client.query.return_value.result.return_value = [{'block_hash': existing}]
+        mock_client.insert_rows_json.return_value = []
+        client = BigQueryClient("test-project", "test_dataset", incremental_storage=True)
+
+        # When: 페이지 저장
+        result = client.store_competitor_pages([make_page(PAGE_TEXT)])
+
+        # Then: 블록과 매니페스트가 순서대로 삽입되어야 함
+        assert result is True
+        block_rows = mock_client.insert_rows_json.call_args_list[0][0][1]
+        version_rows = mock_client.insert_rows_json.call_args_list[1][0][1]
+        assert existing not in {row['block_hash'] for row in block_rows}
+        assert version_rows[0]['block_hashes'][0] == existing
+        assert 'content' not in version_rows[0]
+
+    @patch('google.cloud.bigquery.Client')
+    def test_get_page_version(self, mock_bigquery_client):
+        """매니페스트와 블록으로 본문을 복원하는지 테스트"""
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        version, blocks = build_page_version(make_page(PAGE_TEXT))
+        mock_client.query.return_value.result.side_effect = [
+            [dict(version)],
+            [{'block_hash': h, 'content': c} for h, c in blocks.items()]
+        ]
+        client = BigQueryClient("test-project", "test_dataset", incremental_storage=True)
+
+        restored = client.get_page_version('A', 'https://a.com/pricing')
+
+        assert restored['content'] == PAGE_TEXT
+        assert 'block_hashes' not in restored
+        assert 'page_versions' in mock_client.query.call_args_list[0][0][0]
@@ -0,0 +1,202 @@
+"""
+링크 탐색 크롤러 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.crawler import (
+    BloomFilter, CrawlFrontier, SiteCrawler, normalize_url, page_priority
+)
+from src.data_collection.host_health import HostHealth
+from src.data_collection.web_scraper import WebScraper
+from src.utils.metrics import BandwidthTracker
+
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/pricing</loc></url>
+  <url><loc>https://other.com/pricing</loc></url>
+</urlset>"""
+
+PAGES = {
+    "https://example.com/": '<a href="/blog/post">블로그</a><a href="/products?utm_source=x#top">제품</a>',
+    "https://example.com/pricing": '<a href="/brochure.pdf">PDF</a><a href="https://www.example.com/plans">플랜</a>',
+    "https://example.com/products": '<a href="/">홈</a>',
+    "https://www.example.com/plans": '',
+    "https://example.com/blog/post": '',
+}
+
+
+def make_response(url: str, status_code: int = 200) -> requests.Response:
+    """테스트용 응답 생성 (sitemap.xml 또는 HTML)"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content_consumed = True
+    if url.endswith('/sitemap.xml'):
+        response._content = SITEMAP
+        response.headers['Content-Type'] = 'application/xml'
+    else:
+        html = f"<html><title>{url}</title><body>{PAGES.get(url, '')}</body></html>"
+        response._content = html.encode('utf-8')
+        response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    return response
+
+
+class TestNormalizeUrl:
+    """URL 정규화 테스트"""
+
+    def test_canonical_form(self):
+        """스킴/호스트/포트/프래그먼트/쿼리 정규화 테스트"""
+        assert normalize_url("HTTPS://Example.COM:443/a//b?b=2&a=1&utm_source=x#frag") == \
+            "https://example.com/a/b?a=1&b=2"
+        assert normalize_url("http://example.com") == "http://example.com/"
+        assert normalize_url("http://example.com:8080/x") == "http://example.com:8080/x"
+
+    def test_relative_and_unsupported(self):
+        """상대 경로 해석과 http 이외 스킴 제외 테스트"""
+        assert normalize_url("../pricing", base_url="https://example.com/a/b") == \
+            "https://example.com/pricing"
+        assert normalize_url("mailto:sales@example.com") is None
+        assert normalize_url("javascript:void(0)") is None
+
+
+class TestFrontier:
+    """블룸 필터와 우선순위 대기열 테스트"""
+
+    def test_bloom_filter(self):
+        """추가한 원소는 항상 포함되고 중복 추가는 False인지 테스트"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        urls = [f"https://example.com/page/{i}" for i in range(1000)]
+        for url in urls:
+            bloom.add(url)
+
+        assert all(url in bloom for url in urls)
+        assert bloom.add(urls[0]) is False
+        false_positives = sum(f"https://example.com/other/{i}" in bloom for i in range(1000))
+        assert false_positives < 50
+
+    def test_priority_order(self):
+        """가격 → 제품 → 기타 → 블로그 순서와 중복 제외 테스트"""
+        frontier = CrawlFrontier(max_size=10, expected_urls=100)
+        for url in ["https://e.com/blog/a", "https://e.com/about",
+                    "https://e.com/products", "https://e.com/pricing"]:
+            frontier.push(url, 1)
+
+        assert frontier.push("https://e.com/pricing", 0) is False
+        assert [frontier.pop()[0] for _ in range(4)] == [
+            "https://e.com/pricing", "https://e.com/products",
+            "https://e.com/about", "https://e.com/blog/a",
+        ]
+        assert frontier.pop() is None
+        assert page_priority("https://e.com/ko/요금") == 0
+
+
+class TestSiteCrawler:
+    """WebScraper 크롤 모드 테스트"""
+
+    @patch('requests.Session.get')
+    def test_crawl_discovers_same_site_pages(self, mock_get):
+        """sitemap과 링크로 같은 사이트 페이지를 우선순위대로 수집하는지 테스트"""
+        # Given: 시작 페이지 "/"와 sitemap.xml
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        scraper = WebScraper(delay=0, max_pages_per_site=4)
+        config = {"name": "test", "url": "https://example.com", "target_pages": ["/"], "crawl": True}
+
+        # When: 크롤 모드로 수집
+        results = scraper.scrape_competitor(config)
+
+        # Then: 같은 사이트 HTML 페이지만 가격 → 제품 → 기타 → 블로그 순으로 수집되어야 함
+        assert [r['url'] for r in results] == [
+            "https://example.com/",
+            "https://example.com/pricing",
+            "https://www.example.com/plans",
+            "https://example.com/products",
+        ]
+        assert all('links' not in r for r in results)
+        requested = [call.args[0] for call in mock_get.call_args_list]
+        assert "https://other.com/pricing" not in requested
+        assert "https://example.com/brochure.pdf" not in requested
+
+    @patch('requests.Session.get')
+    def test_crawl_respects_max_pages(self, mock_get):
+        """경쟁사별 max_pages 상한 테스트"""
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        scraper = WebScraper(delay=0)
+        config = {"name": "test", "url": "https://example.com", "target_pages": ["/"],
+                  "crawl": True, "max_pages": 2}
+
+        results = scraper.scrape_competitor(config)
+
+        assert len(results) == 2
+
+
+class TestSitemapFetch:
+    """sitemap 요청 경로 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.host_health = HostHealth(failure_threshold=1, cooldown_seconds=60)
+        self.bandwidth = BandwidthTracker()
+        self.scraper = WebScraper(delay=0, host_health=self.host_health, bandwidth=self.bandwidth,
+                                  max_retries=0)
+        self.config = {"name": "test", "url": "https://example.com", "target_pages": ["/"],
+                       "crawl": True, "max_pages": 2}
+
+    @patch('requests.Session.get')
+    def test_sitemap_uses_scraper_request_path(self, mock_get):
+        """sitemap 요청도 적응형 타임아웃과 전송량 기록을 거치는지 테스트"""
+        # Given
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+
+        # When
+        self.scraper.scrape_competitor(self.config)
+
+        # Then: 호스트 타임아웃으로 요청하고, sitemap 응답 크기도 기록됨
+        sitemap_call = next(call for call in mock_get.call_args_list
+                            if call.args[0].endswith('/sitemap.xml'))
+        assert sitemap_call.kwargs['timeout'] == self.host_health.timeout_for("https://example.com/")
+        assert self.bandwidth.summary()['hosts']['example.com']['responses'] == 3
+        assert self.host_health.summary()['example.com']['samples'] == 3
+
+    @patch('requests.Session.get')
+    def test_sitemap_skipped_when_breaker_open(self, mock_get):
+        """서킷 브레이커가 열린 호스트의 sitemap은 요청하지 않는지 테스트"""
+        # Given: 직전 실패로 브레이커가 열린 호스트
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        self.host_health.record_failure("https://example.com/")
+
+        # When
+        urls = SiteCrawler(self.scraper)._sitemap_urls("https://example.com")
+
+        # Then: 요청 없이 건너뜀
+        assert urls == []
+        mock_get.assert_not_called()
+        assert self.host_health.summary()['example.com']['skipped'] == 1
+
+    @patch('requests.Session.get')
+    def test_sitemap_entity_expansion_is_rejected(self, mock_get):
+        """엔티티 선언이 있는 sitemap은 파싱하지 않는지 테스트"""
+        # Given: 엔티티 확장을 사용하는 sitemap
+        bomb = b"""<?xml version="1.0"?>
+<!DOCTYPE lolz [<!ENTITY lol "lol"><!ENTITY lol2 "&lol;&lol;&lol;&lol;">]>
+<urlset><url><loc>https://example.com/&lol2;</loc></url></urlset>"""
+
+        def respond(url, **kwargs):
+            response = make_response(url)
+            if url.endswith('/sitemap.xml'):
+                response._content = bomb
+            return response
+        mock_get.side_effect = respond
+
+        # When
+        urls = SiteCrawler(self.scraper)._sitemap_urls("https://example.com")
+
+        # Then
+        assert urls == []
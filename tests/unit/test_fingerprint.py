@@ -0,0 +1,181 @@
+"""
+SimHash 지문 모듈 단위 테스트
+"""
+
+import sys
+import os
+import hashlib
+from unittest.mock import Mock, patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.fingerprint import (
+    compute_simhash, simhash_similarity, is_near_duplicate
+)
+from src.utils.bigquery_client import BigQueryClient
+
+
+PRICING_TEXT = " ".join(
+    f"Plan {i} includes analytics reporting dashboards and priority support for teams."
+    for i in range(60)
+)
+
+
+class TestSimHash:
+    """SimHash 계산/비교 테스트"""
+
+    def test_identical_text(self):
+        """같은 텍스트는 같은 지문을 갖는지 테스트"""
+        assert compute_simhash(PRICING_TEXT) == compute_simhash(PRICING_TEXT)
+        assert len(compute_simhash(PRICING_TEXT)) == 16
+
+    def test_small_change_is_near_duplicate(self):
+        """타임스탬프/토큰 같은 작은 변경은 근사 중복으로 판정되는지 테스트"""
+        original = f"Updated 2024-01-01 09:00 csrf a1b2c3 {PRICING_TEXT}"
+        rotated = f"Updated 2024-01-02 10:15 csrf z9y8x7 {PRICING_TEXT}"
+
+        similarity = simhash_similarity(compute_simhash(original), compute_simhash(rotated))
+
+        assert similarity >= 0.95
+        assert is_near_duplicate(compute_simhash(original), compute_simhash(rotated), 0.95)
+
+    def test_different_text_is_not_near_duplicate(self):
+        """실질적으로 다른 텍스트는 근사 중복이 아닌지 테스트"""
+        other = " ".join(f"Careers at company {i} open roles in engineering." for i in range(60))
+
+        assert not is_near_duplicate(compute_simhash(PRICING_TEXT), compute_simhash(other), 0.95)
+
+    def test_missing_fingerprint(self):
+        """지문이 없으면 유사도가 0인지 테스트"""
+        assert simhash_similarity("", compute_simhash(PRICING_TEXT)) == 0.0
+        assert simhash_similarity(None, None) == 0.0
+
+
+class TestLatestFingerprintQuery:
+    """BigQueryClient.get_latest_content_fingerprint 테스트"""
+
+    @patch('google.cloud.bigquery.Client')
+    def test_returns_hash_and_simhash(self, mock_bigquery_client):
+        """최신 해시와 지문을 함께 반환하는지 테스트"""
+        mock_client_instance = Mock()
+        mock_bigquery_client.return_value = mock_client_instance
+        mock_query_job = Mock()
+        mock_query_job.result.return_value = [
+            {'content_hash': 'h1', 'content_simhash': '00ff00ff00ff00ff'}
+        ]
+        mock_client_instance.query.return_value = mock_query_job
+        client = BigQueryClient("test-project", "test_dataset")
+
+        result = client.get_latest_content_fingerprint('Test', 'https://test.com')
+
+        assert result == {'content_hash': 'h1', 'content_simhash': '00ff00ff00ff00ff'}
+
+    @patch('google.cloud.bigquery.Client')
+    def test_query_failure_returns_empty(self, mock_bigquery_client):
+        """조회 실패 시 빈 값을 반환하는지 테스트"""
+        mock_client_instance = Mock()
+        mock_bigquery_client.return_value = mock_client_instance
+        mock_client_instance.query.side_effect = Exception("query failed")
+        client = BigQueryClient("test-project", "test_dataset")
+
+        result = client.get_latest_content_fingerprint('Test', 'https://test.com')
+
+        assert result == {'content_hash': "", 'content_simhash': ""}
+
+
+class TestBulkLatestFingerprintQuery:
+    """BigQueryClient.get_latest_content_fingerprints 테스트"""
+
+    @patch('google.cloud.bigquery.Client')
+    def test_single_query_for_all_pairs(self, mock_bigquery_client):
+        """여러 URL의 최신 지문을 쿼리 한 번으로 조회하는지 테스트"""
+        # Given: 두 URL 중 하나만 기록이 있는 테이블
+        mock_client_instance = Mock()
+        mock_bigquery_client.return_value = mock_client_instance
+        mock_client_instance.query.return_value.result.return_value = [
+            {'competitor_name': 'A', 'url': "https://a.com/it's", 'content_hash': 'h1',
+             'content_simhash': None}
+        ]
+        client = BigQueryClient("test-project", "test_dataset")
+        pairs = [('A', "https://a.com/it's"), ('A', 'https://a.com/new'), ('A', "https://a.com/it's")]
+
+        # When: 일괄 조회
+        fingerprints = client.get_latest_content_fingerprints(pairs)
+        hashes = client.get_latest_content_hashes(pairs)
+
+        # Then: 쌍마다 쿼리하지 않고, URL은 쿼리 문자열이 아닌 파라미터로 전달되어야 함
+        assert mock_client_instance.query.call_count == 2
+        query, = mock_client_instance.query.call_args.args
+        job_config = mock_client_instance.query.call_args.kwargs['job_config']
+        assert "it's" not in query
+        assert job_config.query_parameters[0].values == ["A\thttps://a.com/it's", "A\thttps://a.com/new"]
+        assert fingerprints == {('A', "https://a.com/it's"): {'content_hash': 'h1', 'content_simhash': "",
+                                                              'collected_at': None}}
+        assert hashes == {('A', "https://a.com/it's"): 'h1'}
+
+    @patch('google.cloud.bigquery.Client')
+    def test_empty_and_failure(self, mock_bigquery_client):
+        """빈 입력은 쿼리하지 않고, 조회 실패 시 빈 딕셔너리를 반환하는지 테스트"""
+        mock_client_instance = Mock()
+        mock_bigquery_client.return_value = mock_client_instance
+        client = BigQueryClient("test-project", "test_dataset")
+
+        assert client.get_latest_content_fingerprints([]) == {}
+        assert mock_client_instance.query.call_count == 0
+
+        mock_client_instance.query.side_effect = Exception("query failed")
+        assert client.get_latest_content_fingerprints([('A', 'https://a.com')]) == {}
+
+
+class TestNearDuplicateStorage:
+    """store_new_pages의 근사 중복 처리 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        long_text = " ".join(
+            f"Plan {i} includes analytics reporting dashboards and priority support for teams."
+            for i in range(128)
+        )
+        self.previous = self.make_page(long_text + " Pro plan costs $29 per month.")
+        self.current = self.make_page(long_text + " Pro plan costs $49 per month.")
+        self.client = Mock()
+        self.client.get_latest_content_fingerprints.return_value = {
+            ('A', 'https://a.com/pricing'): {
+                'content_hash': self.previous['content_hash'],
+                'content_simhash': self.previous['content_simhash']
+            }
+        }
+        self.client.store_competitor_pages.return_value = True
+
+    @staticmethod
+    def make_page(content):
+        return {
+            'competitor_name': 'A', 'url': 'https://a.com/pricing', 'content': content,
+            'content_hash': hashlib.md5(content.encode('utf-8')).hexdigest(),
+            'content_simhash': compute_simhash(content)
+        }
+
+    def test_price_change_on_long_page_is_stored(self):
+        """긴 페이지의 가격 토큰 하나 변경도 기본 설정에서 저장되는지 테스트"""
+        from src.main import store_new_pages
+
+        # Given: 약 10KB 페이지에서 가격만 바뀐 버전 (SimHash로는 근사 중복)
+        assert len(self.current['content']) >= 10_000
+        assert is_near_duplicate(self.previous['content_simhash'], self.current['content_simhash'], 0.95)
+
+        # When: 기본 설정으로 저장
+        assert store_new_pages(self.client, None, [self.current]) is True
+
+        # Then: 변경된 페이지로 저장됨
+        self.client.store_competitor_pages.assert_called_once_with([self.current])
+
+    def test_near_duplicate_dedup_is_opt_in(self):
+        """근사 중복 생략을 켠 경우에만 저장하지 않는지 테스트"""
+        from src.main import store_new_pages
+
+        # When: 근사 중복 생략을 켜고 저장
+        assert store_new_pages(self.client, None, [self.current], near_duplicate_dedup=True) is True
+
+        # Then: 저장하지 않음
+        self.client.store_competitor_pages.assert_not_called()
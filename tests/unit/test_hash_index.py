@@ -0,0 +1,80 @@
+"""
+로컬 콘텐츠 해시 인덱스 단위 테스트
+"""
+
+import sys
+import os
+from datetime import datetime, timezone
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.hash_index import ContentHashIndex, split_by_index
+
+
+def make_row(url, content_hash, collected_at, competitor_name="A"):
+    """테스트용 저장 행"""
+    return {
+        'competitor_name': competitor_name,
+        'url': url,
+        'content_hash': content_hash,
+        'content_simhash': '00ff00ff00ff00ff',
+        'collected_at': collected_at
+    }
+
+
+class TestContentHashIndex:
+    """ContentHashIndex 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.index = None
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 연결 정리"""
+        if self.index:
+            self.index.close()
+
+    def test_update_and_lookup(self, tmp_path):
+        """저장한 지문을 다시 열어도 조회되고, 오래된 행은 최신 값을 덮어쓰지 않는지 테스트"""
+        # Given: 두 URL의 지문 저장 후 같은 URL의 더 오래된 행 반영
+        path = str(tmp_path / "state" / "hashes.sqlite3")
+        index = ContentHashIndex(path)
+        index.update([
+            make_row("https://a.com/pricing", "new", "2024-01-02T00:00:00"),
+            make_row("https://a.com/", "home", "2024-01-01T00:00:00"),
+        ])
+        index.update([make_row("https://a.com/pricing", "old", "2024-01-01T00:00:00")])
+        index.close()
+
+        # When: 다시 열어 조회
+        self.index = ContentHashIndex(path)
+        found = self.index.get_many([("A", "https://a.com/pricing"), ("A", "https://a.com/none"),
+                                     ("B", "https://a.com/")])
+
+        # Then: 최신 해시만 반환되고 없는 쌍은 포함되지 않아야 함
+        assert found == {("A", "https://a.com/pricing"): {
+            'content_hash': "new", 'content_simhash': '00ff00ff00ff00ff',
+            'collected_at': "2024-01-02T00:00:00"
+        }}
+        assert self.index.get("A", "https://a.com/")['content_hash'] == "home"
+
+    def test_replace_all_and_split(self, tmp_path):
+        """재구성 시 기존 항목을 교체하고, 인덱스에 없는 쌍만 조회 대상으로 나누는지 테스트"""
+        self.index = ContentHashIndex(str(tmp_path / "hashes.sqlite3"))
+        self.index.update([make_row("https://a.com/stale", "x", "2024-01-01T00:00:00")])
+        bigquery_time = datetime(2024, 1, 3, tzinfo=timezone.utc)
+
+        count = self.index.replace_all([make_row(f"https://a.com/{i}", f"h{i}", bigquery_time)
+                                        for i in range(1000)])
+
+        assert count == 1000
+        assert self.index.count() == 1000
+        assert self.index.get("A", "https://a.com/stale") is None
+        assert self.index.get("A", "https://a.com/7")['collected_at'].startswith("2024-01-03")
+
+        pairs = [("A", f"https://a.com/{i}") for i in range(995, 1005)]
+        found, missing = split_by_index(self.index, pairs)
+        assert len(found) == 5
+        assert missing == pairs[5:]
+        assert split_by_index(None, pairs[:2]) == ({}, pairs[:2])
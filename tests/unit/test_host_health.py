@@ -0,0 +1,125 @@
+"""
+호스트 상태 추적(적응형 타임아웃, 서킷 브레이커) 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.host_health import HostHealth, backoff_delay
+from src.data_collection.web_scraper import WebScraper
+from tests.unit.test_crawler import make_response
+
+
+class FakeClock:
+    """수동으로 진행하는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHostHealth:
+    """HostHealth 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.clock = FakeClock()
+        self.health = HostHealth(default_timeout=10, min_timeout=2, max_timeout=30,
+                                 failure_threshold=3, cooldown_seconds=60, clock=self.clock)
+
+    def test_adaptive_timeout(self):
+        """관측 지연 시간의 p95로 타임아웃을 정하고 범위로 제한하는지 테스트"""
+        url = "https://fast.com/a"
+        assert self.health.timeout_for(url) == 10  # 표본 부족
+
+        for seconds in [0.1] * 19 + [1.0]:
+            self.health.record_success(url, seconds)
+        assert self.health.timeout_for(url) == 4.0  # p95 1.0초 × 4
+
+        for _ in range(50):
+            self.health.record_success("https://tiny.com/", 0.01)
+            self.health.record_success("https://slow.com/", 20)
+        assert self.health.timeout_for("https://tiny.com/x") == 2
+        assert self.health.timeout_for("https://slow.com/x") == 30
+
+    def test_circuit_breaker(self):
+        """연속 실패 시 열리고, 대기 후 재시도 결과에 따라 다시 열리거나 닫히는지 테스트"""
+        url = "https://dead.com/pricing"
+
+        # When: 연속 실패 3회
+        assert self.health.record_failure(url) is False
+        assert self.health.record_failure(url) is False
+        assert self.health.record_failure(url) is True
+
+        # Then: 대기 시간 동안 차단, 다른 호스트는 영향 없음
+        assert self.health.is_available(url) is False
+        assert self.health.is_available("https://other.com/") is True
+
+        # 대기 후 한 번 실패하면 곧바로 다시 열림
+        self.clock.now += 61
+        assert self.health.is_available(url) is True
+        assert self.health.record_failure(url) is True
+
+        # 대기 후 성공하면 닫힘
+        self.clock.now += 61
+        self.health.record_success(url, 0.2)
+        assert self.health.record_failure(url) is False
+        assert self.health.summary()["dead.com"]['trips'] == 2
+
+    def test_backoff_delay_bounds(self):
+        """백오프 대기 시간이 지수 상한과 최대값 안에 있는지 테스트"""
+        delays = [backoff_delay(2, base_seconds=0.5, max_seconds=8) for _ in range(100)]
+        assert all(0 <= delay <= 2.0 for delay in delays)
+        assert all(backoff_delay(10, 0.5, 8) <= 8 for _ in range(100))
+
+
+class TestScraperRetries:
+    """WebScraper 재시도/서킷 브레이커 테스트"""
+
+    @patch('src.data_collection.web_scraper.time.sleep')
+    @patch('requests.Session.get')
+    def test_transient_errors_are_retried(self, mock_get, mock_sleep):
+        """연결 오류와 503 응답을 백오프 후 재시도하는지 테스트"""
+        # Given: 연결 오류 → 503 → 성공 순서의 응답
+        url = "https://example.com/pricing"
+        unavailable = make_response(url, status_code=503)
+        mock_get.side_effect = [requests.ConnectionError("reset"), unavailable, make_response(url)]
+        scraper = WebScraper(delay=0, max_retries=2)
+
+        # When: 스크래핑
+        result = scraper.scrape_page(url, "test")
+
+        # Then: 세 번째 시도에서 성공하고 두 번 대기해야 함
+        assert result is not None
+        assert mock_get.call_count == 3
+        assert mock_sleep.call_count == 2
+        assert mock_get.call_args.kwargs['timeout'] == 10
+
+    @patch('src.data_collection.web_scraper.time.sleep')
+    @patch('requests.Session.get')
+    def test_dead_host_skipped_after_breaker_opens(self, mock_get, mock_sleep):
+        """죽은 호스트는 서킷 브레이커가 열린 뒤 남은 페이지를 요청하지 않는지 테스트"""
+        # Given: 모든 요청이 타임아웃되는 호스트
+        mock_get.side_effect = requests.Timeout("timed out")
+        scraper = WebScraper(delay=0, max_retries=2,
+                             host_health=HostHealth(failure_threshold=3, cooldown_seconds=60))
+        config = {"name": "dead", "url": "https://dead.example.com",
+                  "target_pages": ["/", "/pricing", "/products", "/about"]}
+
+        # When: 경쟁사 수집
+        results = scraper.scrape_competitor(config)
+
+        # Then: 첫 페이지의 시도 3회 이후에는 요청하지 않아야 함
+        assert results == []
+        assert mock_get.call_count == 3
+        stats = scraper.host_health.summary()["dead.example.com"]
+        assert stats['skipped'] == 3
+        assert stats['open'] is True
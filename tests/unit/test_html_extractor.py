@@ -0,0 +1,114 @@
+"""
+HTML 추출 모듈 단위 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.html_extractor import (
+    StreamingTextExtractor, extract_page, resolve_backend
+)
+
+
+SAMPLE_HTML = """
+<html>
+<head>
+    <title>  Pricing - Test  </title>
+    <meta name="description" content=" Simple plans ">
+    <style>body { color: red; }</style>
+    <script>console.log('x');</script>
+</head>
+<body>
+    <h1>Plans</h1>
+    <p>Starter &amp; Pro    plans with <strong>annual</strong> discount.</p>
+    <ul><li>Item 1</li><li>Item 2</li></ul>
+    <script>alert('popup');</script>
+</body>
+</html>
+"""
+
+
+class TestExtractPage:
+    """extract_page 함수 테스트"""
+
+    def test_stream_matches_html_parser(self):
+        """단일 패스 추출 결과가 BeautifulSoup 추출 결과와 같은지 테스트"""
+        expected = extract_page(SAMPLE_HTML, backend='html.parser')
+
+        result = extract_page(SAMPLE_HTML, backend='stream')
+
+        assert result == expected
+        assert result['page_title'] == "Pricing - Test"
+        assert result['meta_description'] == "Simple plans"
+        assert "Starter & Pro plans with annual discount." in result['content']
+        assert "console.log" not in result['content']
+        assert "alert" not in result['content']
+
+    @pytest.mark.parametrize('html', [
+        "<p>a</p><template>tmpl</template><noscript>ns</noscript>",
+        "<p>a</p><template><p>x<script>s</script></p></template><noscript><p>ns</p></noscript>b",
+        "<template>a<template>b</template>c</template>d",
+        "<ruby>漢<rp>(</rp><rt>kan</rt><rp>)</rp></ruby>字",
+        "<ruby>漢<rt>kan</ruby>字",
+        "<div>a<br/>b<img src=x>c</div></span>d<p/>e<template/>f",
+    ])
+    def test_stream_matches_html_parser_for_skipped_tags(self, html):
+        """template/noscript/루비 주석과 닫히지 않은 태그에서도 두 백엔드 결과가 같은지 테스트"""
+        # Given: BeautifulSoup 추출 결과
+        expected = extract_page(html, backend='html.parser')
+
+        # When: 단일 패스 추출
+        result = extract_page(html, backend='stream')
+
+        # Then: 같은 결과 (content_hash가 백엔드에 따라 달라지지 않음)
+        assert result == expected
+        assert "tmpl" not in result['content']
+
+    def test_stream_accepts_bytes(self):
+        """바이트 입력을 디코딩해 추출하는지 테스트"""
+        html = "<html><title>한글 제목</title><body>본문</body></html>".encode('utf-8')
+
+        result = extract_page(html, backend='stream')
+
+        assert result['page_title'] == "한글 제목"
+
+    def test_content_cap(self):
+        """본문 텍스트 상한이 적용되는지 테스트"""
+        html = "<title>t</title>" + "<p>word word</p>\n" * 5000
+
+        for backend in ('html.parser', 'stream'):
+            assert len(extract_page(html, backend=backend, max_chars=100)['content']) == 100
+
+    def test_unknown_backend(self):
+        """지원하지 않는 백엔드 이름이면 ValueError가 발생하는지 테스트"""
+        with pytest.raises(ValueError):
+            resolve_backend('regex')
+
+
+class TestStreamingTextExtractor:
+    """StreamingTextExtractor 클래스 테스트"""
+
+    def test_incremental_feed(self):
+        """여러 조각으로 나눠 넣어도 결과가 같은지 테스트"""
+        extractor = StreamingTextExtractor()
+        for i in range(0, len(SAMPLE_HTML), 7):
+            extractor.feed(SAMPLE_HTML[i:i + 7])
+        extractor.close()
+
+        assert extractor.result() == extract_page(SAMPLE_HTML, backend='html.parser')
+
+    def test_stops_after_cap(self):
+        """텍스트 상한과 제목을 확보하면 이후 입력을 무시하는지 테스트"""
+        extractor = StreamingTextExtractor(max_chars=20)
+        extractor.feed("<title>t</title><p>0123456789</p>\n<p>0123456789</p>\n")
+
+        assert extractor.done is True
+
+        extractor.feed("<p>ignored</p>\n")
+        extractor.close()
+        assert "ignored" not in extractor.result()['content']
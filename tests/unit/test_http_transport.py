@@ -0,0 +1,130 @@
+"""
+공유 HTTP 전송 계층 단위 테스트
+"""
+
+import sys
+import os
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.http_transport import (
+    DNSCache, close_shared_transport, configure_shared_transport, dns_cache,
+    mount_shared_adapter, transport_stats
+)
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """로컬 테스트 서버 핸들러 (keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"ok"
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def fake_getaddrinfo(host, port, family=0, type=0):
+    """호스트 이름과 관계없이 고정 주소를 반환하는 getaddrinfo"""
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.1', port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, '', ('10.0.0.2', port))]
+
+
+class TestDNSCache:
+    """DNSCache 클래스 테스트"""
+
+    @patch('socket.getaddrinfo', side_effect=fake_getaddrinfo)
+    def test_cache_hit_and_invalidate(self, mock_getaddrinfo):
+        """TTL 안에서는 재해석하지 않고, 무효화 후에는 다시 해석하는지 테스트"""
+        # Given: TTL이 긴 캐시
+        cache = DNSCache(ttl_seconds=60)
+
+        # When: 같은 호스트를 두 번 해석
+        first = cache.resolve("Example.com", 443)
+        second = cache.resolve("example.com", 443)
+
+        # Then: getaddrinfo는 한 번만 호출되고 주소는 중복 없이 유지되어야 함
+        assert first == second == ['10.0.0.1', '10.0.0.2']
+        assert mock_getaddrinfo.call_count == 1
+        assert cache.stats()['hits'] == 1
+
+        cache.invalidate("example.com", 443)
+        cache.resolve("example.com", 443)
+        assert mock_getaddrinfo.call_count == 2
+
+    @patch('socket.getaddrinfo', side_effect=fake_getaddrinfo)
+    def test_expired_and_evicted(self, mock_getaddrinfo):
+        """TTL 0은 캐시하지 않고, 최대 항목 수를 넘으면 오래된 항목을 제거하는지 테스트"""
+        no_cache = DNSCache(ttl_seconds=0)
+        no_cache.resolve("a.com", 80)
+        no_cache.resolve("a.com", 80)
+        assert mock_getaddrinfo.call_count == 2
+
+        small = DNSCache(ttl_seconds=60, max_entries=1)
+        small.resolve("a.com", 80)
+        small.resolve("b.com", 80)
+        assert small.stats()['entries'] == 1
+
+    @patch('socket.getaddrinfo')
+    def test_ip_literal_not_cached(self, mock_getaddrinfo):
+        """IP 리터럴은 캐시 항목을 만들지 않는지 테스트"""
+        mock_getaddrinfo.return_value = [(socket.AF_INET, socket.SOCK_STREAM, 6, '', ('127.0.0.1', 80))]
+        cache = DNSCache()
+
+        assert cache.resolve("127.0.0.1", 80) == ['127.0.0.1']
+        assert cache.stats()['entries'] == 0
+
+
+class TestSharedTransport:
+    """공유 어댑터 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        configure_shared_transport(pool_connections=4, pool_maxsize=2)
+        dns_cache.clear()
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 공유 연결 정리"""
+        close_shared_transport()
+
+    def test_sessions_share_connections(self):
+        """서로 다른 세션이 같은 keep-alive 연결과 DNS 캐시를 공유하는지 테스트"""
+        # Given: 로컬 서버와 공유 어댑터를 연결한 두 세션
+        server = ThreadingHTTPServer(('127.0.0.1', 0), _PageHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = f"http://localhost:{server.server_address[1]}/"
+        first, second = requests.Session(), requests.Session()
+        mount_shared_adapter(first)
+        mount_shared_adapter(second)
+
+        try:
+            # When: 각 세션으로 요청하고 한 세션을 닫은 뒤 다시 요청
+            assert first.get(url, timeout=5).text == "ok"
+            first.close()
+            assert second.get(url, timeout=5).text == "ok"
+            stats = transport_stats()
+        finally:
+            close_shared_transport()
+            server.shutdown()
+            server.server_close()
+
+        # Then: 연결은 한 번만 만들어지고 두 번째 요청은 재사용되어야 함
+        assert len(stats['pools']) == 1
+        assert stats['pools'][0]['connections_created'] == 1
+        assert stats['pools'][0]['requests'] == 2
+        assert stats['pools'][0]['reused_requests'] == 1
+        assert stats['dns_cache']['misses'] == 1
@@ -0,0 +1,117 @@
+"""
+로컬 BigQuery 대체 클라이언트 조회 단위 테스트
+"""
+
+import sys
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from google.cloud import bigquery
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+from src.utils.local_bigquery import LocalBigQueryClient
+
+
+def make_page(url, content_hash, collected_at, competitor_name="A", content="본문"):
+    """테스트용 페이지 데이터"""
+    return {
+        'id': f"{url}-{content_hash}",
+        'competitor_name': competitor_name,
+        'url': url,
+        'page_title': url,
+        'content': content,
+        'meta_description': "",
+        'collected_at': collected_at,
+        'content_hash': content_hash,
+        'content_simhash': None
+    }
+
+
+class TestLocalQueries:
+    """BigQueryClient 조회 메서드의 로컬 실행 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.local = LocalBigQueryClient("test-project")
+        self.client = BigQueryClient("test-project", "test_dataset", client=self.local,
+                                     query_cache_size=0)
+        self.now = datetime.now().replace(microsecond=0)
+        self.client.store_competitor_pages([
+            make_page("https://a.com/", "h1", (self.now - timedelta(days=2)).isoformat()),
+            make_page("https://a.com/", "h2", (self.now - timedelta(days=1)).isoformat()),
+            make_page("https://a.com/pricing", "p1", (self.now - timedelta(days=200)).isoformat()),
+            make_page("https://b.com/", "b1", self.now.isoformat(), competitor_name="B"),
+        ])
+
+    def test_latest_fingerprints(self):
+        """URL별 최신 지문만 조회하는지 테스트"""
+        # When
+        fingerprints = self.client.get_latest_content_fingerprints([
+            ("A", "https://a.com/"), ("A", "https://a.com/pricing"), ("A", "https://b.com/")
+        ])
+
+        # Then: 다른 경쟁사의 같은 URL은 포함되지 않음
+        assert {pair: fp['content_hash'] for pair, fp in fingerprints.items()} == {
+            ("A", "https://a.com/"): "h2",
+            ("A", "https://a.com/pricing"): "p1",
+        }
+        assert self.client.get_latest_content_hash("A", "https://a.com/") == "h2"
+        assert len(self.client.get_all_latest_content_fingerprints()) == 3
+
+    def test_filtered_ordered_limited_reads(self):
+        """경쟁사 필터, 최신순 정렬, LIMIT, 기간 조건 테스트"""
+        # When & Then
+        rows = self.client.query_competitor_data("A", limit=2)
+        assert [row['content_hash'] for row in rows] == ["h2", "h1"]
+        pages = list(self.client.iter_competitor_data(columns=['url'], page_size=3))
+        assert [len(page) for page in pages] == [3, 1]
+        assert set(pages[0][0]) == {'url'}
+        assert sorted(row['content_hash'] for row in self.client.get_page_history(days=90)) == \
+            ["b1", "h1", "h2"]
+
+    def test_unsupported_query_is_rejected(self):
+        """지원하지 않는 형태의 쿼리는 ValueError로 거부하는지 테스트"""
+        # When & Then
+        with pytest.raises(ValueError):
+            self.local.query("SELECT COUNT(*) FROM `p.d.competitor_data`")
+        with pytest.raises(ValueError):
+            self.local.query(
+                "SELECT * FROM `p.d.competitor_data` WHERE url LIKE @url",
+                job_config=bigquery.QueryJobConfig(query_parameters=[
+                    bigquery.ScalarQueryParameter('url', 'STRING', "%a%")
+                ])
+            )
+
+
+class TestLocalIncrementalStorage:
+    """블록 단위 저장의 로컬 실행 테스트"""
+
+    def test_blocks_are_reused_and_versions_restored(self, tmp_path):
+        """저장된 블록은 다시 저장하지 않고, 다음 실행에서도 버전을 복원하는지 테스트"""
+        # Given: 디렉터리에 저장하는 블록 단위 클라이언트
+        directory = str(tmp_path / "bq")
+        content = "첫 번째 문단입니다.\n\n두 번째 문단입니다."
+        client = BigQueryClient("p", "d", incremental_storage=True,
+                                client=LocalBigQueryClient("p", directory=directory))
+        assert client.store_competitor_pages([
+            make_page("https://a.com/", "h1", "2024-01-01T00:00:00", content=content)
+        ]) is True
+        blocks = len(client.client.tables['content_blocks'])
+
+        # When: 다음 실행에서 같은 블록을 가진 새 버전 저장
+        reopened = BigQueryClient("p", "d", incremental_storage=True,
+                                  client=LocalBigQueryClient("p", directory=directory))
+        assert reopened.get_latest_content_fingerprints([("A", "https://a.com/")])[
+            ("A", "https://a.com/")]['content_hash'] == "h1"
+        assert reopened.store_competitor_pages([
+            make_page("https://a.com/", "h2", "2024-01-02T00:00:00", content=content + "\n\n추가 문단.")
+        ]) is True
+
+        # Then: 기존 블록은 다시 저장되지 않고 두 버전 모두 복원됨
+        assert len(reopened.client.tables['content_blocks']) == blocks + 1
+        assert reopened.get_page_version("A", "https://a.com/")['content'].endswith("추가 문단.")
+        assert reopened.get_page_version("A", "https://a.com/", "https://a.com/-h1")['content'] == content
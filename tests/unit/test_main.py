@@ -0,0 +1,294 @@
+"""
+메인 실행 스크립트 단위 테스트 (가짜 BigQuery 클라이언트 사용)
+"""
+
+import sys
+import os
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src import main as main_module
+from src.data_collection.archive import ResponseArchive
+from src.data_collection.hash_index import ContentHashIndex
+from src.data_collection.run_journal import RunJournal
+from src.utils.run_summary import save_run_summary
+from tests.unit.test_crawler import make_response
+
+
+COMPETITOR = {"name": "test", "url": "https://example.com", "target_pages": ["/", "/pricing"]}
+
+
+def make_page(url, content_hash, competitor_name="test", **extra):
+    """테스트용 페이지 데이터"""
+    page = {
+        'id': f"id-{url}",
+        'competitor_name': competitor_name,
+        'url': url,
+        'page_title': url,
+        'content': 'content',
+        'meta_description': '',
+        'collected_at': '2024-01-01T00:00:00',
+        'content_hash': content_hash,
+        'content_simhash': None
+    }
+    page.update(extra)
+    return page
+
+
+def make_bq_client(latest=None, store_result=True):
+    """최신 지문과 저장 결과를 지정한 가짜 BigQuery 클라이언트"""
+    client = Mock()
+    client.get_latest_content_fingerprints.side_effect = lambda pairs: {
+        pair: fingerprint for pair, fingerprint in (latest or {}).items() if pair in list(pairs)
+    }
+    client.store_competitor_pages.return_value = store_result
+    return client
+
+
+class TestStoreNewPages:
+    """store_new_pages 중복 제거/실패 처리 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.pages = [
+            make_page("https://a.com/same", "h-same"),
+            make_page("https://a.com/changed", "h-new"),
+            make_page("https://a.com/first", "h-first"),
+            make_page("https://a.com/304", "", not_modified=True),
+        ]
+        self.latest = {
+            ("test", "https://a.com/same"): {'content_hash': "h-same", 'content_simhash': ""},
+            ("test", "https://a.com/changed"): {'content_hash': "h-old", 'content_simhash': ""},
+        }
+
+    def test_only_changed_pages_are_stored(self, tmp_path):
+        """해시가 같은 페이지와 304 페이지는 저장하지 않고 인덱스/일정/개수를 갱신하는지 테스트"""
+        # Given: 가짜 클라이언트와 빈 로컬 해시 인덱스
+        bq_client = make_bq_client(self.latest)
+        hash_index = ContentHashIndex(str(tmp_path / "index.sqlite3"))
+        schedule = Mock()
+        counts = {}
+
+        # When
+        result = main_module.store_new_pages(bq_client, hash_index, self.pages,
+                                             new_page_counts=counts, recrawl_schedule=schedule)
+
+        # Then: 변경/처음 수집 페이지만 저장되고, 이전 기록이 있는 페이지만 변경으로 반영
+        assert result is True
+        stored = bq_client.store_competitor_pages.call_args[0][0]
+        assert [page['url'] for page in stored] == ["https://a.com/changed", "https://a.com/first"]
+        assert dict(schedule.record_checks.call_args[0][0]) == {
+            "https://a.com/same": False,
+            "https://a.com/changed": True,
+            "https://a.com/first": False,
+            "https://a.com/304": False,
+        }
+        assert counts == {"test": 2}
+        assert hash_index.get("test", "https://a.com/changed")['content_hash'] == "h-new"
+        assert hash_index.get("test", "https://a.com/first")['content_hash'] == "h-first"
+
+        # When: 같은 배치를 다시 처리
+        bq_client.get_latest_content_fingerprints.reset_mock()
+        bq_client.store_competitor_pages.reset_mock()
+        assert main_module.store_new_pages(bq_client, hash_index, self.pages) is True
+
+        # Then: 인덱스로 판단하므로 BigQuery 조회와 저장이 없음
+        bq_client.get_latest_content_fingerprints.assert_not_called()
+        bq_client.store_competitor_pages.assert_not_called()
+        hash_index.close()
+
+    def test_failed_batch_does_not_update_index_or_schedule(self, tmp_path):
+        """저장에 실패한 배치는 해시 인덱스와 재수집 일정에 반영하지 않는지 테스트"""
+        # Given: 저장이 실패하는 클라이언트
+        bq_client = make_bq_client(self.latest, store_result=False)
+        hash_index = ContentHashIndex(str(tmp_path / "index.sqlite3"))
+        schedule = Mock()
+        counts = {}
+
+        # When
+        result = main_module.store_new_pages(bq_client, hash_index, self.pages,
+                                             new_page_counts=counts, recrawl_schedule=schedule)
+
+        # Then: 실패를 반환하고, 새 페이지는 인덱스에 없어 다음 실행에서 다시 저장됨
+        assert result is False
+        schedule.record_checks.assert_not_called()
+        assert counts == {}
+        assert hash_index.get("test", "https://a.com/changed")['content_hash'] == "h-old"
+        assert hash_index.get("test", "https://a.com/first") is None
+        hash_index.close()
+
+
+class TestMainRun:
+    """main() 수집-저장 루프 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def local_state(self, tmp_path):
+        """로컬 상태 파일을 임시 디렉터리로 돌리고 직렬 수집으로 설정"""
+        self.tmp_path = tmp_path
+        self.journal_path = str(tmp_path / "run_journal.jsonl")
+        self.validator_path = str(tmp_path / "http_validators.json")
+        with patch.multiple(
+            main_module,
+            COMPETITORS=[COMPETITOR],
+            SCRAPER_MODE="serial",
+            REQUEST_DELAY=0,
+            STREAM_BATCH_ROWS=1,
+            RUN_JOURNAL_ENABLED=True,
+            RESPONSE_ARCHIVE_ENABLED=False,
+            CONTENT_HASH_INDEX_ENABLED=True,
+            RECRAWL_SCHEDULE_ENABLED=True,
+            HTTP_VALIDATOR_CACHE_PATH=self.validator_path,
+            RUN_JOURNAL_PATH=self.journal_path,
+            SCRAPE_METRICS_PATH=str(tmp_path / "scrape_metrics.json"),
+            CONTENT_HASH_INDEX_PATH=str(tmp_path / "content_hashes.sqlite3"),
+            RECRAWL_SCHEDULE_PATH=str(tmp_path / "recrawl_schedule.sqlite3"),
+            RUN_SUMMARY_DIR=str(tmp_path / "run_summaries"),
+        ), patch('requests.Session.get') as mock_get:
+            mock_get.side_effect = lambda url, **kwargs: make_response(url)
+            self.mock_get = mock_get
+            yield
+
+    def run_main(self, bq_client):
+        with patch.object(main_module, 'create_bigquery_client', return_value=bq_client):
+            return main_module.main(run_id="test")
+
+    def test_successful_run_stores_pages_and_clears_journal(self):
+        """모든 배치 저장에 성공하면 검증자를 저장하고 저널을 삭제하는지 테스트"""
+        # Given
+        bq_client = make_bq_client()
+
+        # When
+        result = self.run_main(bq_client)
+
+        # Then: 페이지마다 한 배치씩 저장되고, 저널은 삭제되며 실행 요약은 성공
+        assert result is True
+        stored = [call.args[0][0]['url'] for call in bq_client.store_competitor_pages.call_args_list]
+        assert stored == ["https://example.com/", "https://example.com/pricing"]
+        assert not os.path.exists(self.journal_path)
+        assert os.path.exists(self.validator_path)
+        with open(self.tmp_path / "run_summaries" / "test" / "shard-0000-of-0001.json", encoding='utf-8') as f:
+            assert json.load(f)['new_pages'] == {"test": 2}
+
+    def test_failed_batch_keeps_journal_and_validators(self):
+        """배치 저장이 실패하면 실패를 반환하고 검증자 저장 없이 저널을 보존하는지 테스트"""
+        # Given: 저장이 실패하는 클라이언트
+        bq_client = make_bq_client(store_result=False)
+
+        # When
+        result = self.run_main(bq_client)
+
+        # Then
+        assert result is False
+        assert not os.path.exists(self.validator_path)
+        assert RunJournal(self.journal_path).page_count == 2
+
+    def test_crashed_run_resumes_from_journal(self):
+        """저장 도중 중단된 실행의 저널이 남고, 다음 실행이 재요청 없이 저장하는지 테스트"""
+        # Given: 첫 배치 저장 중 프로세스가 중단되는 실행
+        crashing_client = make_bq_client()
+        crashing_client.store_competitor_pages.side_effect = KeyboardInterrupt
+        with pytest.raises(KeyboardInterrupt):
+            self.run_main(crashing_client)
+        assert os.path.exists(self.journal_path)
+        requested = self.mock_get.call_count
+        self.mock_get.reset_mock()
+
+        # When: 다시 실행
+        bq_client = make_bq_client()
+        result = self.run_main(bq_client)
+
+        # Then: 저널에 기록된 페이지는 다시 요청하지 않고 저장
+        assert result is True
+        pages = [call.args[0][0]['url'] for call in bq_client.store_competitor_pages.call_args_list]
+        assert "https://example.com/" in pages
+        assert self.mock_get.call_count < requested
+        assert not os.path.exists(self.journal_path)
+
+
+class TestCommands:
+    """reextract/reconcile-index/merge-summaries/collect 명령 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.bq_client = Mock()
+
+    def test_reextract_writes_archived_pages(self, tmp_path):
+        """아카이브의 200 응답만 다시 추출해 JSONL로 저장하는지 테스트"""
+        # Given: 200 응답 하나와 404 응답 하나가 있는 아카이브
+        archive_dir = str(tmp_path / "archive")
+        archive = ResponseArchive(archive_dir)
+        archive.append("https://a.com/", "A", "<html><title>T</title><body>본문</body></html>".encode('utf-8'),
+                       {'Content-Type': 'text/html; charset=utf-8'})
+        archive.append("https://a.com/missing", "A", b"", {}, status_code=404)
+        archive.close()
+        output = str(tmp_path / "pages.jsonl")
+
+        # When
+        args = main_module.parse_args(['reextract', '--output', output, '--archive-dir', archive_dir,
+                                       '--workers', '1'])
+        exit_code = main_module.run_command(args)
+
+        # Then
+        assert exit_code == 0
+        with open(output, encoding='utf-8') as f:
+            pages = [json.loads(line) for line in f]
+        assert [(page['url'], page['page_title']) for page in pages] == [("https://a.com/", "T")]
+
+    def test_reconcile_index_replaces_index(self, tmp_path):
+        """BigQuery 최신 지문으로 인덱스를 다시 만들고, 조회 실패 시 실패 코드를 반환하는지 테스트"""
+        # Given
+        index_path = str(tmp_path / "index.sqlite3")
+        self.bq_client.get_all_latest_content_fingerprints.return_value = [
+            {'competitor_name': "A", 'url': "https://a.com/", 'content_hash': "h",
+             'content_simhash': "", 'collected_at': "2024-01-01T00:00:00"}
+        ]
+        args = main_module.parse_args(['reconcile-index', '--index-path', index_path])
+
+        # When
+        with patch.object(main_module, 'create_bigquery_client', return_value=self.bq_client):
+            exit_code = main_module.run_command(args)
+
+            # Then
+            assert exit_code == 0
+            hash_index = ContentHashIndex(index_path)
+            assert hash_index.get("A", "https://a.com/")['content_hash'] == "h"
+            hash_index.close()
+
+            self.bq_client.get_all_latest_content_fingerprints.return_value = None
+            assert main_module.run_command(args) == 1
+
+    def test_merge_summaries_exit_code(self, tmp_path):
+        """샤드가 누락되면 실패 코드를 반환하는지 테스트"""
+        # Given: 두 샤드 중 하나만 요약을 남긴 실행
+        summary_dir = str(tmp_path / "summaries")
+        save_run_summary(summary_dir, {'run_id': "r1", 'shard': 0, 'num_shards': 2, 'success': True,
+                                       'competitors': ["A"], 'new_pages': {"A": 1},
+                                       'started_at': 0.0, 'finished_at': 1.0})
+        output = str(tmp_path / "merged.json")
+
+        # When
+        exit_code = main_module.run_command(main_module.parse_args([
+            'merge-summaries', '--run-id', "r1", '--summary-dir', summary_dir, '--output', output
+        ]))
+
+        # Then
+        assert exit_code == 1
+        with open(output, encoding='utf-8') as f:
+            assert json.load(f)['success'] is False
+
+    def test_collect_exit_code_follows_main(self):
+        """collect 명령이 main()의 결과를 종료 코드로 반환하는지 테스트"""
+        # Given
+        args = main_module.parse_args(['collect', '--shard', '1', '--num-shards', '2', '--run-id', "r1"])
+
+        # When & Then
+        with patch.object(main_module, 'main', return_value=False) as mock_main:
+            assert main_module.run_command(args) == 1
+            mock_main.assert_called_once_with(1, 2, "r1")
+        with patch.object(main_module, 'main', return_value=True):
+            assert main_module.run_command(args) == 0
@@ -0,0 +1,242 @@
+"""
+수집 지표 및 HTTP 단계 측정 단위 테스트
+"""
+
+import sys
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import patch
+
+import pytest
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.sharding import shard_state_path
+from src.data_collection.web_scraper import WebScraper
+from src.utils.http_transport import mount_instrumented_adapter
+from src.utils.metrics import (
+    BandwidthTracker, LatencyHistogram, ScrapeMetrics, hosts_by_total_time,
+    load_merged_metrics_summary, load_metrics_summary, scrape_metrics
+)
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    """로컬 테스트 서버 핸들러 (keep-alive)"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = b"<html><title>local</title><body>ok</body></html>"
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestLatencyHistogram:
+    """LatencyHistogram 클래스 테스트"""
+
+    def test_percentiles(self):
+        """버킷 기반 백분위 추정 테스트"""
+        histogram = LatencyHistogram()
+        for value in [0.5] * 90 + [300] * 10:
+            histogram.observe(value)
+
+        assert histogram.count == 100
+        assert histogram.percentile(0.5) == 1
+        assert histogram.percentile(0.95) == 300  # 버킷 상한(500)이 최대값으로 제한됨
+        assert histogram.to_dict()['buckets']['le_1'] == 90
+
+    def test_empty(self):
+        """빈 히스토그램 테스트"""
+        assert LatencyHistogram().percentile(0.5) == 0.0
+        assert LatencyHistogram().to_dict()['mean_ms'] == 0.0
+
+
+class TestScrapeMetrics:
+    """ScrapeMetrics 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.metrics = ScrapeMetrics()
+
+    def test_summary_and_totals(self, tmp_path):
+        """호스트별 요약, 느린 호스트 정렬, 저장 테스트"""
+        # Given: 두 호스트의 단계 시간
+        self.metrics.record("a.com", "ttfb", 0.2)
+        self.metrics.record("a.com", "parse", 0.01)
+        self.metrics.record("b.com", "ttfb", 0.05)
+
+        # When: 요약 생성 및 저장
+        summary = self.metrics.summary()
+        path = str(tmp_path / "metrics.json")
+        saved = self.metrics.save(path)
+
+        # Then: 단계별 통계와 네트워크/CPU 합계가 계산되어야 함
+        assert summary["a.com"]["ttfb"]["count"] == 1
+        assert summary["a.com"]["ttfb"]["mean_ms"] == 200.0
+        assert hosts_by_total_time(summary)[0][0] == "a.com"
+        assert "네트워크 200 ms / CPU 10 ms" in self.metrics.format_summary()
+        assert saved is True
+        assert load_metrics_summary(path)["hosts"] == summary
+
+    def test_timer_and_reset(self):
+        """timer 컨텍스트 매니저와 초기화 테스트"""
+        with self.metrics.timer("a.com", "hash"):
+            pass
+
+        assert self.metrics.summary()["a.com"]["hash"]["count"] == 1
+        self.metrics.reset()
+        assert self.metrics.summary() == {}
+        assert self.metrics.format_summary() == "수집된 지표가 없습니다."
+
+
+class TestMergedMetricsSummary:
+    """샤드별 지표 파일 병합 테스트"""
+
+    def save_shard(self, path, shard, num_shards, ttfb_seconds):
+        """샤드 하나의 지표를 main.py와 같은 경로 규칙으로 저장 (호스트별 ttfb 초 목록)"""
+        metrics = ScrapeMetrics()
+        bandwidth = BandwidthTracker(budget_bytes=1000)
+        for host, values in ttfb_seconds.items():
+            for seconds in values:
+                metrics.record(host, "ttfb", seconds)
+            bandwidth.record(host, 100, 300)
+        bandwidth.record_deferred(f"https://example.com/{shard}")
+        shard_path = shard_state_path(path, shard, num_shards)
+        assert metrics.save(shard_path, extra={'bandwidth': bandwidth.summary()}) is True
+        return shard_path
+
+    def test_shard_files_are_merged(self, tmp_path):
+        """샤드 파일을 모두 읽어 히스토그램과 전송량을 합치는지 테스트"""
+        # Given: 두 샤드가 같은 호스트/다른 호스트 지표를 저장 (원래 경로에는 파일 없음)
+        path = str(tmp_path / "scrape_metrics.json")
+        self.save_shard(path, 0, 2, {"a.com": [0.001] * 9})
+        self.save_shard(path, 1, 2, {"a.com": [0.3], "b.com": [0.01]})
+
+        # When: 병합 요약 조회
+        merged = load_merged_metrics_summary(path)
+
+        # Then: 버킷 단위로 합쳐 백분위를 다시 계산하고 전송량도 합산됨
+        assert not os.path.exists(path)
+        assert merged['files'] == 2
+        ttfb = merged['hosts']["a.com"]["ttfb"]
+        assert ttfb['count'] == 10
+        assert ttfb['p50_ms'] == 1
+        assert ttfb['p95_ms'] == 300
+        assert ttfb['max_ms'] == 300.0
+        assert set(merged['hosts']) == {"a.com", "b.com"}
+        assert merged['bandwidth']['hosts']["a.com"]['wire_bytes'] == 200
+        assert merged['bandwidth']['wire_bytes'] == 300
+        assert merged['bandwidth']['compression_ratio'] == 3.0
+        assert merged['bandwidth']['budget_bytes'] == 2000
+        assert sorted(merged['bandwidth']['deferred_urls']) == ["https://example.com/0", "https://example.com/1"]
+
+    def test_only_latest_shard_layout_is_read(self, tmp_path):
+        """샤드 수가 다른 이전 실행 파일은 합치지 않는지 테스트"""
+        # Given: 이전 단일 실행 파일과 이후 두 샤드 실행 파일
+        path = str(tmp_path / "scrape_metrics.json")
+        self.save_shard(path, 0, 1, {"old.com": [0.5]})
+        os.utime(path, (1, 1))
+        self.save_shard(path, 0, 2, {"a.com": [0.001]})
+        self.save_shard(path, 1, 2, {"b.com": [0.001]})
+
+        # When & Then: 가장 최근 실행(두 샤드)만 합침
+        merged = load_merged_metrics_summary(path)
+        assert merged['files'] == 2
+        assert set(merged['hosts']) == {"a.com", "b.com"}
+
+    def test_missing_files(self, tmp_path):
+        """지표 파일이 없으면 None을 반환하는지 테스트"""
+        assert load_merged_metrics_summary(str(tmp_path / "scrape_metrics.json")) is None
+
+    def test_route_returns_merged_shard_metrics(self, tmp_path):
+        """지표 API가 샤드 파일을 합친 마지막 실행 지표를 반환하는지 테스트"""
+        pytest.importorskip("fastapi")
+        pytest.importorskip("httpx")
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from api.routes import metrics as metrics_route
+
+        # Given: 샤드 실행 지표 파일만 있는 상태
+        path = str(tmp_path / "scrape_metrics.json")
+        self.save_shard(path, 0, 2, {"a.com": [0.2]})
+        self.save_shard(path, 1, 2, {"b.com": [0.1]})
+        app = FastAPI()
+        app.include_router(metrics_route.router)
+
+        # When: 이 프로세스의 지표가 없는 상태로 조회
+        with patch.object(metrics_route, 'SCRAPE_METRICS_PATH', path), \
+                patch.object(metrics_route.scrape_metrics, 'summary', return_value={}):
+            response = TestClient(app).get("/metrics/scraping")
+
+        # Then: 두 샤드의 호스트가 모두 포함됨
+        assert response.status_code == 200
+        body = response.json()
+        assert body['source'] == "last_run"
+        assert body['files'] == 2
+        assert [item['host'] for item in body['slowest_hosts']] == ["a.com", "b.com"]
+
+
+class TestRequestPhases:
+    """실제 요청의 단계 시간 기록 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        scrape_metrics.reset()
+
+    def test_connection_phases_recorded(self):
+        """로컬 서버 요청 시 DNS/연결/TTFB가 기록되고 연결이 재사용되는지 테스트"""
+        # Given: 로컬 HTTP 서버와 측정 어댑터를 연결한 세션
+        server = HTTPServer(('127.0.0.1', 0), _PageHandler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        session = requests.Session()
+        mount_instrumented_adapter(session)
+        url = f"http://localhost:{server.server_address[1]}/"
+
+        try:
+            # When: 같은 호스트에 두 번 요청
+            assert session.get(url, timeout=5).status_code == 200
+            assert session.get(url, timeout=5).status_code == 200
+        finally:
+            session.close()
+            server.shutdown()
+            server.server_close()
+
+        # Then: 연결 단계는 한 번, TTFB는 요청마다 기록되어야 함
+        phases = scrape_metrics.summary()["localhost"]
+        assert phases["dns"]["count"] == 1
+        assert phases["connect"]["count"] == 1
+        assert phases["ttfb"]["count"] == 2
+        assert "tls" not in phases
+
+    def test_unresolvable_host_raises_connection_error(self):
+        """이름 해석 실패가 requests ConnectionError로 전달되는지 테스트"""
+        session = requests.Session()
+        mount_instrumented_adapter(session)
+
+        with pytest.raises(requests.ConnectionError):
+            session.get("http://nonexistent.invalid/", timeout=2)
+
+    @patch('requests.Session.get')
+    def test_scraper_records_cpu_phases(self, mock_get):
+        """스크래퍼가 다운로드/파싱/추출/해시 시간을 기록하는지 테스트"""
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><title>t</title><body>text</body></html>"
+        response._content_consumed = True
+        response.headers['Content-Type'] = 'text/html'
+        mock_get.return_value = response
+
+        WebScraper(delay=0).scrape_page("https://a.example.com/pricing", "a")
+
+        phases = scrape_metrics.summary()["a.example.com"]
+        assert set(phases) == {'download', 'parse', 'extract', 'hash'}
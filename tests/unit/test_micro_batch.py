@@ -0,0 +1,75 @@
+"""
+마이크로 배치 버퍼 단위 테스트
+"""
+
+import sys
+import os
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.micro_batch import MicroBatchBuffer
+
+
+class FakeClock:
+    """수동으로 진행하는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMicroBatchBuffer:
+    """MicroBatchBuffer 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.clock = FakeClock()
+        self.batches = []
+        self.buffer = MicroBatchBuffer(self._store, max_rows=3, max_wait_seconds=5,
+                                       clock=self.clock)
+
+    def _store(self, batch):
+        self.batches.append([row['id'] for row in batch])
+        return not any(row.get('fail') for row in batch)
+
+    def test_flush_by_size_and_time(self):
+        """행 수가 차면 바로, 덜 찼으면 대기 시간이 지난 뒤 비우는지 테스트"""
+        # Given/When: 4개 행 추가
+        for i in range(4):
+            self.buffer.add({'id': i})
+
+        # Then: 3개는 즉시 저장되고 1개는 대기
+        assert self.batches == [[0, 1, 2]]
+        assert len(self.buffer) == 1
+
+        # 대기 시간 전에는 비우지 않음
+        self.clock.now += 4
+        assert self.buffer.flush_if_due() is False
+
+        self.clock.now += 1
+        assert self.buffer.flush_if_due() is True
+        assert self.batches == [[0, 1, 2], [3]]
+        assert self.buffer.flush_if_due() is False
+
+    def test_failed_batches_reported_on_close(self):
+        """실패한 배치는 건수로 기록되고 close()가 False를 반환하는지 테스트"""
+        self.buffer.add({'id': 0, 'fail': True})
+        self.buffer.add({'id': 1})
+        self.buffer.add({'id': 2})
+        self.buffer.add({'id': 3})
+
+        assert self.buffer.close() is False
+        assert self.batches == [[0, 1, 2], [3]]
+        assert (self.buffer.failed_batches, self.buffer.failed_rows) == (1, 3)
+        assert (self.buffer.flushed_batches, self.buffer.flushed_rows) == (1, 1)
+
+        # 예외도 실패로 처리
+        def raising(batch):
+            raise RuntimeError("insert failed")
+        buffer = MicroBatchBuffer(raising, max_rows=10)
+        buffer.add({'id': 0})
+        assert buffer.close() is False
+        assert MicroBatchBuffer(raising).close() is True
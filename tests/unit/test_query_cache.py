@@ -0,0 +1,188 @@
+"""
+조회 결과 캐시 모듈 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+from google.cloud import bigquery
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+from src.utils.query_cache import QueryCache, cache_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestQueryCache:
+    """TTL/LRU/테이블 무효화 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.clock = FakeClock()
+        self.cache = QueryCache(max_entries=2, ttl_seconds=60, clock=self.clock)
+
+    def test_key_ignores_whitespace_but_not_parameters(self):
+        """들여쓰기만 다른 SQL은 같은 키, 파라미터가 다르면 다른 키인지 테스트"""
+        # Given
+        param_a = [bigquery.ScalarQueryParameter('url', 'STRING', 'https://a.com')]
+        param_b = [bigquery.ScalarQueryParameter('url', 'STRING', 'https://b.com')]
+
+        # When & Then
+        assert cache_key("SELECT *\n   FROM t WHERE url = @url", param_a) == \
+            cache_key("SELECT * FROM t WHERE url = @url", param_a)
+        assert cache_key("SELECT * FROM t WHERE url = @url", param_a) != \
+            cache_key("SELECT * FROM t WHERE url = @url", param_b)
+
+    def test_entries_expire_after_ttl(self):
+        """TTL이 지난 항목은 적중하지 않는지 테스트"""
+        # Given: 저장된 항목
+        self.cache.put(('q', '[]'), [1], ['t'])
+
+        # When & Then: TTL 전에는 적중, 후에는 만료
+        assert self.cache.get(('q', '[]')) == (True, [1])
+        self.clock.now += 61
+        assert self.cache.get(('q', '[]')) == (False, None)
+        assert self.cache.stats()['entries'] == 0
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """상한을 넘으면 가장 오래 사용하지 않은 항목이 제거되는지 테스트"""
+        # Given: a, b 저장 후 a 사용
+        self.cache.put(('a', '[]'), 'A', ['t'])
+        self.cache.put(('b', '[]'), 'B', ['t'])
+        self.cache.get(('a', '[]'))
+
+        # When: 세 번째 항목 저장
+        self.cache.put(('c', '[]'), 'C', ['t'])
+
+        # Then: b가 제거됨
+        assert self.cache.get(('b', '[]'))[0] is False
+        assert self.cache.get(('a', '[]'))[0] is True
+        assert self.cache.get(('c', '[]'))[0] is True
+        assert self.cache.evictions == 1
+
+    def test_invalidate_by_table(self):
+        """테이블을 읽은 항목만 무효화되는지 테스트"""
+        # Given: 서로 다른 테이블을 읽은 항목
+        self.cache.put(('a', '[]'), 'A', ['competitor_data'])
+        self.cache.put(('b', '[]'), 'B', ['analysis_results'])
+
+        # When: competitor_data 무효화
+        removed = self.cache.invalidate_tables(['competitor_data'])
+
+        # Then
+        assert removed == 1
+        assert self.cache.get(('a', '[]'))[0] is False
+        assert self.cache.get(('b', '[]'))[0] is True
+
+
+class TestBigQueryClientQueryCache:
+    """BigQueryClient 조회 캐시 사용 테스트"""
+
+    @patch('google.cloud.bigquery.Client')
+    def test_repeated_reads_use_cache_until_insert(self, mock_bigquery_client):
+        """같은 조회는 캐시에서 반환하고 삽입 후에는 다시 조회하는지 테스트"""
+        # Given: 조회 결과를 반환하는 BigQuery 클라이언트
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        mock_client.query.return_value.result.return_value = [{'id': 'a', 'competitor_name': 'A'}]
+        mock_client.insert_rows_json.return_value = []
+        client = BigQueryClient("test-project", "test_dataset")
+
+        # When: 같은 조회 두 번 (반환값 수정은 캐시에 영향 없어야 함)
+        first = client.query_competitor_data('A', limit=10)
+        first[0]['id'] = 'modified'
+        second = client.query_competitor_data('A', limit=10)
+
+        # Then: 쿼리는 한 번만 실행됨
+        assert mock_client.query.call_count == 1
+        assert second == [{'id': 'a', 'competitor_name': 'A'}]
+
+        # When: 다른 파라미터로 조회
+        client.query_competitor_data('B', limit=10)
+
+        # Then: 새 쿼리 실행
+        assert mock_client.query.call_count == 2
+
+        # When: 삽입 후 같은 조회
+        client.insert_competitor_data([{
+            'id': 'b', 'competitor_name': 'A', 'url': 'https://a.com', 'page_title': '',
+            'content': '', 'meta_description': '', 'collected_at': '2024-01-01T00:00:00',
+            'content_hash': 'h'
+        }])
+        client.query_competitor_data('A', limit=10)
+
+        # Then: 캐시가 무효화되어 다시 조회
+        assert mock_client.query.call_count == 3
+
+    @patch('google.cloud.bigquery.Client')
+    def test_failed_queries_are_not_cached(self, mock_bigquery_client):
+        """실패한 조회는 캐시하지 않는지 테스트"""
+        # Given: 첫 조회는 실패, 두 번째는 성공
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        mock_client.query.side_effect = [Exception("timeout"), Mock(result=Mock(return_value=[
+            {'content_hash': 'h1'}
+        ]))]
+        client = BigQueryClient("test-project", "test_dataset")
+
+        # When & Then: 실패 후 재조회 시 새로 실행
+        assert client.get_latest_content_hash('A', 'https://a.com') == ""
+        assert client.get_latest_content_hash('A', 'https://a.com') == 'h1'
+        assert mock_client.query.call_count == 2
+
+
+class TestQueryCacheWriteRace:
+    """쓰기와 겹친 조회의 캐시 저장 테스트"""
+
+    def test_result_of_read_overlapping_write_is_not_cached(self):
+        """조회 도중 테이블이 무효화되면 그 결과를 저장하지 않는지 테스트"""
+        # Given: 조회 시작 전 세대
+        cache = QueryCache()
+        generation = cache.generation(['competitor_data'])
+
+        # When: 조회 도중 쓰기 완료로 무효화된 뒤 이전 결과 저장 시도
+        cache.invalidate_tables(['competitor_data'])
+        stored = cache.put(('q', '[]'), ['old'], ['competitor_data'], generation=generation)
+
+        # Then: 저장되지 않음 (다른 테이블 무효화는 영향 없음)
+        assert stored is False
+        assert cache.get(('q', '[]'))[0] is False
+        generation = cache.generation(['competitor_data'])
+        cache.invalidate_tables(['analysis_results'])
+        assert cache.put(('q', '[]'), ['new'], ['competitor_data'], generation=generation) is True
+
+    @patch('google.cloud.bigquery.Client')
+    def test_write_invalidates_after_insert(self, mock_bigquery_client):
+        """삽입 중 조회된 이전 결과가 삽입 후 캐시에 남지 않는지 테스트"""
+        # Given: 삽입 도중 같은 조회가 실행되는 클라이언트
+        mock_client = Mock()
+        mock_bigquery_client.return_value = mock_client
+        mock_client.query.return_value.result.return_value = [{'content_hash': 'old'}]
+        client = BigQueryClient("test-project", "test_dataset")
+
+        def insert_while_reading(table, rows):
+            assert client.get_latest_content_hash('A', 'https://a.com') == 'old'
+            return []
+        mock_client.insert_rows_json.side_effect = insert_while_reading
+
+        # When: 삽입 후 같은 조회
+        client.insert_competitor_data([{
+            'id': 'b', 'competitor_name': 'A', 'url': 'https://a.com', 'page_title': '',
+            'content': '', 'meta_description': '', 'collected_at': '2024-01-01T00:00:00',
+            'content_hash': 'new'
+        }])
+        mock_client.query.return_value.result.return_value = [{'content_hash': 'new'}]
+
+        # Then: 삽입 중 캐시된 이전 결과가 아닌 새 결과를 조회
+        assert client.get_latest_content_hash('A', 'https://a.com') == 'new'
+        assert mock_client.query.call_count == 2
@@ -0,0 +1,95 @@
+"""
+호스트별 속도 제한기 단위 테스트
+"""
+
+import sys
+import os
+import time
+import asyncio
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.rate_limiter import TokenBucket, HostRateLimiter
+from src.data_collection.async_scraper import AsyncWebScraper
+
+
+class TestTokenBucket:
+    """TokenBucket 클래스 테스트"""
+
+    def test_burst_is_immediate(self):
+        """버스트 크기만큼은 대기 없이 허용되는지 테스트"""
+        bucket = TokenBucket(requests_per_second=1.0, burst=3)
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits == [0.0, 0.0, 0.0]
+
+    def test_reservations_are_spaced_by_rate(self):
+        """버스트 이후 요청이 1/rate 간격으로 예약되는지 테스트"""
+        bucket = TokenBucket(requests_per_second=10.0, burst=1)
+
+        waits = [bucket.reserve() for _ in range(3)]
+
+        assert waits[0] == 0.0
+        assert abs(waits[1] - 0.1) < 0.01
+        assert abs(waits[2] - 0.2) < 0.01
+
+    def test_unlimited_when_rate_missing(self):
+        """rate가 없으면 제한하지 않는지 테스트"""
+        bucket = TokenBucket(requests_per_second=None)
+
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+
+class TestHostRateLimiter:
+    """HostRateLimiter 클래스 테스트"""
+
+    def test_hosts_are_independent(self):
+        """서로 다른 호스트가 버킷을 공유하지 않는지 테스트"""
+        limiter = HostRateLimiter(requests_per_second=1.0, burst=1)
+
+        limiter.bucket_for("https://a.com/x").reserve()
+
+        assert limiter.bucket_for("https://b.com/y").reserve() == 0.0
+        assert limiter.bucket_for("https://A.com/z").reserve() > 0.0
+
+    def test_configure_overrides_default(self):
+        """호스트별 설정이 기본값보다 우선하는지 테스트"""
+        limiter = HostRateLimiter(requests_per_second=1.0, burst=1)
+        limiter.configure("https://fast.com", requests_per_second=100.0, burst=5)
+
+        bucket = limiter.bucket_for("https://fast.com/pricing")
+
+        assert bucket.rate == 100.0
+        assert bucket.burst == 5
+
+
+class TestAsyncScraperRateLimit:
+    """비동기 스크래퍼의 호스트별 속도 제한 통합 테스트"""
+
+    @patch('src.data_collection.async_scraper.AsyncWebScraper._fetch_page_data')
+    def test_wall_clock_scales_with_slowest_host(self, mock_fetch):
+        """전체 소요 시간이 총 페이지 수가 아닌 가장 느린 호스트에 비례하는지 테스트"""
+        # Given: 4개 호스트, 호스트당 3페이지, 호스트당 초당 20회 제한
+        mock_fetch.side_effect = lambda url, name: {'url': url, 'competitor_name': name}
+        competitors = [
+            {
+                "name": f"c{i}",
+                "url": f"https://c{i}.example.com",
+                "target_pages": ["/a", "/b", "/c"],
+                "rate_limit": {"requests_per_second": 20.0, "burst": 1}
+            }
+            for i in range(4)
+        ]
+        scraper = AsyncWebScraper(delay=0, max_concurrency=12)
+
+        # When: 동시 스크래핑
+        start = time.monotonic()
+        results = asyncio.run(scraper.scrape_many(competitors))
+        elapsed = time.monotonic() - start
+
+        # Then: 호스트당 2회 대기(0.1초)만큼만 걸려야 함 (전역 직렬이면 0.55초)
+        assert len(results) == 12
+        assert 0.09 <= elapsed < 0.3
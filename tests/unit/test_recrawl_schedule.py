@@ -0,0 +1,135 @@
+"""
+적응형 재수집 일정 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.analysis.basic_analyzer import BasicAnalyzer
+from src.data_collection.recrawl_schedule import HOUR, RecrawlSchedule
+from src.data_collection.web_scraper import WebScraper
+from tests.unit.test_crawler import make_response
+
+DAY = 24 * HOUR
+
+
+class FakeClock:
+    """수동으로 진행하는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestRecrawlSchedule:
+    """RecrawlSchedule 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.clock = FakeClock()
+        self.schedules = []
+
+    def teardown_method(self):
+        """각 테스트 메서드 실행 후 연결 정리"""
+        for schedule in self.schedules:
+            schedule.close()
+
+    def open(self, path):
+        schedule = RecrawlSchedule(str(path), clock=self.clock)
+        self.schedules.append(schedule)
+        return schedule
+
+    def simulate_daily(self, path, url, changes_every, days):
+        """매일 실행하며 수집 시각이 된 경우만 확인, changes_every일마다 변경되는 페이지"""
+        fetches = 0
+        last_version = None
+        for day in range(days):
+            schedule = self.open(path)
+            if schedule.is_due(url):
+                version = day // changes_every
+                schedule.record_checks([(url, last_version is not None and version != last_version)])
+                last_version = version
+                fetches += 1
+            self.clock.now += DAY
+        return fetches
+
+    def test_due_state_persists_and_priority_caps_interval(self, tmp_path):
+        """확인한 URL은 다음 수집 시각 전까지 대상이 아니고, 가격 페이지는 최대 간격이 짧은지 테스트"""
+        # Given: 처음 보는 URL은 모두 수집 대상
+        path = tmp_path / "schedule.sqlite3"
+        schedule = self.open(path)
+        pricing, blog = "https://a.com/pricing", "https://a.com/blog/post"
+        assert schedule.is_due(pricing) and schedule.is_due(blog)
+
+        # When: 확인 후 다시 열기
+        schedule.record_checks([(pricing, False), (blog, False)])
+        reopened = self.open(path)
+
+        # Then: 최소 간격 전에는 대상이 아니고, 다음 날에는 다시 대상이어야 함
+        assert not reopened.is_due(pricing)
+        assert reopened.skip_if_not_due(blog) is True
+        assert reopened.skipped == 1
+        self.clock.now += 1 * DAY
+        assert self.open(path).is_due(blog)
+
+        # 한 달 동안 변경이 없던 페이지: 가격 페이지는 2일, 블로그는 14일로 제한
+        assert schedule.interval_for(pricing, 30, 0, 30 * DAY) == 2 * DAY
+        assert schedule.interval_for(blog, 30, 0, 30 * DAY) == 14 * DAY
+        assert schedule.interval_for(blog, 30, 30, 30 * DAY) == 20 * HOUR
+
+    def test_interval_follows_change_rate(self, tmp_path):
+        """자주 바뀌는 페이지는 매일, 드물게 바뀌는 페이지는 훨씬 적게 수집하는지 테스트"""
+        volatile = self.simulate_daily(tmp_path / "v.sqlite3", "https://a.com/news", 1, 60)
+        stable = self.simulate_daily(tmp_path / "s.sqlite3", "https://a.com/about", 30, 60)
+
+        assert volatile >= 50
+        assert stable <= 15
+
+    def test_seed_from_analysis(self, tmp_path):
+        """변경 분석 결과로 일정을 초기화하는지 테스트"""
+        # Given: 30일 동안 버전이 6개 저장된 페이지와 한 번만 저장된 페이지
+        history = [
+            {'url': "https://a.com/news", 'content_hash': f"h{i}",
+             'collected_at': f"2023-10-{i * 5 + 1:02d}T00:00:00"}
+            for i in range(6)
+        ] + [{'url': "https://a.com/about", 'content_hash': "x", 'collected_at': "2023-11-10T00:00:00"}]
+        analysis = BasicAnalyzer().analyze_content_changes(history)
+        schedule = self.open(tmp_path / "schedule.sqlite3")
+
+        # When: 초기화
+        count = schedule.seed_from_analysis(analysis['page_analysis'])
+
+        # Then: 두 URL이 일정에 들어가고, 기존 항목은 덮어쓰지 않아야 함
+        assert count == 2
+        assert schedule.count() == 2
+        assert schedule.seed_from_analysis(analysis['page_analysis']) == 0
+
+
+class TestScraperSchedule:
+    """재수집 일정을 사용하는 스크래퍼 테스트"""
+
+    @patch('requests.Session.get')
+    def test_not_due_pages_not_requested(self, mock_get, tmp_path):
+        """수집 시각 전인 대상 페이지는 요청하지 않는지 테스트"""
+        # Given: "/pricing"만 방금 확인한 일정
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        schedule = RecrawlSchedule(str(tmp_path / "schedule.sqlite3"))
+        schedule.record_checks([("https://example.com/pricing", False)])
+        scraper = WebScraper(delay=0, recrawl_schedule=RecrawlSchedule(schedule.path))
+        config = {"name": "test", "url": "https://example.com", "target_pages": ["/", "/pricing"]}
+
+        # When: 수집
+        results = scraper.scrape_competitor(config)
+
+        # Then: 수집 시각이 된 페이지만 요청해야 함
+        assert [r['url'] for r in results] == ["https://example.com/"]
+        assert [call.args[0] for call in mock_get.call_args_list] == ["https://example.com/"]
+        assert scraper.recrawl_schedule.skipped == 1
+        schedule.close()
+        scraper.recrawl_schedule.close()
@@ -0,0 +1,149 @@
+"""
+스키마 기반 행 직렬화 모듈 단위 테스트
+"""
+
+import sys
+import os
+import json
+from datetime import datetime
+from unittest.mock import patch
+
+from google.cloud import bigquery
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+from src.utils.local_bigquery import LocalBigQueryClient
+from src.utils.row_serializer import TABLE_SCHEMAS, RowSerializer
+
+
+def make_page(i, **overrides):
+    page = {
+        'id': f"id-{i}",
+        'competitor_name': "A",
+        'url': f"https://a.com/{i}",
+        'page_title': f"페이지 {i}",
+        'content': "본문",
+        'meta_description': "",
+        'collected_at': "2024-01-01T10:00:00",
+        'content_hash': f"h{i}",
+        'content_simhash': None,
+        'status_code': 200
+    }
+    page.update(overrides)
+    return page
+
+
+class TestRowSerializer:
+    """RowSerializer 변환/검증 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.serializer = RowSerializer(TABLE_SCHEMAS['competitor_data'])
+
+    def test_converts_rows_to_schema_fields(self):
+        """스키마 필드만 남기고 값을 변환하는지 테스트"""
+        # Given: 스키마에 없는 필드와 datetime 값을 가진 행
+        row = make_page(1, collected_at=datetime(2024, 1, 2, 3, 4, 5))
+
+        # When: 직렬화
+        batch = self.serializer.serialize([row])
+
+        # Then: 스키마 필드만 남고 시각은 ISO 문자열로 변환됨
+        assert batch.errors == []
+        assert 'status_code' not in batch.rows[0]
+        assert batch.rows[0]['collected_at'] == "2024-01-02T03:04:05"
+        compact = json.dumps(batch.rows, ensure_ascii=False, separators=(',', ':'))
+        assert batch.json_bytes == len(compact.encode('utf-8'))
+
+    def test_bad_rows_are_reported_without_failing_batch(self):
+        """잘못된 행만 제외되고 인덱스와 이유가 보고되는지 테스트"""
+        # Given: 필수 필드 누락, 잘못된 시각, 문자열이 아닌 제목을 가진 행이 섞인 배치
+        rows = [
+            make_page(0),
+            make_page(1, content_hash=None),
+            make_page(2, collected_at="어제"),
+            make_page(3, page_title=123),
+            make_page(4),
+        ]
+
+        # When: 직렬화
+        batch = self.serializer.serialize(rows)
+
+        # Then: 정상 행 2개만 남고 나머지는 이유와 함께 보고됨
+        assert [row['id'] for row in batch.rows] == ["id-0", "id-4"]
+        assert [index for index, _ in batch.errors] == [1, 2, 3]
+        assert "content_hash" in batch.errors[0][1]
+        assert "collected_at" in batch.errors[1][1]
+        assert "page_title" in batch.errors[2][1]
+
+    def test_string_column_json_encodes_structures(self):
+        """STRING 컬럼에 들어온 dict는 JSON 문자열, 빈 dict는 NULL로 저장하는지 테스트"""
+        # Given: 분석 결과 테이블 직렬화기
+        serializer = RowSerializer(TABLE_SCHEMAS['analysis_results'])
+        base = {'id': "a", 'competitor_name': "A", 'analysis_type': "keyword",
+                'analysis_date': "2024-01-01", 'summary': "", 'created_at': "2024-01-01T00:00:00"}
+
+        # When: 결과가 있는 행과 빈 행 직렬화
+        batch = serializer.serialize([dict(base, results={'키워드': 3}), dict(base, results={})])
+
+        # Then: JSON 문자열과 NULL
+        assert json.loads(batch.rows[0]['results']) == {'키워드': 3}
+        assert batch.rows[1]['results'] is None
+
+    def test_repeated_and_integer_fields(self):
+        """REPEATED/INTEGER 필드 변환과 검증 테스트"""
+        # Given: 반복 문자열과 정수 필드 스키마
+        serializer = RowSerializer([
+            bigquery.SchemaField('block_hashes', 'STRING', mode='REPEATED'),
+            bigquery.SchemaField('content_length', 'INTEGER'),
+        ])
+
+        # When: 정상 행과 불리언 정수 행 직렬화
+        batch = serializer.serialize([
+            {'block_hashes': ["a", "b"], 'content_length': "12"},
+            {'block_hashes': ["a"], 'content_length': True},
+        ])
+
+        # Then: 문자열 정수는 변환되고 불리언은 거부됨
+        assert batch.rows == [{'block_hashes': ["a", "b"], 'content_length': 12}]
+        assert batch.errors[0][0] == 1
+
+
+class TestBigQueryClientSerialization:
+    """BigQueryClient 삽입 경로의 직렬화기 사용 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.local = LocalBigQueryClient("test-project")
+        self.client = BigQueryClient("test-project", "test_dataset", client=self.local)
+
+    def test_table_metadata_is_fetched_once(self):
+        """테이블 메타데이터를 테이블별로 한 번만 조회하는지 테스트"""
+        # Given: get_table 호출 추적
+        with patch.object(self.local, 'get_table', wraps=self.local.get_table) as get_table:
+            # When: 같은 테이블에 두 번 삽입
+            assert self.client.insert_competitor_data([make_page(0)]) is True
+            assert self.client.insert_competitor_data([make_page(1)]) is True
+
+        # Then: 한 번만 조회
+        assert get_table.call_count == 1
+        assert len(self.local.tables['competitor_data']) == 2
+
+    def test_insert_skips_bad_rows(self):
+        """잘못된 행을 건너뛰고 나머지는 저장하는지 테스트"""
+        # When: 필수 필드가 빠진 행이 섞인 배치 삽입
+        result = self.client.insert_competitor_data([make_page(0), make_page(1, url=None)])
+
+        # Then: 정상 행만 저장되고 잘못된 행은 기록됨
+        assert result is True
+        assert [row['id'] for row in self.local.tables['competitor_data']] == ["id-0"]
+        assert len(self.client.rejected_rows) == 1
+        assert self.client.rejected_rows[0]['row']['id'] == "id-1"
+
+    def test_insert_fails_when_every_row_is_bad(self):
+        """모든 행이 잘못되면 실패로 처리하는지 테스트"""
+        # When & Then
+        assert self.client.insert_competitor_data([make_page(0, id=None)]) is False
+        assert 'competitor_data' not in self.local.tables
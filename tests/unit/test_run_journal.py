@@ -0,0 +1,147 @@
+"""
+수집 실행 저널 단위 테스트
+"""
+
+import sys
+import os
+import json
+import time
+from unittest.mock import patch
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.run_journal import RunJournal
+from src.data_collection.web_scraper import WebScraper
+from tests.unit.test_crawler import make_response
+
+
+def make_page(url, competitor_name="test", links=None):
+    """테스트용 페이지 데이터"""
+    page = {
+        'id': f"id-{url}",
+        'competitor_name': competitor_name,
+        'url': url,
+        'page_title': url,
+        'content': 'content',
+        'meta_description': '',
+        'collected_at': '2024-01-01T00:00:00',
+        'content_hash': 'hash',
+        'content_simhash': None
+    }
+    if links is not None:
+        page['links'] = links
+    return page
+
+
+class TestRunJournal:
+    """RunJournal 클래스 테스트"""
+
+    def test_resume_after_restart(self, tmp_path):
+        """기록한 페이지를 새 인스턴스가 이어받는지 테스트 (손상된 마지막 줄 무시)"""
+        # Given: 페이지 두 개를 기록하고 종료 중 마지막 줄이 잘린 저널
+        path = str(tmp_path / "journal.jsonl")
+        journal = RunJournal(path)
+        journal.record_page(make_page("https://a.com/"))
+        journal.record_page(make_page("https://a.com/pricing", links=["/plans"]))
+        journal.close()
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "page", "page": {"url": ')
+
+        # When: 다시 시작
+        resumed = RunJournal(path)
+
+        # Then: 완료된 페이지가 복원되어야 함
+        assert resumed.resumed is True
+        assert resumed.page_count == 2
+        assert resumed.completed_page("https://a.com/pricing", "test")['links'] == ["/plans"]
+        assert resumed.completed_page("https://a.com/pricing", "other") is None
+
+    def test_pages_are_read_back_from_file(self, tmp_path):
+        """페이지 본문은 메모리에 두지 않고 파일에서 읽으며, 잘린 줄 뒤에도 기록이 이어지는지 테스트"""
+        # Given: 마지막 줄이 잘린 저널을 이어받아 페이지 하나를 더 기록
+        path = str(tmp_path / "journal.jsonl")
+        journal = RunJournal(path)
+        journal.record_page(make_page("https://a.com/"))
+        journal.close()
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "page", "page": {"url": ')
+        resumed = RunJournal(path)
+        page = make_page("https://a.com/요금제", links=["/plans"])
+        resumed.record_page(page)
+
+        # When: 기록 후 원본을 수정
+        page['content'] = 'modified'
+
+        # Then: 메모리에는 위치만 있고, 기록 당시 내용이 파일에서 읽힘
+        assert list(resumed._offsets) == [("test", "https://a.com/"), ("test", "https://a.com/요금제")]
+        assert resumed.completed_page("https://a.com/요금제", "test")['content'] == 'content'
+        resumed.close()
+        reopened = RunJournal(path)
+        assert [p['url'] for p in reopened.pages()] == ["https://a.com/", "https://a.com/요금제"]
+
+    def test_expired_and_complete(self, tmp_path):
+        """만료된 저널은 폐기되고, 완료 시 파일이 삭제되는지 테스트"""
+        path = str(tmp_path / "journal.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'type': 'run', 'started_at': time.time() - 7200}) + "\n")
+            f.write(json.dumps({'type': 'page', 'page': make_page("https://a.com/")}) + "\n")
+
+        assert RunJournal(path, max_age_hours=1).resumed is False
+        assert not os.path.exists(path)
+
+        journal = RunJournal(path)
+        journal.record_page(make_page("https://a.com/"))
+        journal.complete()
+        assert not os.path.exists(path)
+        assert RunJournal(path).resumed is False
+
+
+class TestScraperResume:
+    """저널을 사용하는 스크래퍼 재개 테스트"""
+
+    @patch('requests.Session.get')
+    def test_completed_pages_not_refetched(self, mock_get, tmp_path):
+        """이전 실행에서 완료된 대상 페이지는 다시 요청하지 않는지 테스트"""
+        # Given: "/"만 완료된 저널
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        path = str(tmp_path / "journal.jsonl")
+        RunJournal(path).record_page(make_page("https://example.com/"))
+        scraper = WebScraper(delay=0, journal=RunJournal(path))
+        config = {"name": "test", "url": "https://example.com", "target_pages": ["/", "/pricing"]}
+
+        # When: 다시 수집
+        results = scraper.scrape_competitor(config)
+
+        # Then: 완료된 페이지는 기록된 결과로, 나머지만 요청해야 함
+        assert [r['url'] for r in results] == ["https://example.com/", "https://example.com/pricing"]
+        assert results[0]['id'] == "id-https://example.com/"
+        assert [call.args[0] for call in mock_get.call_args_list] == ["https://example.com/pricing"]
+        assert scraper.journal.page_count == 2
+
+    @patch('requests.Session.get')
+    def test_crawl_frontier_rebuilt_from_journal(self, mock_get, tmp_path):
+        """크롤 모드 재개 시 기록된 링크로 대기열을 다시 구성하는지 테스트"""
+        # Given: 첫 실행에서 두 페이지를 수집하고 중단
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        path = str(tmp_path / "journal.jsonl")
+        config = {"name": "test", "url": "https://example.com", "target_pages": ["/"],
+                  "crawl": True, "max_pages": 2}
+        WebScraper(delay=0, journal=RunJournal(path)).scrape_competitor(config)
+        mock_get.reset_mock()
+
+        # When: 상한을 늘려 다시 실행
+        scraper = WebScraper(delay=0, journal=RunJournal(path))
+        results = scraper.scrape_competitor(dict(config, max_pages=4))
+
+        # Then: 완료된 두 페이지는 다시 요청하지 않고 이후 페이지만 요청해야 함
+        requested = [call.args[0] for call in mock_get.call_args_list
+                     if not call.args[0].endswith('sitemap.xml')]
+        assert [r['url'] for r in results] == [
+            "https://example.com/",
+            "https://example.com/pricing",
+            "https://www.example.com/plans",
+            "https://example.com/products",
+        ]
+        assert requested == ["https://www.example.com/plans", "https://example.com/products"]
+        assert all('links' not in r for r in results)
@@ -0,0 +1,116 @@
+"""
+2단계 스크래핑 파이프라인 단위 테스트
+"""
+
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.scrape_pipeline import ScrapePipeline
+from src.data_collection.validator_cache import ValidatorStore
+from src.data_collection.web_scraper import WebScraper, parse_page_body
+
+
+def make_response(url: str, status_code: int = 200) -> requests.Response:
+    """URL을 제목으로 가진 HTML 응답 생성"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = f"<html><title>{url}</title><body>본문 {url}</body></html>".encode('utf-8')
+    response._content_consumed = True
+    response.headers['Content-Type'] = 'text/html; charset=utf-8'
+    response.headers['ETag'] = f'"{url}"'
+    return response
+
+
+class TestScrapePipeline:
+    """ScrapePipeline 클래스 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.competitors = [
+            {"name": "a", "url": "https://a.example.com", "target_pages": ["/pricing", "/about"]},
+            {"name": "b", "url": "https://b.example.com", "target_pages": ["/products"]},
+        ]
+
+    @patch('requests.Session.get')
+    def test_process_pool_matches_serial_extraction(self, mock_get):
+        """프로세스 풀 추출 결과가 순차 추출과 같은지 테스트"""
+        # Given: URL별 HTML 응답
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        scraper = WebScraper(delay=0, parser_backend='stream')
+
+        # When: 파이프라인 실행 (실제 프로세스 풀)
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            pipeline = ScrapePipeline(scraper, fetch_workers=2, queue_size=2, executor=executor)
+            results = pipeline.run(self.competitors)
+
+        # Then: 입력 순서대로 순차 방식과 같은 필드를 가져야 함
+        assert [r['url'] for r in results] == [
+            "https://a.example.com/pricing",
+            "https://a.example.com/about",
+            "https://b.example.com/products",
+        ]
+        expected = parse_page_body(make_response(results[0]['url']).content, 'stream', 'utf-8')
+        for field in ('page_title', 'content', 'meta_description', 'content_hash', 'content_simhash'):
+            assert results[0][field] == expected[field]
+        assert results[2]['competitor_name'] == "b"
+
+    @patch('requests.Session.get')
+    def test_failed_and_not_modified_pages(self, mock_get, tmp_path):
+        """실패 페이지 제외 및 304 응답 처리 테스트"""
+        # Given: 한 페이지는 연결 실패, 한 페이지는 304
+        store = ValidatorStore(str(tmp_path / "v.json"))
+        store.update("https://a.example.com/about", etag='"v1"', last_modified=None,
+                     content_hash="stored")
+
+        def side_effect(url, **kwargs):
+            if url.endswith('/products'):
+                raise requests.RequestException("Connection failed")
+            if url.endswith('/about'):
+                return make_response(url, status_code=304)
+            return make_response(url)
+        mock_get.side_effect = side_effect
+        scraper = WebScraper(delay=0, validator_store=store)
+
+        # When: 파이프라인 실행 (스레드 실행기로 대체)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = ScrapePipeline(scraper, executor=executor).run(self.competitors)
+
+        # Then: 성공/304 페이지만 반환되고 새 검증자가 기록되어야 함
+        assert len(results) == 2
+        assert results[1]['not_modified'] is True
+        assert results[1]['content_hash'] == "stored"
+        assert store.get("https://a.example.com/pricing")['etag'] == '"https://a.example.com/pricing"'
+
+    @patch('requests.Session.get')
+    def test_on_page_streams_results(self, mock_get):
+        """on_page를 지정하면 완료된 페이지를 바로 전달하고 결과를 모아 두지 않는지 테스트"""
+        # Given: URL별 HTML 응답
+        mock_get.side_effect = lambda url, **kwargs: make_response(url)
+        scraper = WebScraper(delay=0)
+        streamed = []
+
+        # When: on_page와 함께 파이프라인 실행
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            pipeline = ScrapePipeline(scraper, fetch_workers=2, queue_size=1, executor=executor)
+            results = pipeline.run(self.competitors, on_page=streamed.append)
+
+        # Then: 모든 페이지가 on_page로 전달되어야 함
+        assert results == []
+        assert sorted(page['url'] for page in streamed) == [
+            "https://a.example.com/about",
+            "https://a.example.com/pricing",
+            "https://b.example.com/products",
+        ]
+
+    def test_interleave_by_competitor(self):
+        """경쟁사 간 라운드 로빈 배치 테스트"""
+        targets = [("u1", "a"), ("u2", "a"), ("u3", "a"), ("u4", "b")]
+
+        assert ScrapePipeline._interleave_by_competitor(targets) == [0, 3, 1, 2]
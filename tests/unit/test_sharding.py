@@ -0,0 +1,98 @@
+"""
+수집 샤딩 및 실행 요약 통합 단위 테스트
+"""
+
+import sys
+import os
+
+import pytest
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.sharding import select_shard, shard_key, shard_of, shard_state_path
+from src.utils.run_summary import load_run_summaries, merge_run_summaries, save_run_summary
+
+
+def make_competitors(count):
+    """테스트용 경쟁사 설정"""
+    return [{"name": f"c{i}", "url": f"https://site{i}.example.com", "target_pages": ["/"]}
+            for i in range(count)]
+
+
+class TestSharding:
+    """샤드 배정 테스트"""
+
+    def test_shards_partition_competitors(self):
+        """모든 경쟁사가 정확히 한 샤드에 배정되고 같은 호스트는 같은 샤드인지 테스트"""
+        # Given: 경쟁사 200개와 www만 다른 같은 호스트
+        competitors = make_competitors(200)
+        competitors.append({"name": "dup", "url": "https://www.site7.example.com"})
+
+        # When: 4개 샤드로 분할
+        shards = [select_shard(competitors, shard, 4) for shard in range(4)]
+
+        # Then: 빠짐없이 한 번씩 배정되고 크기가 고르게 분포해야 함
+        names = sorted(c['name'] for shard in shards for c in shard)
+        assert names == sorted(c['name'] for c in competitors)
+        assert all(30 <= len(shard) <= 70 for shard in shards)
+        assert shard_of(shard_key(competitors[7]), 4) == shard_of(shard_key(competitors[-1]), 4)
+        assert shards == [select_shard(competitors, shard, 4) for shard in range(4)]
+
+    def test_adding_shard_moves_only_to_new_shard(self):
+        """샤드 수를 늘리면 새 샤드로 옮겨 가는 경쟁사만 배정이 바뀌는지 테스트"""
+        keys = [shard_key(c) for c in make_competitors(300)]
+
+        moved = [key for key in keys if shard_of(key, 4) != shard_of(key, 5)]
+
+        assert moved
+        assert all(shard_of(key, 5) == 4 for key in moved)
+        assert len(moved) < len(keys) / 3
+
+    def test_invalid_shard_and_state_path(self):
+        """잘못된 샤드 번호 거부 및 샤드별 상태 파일 경로 테스트"""
+        with pytest.raises(ValueError):
+            select_shard(make_competitors(3), 2, 2)
+
+        assert shard_state_path("state/journal.jsonl", 0, 1) == "state/journal.jsonl"
+        assert shard_state_path("state/journal.jsonl", 2, 8) == "state/journal.shard-0002-of-0008.jsonl"
+
+
+class TestRunSummaryMerge:
+    """샤드 실행 요약 저장/통합 테스트"""
+
+    def make_summary(self, shard, success=True, finished_at=200.0, new_pages=None):
+        return {
+            'run_id': "20240101", 'shard': shard, 'num_shards': 3,
+            'competitors': [f"c{shard}"], 'started_at': 100.0 + shard,
+            'finished_at': finished_at, 'success': success,
+            'new_pages': new_pages or {f"c{shard}": 2},
+            'stored_batches': 1, 'failed_batches': 0 if success else 1,
+            'failed_pages': 0 if success else 5,
+            'bandwidth': {'wire_bytes': 1000, 'decoded_bytes': 3000, 'deferred_urls': []},
+        }
+
+    def test_merge_reports_missing_and_failed_shards(self, tmp_path):
+        """저장한 요약을 읽어 합치고 누락/실패 샤드를 표시하는지 테스트"""
+        # Given: 샤드 0(재시도로 두 번 보고), 샤드 1 실패, 샤드 2 누락
+        directory = str(tmp_path)
+        save_run_summary(directory, self.make_summary(0, success=False, finished_at=150.0))
+        save_run_summary(directory, self.make_summary(1, success=False))
+        summaries = load_run_summaries(directory, "20240101")
+        summaries.append(self.make_summary(0, finished_at=300.0))
+
+        # When: 통합
+        merged = merge_run_summaries(summaries)
+
+        # Then: 샤드 0은 마지막 결과를 사용하고 누락/실패가 표시되어야 함
+        assert len(summaries) == 3
+        assert merged['missing_shards'] == [2]
+        assert merged['failed_shards'] == [1]
+        assert merged['success'] is False
+        assert merged['new_pages'] == {"c0": 2, "c1": 2}
+        assert merged['wire_bytes'] == 2000
+        assert (merged['started_at'], merged['finished_at']) == (100.0, 300.0)
+
+        complete = [self.make_summary(shard) for shard in range(3)]
+        assert merge_run_summaries(complete)['success'] is True
+        assert merge_run_summaries(complete, num_shards=4)['missing_shards'] == [3]
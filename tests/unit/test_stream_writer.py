@@ -0,0 +1,219 @@
+"""
+커밋 스트림 쓰기 모듈 단위 테스트 (로컬 가짜 서버 사용)
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+import grpc
+import pytest
+from google.api_core import exceptions
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.utils.bigquery_client import BigQueryClient
+from src.utils.local_bigquery import LocalBigQueryClient
+from src.utils.row_serializer import TABLE_SCHEMAS
+from src.utils.stream_writer import (
+    CommittedStreamWriter, LocalWriteServer, OffsetAlreadyExists, OffsetOutOfRange,
+    StorageWriteTransport, StreamWriteError, TransientAppendError
+)
+
+
+def make_rows(start, count):
+    return [{'id': f"row-{i}", 'url': f"https://a.com/{i}"} for i in range(start, start + count)]
+
+
+class TestCommittedStreamWriter:
+    """오프셋 기반 추가 쓰기 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.table_path = "projects/p/datasets/d/tables/competitor_data"
+
+    def make_writer(self, server, **kwargs):
+        kwargs.setdefault('max_rows_per_request', 10)
+        return CommittedStreamWriter(server, self.table_path, sleep=lambda _: None, **kwargs)
+
+    def test_pipelined_appends_keep_order_within_in_flight_limit(self):
+        """응답 대기 요청 수가 상한을 넘지 않고 행이 순서대로 기록되는지 테스트"""
+        # Given: 지연이 있는 서버와 동시 요청 3개로 제한한 쓰기 객체
+        server = LocalWriteServer(latency_seconds=0.01)
+        writer = self.make_writer(server, max_in_flight=3)
+
+        # When: 100행을 두 번에 나누어 추가 (요청당 10행)
+        assert writer.append_rows(make_rows(0, 40)) == 0
+        assert writer.append_rows(make_rows(40, 60)) == 40
+        committed = writer.close()
+
+        # Then: 요청 10개가 겹쳐 전송되되 3개를 넘지 않음
+        assert committed == 100
+        assert server.requests == 10
+        assert 1 < server.max_concurrent <= 3
+        assert [row['id'] for row in server.rows(writer.stream_name)] == [f"row-{i}" for i in range(100)]
+        assert server.finalized[writer.stream_name] == 100
+        server.close()
+
+    def test_lost_ack_and_failed_append_are_retried_without_duplicates(self):
+        """커밋 후 응답 유실과 커밋 전 실패가 중복/누락 없이 재시도되는지 테스트"""
+        # Given: 두 번째 요청은 커밋 후 응답 유실, 아홉 번째 요청은 커밋 전 실패
+        server = LocalWriteServer(failures={1: 'after_commit', 8: 'before_commit'})
+        writer = self.make_writer(server, max_in_flight=4)
+
+        # When: 80행 추가
+        writer.append_rows(make_rows(0, 80))
+        writer.close()
+
+        # Then: 모든 행이 정확히 한 번씩 기록되고, 이미 기록된 재전송은 건너뜀
+        ids = [row['id'] for row in server.rows(writer.stream_name)]
+        assert ids == [f"row-{i}" for i in range(80)]
+        assert writer.rows_committed == 80
+        assert writer.retries == 2
+        assert writer.duplicates_skipped == 10
+        server.close()
+
+    def test_exhausted_retries_raise(self):
+        """같은 요청이 재시도 횟수를 넘겨 실패하면 예외가 발생하는지 테스트"""
+        # Given: 첫 요청과 그 재전송이 모두 커밋 전에 실패하는 서버
+        server = LocalWriteServer(failures={0: 'before_commit', 1: 'before_commit'})
+        writer = self.make_writer(server, max_in_flight=1, max_retries=1)
+
+        # When & Then: 재시도 1회 후에도 실패하므로 예외
+        writer.append_rows(make_rows(0, 5))
+        with pytest.raises(StreamWriteError):
+            writer.flush()
+        assert server.rows(writer.stream_name) == []
+        server.close()
+
+    def test_bigquery_client_builds_writer_for_table(self):
+        """BigQueryClient가 테이블 경로로 쓰기 객체를 만드는지 테스트"""
+        # Given: 로컬 대체 클라이언트를 쓰는 BigQueryClient와 가짜 서버
+        client = BigQueryClient("test-project", "test_dataset", client=LocalBigQueryClient("test-project"))
+        server = LocalWriteServer()
+
+        # When: competitor_data 테이블용 쓰기 객체로 행 추가
+        writer = client.committed_stream_writer('competitor_data', transport=server, max_in_flight=2)
+        writer.append_rows(make_rows(0, 3))
+        writer.close()
+
+        # Then: 테이블 경로 아래 스트림에 기록됨
+        assert writer.stream_name.startswith(
+            "projects/test-project/datasets/test_dataset/tables/competitor_data/streams/"
+        )
+        assert len(server.rows(writer.stream_name)) == 3
+        server.close()
+
+
+class FakeRpcError(grpc.RpcError, grpc.Call):
+    """상태 코드만 가진 gRPC 호출 오류"""
+
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return "fake"
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+
+class TestStorageWriteTransport:
+    """기본 Storage Write API 전송 계층 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.client = BigQueryClient("test-project", "test_dataset",
+                                     client=LocalBigQueryClient("test-project"))
+
+    def test_default_transport_for_competitor_data(self):
+        """competitor_data 스키마로 메시지 클래스를 만들어 행을 직렬화하는지 테스트"""
+        # When: 전송 계층 없이 쓰기 객체 생성 (두 번)
+        writer = self.client.committed_stream_writer('competitor_data')
+        again = self.client.committed_stream_writer('competitor_data')
+
+        # Then: 스키마 컬럼과 같은 필드를 가진 메시지로 직렬화되고, 전송 계층은 재사용됨
+        transport = writer.transport
+        assert isinstance(transport, StorageWriteTransport)
+        assert again.transport is transport
+        assert [field.name for field in transport._proto_descriptor.field] == \
+            [field.name for field in TABLE_SCHEMAS['competitor_data']]
+
+        message = transport.row_message_cls()
+        message.ParseFromString(transport.serialize_row({
+            'id': "a", 'competitor_name': "A", 'url': "https://a.com/", 'page_title': "가격",
+            'content': None, 'collected_at': "2024-01-01T00:00:01", 'content_hash': "h"
+        }))
+        assert message.page_title == "가격"
+        assert message.collected_at == 1704067201000000
+        assert not message.HasField('content')
+
+    def test_api_and_grpc_errors_are_mapped(self):
+        """API/gRPC 오류가 재시도/중복 규칙 오류로 변환되는지 테스트"""
+        # Given
+        transport = StorageWriteTransport(schema=TABLE_SCHEMAS['competitor_data'])
+
+        # When & Then
+        assert isinstance(transport._translate(exceptions.ServiceUnavailable("x")), TransientAppendError)
+        assert isinstance(transport._translate(exceptions.AlreadyExists("x")), OffsetAlreadyExists)
+        assert isinstance(transport._translate(FakeRpcError(grpc.StatusCode.UNAVAILABLE)),
+                          TransientAppendError)
+        assert isinstance(transport._translate(FakeRpcError(grpc.StatusCode.OUT_OF_RANGE)),
+                          OffsetOutOfRange)
+        assert isinstance(transport._translate(exceptions.PermissionDenied("x")),
+                          exceptions.PermissionDenied)
+
+    def test_closed_stream_is_retryable_and_reconnects(self):
+        """연결 종료 오류는 재시도 가능 오류로 바꾸고 다음 요청에서 다시 연결하는지 테스트"""
+        # Given: 연결이 있는 스트림
+        transport = StorageWriteTransport(schema=TABLE_SCHEMAS['competitor_data'])
+        transport._connections['stream'] = object()
+
+        # When
+        with patch('src.utils.stream_writer._is_stream_closed', return_value=True):
+            error = transport._translate(RuntimeError("closed"), 'stream')
+
+        # Then
+        assert isinstance(error, TransientAppendError)
+        assert 'stream' not in transport._connections
+
+    def test_inserts_use_committed_stream_when_enabled(self):
+        """storage_write_api가 켜져 있으면 삽입이 커밋 스트림으로 처리되는지 테스트"""
+        # Given
+        server = LocalWriteServer()
+        local = LocalBigQueryClient("test-project")
+        client = BigQueryClient("test-project", "test_dataset", client=local,
+                                storage_write_api=True, write_transport=server)
+
+        # When
+        assert client.insert_competitor_data([{
+            'id': "a", 'competitor_name': "A", 'url': "https://a.com/", 'page_title': "",
+            'content': "", 'meta_description': "", 'collected_at': "2024-01-01T00:00:00",
+            'content_hash': "h"
+        }]) is True
+
+        # Then: 스트리밍 삽입 없이 스트림에 기록되고 종료됨
+        stream_name, = server.streams
+        assert [row['id'] for row in server.rows(stream_name)] == ["a"]
+        assert server.finalized[stream_name] == 1
+        assert local.streaming_requests == 0
+        server.close()
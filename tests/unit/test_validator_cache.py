@@ -0,0 +1,110 @@
+"""
+조건부 GET 검증자 저장소 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.validator_cache import ValidatorStore
+from src.data_collection.web_scraper import WebScraper
+
+
+class TestValidatorStore:
+    """ValidatorStore 클래스 테스트"""
+
+    def test_save_and_reload(self, tmp_path):
+        """저장한 검증자가 다시 로드되는지 테스트"""
+        # Given: 검증자가 기록된 저장소
+        path = str(tmp_path / "state" / "validators.json")
+        store = ValidatorStore(path)
+        store.update("https://a.com/", etag='"abc"', last_modified=None, content_hash="h1")
+
+        # When: 저장 후 새 인스턴스로 로드
+        assert store.save() is True
+        reloaded = ValidatorStore(path)
+
+        # Then: 조건부 헤더가 복원되어야 함
+        assert reloaded.conditional_headers("https://a.com/") == {'If-None-Match': '"abc"'}
+        assert reloaded.get("https://a.com/")['content_hash'] == "h1"
+
+    def test_response_without_validators_removes_entry(self, tmp_path):
+        """검증자가 없는 응답이면 기존 항목이 제거되는지 테스트"""
+        store = ValidatorStore(str(tmp_path / "v.json"))
+        store.update("https://a.com/", etag='"abc"', last_modified=None, content_hash="h1")
+
+        store.update("https://a.com/", etag=None, last_modified=None, content_hash="h2")
+
+        assert store.get("https://a.com/") is None
+        assert store.conditional_headers("https://a.com/") == {}
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        """손상된 파일이면 빈 저장소로 시작하는지 테스트"""
+        path = tmp_path / "v.json"
+        path.write_text("{not json")
+
+        store = ValidatorStore(str(path))
+
+        assert store.get("https://a.com/") is None
+
+
+class TestConditionalScrape:
+    """WebScraper 조건부 요청 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.url = "https://example.com/pricing"
+
+    @patch('requests.Session.get')
+    def test_first_fetch_records_validators(self, mock_get, tmp_path):
+        """200 응답의 ETag/Last-Modified가 기록되는지 테스트"""
+        # Given: 검증자를 포함한 200 응답
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<html><title>Pricing</title><body>Plans</body></html>"
+        response._content_consumed = True
+        response.headers.update({
+            'Content-Type': 'text/html',
+            'ETag': '"v1"',
+            'Last-Modified': 'Wed, 01 Jan 2025 00:00:00 GMT'
+        })
+        mock_get.return_value = response
+        store = ValidatorStore(str(tmp_path / "v.json"))
+        scraper = WebScraper(delay=0, validator_store=store)
+
+        # When: 스크래핑
+        result = scraper.scrape_page(self.url, "test")
+
+        # Then: 조건부 헤더 없이 요청하고 검증자를 기록해야 함
+        assert mock_get.call_args.kwargs.get('headers') is None
+        assert store.get(self.url) == {
+            'etag': '"v1"',
+            'last_modified': 'Wed, 01 Jan 2025 00:00:00 GMT',
+            'content_hash': result['content_hash']
+        }
+
+    @patch('src.data_collection.web_scraper.IncrementalPageExtractor')
+    @patch('requests.Session.get')
+    def test_not_modified_skips_parse(self, mock_get, mock_extract, tmp_path):
+        """304 응답이면 파싱 없이 변경 없음으로 반환하는지 테스트"""
+        # Given: 검증자가 저장된 URL과 304 응답
+        store = ValidatorStore(str(tmp_path / "v.json"))
+        store.update(self.url, etag='"v1"', last_modified=None, content_hash="stored-hash")
+        response = Mock()
+        response.status_code = 304
+        mock_get.return_value = response
+        scraper = WebScraper(delay=0, validator_store=store)
+
+        # When: 스크래핑
+        result = scraper.scrape_page(self.url, "test")
+
+        # Then: 조건부 헤더를 보내고, 파싱 없이 저장된 해시와 함께 반환해야 함
+        assert mock_get.call_args.kwargs['headers'] == {'If-None-Match': '"v1"'}
+        mock_extract.assert_not_called()
+        assert result['not_modified'] is True
+        assert result['content_hash'] == "stored-hash"
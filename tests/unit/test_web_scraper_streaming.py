@@ -0,0 +1,115 @@
+"""
+WebScraper 스트리밍 다운로드 단위 테스트
+"""
+
+import sys
+import os
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트 경로 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data_collection.web_scraper import WebScraper
+
+
+class FakeStreamResponse(requests.Response):
+    """iter_content로 소비한 조각 수를 기록하는 스트리밍 응답"""
+
+    def __init__(self, chunks, content_type='text/html', content_length=None):
+        super().__init__()
+        self.status_code = 200
+        self.headers['Content-Type'] = content_type
+        if content_length is not None:
+            self.headers['Content-Length'] = str(content_length)
+        self._chunks = chunks
+        self._content_consumed = True
+        self.chunks_read = 0
+        self.closed = False
+
+    def iter_content(self, chunk_size=1, decode_unicode=False):
+        for chunk in self._chunks:
+            self.chunks_read += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+class TestStreamingDownload:
+    """스트리밍 다운로드/크기 제한 테스트"""
+
+    def setup_method(self):
+        """각 테스트 메서드 실행 전 호출되는 설정"""
+        self.url = "https://example.com/pricing"
+
+    @patch('requests.Session.get')
+    def test_stops_download_after_text_cap(self, mock_get):
+        """텍스트 상한에 도달하면 나머지 본문을 받지 않는지 테스트"""
+        # Given: 100개 조각으로 나뉜 긴 페이지
+        head = b"<html><head><title>Pricing</title></head><body>"
+        chunks = [head] + [b"<p>" + b"plan " * 200 + b"</p>\n" for _ in range(100)]
+        response = FakeStreamResponse(chunks)
+        mock_get.return_value = response
+        scraper = WebScraper(delay=0, parser_backend='stream')
+
+        # When: 스크래핑
+        result = scraper.scrape_page(self.url, "test")
+
+        # Then: 상한까지만 읽고 연결을 닫아야 함
+        assert mock_get.call_args.kwargs['stream'] is True
+        assert result['page_title'] == "Pricing"
+        assert len(result['content']) == 10000
+        assert response.chunks_read < 20
+        assert response.closed is True
+
+    @patch('requests.Session.get')
+    def test_rejects_oversized_body(self, mock_get):
+        """본문이 최대 크기를 넘으면 중단하는지 테스트"""
+        # Given: Content-Length 없이 계속 커지는 본문
+        response = FakeStreamResponse([b"<html><body>" + b"x" * 1024] * 10)
+        mock_get.return_value = response
+        scraper = WebScraper(delay=0, parser_backend='html.parser', max_response_bytes=4096)
+
+        # When: 스크래핑
+        result = scraper.scrape_page(self.url, "test")
+
+        # Then: 상한을 넘는 조각에서 중단하고 None을 반환해야 함
+        assert result is None
+        assert response.chunks_read == 4
+        assert response.closed is True
+
+    @patch('requests.Session.get')
+    def test_rejects_declared_oversized_body(self, mock_get):
+        """Content-Length가 최대 크기를 넘으면 본문을 읽지 않는지 테스트"""
+        response = FakeStreamResponse([b"<html></html>"], content_length=10 ** 9)
+        mock_get.return_value = response
+        scraper = WebScraper(delay=0)
+
+        assert scraper.scrape_page(self.url, "test") is None
+        assert response.chunks_read == 0
+
+    @patch('requests.Session.get')
+    def test_rejects_disallowed_content_type(self, mock_get):
+        """허용 목록에 없는 Content-Type이면 본문을 읽지 않는지 테스트"""
+        response = FakeStreamResponse([b"%PDF-1.4"], content_type='application/pdf')
+        mock_get.return_value = response
+        scraper = WebScraper(delay=0)
+
+        assert scraper.scrape_page(self.url, "test") is None
+        assert response.chunks_read == 0
+
+    @patch('requests.Session.get')
+    def test_header_charset_is_used(self, mock_get):
+        """Content-Type의 charset으로 조각을 디코딩하는지 테스트"""
+        html = "<html><title>가격 안내</title><body>요금제</body></html>".encode('euc-kr')
+        mock_get.return_value = FakeStreamResponse(
+            [html[:7], html[7:]], content_type='text/html; charset=EUC-KR'
+        )
+        scraper = WebScraper(delay=0, parser_backend='stream')
+
+        result = scraper.scrape_page(self.url, "test")
+
+        assert result['page_title'] == "가격 안내"
+        assert "요금제" in result['content']